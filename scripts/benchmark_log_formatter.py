@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+"""Benchmark structured log formatting throughput.
+
+Compares the previous dict-and-json.dumps formatter with StructuredFormatter
+on its appending encoder and, when installed, its orjson backend. Records
+are built the way ContextualLogger builds them (context plus a few extra
+fields). Each record is formatted once, as the encoded line is cached on it.
+
+Usage:
+    python scripts/benchmark_log_formatter.py [--records N] [--rounds N]
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import time
+import traceback
+from datetime import datetime
+
+from cc_orchestrator.utils import logging as cc_logging
+from cc_orchestrator.utils.logging import StructuredFormatter
+
+
+class LegacyFormatter(logging.Formatter):
+    """The formatter as it was before the encoder rewrite."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_data = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+        }
+        if hasattr(record, "context"):
+            log_data["context"] = record.context
+        if hasattr(record, "instance_id"):
+            log_data["instance_id"] = record.instance_id
+        if hasattr(record, "task_id"):
+            log_data["task_id"] = record.task_id
+        standard_fields = {
+            "name",
+            "msg",
+            "args",
+            "levelname",
+            "levelno",
+            "pathname",
+            "filename",
+            "module",
+            "exc_info",
+            "exc_text",
+            "stack_info",
+            "lineno",
+            "funcName",
+            "created",
+            "msecs",
+            "relativeCreated",
+            "thread",
+            "threadName",
+            "processName",
+            "process",
+            "getMessage",
+            "context",
+            "instance_id",
+            "task_id",
+        }
+        for key, value in record.__dict__.items():
+            if key not in standard_fields and not key.startswith("_"):
+                log_data[key] = value
+        if record.exc_info and record.exc_info[0] is not None:
+            exc_type, exc_value, exc_traceback = record.exc_info
+            log_data["exception"] = {
+                "type": exc_type.__name__,
+                "message": str(exc_value) if exc_value is not None else "",
+                "traceback": traceback.format_exception(
+                    exc_type, exc_value, exc_traceback
+                ),
+            }
+        return json.dumps(log_data)
+
+
+def _records(count: int) -> list[logging.LogRecord]:
+    """Build records resembling ContextualLogger output."""
+    records = []
+    for i in range(count):
+        record = logging.LogRecord(
+            "cc_orchestrator.web.middleware",
+            logging.INFO,
+            __file__,
+            42,
+            "Request completed",
+            None,
+            None,
+            func="dispatch",
+        )
+        record.context = "web"
+        record.instance_id = f"instance-{i % 16}"
+        record.method = "GET"
+        record.path = "/api/v1/instances"
+        record.status_code = 200
+        record.duration_ms = 1.25 + i % 7
+        records.append(record)
+    return records
+
+
+def _throughput(formatter: logging.Formatter, count: int, rounds: int) -> float:
+    """Median records formatted per second."""
+    rates = []
+    for _ in range(rounds):
+        records = _records(count)
+        start = time.perf_counter()
+        for record in records:
+            formatter.format(record)
+        rates.append(count / (time.perf_counter() - start))
+    return statistics.median(rates)
+
+
+def main(count: int, rounds: int) -> None:
+    """Run the benchmark and print records per second per formatter."""
+    formatters = [
+        ("legacy", LegacyFormatter()),
+        ("json", StructuredFormatter(backend="json")),
+    ]
+    if cc_logging.orjson is not None:
+        formatters.append(("orjson", StructuredFormatter(backend="orjson")))
+
+    baseline = None
+    print(f"{'formatter':<10}{'records/s':>14}{'speedup':>10}")
+    for name, formatter in formatters:
+        rate = _throughput(formatter, count, rounds)
+        baseline = baseline or rate
+        print(f"{name:<10}{rate:>14,.0f}{rate / baseline:>9.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    main(args.records, args.rounds)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""Benchmark rate limit decision throughput.
+
+Compares the previous timestamp-log limiter with RateLimitEngine. Traffic
+comes from a pool of client IPs where a few hot clients send most requests,
+each hit against a limit the hot clients exceed, which is the case where
+timestamp logs are longest. Also reports how many keys each holds at the
+end of a round.
+
+Usage:
+    python scripts/benchmark_rate_limiter.py [--decisions N] [--clients N]
+"""
+
+import argparse
+import random
+import statistics
+import time
+from collections import defaultdict
+
+from cc_orchestrator.web.rate_limit_engine import Quota, RateLimitEngine
+
+
+class LegacyLimiter:
+    """InMemoryRateLimiter as it was before the engine rewrite."""
+
+    def __init__(self) -> None:
+        self.request_history: dict[str, dict[str, list[float]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+
+    def check(self, client_ip: str, endpoint: str, limit: int, window: int) -> bool:
+        current_time = time.time()
+        window_start = current_time - window
+        client_history = self.request_history[client_ip][endpoint]
+        self.request_history[client_ip][endpoint] = [
+            req for req in client_history if req > window_start
+        ]
+        if len(self.request_history[client_ip][endpoint]) >= limit:
+            return False
+        self.request_history[client_ip][endpoint].append(current_time)
+        return True
+
+    def size(self) -> int:
+        return sum(len(endpoints) for endpoints in self.request_history.values())
+
+
+class EngineLimiter:
+    """The engine as InMemoryRateLimiter uses it."""
+
+    def __init__(self) -> None:
+        self.engine = RateLimitEngine()
+
+    def check(self, client_ip: str, endpoint: str, limit: int, window: int) -> bool:
+        quota = Quota(limit=limit, period=window)
+        return self.engine.hit((client_ip, endpoint), quota).allowed
+
+    def size(self) -> int:
+        return len(self.engine)
+
+
+def _traffic(count: int, clients: int) -> list[str]:
+    """Client IPs of ``count`` requests, skewed towards a few hot clients."""
+    rng = random.Random(42)
+    ips = [f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}" for i in range(clients)]
+    weights = [1 / (rank + 1) for rank in range(clients)]
+    return rng.choices(ips, weights, k=count)
+
+
+def _throughput(factory: type, traffic: list[str], rounds: int) -> tuple[float, int]:
+    """Median decisions per second and keys held after the last round."""
+    rates = []
+    size = 0
+    for _ in range(rounds):
+        limiter = factory()
+        start = time.perf_counter()
+        for client_ip in traffic:
+            limiter.check(client_ip, "GET:/api/v1/instances", 600, 60)
+        rates.append(len(traffic) / (time.perf_counter() - start))
+        size = limiter.size()
+    return statistics.median(rates), size
+
+
+def main(decisions: int, clients: int, rounds: int) -> None:
+    """Run the benchmark and print decisions per second per limiter."""
+    traffic = _traffic(decisions, clients)
+
+    baseline = None
+    print(f"{'limiter':<10}{'decisions/s':>14}{'speedup':>10}{'keys':>10}")
+    for name, factory in (("legacy", LegacyLimiter), ("engine", EngineLimiter)):
+        rate, size = _throughput(factory, traffic, rounds)
+        baseline = baseline or rate
+        print(f"{name:<10}{rate:>14,.0f}{rate / baseline:>9.2f}x{size:>10,}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--decisions", type=int, default=200000)
+    parser.add_argument("--clients", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    main(args.decisions, args.clients, args.rounds)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""Benchmark tmux session creation across layout templates.
+
+Compares applying each template through per-call libtmux operations with the
+compiled command batch sent over a control-mode connection. Runs against a
+private tmux socket, so existing sessions are not touched.
+
+Usage:
+    python scripts/benchmark_tmux_templates.py [--rounds N]
+"""
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+import libtmux
+
+from cc_orchestrator.tmux.control import TmuxControlClient
+from cc_orchestrator.tmux.service import SessionConfig, TmuxService
+
+SOCKET_NAME = "cc-orchestrator-benchmark"
+
+
+async def _time_creation(
+    service: TmuxService, template: str, rounds: int, directory: Path
+) -> list[float]:
+    """Create and destroy a session per round, timing creation only."""
+    timings = []
+    for i in range(rounds):
+        config = SessionConfig(
+            session_name=f"bench-{template}-{i}",
+            working_directory=directory,
+            instance_id=f"bench-{i}",
+            layout_template=template,
+        )
+        start = time.perf_counter()
+        await service.create_session(config)
+        timings.append((time.perf_counter() - start) * 1000)
+        await service.destroy_session(config.session_name, force=True)
+    return timings
+
+
+async def main(rounds: int) -> None:
+    """Run the benchmark and print a table of creation times."""
+    directory = Path(tempfile.mkdtemp(prefix="tmux-bench-"))
+    control = TmuxControlClient(socket_name=SOCKET_NAME)
+    if not control.start():
+        raise SystemExit("tmux control client could not connect")
+
+    per_call = TmuxService()
+    per_call._server = libtmux.Server(socket_name=SOCKET_NAME)
+    batched = TmuxService(control_client=control)
+    batched._server = per_call._server
+
+    print(f"{'template':<14}{'mode':<10}{'median ms':>10}{'p90 ms':>10}")
+    try:
+        for template in per_call.get_layout_templates():
+            for mode, service in (("per-call", per_call), ("batched", batched)):
+                timings = await _time_creation(service, template, rounds, directory)
+                p90 = statistics.quantiles(timings, n=10)[-1] if rounds > 1 else 0
+                print(
+                    f"{template:<14}{mode:<10}"
+                    f"{statistics.median(timings):>10.1f}{p90:>10.1f}"
+                )
+    finally:
+        control.close()
+        subprocess.run(["tmux", "-L", SOCKET_NAME, "kill-server"], capture_output=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=10)
+    asyncio.run(main(parser.parse_args().rounds))
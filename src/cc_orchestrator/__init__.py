@@ -4,7 +4,23 @@ __version__ = "0.1.0"
 __author__ = "CC-Orchestrator Team"
 __email__ = "team@cc-orchestrator.dev"
 
-from .core.instance import ClaudeInstance
-from .core.orchestrator import Orchestrator
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core.instance import ClaudeInstance
+    from .core.orchestrator import Orchestrator
 
 __all__ = ["Orchestrator", "ClaudeInstance", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the core classes on first access.
+
+    Importing them eagerly would load SQLAlchemy, libtmux and psutil for every
+    submodule import, including the CLI entry point.
+    """
+    if name in ("Orchestrator", "ClaudeInstance"):
+        from . import core
+
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
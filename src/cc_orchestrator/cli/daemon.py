@@ -0,0 +1,32 @@
+"""Orchestrator daemon command."""
+
+import asyncio
+from pathlib import Path
+
+import click
+
+from .utils import CliError, error_handler
+
+
+@click.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Unix socket to listen on (default: ~/.cc-orchestrator/orchestrator.sock)",
+)
+@error_handler
+def daemon(socket_path: Path | None) -> None:
+    """Run the orchestrator daemon.
+
+    The daemon keeps one orchestrator, its health monitor and the task
+    scheduler running, and serves the instance and health commands of other
+    cc-orchestrator invocations and of the web app over a Unix socket, so
+    they reuse its state instead of starting their own orchestrator.
+    """
+    from ..daemon.server import run_daemon
+
+    try:
+        asyncio.run(run_daemon(socket_path))
+    except RuntimeError as e:
+        raise CliError(str(e)) from e
@@ -1,22 +1,60 @@
-"""Instance management commands."""
+"""Instance management commands.
+
+Instance and health commands run on the orchestrator daemon when one is
+listening on its socket, reusing its warm state and long-running health
+monitor. Otherwise they start throwaway components for the one command, as
+before the daemon existed.
+"""
 
 import asyncio
-import builtins
 import json
-from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import click
 
-from ..core.health_monitor import get_health_monitor
-from ..core.orchestrator import Orchestrator
-from ..database.models import HealthStatus
+from ..daemon.client import connect_daemon
 from ..utils.logging import LogContext, get_logger
 
 logger = get_logger(__name__, LogContext.CLI)
 
 
+def call_orchestrator(method: str, **params: Any) -> Any:
+    """Invoke an orchestrator RPC on the daemon, or in-process without one.
+
+    Args:
+        method: RPC method name
+        **params: Method parameters
+
+    Returns:
+        The method result
+    """
+    client = connect_daemon()
+    if client is not None:
+        with client:
+            return client.call(method, **params)
+
+    from ..daemon.service import call_local
+
+    return asyncio.run(call_local(method, params))
+
+
+def _echo_persistence_warning(result: dict[str, Any], action: str) -> None:
+    """Warn on stderr when an instance's new state was not saved."""
+    if result.get("warning") != "state_not_persisted":
+        return
+    if action == "started":
+        click.echo(
+            "ERROR: Instance started but will NOT survive system restart!", err=True
+        )
+    else:
+        click.echo(
+            "ERROR: Instance stopped but state may not persist across sessions!",
+            err=True,
+        )
+    click.echo("This is a critical issue - contact system administrator", err=True)
+
+
 @click.group()
 def instances() -> None:
     """Manage Claude Code instances."""
@@ -27,71 +65,42 @@ def instances() -> None:
 @click.option("--json", "output_json", is_flag=True, help="Output in JSON format")
 def status(output_json: bool) -> None:
     """Show status of all Claude instances."""
+    try:
+        result = call_orchestrator("instances.list")
+        status_data = result["instances"]
 
-    async def _status() -> None:
-        try:
-            orchestrator = Orchestrator()
-            await orchestrator.initialize()
-
-            instances = orchestrator.list_instances()
-
-            if not instances:
-                if output_json:
-                    click.echo(json.dumps({"instances": [], "total": 0}))
-                else:
-                    click.echo("No active instances found.")
-                return
-
-            # Gather status information
-            status_data: builtins.list[dict[str, Any]] = []
-            for instance in instances:
-                info = instance.get_info()
-                process_info = await instance.get_process_status()
-
-                if process_info:
-                    info.update(
-                        {
-                            "process_status": process_info.status.value,
-                            "cpu_percent": process_info.cpu_percent,
-                            "memory_mb": process_info.memory_mb,
-                        }
-                    )
-
-                status_data.append(info)
-
+        if not status_data:
             if output_json:
-                click.echo(
-                    json.dumps(
-                        {"instances": status_data, "total": len(status_data)}, indent=2
-                    )
-                )
+                click.echo(json.dumps({"instances": [], "total": 0}))
             else:
-                # Human-readable output
-                click.echo(f"\nActive Claude Instances ({len(status_data)}):\n")
-                for info in status_data:
-                    click.echo(f"Issue ID: {info['issue_id']}")
-                    click.echo(f"  Status: {info['status']}")
-                    click.echo(f"  Workspace: {info['workspace_path']}")
-                    click.echo(f"  Branch: {info['branch_name']}")
-                    click.echo(f"  Tmux Session: {info['tmux_session']}")
-                    if info.get("process_id"):
-                        click.echo(f"  Process ID: {info['process_id']}")
-                        if info.get("cpu_percent") is not None:
-                            click.echo(f"  CPU: {info['cpu_percent']:.1f}%")
-                        if info.get("memory_mb") is not None:
-                            click.echo(f"  Memory: {info['memory_mb']:.1f} MB")
-                    click.echo()
-
-            await orchestrator.cleanup()
-
-        except Exception as e:
-            logger.error("Error getting instance status", error=str(e))
-            if output_json:
-                click.echo(json.dumps({"error": str(e)}))
-            else:
-                click.echo(f"Error: {e}", err=True)
-
-    asyncio.run(_status())
+                click.echo("No active instances found.")
+            return
+
+        if output_json:
+            click.echo(json.dumps(result, indent=2))
+        else:
+            # Human-readable output
+            click.echo(f"\nActive Claude Instances ({len(status_data)}):\n")
+            for info in status_data:
+                click.echo(f"Issue ID: {info['issue_id']}")
+                click.echo(f"  Status: {info['status']}")
+                click.echo(f"  Workspace: {info['workspace_path']}")
+                click.echo(f"  Branch: {info['branch_name']}")
+                click.echo(f"  Tmux Session: {info['tmux_session']}")
+                if info.get("process_id"):
+                    click.echo(f"  Process ID: {info['process_id']}")
+                    if info.get("cpu_percent") is not None:
+                        click.echo(f"  CPU: {info['cpu_percent']:.1f}%")
+                    if info.get("memory_mb") is not None:
+                        click.echo(f"  Memory: {info['memory_mb']:.1f} MB")
+                click.echo()
+
+    except Exception as e:
+        logger.error("Error getting instance status", error=str(e))
+        if output_json:
+            click.echo(json.dumps({"error": str(e)}))
+        else:
+            click.echo(f"Error: {e}", err=True)
 
 
 @instances.command()
@@ -114,145 +123,34 @@ def start(
     output_json: bool,
 ) -> None:
     """Start a new Claude instance for an issue."""
-
-    async def _start() -> None:
-        try:
-            orchestrator = Orchestrator()
-            await orchestrator.initialize()
-
-            # Check if instance already exists
-            existing_instance = orchestrator.get_instance(issue_id)
-            if existing_instance:
-                if existing_instance.is_running():
-                    message = f"Instance for issue {issue_id} is already running"
-                    if output_json:
-                        click.echo(json.dumps({"error": message, "issue_id": issue_id}))
-                    else:
-                        click.echo(f"Error: {message}")
-                    return
-                else:
-                    # Instance exists but not running, start it
-                    success = await existing_instance.start()
-
-                    # Sync instance state changes back to database
-                    if success:
-                        sync_success = orchestrator.sync_instance_to_database(
-                            existing_instance
-                        )
-                        if not sync_success:
-                            if output_json:
-                                # Add warning to JSON output
-                                # Will be handled in the JSON response below
-                                pass
-                            else:
-                                click.echo(
-                                    "ERROR: Instance started but will NOT survive system restart!",
-                                    err=True,
-                                )
-                                click.echo(
-                                    "This is a critical issue - contact system administrator",
-                                    err=True,
-                                )
-
-                    if success:
-                        info = existing_instance.get_info()
-                        if output_json:
-                            result = {"status": "started", "instance": info}
-                            # Add sync status to JSON output for monitoring
-                            if "sync_success" in locals():
-                                if not sync_success:
-                                    result["warning"] = "state_not_persisted"
-                                    result["persistence_status"] = "failed"
-                                else:
-                                    result["persistence_status"] = "success"
-                            click.echo(json.dumps(result))
-                        else:
-                            click.echo(
-                                f"Started existing instance for issue {issue_id}"
-                            )
-                            click.echo(f"  Process ID: {info['process_id']}")
-                            click.echo(f"  Workspace: {info['workspace_path']}")
-                    else:
-                        message = (
-                            f"Failed to start existing instance for issue {issue_id}"
-                        )
-                        if output_json:
-                            click.echo(
-                                json.dumps({"error": message, "issue_id": issue_id})
-                            )
-                        else:
-                            click.echo(f"Error: {message}")
-                    await orchestrator.cleanup()
-                    return
-
-            # Create new instance
-            kwargs: dict[str, Any] = {}
-            if workspace:
-                kwargs["workspace_path"] = workspace
-            if branch:
-                kwargs["branch_name"] = branch
-            if tmux_session:
-                kwargs["tmux_session"] = tmux_session
-
-            instance = await orchestrator.create_instance(issue_id, **kwargs)
-
-            # Start the instance
-            success = await instance.start()
-
-            # Sync instance state changes back to database
-            if success:
-                sync_success = orchestrator.sync_instance_to_database(instance)
-                if not sync_success:
-                    if output_json:
-                        # Will be handled in JSON response below
-                        pass
-                    else:
-                        click.echo(
-                            "ERROR: Instance started but will NOT survive system restart!",
-                            err=True,
-                        )
-                        click.echo(
-                            "This is a critical issue - contact system administrator",
-                            err=True,
-                        )
-
-            if success:
-                info = instance.get_info()
-                if output_json:
-                    result = {"status": "started", "instance": info}
-                    # Add sync status to JSON output for monitoring
-                    if "sync_success" in locals():
-                        if not sync_success:
-                            result["warning"] = "state_not_persisted"
-                            result["persistence_status"] = "failed"
-                        else:
-                            result["persistence_status"] = "success"
-                    click.echo(json.dumps(result))
-                else:
-                    click.echo(
-                        f"Successfully started Claude instance for issue {issue_id}"
-                    )
-                    click.echo(f"  Process ID: {info['process_id']}")
-                    click.echo(f"  Workspace: {info['workspace_path']}")
-                    click.echo(f"  Branch: {info['branch_name']}")
-                    click.echo(f"  Tmux Session: {info['tmux_session']}")
-            else:
-                message = f"Failed to start instance for issue {issue_id}"
-                if output_json:
-                    click.echo(json.dumps({"error": message, "issue_id": issue_id}))
-                else:
-                    click.echo(f"Error: {message}")
-
-            await orchestrator.cleanup()
-
-        except Exception as e:
-            logger.error("Error starting instance", issue_id=issue_id, error=str(e))
-            if output_json:
-                click.echo(json.dumps({"error": str(e), "issue_id": issue_id}))
-            else:
-                click.echo(f"Error: {e}", err=True)
-
-    asyncio.run(_start())
+    try:
+        result = call_orchestrator(
+            "instances.start",
+            issue_id=issue_id,
+            workspace_path=str(workspace) if workspace else None,
+            branch_name=branch,
+            tmux_session=tmux_session,
+        )
+
+        if output_json:
+            click.echo(json.dumps(result))
+        elif "error" in result:
+            click.echo(f"Error: {result['error']}")
+        else:
+            _echo_persistence_warning(result, "started")
+            info = result["instance"]
+            click.echo(result["message"])
+            click.echo(f"  Process ID: {info['process_id']}")
+            click.echo(f"  Workspace: {info['workspace_path']}")
+            click.echo(f"  Branch: {info['branch_name']}")
+            click.echo(f"  Tmux Session: {info['tmux_session']}")
+
+    except Exception as e:
+        logger.error("Error starting instance", issue_id=issue_id, error=str(e))
+        if output_json:
+            click.echo(json.dumps({"error": str(e), "issue_id": issue_id}))
+        else:
+            click.echo(f"Error: {e}", err=True)
 
 
 @instances.command()
@@ -266,83 +164,25 @@ def start(
 @click.option("--json", "output_json", is_flag=True, help="Output in JSON format")
 def stop(issue_id: str, force: bool, timeout: int, output_json: bool) -> None:
     """Stop a Claude instance."""
-
-    async def _stop() -> None:
-        try:
-            orchestrator = Orchestrator()
-            await orchestrator.initialize()
-
-            instance = orchestrator.get_instance(issue_id)
-            if not instance:
-                message = f"No instance found for issue {issue_id}"
-                if output_json:
-                    click.echo(json.dumps({"error": message, "issue_id": issue_id}))
-                else:
-                    click.echo(f"Error: {message}")
-                await orchestrator.cleanup()
-                return
-
-            if not instance.is_running():
-                message = f"Instance for issue {issue_id} is not running"
-                if output_json:
-                    click.echo(
-                        json.dumps({"status": "already_stopped", "issue_id": issue_id})
-                    )
-                else:
-                    click.echo(f"Instance for issue {issue_id} is already stopped")
-                await orchestrator.cleanup()
-                return
-
-            # Stop the instance
-            success = await instance.stop()
-
-            # Sync instance state changes back to database
-            if success:
-                sync_success = orchestrator.sync_instance_to_database(instance)
-                if not sync_success:
-                    if output_json:
-                        # Will be handled in JSON response below
-                        pass
-                    else:
-                        click.echo(
-                            "ERROR: Instance stopped but state may not persist across sessions!",
-                            err=True,
-                        )
-                        click.echo(
-                            "This is a critical issue - contact system administrator",
-                            err=True,
-                        )
-
-            if success:
-                if output_json:
-                    result = {"status": "stopped", "issue_id": issue_id}
-                    # Add sync status to JSON output for monitoring
-                    if "sync_success" in locals():
-                        if not sync_success:
-                            result["warning"] = "state_not_persisted"
-                            result["persistence_status"] = "failed"
-                        else:
-                            result["persistence_status"] = "success"
-                    click.echo(json.dumps(result))
-                else:
-                    click.echo(f"Successfully stopped instance for issue {issue_id}")
-            else:
-                message = f"Failed to stop instance for issue {issue_id}"
-                if output_json:
-                    click.echo(json.dumps({"error": message, "issue_id": issue_id}))
-                else:
-                    click.echo(f"Error: {message}")
-
-            await orchestrator.cleanup()
-
-        except Exception as e:
-            logger.error("Error stopping instance", issue_id=issue_id, error=str(e))
-            if output_json:
-                click.echo(json.dumps({"error": str(e), "issue_id": issue_id}))
-            else:
-                click.echo(f"Error: {e}", err=True)
-
-    asyncio.run(_stop())
+    try:
+        result = call_orchestrator("instances.stop", issue_id=issue_id)
+
+        if output_json:
+            click.echo(json.dumps(result))
+        elif "error" in result:
+            click.echo(f"Error: {result['error']}")
+        elif result["status"] == "already_stopped":
+            click.echo(f"Instance for issue {issue_id} is already stopped")
+        else:
+            _echo_persistence_warning(result, "stopped")
+            click.echo(f"Successfully stopped instance for issue {issue_id}")
+
+    except Exception as e:
+        logger.error("Error stopping instance", issue_id=issue_id, error=str(e))
+        if output_json:
+            click.echo(json.dumps({"error": str(e), "issue_id": issue_id}))
+        else:
+            click.echo(f"Error: {e}", err=True)
 
 
 @instances.command()
@@ -350,85 +190,56 @@ def stop(issue_id: str, force: bool, timeout: int, output_json: bool) -> None:
 @click.option("--running-only", is_flag=True, help="Show only running instances")
 def list(output_json: bool, running_only: bool) -> None:
     """List all active instances."""
+    try:
+        result = call_orchestrator("instances.list", running_only=running_only)
+        instance_data = result["instances"]
 
-    async def _list() -> None:
-        try:
-            orchestrator = Orchestrator()
-            await orchestrator.initialize()
-
-            instances = orchestrator.list_instances()
-
-            if running_only:
-                instances = [i for i in instances if i.is_running()]
-
-            if not instances:
-                if output_json:
-                    click.echo(json.dumps({"instances": [], "total": 0}))
-                else:
-                    status_msg = "running" if running_only else "active"
-                    click.echo(f"No {status_msg} instances found.")
-                await orchestrator.cleanup()
-                return
-
-            # Gather instance information
-            instance_data: builtins.list[dict[str, Any]] = []
-            for instance in instances:
-                info = instance.get_info()
-                process_info = await instance.get_process_status()
-
-                if process_info:
-                    info.update(
-                        {
-                            "process_status": process_info.status.value,
-                            "cpu_percent": process_info.cpu_percent,
-                            "memory_mb": process_info.memory_mb,
-                        }
-                    )
-
-                instance_data.append(info)
-
-            if output_json:
-                click.echo(
-                    json.dumps(
-                        {
-                            "instances": instance_data,
-                            "total": len(instance_data),
-                            "filter": "running" if running_only else "all",
-                        },
-                        indent=2,
-                    )
-                )
-            else:
-                # Human-readable output
-                status_msg = "Running" if running_only else "Active"
-                click.echo(f"\n{status_msg} Claude Instances ({len(instance_data)}):\n")
-
-                for info in instance_data:
-                    status_indicator = "🟢" if info["status"] == "running" else "🔴"
-                    click.echo(f"{status_indicator} {info['issue_id']}")
-                    click.echo(f"   Status: {info['status']}")
-                    click.echo(f"   Workspace: {info['workspace_path']}")
-                    if info.get("process_id"):
-                        click.echo(f"   PID: {info['process_id']}")
-                        if (
-                            info.get("cpu_percent") is not None
-                            and info.get("memory_mb") is not None
-                        ):
-                            click.echo(
-                                f"   Resources: {info['cpu_percent']:.1f}% CPU, {info['memory_mb']:.1f} MB RAM"
-                            )
-                    click.echo()
-
-            await orchestrator.cleanup()
-
-        except Exception as e:
-            logger.error("Error listing instances", error=str(e))
+        if not instance_data:
             if output_json:
-                click.echo(json.dumps({"error": str(e)}))
+                click.echo(json.dumps({"instances": [], "total": 0}))
             else:
-                click.echo(f"Error: {e}", err=True)
+                status_msg = "running" if running_only else "active"
+                click.echo(f"No {status_msg} instances found.")
+            return
+
+        if output_json:
+            click.echo(
+                json.dumps(
+                    {
+                        "instances": instance_data,
+                        "total": len(instance_data),
+                        "filter": "running" if running_only else "all",
+                    },
+                    indent=2,
+                )
+            )
+        else:
+            # Human-readable output
+            status_msg = "Running" if running_only else "Active"
+            click.echo(f"\n{status_msg} Claude Instances ({len(instance_data)}):\n")
+
+            for info in instance_data:
+                status_indicator = "🟢" if info["status"] == "running" else "🔴"
+                click.echo(f"{status_indicator} {info['issue_id']}")
+                click.echo(f"   Status: {info['status']}")
+                click.echo(f"   Workspace: {info['workspace_path']}")
+                if info.get("process_id"):
+                    click.echo(f"   PID: {info['process_id']}")
+                    if (
+                        info.get("cpu_percent") is not None
+                        and info.get("memory_mb") is not None
+                    ):
+                        click.echo(
+                            f"   Resources: {info['cpu_percent']:.1f}% CPU, {info['memory_mb']:.1f} MB RAM"
+                        )
+                click.echo()
 
-    asyncio.run(_list())
+    except Exception as e:
+        logger.error("Error listing instances", error=str(e))
+        if output_json:
+            click.echo(json.dumps({"error": str(e)}))
+        else:
+            click.echo(f"Error: {e}", err=True)
 
 
 @instances.group()
@@ -437,62 +248,54 @@ def health() -> None:
     pass
 
 
+# Icons of the health status values
+HEALTH_ICONS = {
+    "healthy": "🟢",
+    "degraded": "🟡",
+    "unhealthy": "🟠",
+    "critical": "🔴",
+    "unknown": "⚪",
+}
+
+
 @health.command()
 @click.argument("issue_id")
 @click.option("--json", "output_json", is_flag=True, help="Output in JSON format")
 def check(issue_id: str, output_json: bool) -> None:
     """Perform a health check on a specific instance."""
-
-    async def _health_check() -> None:
-        try:
-            health_monitor = get_health_monitor()
-            result = await health_monitor.check_instance_health(issue_id)
-
-            if output_json:
-                # Convert enum to string value for JSON serialization
-                json_result = result.copy()
-                if "overall_status" in json_result and hasattr(
-                    json_result["overall_status"], "value"
-                ):
-                    json_result["overall_status"] = json_result["overall_status"].value
-                click.echo(json.dumps(json_result, indent=2, default=str))
-            else:
-                status = result["overall_status"]
-                status_icon = {
-                    HealthStatus.HEALTHY: "🟢",
-                    HealthStatus.DEGRADED: "🟡",
-                    HealthStatus.UNHEALTHY: "🟠",
-                    HealthStatus.CRITICAL: "🔴",
-                    HealthStatus.UNKNOWN: "⚪",
-                }.get(status, "❓")
-
-                click.echo(f"\nHealth Check Results for {issue_id}:")
-                click.echo(f"  Overall Status: {status_icon} {status.value.upper()}")
-                click.echo(f"  Duration: {result['duration_ms']:.1f}ms")
-
-                if "error" in result:
-                    click.echo(f"  Error: {result['error']}")
-                else:
-                    click.echo("  Individual Checks:")
-                    checks = result.get("checks", {})
-
-                    for check_name, check_result in checks.items():
-                        if isinstance(check_result, bool):
-                            icon = "✅" if check_result else "❌"
-                            click.echo(f"    {icon} {check_name}")
-                        elif check_result is not None:
-                            click.echo(f"    ℹ️  {check_name}: {check_result}")
-
-        except Exception as e:
-            logger.error(
-                "Error performing health check", issue_id=issue_id, error=str(e)
-            )
-            if output_json:
-                click.echo(json.dumps({"error": str(e)}))
-            else:
-                click.echo(f"Error: {e}", err=True)
-
-    asyncio.run(_health_check())
+    try:
+        result = call_orchestrator("health.check", issue_id=issue_id)
+
+        if output_json:
+            click.echo(json.dumps(result, indent=2, default=str))
+            return
+
+        status_val = result["overall_status"]
+        status_icon = HEALTH_ICONS.get(status_val, "❓")
+
+        click.echo(f"\nHealth Check Results for {issue_id}:")
+        click.echo(f"  Overall Status: {status_icon} {status_val.upper()}")
+        click.echo(f"  Duration: {result['duration_ms']:.1f}ms")
+
+        if "error" in result:
+            click.echo(f"  Error: {result['error']}")
+        else:
+            click.echo("  Individual Checks:")
+            checks = result.get("checks", {})
+
+            for check_name, check_result in checks.items():
+                if isinstance(check_result, bool):
+                    icon = "✅" if check_result else "❌"
+                    click.echo(f"    {icon} {check_name}")
+                elif check_result is not None:
+                    click.echo(f"    ℹ️  {check_name}: {check_result}")
+
+    except Exception as e:
+        logger.error("Error performing health check", issue_id=issue_id, error=str(e))
+        if output_json:
+            click.echo(json.dumps({"error": str(e)}))
+        else:
+            click.echo(f"Error: {e}", err=True)
 
 
 @health.command()
@@ -505,76 +308,42 @@ def check(issue_id: str, output_json: bool) -> None:
 # )
 def summary(output_json: bool) -> None:
     """Show health summary of all instances."""
+    try:
+        # For now, show health status of active processes
+        result = call_orchestrator("health.summary")
+        instance_health = result["instances"]
 
-    async def _health_status() -> None:
-        try:
-            # For now, show health status of active processes
-            health_monitor = get_health_monitor()
-            processes = await health_monitor.process_manager.list_processes()
-
-            if not processes:
-                if output_json:
-                    click.echo(json.dumps({"instances": [], "total": 0}))
-                else:
-                    click.echo("No active processes found to monitor.")
-                return
-
-            instance_health = []
-            for instance_id, _process_info in processes.items():
-
-                # Perform quick health check
-                health_result = await health_monitor.check_instance_health(instance_id)
-
-                health_data = {
-                    "issue_id": instance_id,
-                    "health_status": health_result["overall_status"].value,
-                    "process_status": health_result["checks"].get(
-                        "process_status", "unknown"
-                    ),
-                    "cpu_percent": health_result["checks"].get("cpu_percent", 0.0),
-                    "memory_mb": health_result["checks"].get("memory_mb", 0.0),
-                    "duration_ms": health_result["duration_ms"],
-                }
-                instance_health.append(health_data)
-
-            if output_json:
-                click.echo(
-                    json.dumps(
-                        {"instances": instance_health, "total": len(instance_health)},
-                        indent=2,
-                    )
-                )
-            else:
-                click.echo(
-                    f"\nInstance Health Status ({len(instance_health)} processes):\n"
-                )
-
-                for health_data in instance_health:
-                    status_val = health_data["health_status"]
-                    status_icon = {
-                        "healthy": "🟢",
-                        "degraded": "🟡",
-                        "unhealthy": "🟠",
-                        "critical": "🔴",
-                        "unknown": "⚪",
-                    }.get(status_val, "❓")
-
-                    click.echo(f"{status_icon} {health_data['issue_id']}")
-                    click.echo(f"   Status: {status_val.upper()}")
-                    click.echo(f"   Process: {health_data['process_status']}")
-                    click.echo(f"   CPU: {health_data['cpu_percent']:.1f}%")
-                    click.echo(f"   Memory: {health_data['memory_mb']:.1f} MB")
-                    click.echo(f"   Check Duration: {health_data['duration_ms']:.1f}ms")
-                    click.echo()
-
-        except Exception as e:
-            logger.error("Error getting health status", error=str(e))
+        if not instance_health:
             if output_json:
-                click.echo(json.dumps({"error": str(e)}))
+                click.echo(json.dumps({"instances": [], "total": 0}))
             else:
-                click.echo(f"Error: {e}", err=True)
-
-    asyncio.run(_health_status())
+                click.echo("No active processes found to monitor.")
+            return
+
+        if output_json:
+            click.echo(json.dumps(result, indent=2))
+            return
+
+        click.echo(f"\nInstance Health Status ({len(instance_health)} processes):\n")
+
+        for health_data in instance_health:
+            status_val = health_data["health_status"]
+            status_icon = HEALTH_ICONS.get(status_val, "❓")
+
+            click.echo(f"{status_icon} {health_data['issue_id']}")
+            click.echo(f"   Status: {status_val.upper()}")
+            click.echo(f"   Process: {health_data['process_status']}")
+            click.echo(f"   CPU: {health_data['cpu_percent']:.1f}%")
+            click.echo(f"   Memory: {health_data['memory_mb']:.1f} MB")
+            click.echo(f"   Check Duration: {health_data['duration_ms']:.1f}ms")
+            click.echo()
+
+    except Exception as e:
+        logger.error("Error getting health status", error=str(e))
+        if output_json:
+            click.echo(json.dumps({"error": str(e)}))
+        else:
+            click.echo(f"Error: {e}", err=True)
 
 
 @health.command()
@@ -585,166 +354,92 @@ def summary(output_json: bool) -> None:
 @click.option("--json", "output_json", is_flag=True, help="Output in JSON format")
 def history(issue_id: str, days: int, output_json: bool) -> None:
     """Show health check history for an instance."""
+    try:
+        # For now, just perform a current health check
+        # Full history would require database integration
+        result = call_orchestrator("health.history", issue_id=issue_id, days=days)
 
-    async def _health_history() -> None:
-        try:
-            # For now, just perform a current health check
-            # Full history would require database integration
-            health_monitor = get_health_monitor()
-            result = await health_monitor.check_instance_health(issue_id)
-
-            if "error" in result:
-                if output_json:
-                    click.echo(
-                        json.dumps({"error": result["error"], "instance_id": issue_id})
-                    )
-                else:
-                    click.echo(f"Error: {result['error']}")
-                return
-
-            # Create a single history entry with current status
-            history_data = [
-                {
-                    "timestamp": result["timestamp"],
-                    "status": result["overall_status"].value,
-                    "duration_ms": result["duration_ms"],
-                    "checks": result["checks"],
-                }
-            ]
-
+        if "error" in result:
             if output_json:
-                click.echo(
-                    json.dumps(
-                        {
-                            "instance_id": issue_id,
-                            "history": history_data,
-                            "total": 1,
-                            "note": "Full history requires database integration",
-                        },
-                        indent=2,
-                        default=str,
-                    )
-                )
+                click.echo(json.dumps(result))
             else:
-                click.echo(f"\nCurrent Health Status for {issue_id}:\n")
-                click.echo("(Full history requires database integration)\n")
-
-                entry = history_data[0]
-                status_val = entry["status"]
-                status_icon = {
-                    "healthy": "🟢",
-                    "degraded": "🟡",
-                    "unhealthy": "🟠",
-                    "critical": "🔴",
-                    "unknown": "⚪",
-                }.get(status_val, "❓")
-
-                click.echo(
-                    f"{status_icon} {entry['timestamp']} - {status_val.upper()} ({entry['duration_ms']:.1f}ms)"
-                )
-
-                # Show key check results
-                checks = entry.get("checks", {})
-                if checks.get("process_running") is False:
-                    click.echo("    ❌ Process not running")
-                elif checks.get("cpu_healthy") is False:
-                    click.echo(
-                        f"    ⚠️  High CPU usage: {checks.get('cpu_percent', 'N/A')}%"
-                    )
-                elif checks.get("memory_healthy") is False:
-                    click.echo(
-                        f"    ⚠️  High memory usage: {checks.get('memory_mb', 'N/A')} MB"
-                    )
-
-        except Exception as e:
-            logger.error(
-                "Error getting health history", issue_id=issue_id, error=str(e)
+                click.echo(f"Error: {result['error']}")
+            return
+
+        if output_json:
+            click.echo(json.dumps(result, indent=2, default=str))
+            return
+
+        click.echo(f"\nCurrent Health Status for {issue_id}:\n")
+        click.echo("(Full history requires database integration)\n")
+
+        entry = result["history"][0]
+        status_val = entry["status"]
+        status_icon = HEALTH_ICONS.get(status_val, "❓")
+
+        click.echo(
+            f"{status_icon} {entry['timestamp']} - {status_val.upper()} ({entry['duration_ms']:.1f}ms)"
+        )
+
+        # Show key check results
+        checks = entry.get("checks", {})
+        if checks.get("process_running") is False:
+            click.echo("    ❌ Process not running")
+        elif checks.get("cpu_healthy") is False:
+            click.echo(f"    ⚠️  High CPU usage: {checks.get('cpu_percent', 'N/A')}%")
+        elif checks.get("memory_healthy") is False:
+            click.echo(
+                f"    ⚠️  High memory usage: {checks.get('memory_mb', 'N/A')} MB"
             )
-            if output_json:
-                click.echo(json.dumps({"error": str(e)}))
-            else:
-                click.echo(f"Error: {e}", err=True)
 
-    asyncio.run(_health_history())
+    except Exception as e:
+        logger.error("Error getting health history", issue_id=issue_id, error=str(e))
+        if output_json:
+            click.echo(json.dumps({"error": str(e)}))
+        else:
+            click.echo(f"Error: {e}", err=True)
 
 
 @health.command()
 @click.option("--json", "output_json", is_flag=True, help="Output in JSON format")
 def overview(output_json: bool) -> None:
     """Show overall health overview of all instances."""
+    try:
+        # For now, show overview of active processes
+        overview_data = call_orchestrator("health.overview")
+        total_instances = overview_data["total_instances"]
 
-    async def _health_overview() -> None:
-        try:
-            # For now, show overview of active processes
-            health_monitor = get_health_monitor()
-            processes = await health_monitor.process_manager.list_processes()
-
-            if not processes:
-                if output_json:
-                    click.echo(
-                        json.dumps({"total_instances": 0, "health_percentage": 100.0})
-                    )
-                else:
-                    click.echo("No active processes found.")
-                return
-
-            # Calculate overview metrics from current processes
-            status_counts = {status.value: 0 for status in HealthStatus}
-            total_instances = len(processes)
-
-            for instance_id in processes:
-                try:
-                    health_result = await health_monitor.check_instance_health(
-                        instance_id
-                    )
-                    status = health_result["overall_status"]
-                    status_counts[status.value] += 1
-                except Exception:
-                    status_counts["unknown"] += 1
-
-            # Calculate overall health percentage
-            healthy_count = status_counts.get("healthy", 0)
-            overall_health_percentage = (healthy_count / max(total_instances, 1)) * 100
-
-            overview_data = {
-                "total_instances": total_instances,
-                "overall_health_percentage": overall_health_percentage,
-                "status_distribution": status_counts,
-                "timestamp": datetime.now().isoformat(),
-                "note": "Based on current running processes. Full metrics require database integration.",
-            }
-
+        if not total_instances:
             if output_json:
-                click.echo(json.dumps(overview_data, indent=2))
+                click.echo(json.dumps(overview_data))
             else:
-                click.echo("\n📊 Health Overview:\n")
-                click.echo(f"Total Active Processes: {total_instances}")
-                click.echo(f"Overall Health: {overall_health_percentage:.1f}%")
-                click.echo("(Based on current running processes)")
-
-                click.echo("\nStatus Distribution:")
-                for status_name, count in status_counts.items():
-                    if count > 0:
-                        icon = {
-                            "healthy": "🟢",
-                            "degraded": "🟡",
-                            "unhealthy": "🟠",
-                            "critical": "🔴",
-                            "unknown": "⚪",
-                        }.get(status_name, "❓")
-                        percentage = (count / total_instances) * 100
-                        click.echo(
-                            f"  {icon} {status_name.capitalize()}: {count} ({percentage:.1f}%)"
-                        )
-
-        except Exception as e:
-            logger.error("Error getting health overview", error=str(e))
-            if output_json:
-                click.echo(json.dumps({"error": str(e)}))
-            else:
-                click.echo(f"Error: {e}", err=True)
+                click.echo("No active processes found.")
+            return
+
+        if output_json:
+            click.echo(json.dumps(overview_data, indent=2))
+            return
+
+        click.echo("\n📊 Health Overview:\n")
+        click.echo(f"Total Active Processes: {total_instances}")
+        click.echo(f"Overall Health: {overview_data['overall_health_percentage']:.1f}%")
+        click.echo("(Based on current running processes)")
+
+        click.echo("\nStatus Distribution:")
+        for status_name, count in overview_data["status_distribution"].items():
+            if count > 0:
+                icon = HEALTH_ICONS.get(status_name, "❓")
+                percentage = (count / total_instances) * 100
+                click.echo(
+                    f"  {icon} {status_name.capitalize()}: {count} ({percentage:.1f}%)"
+                )
 
-    asyncio.run(_health_overview())
+    except Exception as e:
+        logger.error("Error getting health overview", error=str(e))
+        if output_json:
+            click.echo(json.dumps({"error": str(e)}))
+        else:
+            click.echo(f"Error: {e}", err=True)
 
 
 @health.command()
@@ -755,32 +450,24 @@ def overview(output_json: bool) -> None:
     "--interval", type=int, help="Health check interval in seconds (default: 30)"
 )
 def configure(enable: bool, interval: int | None) -> None:
-    """Configure health monitoring settings."""
-
-    async def _configure() -> None:
-        try:
-            health_monitor = get_health_monitor()
-
-            # Update configuration
-            if interval is not None:
-                health_monitor.check_interval = float(interval)
-                click.echo(f"Health check interval set to {interval} seconds")
-
-            health_monitor.enabled = enable
-            status_msg = "enabled" if enable else "disabled"
-            click.echo(f"Health monitoring {status_msg}")
-
-            # Restart monitoring with new settings if enabled
-            if enable:
-                await health_monitor.stop()
-                await health_monitor.start()
-                click.echo("Health monitoring restarted with new settings")
-            else:
-                await health_monitor.stop()
-                click.echo("Health monitoring stopped")
-
-        except Exception as e:
-            logger.error("Error configuring health monitoring", error=str(e))
-            click.echo(f"Error: {e}", err=True)
-
-    asyncio.run(_configure())
+    """Configure health monitoring settings.
+
+    With a running daemon the settings apply to its monitor; otherwise they
+    only last for this invocation.
+    """
+    try:
+        call_orchestrator("health.configure", enabled=enable, interval=interval)
+
+        if interval is not None:
+            click.echo(f"Health check interval set to {interval} seconds")
+        status_msg = "enabled" if enable else "disabled"
+        click.echo(f"Health monitoring {status_msg}")
+
+        if enable:
+            click.echo("Health monitoring restarted with new settings")
+        else:
+            click.echo("Health monitoring stopped")
+
+    except Exception as e:
+        logger.error("Error configuring health monitoring", error=str(e))
+        click.echo(f"Error: {e}", err=True)
@@ -1,27 +1,47 @@
 """Main CLI entry point for CC-Orchestrator."""
 
+import sys
 import warnings
+from typing import Any
 
 import click
 
-from .config import config
-from .instances import instances
-from .tasks import tasks
-from .tmux import tmux
-from .web import web
-from .worktrees import worktrees
+from .utils import LazyGroup
+
+# Command groups, imported when first used so that startup, --help and shell
+# completion do not load the database, git, tmux and web stacks
+SUBCOMMANDS = {
+    "instances": (
+        "cc_orchestrator.cli.instances:instances",
+        "Manage Claude Code instances.",
+    ),
+    "tasks": ("cc_orchestrator.cli.tasks:tasks", "Manage tasks and work items."),
+    "worktrees": ("cc_orchestrator.cli.worktrees:worktrees", "Manage git worktrees."),
+    "config": ("cc_orchestrator.cli.config:config", "Manage configuration settings."),
+    "web": ("cc_orchestrator.cli.web:web", "Manage the web interface."),
+    "tmux": (
+        "cc_orchestrator.cli.tmux:tmux",
+        "Manage tmux sessions for Claude Code instances.",
+    ),
+    "daemon": ("cc_orchestrator.cli.daemon:daemon", "Run the orchestrator daemon."),
+}
 
 # Suppress Pydantic serialization warnings globally for better CLI UX
 warnings.filterwarnings("ignore", message=".*Pydantic serializer warnings.*")
 
 
-@click.group()
+@click.group(cls=LazyGroup, lazy_subcommands=SUBCOMMANDS)
 @click.version_option(version="0.1.0", prog_name="cc-orchestrator")
 @click.option("--config", "-c", help="Configuration file path")
 @click.option("--profile", "-p", help="Configuration profile to use")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
 @click.option("--quiet", "-q", is_flag=True, help="Suppress non-essential output")
 @click.option("--json", is_flag=True, help="Output in JSON format")
+@click.option(
+    "--profile-report",
+    type=click.Path(dir_okay=False),
+    help="Profile the command with cProfile and tracemalloc, writing a report here",
+)
 # Configuration override flags
 @click.option("--max-instances", type=int, help="Override max_instances setting")
 @click.option("--web-port", type=int, help="Override web_port setting")
@@ -45,6 +65,7 @@ def main(
     worktree_base_path: str | None,
     cpu_threshold: float | None,
     memory_limit: int | None,
+    profile_report: str | None = None,
 ) -> None:
     """Claude Code Orchestrator - Manage multiple Claude instances through git worktrees.
 
@@ -59,6 +80,7 @@ def main(
     - config: Manage configuration settings
     - web: Control the web interface
     - tmux: Manage tmux sessions for persistent environments
+    - daemon: Run the orchestrator daemon that other commands talk to
     """
     ctx.ensure_object(dict)
     ctx.obj["config"] = config
@@ -86,14 +108,31 @@ def main(
     if verbose and quiet:
         raise click.UsageError("Cannot use both --verbose and --quiet options")
 
+    if profile_report:
+        _start_profiling(ctx, profile_report)
+
+
+def _start_profiling(ctx: click.Context, report_path: str) -> None:
+    """Profile the rest of the invocation, writing the report on exit."""
+    from ..utils.profiling import CommandProfiler
+
+    profiler = CommandProfiler(
+        report_path, title="cc-orchestrator " + " ".join(sys.argv[1:])
+    )
+
+    def finish() -> None:
+        path = profiler.stop()
+        click.echo(f"Profile report written to {path}", err=True)
+
+    profiler.start()
+    ctx.call_on_close(finish)
+
 
-# Add command groups
-main.add_command(instances)
-main.add_command(tasks)
-main.add_command(worktrees)
-main.add_command(config)
-main.add_command(web)
-main.add_command(tmux)
+def __getattr__(name: str) -> Any:
+    """Resolve ``from cc_orchestrator.cli.main import instances`` lazily."""
+    if name in SUBCOMMANDS:
+        return main.get_command(click.Context(main), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 """CLI utilities for output formatting and common functionality."""
 
+import importlib
 import json
 import sys
 from collections.abc import Callable
@@ -24,6 +25,89 @@ class CliError(Exception):
         self.exit_code = exit_code
 
 
+class LazyGroup(click.Group):
+    """Click group that imports its subcommands on first use.
+
+    Subcommands are declared as ``name -> ("module:attribute", short_help)``.
+    The module is imported only when the subcommand is invoked or resolved,
+    so ``--help`` and shell completion of the group never pay for the
+    dependencies of commands that are not run.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: dict[str, tuple[str, str]] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the group.
+
+        Args:
+            lazy_subcommands: Import path and short help of each subcommand
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List eager and lazy subcommand names."""
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Resolve a subcommand, importing it if needed."""
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_subcommands:
+            command = self._load(cmd_name)
+        return command
+
+    def _load(self, cmd_name: str) -> click.Command:
+        import_path, _ = self.lazy_subcommands[cmd_name]
+        module_name, attribute = import_path.split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{import_path} is not a click command")
+        # Later lookups hit the regular command table
+        self.add_command(command, cmd_name)
+        return command
+
+    def _short_help(self, ctx: click.Context, cmd_name: str, limit: int) -> str | None:
+        """Short help of a subcommand without importing it; None if hidden."""
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            help_text = self.lazy_subcommands[cmd_name][1]
+            return click.Command(cmd_name, help=help_text).get_short_help_str(limit)
+        command = self.get_command(ctx, cmd_name)
+        if command is None or command.hidden:
+            return None
+        return str(command.get_short_help_str(limit))
+
+    def format_commands(self, ctx: click.Context, formatter: Any) -> None:
+        """Write the command list using the declared short help."""
+        names = self.list_commands(ctx)
+        if not names:
+            return
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = []
+        for name in names:
+            short_help = self._short_help(ctx, name, limit)
+            if short_help is not None:
+                rows.append((name, short_help))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def shell_complete(self, ctx: click.Context, incomplete: str) -> list[Any]:
+        """Complete subcommand names without importing them."""
+        from click.shell_completion import CompletionItem
+
+        results = []
+        for name in self.list_commands(ctx):
+            if name.startswith(incomplete):
+                short_help = self._short_help(ctx, name, 45)
+                if short_help is not None:
+                    results.append(CompletionItem(name, help=short_help))
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
+
+
 def error_handler(func: Callable[..., Any]) -> Callable[..., Any]:
     """Decorator for handling CLI errors."""
 
@@ -6,6 +6,7 @@ from typing import Any
 
 import click
 
+from ..core.enums import WorktreeCheckoutMode
 from ..core.worktree_service import WorktreeService, WorktreeServiceError
 from ..utils.logging import LogContext, get_logger
 
@@ -72,6 +73,18 @@ def list(format: str, sync: bool) -> None:
 @click.option("--from-branch", help="Branch to checkout from (defaults to main/master)")
 @click.option("--instance-id", type=int, help="Associate with instance ID")
 @click.option("--force", is_flag=True, help="Force creation even if path exists")
+@click.option(
+    "--mode",
+    default=WorktreeCheckoutMode.FULL.value,
+    type=click.Choice([mode.value for mode in WorktreeCheckoutMode]),
+    help="How to check out files",
+)
+@click.option(
+    "--sparse-path",
+    "sparse_paths",
+    multiple=True,
+    help="Path the work touches (repeatable; used by --mode sparse)",
+)
 @click.option(
     "--format",
     default="table",
@@ -85,6 +98,8 @@ def create(
     from_branch: str | None,
     instance_id: int | None,
     force: bool,
+    mode: str,
+    sparse_paths: tuple[str, ...],
     format: str,
 ) -> None:
     """Create a new git worktree.
@@ -102,6 +117,8 @@ def create(
             custom_path=path,
             instance_id=instance_id,
             force=force,
+            checkout_mode=WorktreeCheckoutMode(mode),
+            sparse_paths=builtins.list(sparse_paths) or None,
         )
 
         if format == "json":
@@ -160,6 +177,32 @@ def remove(path_or_id: str, force: bool) -> None:
         raise click.Abort()
 
 
+@worktrees.command()
+@click.argument("path_or_id")
+@click.argument("paths", nargs=-1)
+def populate(path_or_id: str, paths: tuple[str, ...]) -> None:
+    """Check out files in a sparse or no-checkout worktree.
+
+    PATH_OR_ID: Worktree path or database ID
+    PATHS: Paths now needed (omit to check out everything)
+    """
+    try:
+        service = WorktreeService()
+
+        try:
+            target: int | str = int(path_or_id)
+        except ValueError:
+            target = path_or_id
+        service.populate_worktree(target, builtins.list(paths) or None)
+
+        click.echo(f"✓ Populated worktree: {path_or_id}")
+
+    except WorktreeServiceError as e:
+        logger.error(f"Failed to populate worktree: {e}")
+        click.echo(f"Error: {e}", err=True)
+        raise click.Abort()
+
+
 @worktrees.command()
 @click.option(
     "--format",
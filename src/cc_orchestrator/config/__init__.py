@@ -1,5 +1,22 @@
 """Configuration management module."""
 
-from .loader import OrchestratorConfig, find_config_file, load_config, save_config
+from .loader import (
+    OrchestratorConfig,
+    RetentionPolicy,
+    build_config,
+    find_config_file,
+    load_config,
+    save_config,
+)
+from .service import ConfigService, get_config_service
 
-__all__ = ["OrchestratorConfig", "load_config", "save_config", "find_config_file"]
+__all__ = [
+    "ConfigService",
+    "OrchestratorConfig",
+    "RetentionPolicy",
+    "load_config",
+    "save_config",
+    "find_config_file",
+    "build_config",
+    "get_config_service",
+]
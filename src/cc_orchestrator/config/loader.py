@@ -18,6 +18,29 @@ class ConfigurationError(Exception):
     pass
 
 
+class RetentionPolicy(BaseModel):
+    """Retention policy for a single table or log store."""
+
+    enabled: bool = Field(default=True, description="Whether pruning is enabled")
+    max_age_hours: float = Field(
+        default=168.0, description="Delete rows older than this many hours"
+    )
+    rollup_bucket_minutes: int | None = Field(
+        default=None,
+        description="Downsample expiring rows into buckets of this many minutes "
+        "before deleting them (None disables rollups)",
+    )
+
+
+def default_retention_policies() -> dict[str, RetentionPolicy]:
+    """Build the default per-table retention policies."""
+    return {
+        "health_checks": RetentionPolicy(max_age_hours=168.0, rollup_bucket_minutes=60),
+        "health_check_rollups": RetentionPolicy(max_age_hours=24.0 * 90),
+        "logs": RetentionPolicy(max_age_hours=24.0),
+    }
+
+
 class OrchestratorConfig(BaseModel):
     """Configuration model for CC-Orchestrator."""
 
@@ -47,12 +70,44 @@ class OrchestratorConfig(BaseModel):
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
     log_file: str | None = Field(default=None, description="Log file path")
+    log_async: bool = Field(
+        default=True,
+        description="Write logs from a background thread fed by a bounded queue",
+    )
+    log_queue_size: int = Field(
+        default=10000, description="Log records queued before new ones are dropped"
+    )
+    log_max_bytes: int = Field(
+        default=0, description="Rotate the log file at this size in bytes (0: never)"
+    )
+    log_rotate_when: str | None = Field(
+        default=None,
+        description="Rotate the log file on this interval (e.g. 'midnight')",
+    )
+    log_backup_count: int = Field(default=5, description="Rotated log files to keep")
+
+    # Request tracing
+    tracing_sample_rate: float = Field(
+        default=0.1, description="Fraction of root operations traced (0 disables)"
+    )
+    tracing_buffer_size: int = Field(
+        default=256, description="Finished traces kept for /debug/traces"
+    )
+    tracing_otlp_file: str | None = Field(
+        default=None, description="Append finished traces as OTLP JSON to this file"
+    )
 
     # Output formatting
     default_output_format: str = Field(
         default="human", description="Default output format"
     )
 
+    # Configuration reloading
+    config_watch_interval: float = Field(
+        default=2.0,
+        description="Seconds between checks of the config file for changes (0 disables)",
+    )
+
     # Health monitoring configuration
     health_check_interval: float = Field(
         default=30.0, description="Health check interval in seconds"
@@ -78,6 +133,103 @@ class OrchestratorConfig(BaseModel):
         default=300.0, description="Maximum delay between restart attempts in seconds"
     )
 
+    # Data retention configuration
+    retention_interval: float = Field(
+        default=3600.0, description="Interval between retention passes in seconds"
+    )
+    retention_batch_size: int = Field(
+        default=500, description="Maximum rows deleted per retention transaction"
+    )
+    retention_policies: dict[str, RetentionPolicy] = Field(
+        default_factory=default_retention_policies,
+        description="Retention policies keyed by table name",
+    )
+
+    # Task scheduler configuration
+    scheduler_enabled: bool = Field(
+        default=True, description="Automatically dispatch pending tasks to instances"
+    )
+    scheduler_interval: float = Field(
+        default=2.0, description="Maximum idle time between dispatch cycles in seconds"
+    )
+    scheduler_resync_interval: float = Field(
+        default=30.0,
+        description="Interval between full reloads of the pending queue in seconds",
+    )
+    scheduler_max_tasks_per_instance: int = Field(
+        default=1, description="Concurrent in-progress tasks allowed per instance"
+    )
+    scheduler_cpu_threshold: float = Field(
+        default=80.0,
+        description="Instances above this CPU percentage receive no new tasks",
+    )
+    scheduler_affinity_wait: float = Field(
+        default=60.0,
+        description="Seconds a task waits for the instance owning its worktree "
+        "before it may go to another instance",
+    )
+    scheduler_lease_seconds: int = Field(
+        default=3600, description="Minimum lease granted on dispatched tasks"
+    )
+
+    # Worktree filesystem watcher configuration
+    worktree_watcher_enabled: bool = Field(
+        default=True, description="Watch worktrees and cache their git status"
+    )
+    worktree_watch_debounce: float = Field(
+        default=0.5,
+        description="Quiet period after filesystem events before refreshing status",
+    )
+    worktree_watch_reconcile_interval: float = Field(
+        default=30.0,
+        description="Interval between reconciling watched paths with the database",
+    )
+
+    # Tmux
+    tmux_control_mode: bool = Field(
+        default=True,
+        description="Serve tmux session queries from a persistent control-mode "
+        "connection instead of one tmux process per query",
+    )
+    tmux_cleanup_concurrency: int = Field(
+        default=8,
+        description="Maximum tmux sessions destroyed in parallel during bulk cleanup",
+    )
+    tmux_reaper_enabled: bool = Field(
+        default=False,
+        description="Periodically destroy tmux sessions created for this "
+        "database that no instance in it claims",
+    )
+    tmux_reap_interval: float = Field(
+        default=300.0, description="Interval between orphaned session reaps"
+    )
+    tmux_reap_min_age: float = Field(
+        default=600.0,
+        description="Minimum age in seconds before an unclaimed session is reaped",
+    )
+    tmux_capture_enabled: bool = Field(
+        default=True,
+        description=(
+            "Pipe the output of orchestrator tmux panes into the log stream "
+            "of the web app or daemon"
+        ),
+    )
+    tmux_capture_dir: str | None = Field(
+        default=None,
+        description="Directory for pane output FIFOs (private temp dir if unset)",
+    )
+    tmux_capture_rate: float = Field(
+        default=65536.0,
+        description="Sustained pane output bytes per second logged per instance",
+    )
+    tmux_capture_burst: float = Field(
+        default=262144.0,
+        description="Pane output bytes an instance may log in a burst",
+    )
+    tmux_capture_max_line: int = Field(
+        default=4096, description="Pane output lines longer than this are truncated"
+    )
+
     # Performance settings (for testing float and Union types)
     cpu_threshold: float = Field(
         default=80.0, description="CPU usage threshold percentage"
@@ -95,17 +247,20 @@ def find_config_file(custom_path: str | None = None) -> Path | None:
             return path
         raise FileNotFoundError(f"Config file not found: {custom_path}")
 
-    # Search in standard locations
+    # Search in standard locations; plain os.path keeps this cheap since
+    # every cached load_config call repeats the search
+    cwd = os.getcwd()
+    home = os.path.expanduser("~")
     search_paths = [
-        Path.cwd() / "cc-orchestrator.yaml",
-        Path.cwd() / "cc-orchestrator.yml",
-        Path.home() / ".config" / "cc-orchestrator" / "config.yaml",
-        Path.home() / ".cc-orchestrator.yaml",
+        os.path.join(cwd, "cc-orchestrator.yaml"),
+        os.path.join(cwd, "cc-orchestrator.yml"),
+        os.path.join(home, ".config", "cc-orchestrator", "config.yaml"),
+        os.path.join(home, ".cc-orchestrator.yaml"),
     ]
 
     for path in search_paths:
-        if path.exists():
-            return path
+        if os.path.exists(path):
+            return Path(path)
 
     return None
 
@@ -139,7 +294,16 @@ def load_env_vars() -> dict[str, Any]:
         f"{prefix}GITHUB_REPO": "github_repo",
         f"{prefix}LOG_LEVEL": "log_level",
         f"{prefix}LOG_FILE": "log_file",
+        f"{prefix}LOG_ASYNC": "log_async",
+        f"{prefix}LOG_QUEUE_SIZE": "log_queue_size",
+        f"{prefix}LOG_MAX_BYTES": "log_max_bytes",
+        f"{prefix}LOG_ROTATE_WHEN": "log_rotate_when",
+        f"{prefix}LOG_BACKUP_COUNT": "log_backup_count",
+        f"{prefix}TRACING_SAMPLE_RATE": "tracing_sample_rate",
+        f"{prefix}TRACING_BUFFER_SIZE": "tracing_buffer_size",
+        f"{prefix}TRACING_OTLP_FILE": "tracing_otlp_file",
         f"{prefix}DEFAULT_OUTPUT_FORMAT": "default_output_format",
+        f"{prefix}CONFIG_WATCH_INTERVAL": "config_watch_interval",
         # Health monitoring
         f"{prefix}HEALTH_CHECK_INTERVAL": "health_check_interval",
         f"{prefix}HEALTH_CPU_THRESHOLD": "health_cpu_threshold",
@@ -149,6 +313,32 @@ def load_env_vars() -> dict[str, Any]:
         f"{prefix}RESTART_MAX_ATTEMPTS": "restart_max_attempts",
         f"{prefix}RESTART_BASE_DELAY": "restart_base_delay",
         f"{prefix}RESTART_MAX_DELAY": "restart_max_delay",
+        # Data retention
+        f"{prefix}RETENTION_INTERVAL": "retention_interval",
+        f"{prefix}RETENTION_BATCH_SIZE": "retention_batch_size",
+        # Task scheduler
+        f"{prefix}SCHEDULER_ENABLED": "scheduler_enabled",
+        f"{prefix}SCHEDULER_INTERVAL": "scheduler_interval",
+        f"{prefix}SCHEDULER_RESYNC_INTERVAL": "scheduler_resync_interval",
+        f"{prefix}SCHEDULER_MAX_TASKS_PER_INSTANCE": "scheduler_max_tasks_per_instance",
+        f"{prefix}SCHEDULER_CPU_THRESHOLD": "scheduler_cpu_threshold",
+        f"{prefix}SCHEDULER_AFFINITY_WAIT": "scheduler_affinity_wait",
+        f"{prefix}SCHEDULER_LEASE_SECONDS": "scheduler_lease_seconds",
+        # Worktree watcher
+        f"{prefix}WORKTREE_WATCHER_ENABLED": "worktree_watcher_enabled",
+        f"{prefix}WORKTREE_WATCH_DEBOUNCE": "worktree_watch_debounce",
+        f"{prefix}WORKTREE_WATCH_RECONCILE_INTERVAL": "worktree_watch_reconcile_interval",
+        # Tmux
+        f"{prefix}TMUX_CONTROL_MODE": "tmux_control_mode",
+        f"{prefix}TMUX_CLEANUP_CONCURRENCY": "tmux_cleanup_concurrency",
+        f"{prefix}TMUX_REAPER_ENABLED": "tmux_reaper_enabled",
+        f"{prefix}TMUX_REAP_INTERVAL": "tmux_reap_interval",
+        f"{prefix}TMUX_REAP_MIN_AGE": "tmux_reap_min_age",
+        f"{prefix}TMUX_CAPTURE_ENABLED": "tmux_capture_enabled",
+        f"{prefix}TMUX_CAPTURE_DIR": "tmux_capture_dir",
+        f"{prefix}TMUX_CAPTURE_RATE": "tmux_capture_rate",
+        f"{prefix}TMUX_CAPTURE_BURST": "tmux_capture_burst",
+        f"{prefix}TMUX_CAPTURE_MAX_LINE": "tmux_capture_max_line",
     }
 
     for env_var, config_key in env_mappings.items():
@@ -161,23 +351,53 @@ def load_env_vars() -> dict[str, Any]:
                 "web_port",
                 "health_memory_threshold_mb",
                 "restart_max_attempts",
+                "retention_batch_size",
+                "scheduler_max_tasks_per_instance",
+                "scheduler_lease_seconds",
+                "tmux_cleanup_concurrency",
+                "log_queue_size",
+                "log_max_bytes",
+                "log_backup_count",
+                "tmux_capture_max_line",
+                "tracing_buffer_size",
             ]:
                 try:
                     config[config_key] = int(env_value)
                 except ValueError:
                     continue
             elif config_key in [
+                "config_watch_interval",
                 "health_check_interval",
                 "health_cpu_threshold",
                 "health_response_timeout",
                 "restart_base_delay",
                 "restart_max_delay",
+                "retention_interval",
+                "scheduler_interval",
+                "scheduler_resync_interval",
+                "scheduler_cpu_threshold",
+                "scheduler_affinity_wait",
+                "worktree_watch_debounce",
+                "worktree_watch_reconcile_interval",
+                "tmux_reap_interval",
+                "tmux_reap_min_age",
+                "tmux_capture_rate",
+                "tmux_capture_burst",
+                "tracing_sample_rate",
             ]:
                 try:
                     config[config_key] = float(env_value)
                 except ValueError:
                     continue
-            elif config_key == "auto_cleanup":
+            elif config_key in (
+                "auto_cleanup",
+                "log_async",
+                "scheduler_enabled",
+                "worktree_watcher_enabled",
+                "tmux_control_mode",
+                "tmux_reaper_enabled",
+                "tmux_capture_enabled",
+            ):
                 config[config_key] = env_value.lower() in ("true", "1", "yes", "on")
             else:
                 config[config_key] = env_value
@@ -197,11 +417,37 @@ def load_config(
     2. Environment variables
     3. Configuration file (with profile support)
     4. Default values
+
+    Without CLI overrides the result comes from the ``ConfigService`` cache,
+    which only rebuilds it when the file or the environment changed. Treat
+    the returned configuration as read-only.
+    """
+    if cli_overrides:
+        return build_config(find_config_file(config_path), profile, cli_overrides)
+
+    from .service import get_config_service
+
+    return get_config_service().get(config_path, profile)
+
+
+def build_config(
+    config_file: Path | None,
+    profile: str | None = None,
+    cli_overrides: dict[str, Any] | None = None,
+) -> OrchestratorConfig:
+    """Parse and validate configuration without caching.
+
+    Args:
+        config_file: Configuration file to read, if any
+        profile: Profile of the file to apply
+        cli_overrides: CLI flag overrides
+
+    Returns:
+        Validated configuration
     """
     config_data = {}
 
     # Load from file if available
-    config_file = find_config_file(config_path)
     if config_file:
         file_data = load_config_file(config_file)
 
@@ -0,0 +1,279 @@
+"""
+Cached configuration with hot reload.
+
+Building a configuration parses the YAML file and validates
+``OrchestratorConfig``, which dominates the cost of ``load_config``.
+``ConfigService`` keeps each validated configuration keyed by the identity
+of its file (path, mtime, size, inode), the profile and a fingerprint of the
+``CC_ORCHESTRATOR_*`` environment, so a repeated load costs a few ``stat``
+calls. Its watch loop polls that key and publishes the
+new configuration to listeners whenever it changed, which lets long-running
+services such as the health monitor pick up edits without a restart.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from ..utils.logging import LogContext, get_logger
+from . import loader
+from .loader import OrchestratorConfig
+
+logger = get_logger(__name__, LogContext.ORCHESTRATOR)
+
+# Prefix of the environment variables that override file settings
+ENV_PREFIX = "CC_ORCHESTRATOR_"
+
+# A file written this recently may be rewritten within the same mtime tick
+# without its key changing, so a cached parse of it is not trusted yet
+RACY_WINDOW = 2.0
+
+ConfigListener = Callable[[OrchestratorConfig], None]
+
+
+class ConfigKey(NamedTuple):
+    """Everything a loaded configuration depends on."""
+
+    path: str | None
+    mtime_ns: int
+    size: int
+    inode: int
+    profile: str | None
+    env: tuple[tuple[Any, Any], ...]
+
+
+def env_fingerprint() -> tuple[tuple[Any, Any], ...]:
+    """Get the environment variables that can override the configuration."""
+    # The bytes environment skips decoding every variable on each call
+    if os.supports_bytes_environ:
+        prefix = ENV_PREFIX.encode()
+        return tuple(sorted(i for i in os.environb.items() if i[0].startswith(prefix)))
+    return tuple(sorted(i for i in os.environ.items() if i[0].startswith(ENV_PREFIX)))
+
+
+def config_key(config_file: Path | None, profile: str | None) -> ConfigKey | None:
+    """Get the cache key of a configuration.
+
+    Args:
+        config_file: Configuration file, if any
+        profile: Profile applied to the file
+
+    Returns:
+        The key, or None if the file vanished since it was found
+    """
+    if config_file is None:
+        return ConfigKey(None, 0, 0, 0, profile, env_fingerprint())
+    try:
+        stat = config_file.stat()
+    except OSError:
+        return None
+    return ConfigKey(
+        str(config_file),
+        stat.st_mtime_ns,
+        stat.st_size,
+        stat.st_ino,
+        profile,
+        env_fingerprint(),
+    )
+
+
+def _is_racy(key: ConfigKey) -> bool:
+    return key.path is not None and time.time() - key.mtime_ns / 1e9 < RACY_WINDOW
+
+
+class ConfigService:
+    """Caches validated configuration and reloads it when it changes."""
+
+    def __init__(
+        self, config_path: str | None = None, profile: str | None = None
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            config_path: Configuration file the watch loop follows
+            profile: Profile the watch loop follows
+        """
+        self.config_path = config_path
+        self.profile = profile
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: dict[
+            tuple[str | None, str | None], tuple[ConfigKey, OrchestratorConfig]
+        ] = {}
+        self._lock = threading.Lock()
+        self._listeners: list[ConfigListener] = []
+        self._published: OrchestratorConfig | None = None
+
+        self.watch_task: asyncio.Task | None = None
+        self.shutdown_event = asyncio.Event()
+
+    def get(
+        self, config_path: str | None = None, profile: str | None = None
+    ) -> OrchestratorConfig:
+        """Get a configuration, rebuilding it only when its inputs changed.
+
+        Args:
+            config_path: Custom configuration file
+            profile: Configuration profile to apply
+
+        Returns:
+            Validated configuration, shared between callers
+        """
+        config_file = loader.find_config_file(config_path)
+        key = config_key(config_file, profile)
+        request = (config_path, profile)
+
+        with self._lock:
+            cached = self._entries.get(request)
+        if cached is not None and cached[0] == key and not _is_racy(key):
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        config = loader.build_config(config_file, profile)
+        if key is not None:
+            with self._lock:
+                self._entries[request] = (key, config)
+        return config
+
+    @property
+    def current(self) -> OrchestratorConfig:
+        """The configuration followed by the watch loop, as of now."""
+        config = self.get(self.config_path, self.profile)
+        if self._published is None:
+            self._published = config
+        return config
+
+    def invalidate(self) -> None:
+        """Drop all cached configurations."""
+        with self._lock:
+            self._entries.clear()
+
+    def add_listener(self, listener: ConfigListener) -> None:
+        """Register a callback invoked with the new configuration on reload.
+
+        Callbacks run on the event loop of the watch loop and must not block.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: ConfigListener) -> None:
+        """Unregister a reload callback."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def reload(self) -> bool:
+        """Reload the followed configuration and publish it if it changed.
+
+        An invalid edit keeps the previous configuration in effect.
+
+        Returns:
+            True if listeners were notified of a new configuration
+        """
+        previous = self._published
+        try:
+            config = self.current
+        except Exception as e:
+            logger.error("Failed to reload configuration", error=str(e))
+            return False
+
+        if previous is None or config is previous:
+            return False
+        self._published = config
+        if config == previous:
+            return False
+
+        changed = sorted(
+            name
+            for name in OrchestratorConfig.model_fields
+            if getattr(config, name) != getattr(previous, name)
+        )
+        logger.info("Configuration reloaded", changed=changed)
+        for listener in list(self._listeners):
+            try:
+                listener(config)
+            except Exception as e:
+                logger.warning(f"Configuration listener failed: {e}")
+        return True
+
+    async def start(self) -> None:
+        """Start watching the configuration for changes."""
+        if self.watch_task and not self.watch_task.done():
+            logger.warning("Configuration watcher is already running")
+            return
+
+        interval = self.current.config_watch_interval
+        if interval <= 0:
+            logger.info("Configuration watching disabled")
+            return
+
+        logger.info("Starting configuration watcher", interval=interval)
+        self.shutdown_event.clear()
+        self.watch_task = asyncio.create_task(self._watch_loop())
+
+    async def stop(self) -> None:
+        """Stop watching the configuration."""
+        self.shutdown_event.set()
+
+        if self.watch_task:
+            try:
+                await asyncio.wait_for(self.watch_task, timeout=5.0)
+            except TimeoutError:
+                self.watch_task.cancel()
+                try:
+                    await self.watch_task
+                except asyncio.CancelledError:
+                    pass
+            self.watch_task = None
+
+    def _interval(self) -> float:
+        published = self._published
+        if published is None or published.config_watch_interval <= 0:
+            return 2.0
+        return published.config_watch_interval
+
+    async def _watch_loop(self) -> None:
+        """Poll the configuration until shutdown is requested."""
+        try:
+            while not self.shutdown_event.is_set():
+                try:
+                    await asyncio.wait_for(
+                        self.shutdown_event.wait(),
+                        timeout=self._interval(),
+                    )
+                    break
+                except TimeoutError:
+                    pass
+                self.reload()
+
+        except asyncio.CancelledError:
+            logger.info("Configuration watcher cancelled")
+            raise
+
+
+# Global configuration service
+_config_service: ConfigService | None = None
+
+
+def get_config_service() -> ConfigService:
+    """Get the global configuration service.
+
+    Returns:
+        ConfigService instance
+    """
+    global _config_service
+    if _config_service is None:
+        _config_service = ConfigService()
+    return _config_service
+
+
+async def cleanup_config_service() -> None:
+    """Stop and drop the global configuration service."""
+    global _config_service
+    if _config_service is not None:
+        await _config_service.stop()
+        _config_service = None
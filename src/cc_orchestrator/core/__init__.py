@@ -1,6 +1,22 @@
 """Core orchestration functionality."""
 
-from .instance import ClaudeInstance
-from .orchestrator import Orchestrator
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .instance import ClaudeInstance
+    from .orchestrator import Orchestrator
 
 __all__ = ["Orchestrator", "ClaudeInstance"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the orchestrator classes on first access."""
+    if name == "Orchestrator":
+        from .orchestrator import Orchestrator
+
+        return Orchestrator
+    if name == "ClaudeInstance":
+        from .instance import ClaudeInstance
+
+        return ClaudeInstance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,5 +12,14 @@ class InstanceStatus(Enum):
     ERROR = "error"
 
 
+class WorktreeCheckoutMode(Enum):
+    """How a new worktree's files are materialized."""
+
+    FULL = "full"  # Regular checkout of the whole tree
+    SPARSE = "sparse"  # Cone-mode sparse checkout of selected directories
+    NO_CHECKOUT = "no_checkout"  # Top-level files only; populate lazily
+    REFLINK = "reflink"  # Copy-on-write clones of the main worktree's files
+
+
 # Alias for compatibility
 InstanceState = InstanceStatus
@@ -1,7 +1,12 @@
 """Git operations for worktree management."""
 
+import errno
+import fcntl
+import hashlib
 import os
 import shutil
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -9,9 +14,23 @@ from git import Repo
 from git.exc import GitCommandError, InvalidGitRepositoryError
 
 from ..utils.logging import LogContext, get_logger
+from .enums import WorktreeCheckoutMode
+from .git_runner import GitRunner, get_git_runner
 
 logger = get_logger(__name__, LogContext.WORKTREE)
 
+# Ahead/behind counts memoized by (local sha, upstream sha). Commits are
+# immutable, so an entry never goes stale; the bound only caps memory.
+AHEAD_BEHIND_CACHE_SIZE = 1024
+_ahead_behind_cache: OrderedDict[tuple[str, str], tuple[int, int]] = OrderedDict()
+_ahead_behind_lock = threading.Lock()
+
+# Linux ioctl cloning a file's extents into another (btrfs, XFS, bcachefs)
+FICLONE = 0x40049409
+
+# Reflink support per filesystem device, probed once
+_reflink_support: dict[int, bool] = {}
+
 
 class GitError(Exception):
     """Base exception for git operations."""
@@ -86,6 +105,11 @@ class GitWorktreeManager:
                 ) from e
         return self._repo
 
+    @property
+    def runner(self) -> GitRunner:
+        """Get the shared git runner for this repository."""
+        return get_git_runner(self.repo_path)
+
     def list_worktrees(self) -> list[dict[str, str]]:
         """List all git worktrees.
 
@@ -95,36 +119,16 @@ class GitWorktreeManager:
             - branch: Branch name
             - commit: Current commit SHA
             - status: Status (bare, detached, etc.)
+            - locked: Lock reason, present only for locked worktrees
+            - prunable: Prune reason, present only for prunable worktrees
         """
         try:
-            # Use git worktree list command
-            worktree_output = self.repo.git.worktree("list", "--porcelain")
-
-            worktrees: list[dict[str, str]] = []
-            current_worktree: dict[str, str] = {}
-
-            for line in worktree_output.split("\n"):
-                if not line.strip():
-                    if current_worktree:
-                        worktrees.append(current_worktree)
-                        current_worktree = {}
-                    continue
-
-                if line.startswith("worktree "):
-                    current_worktree["path"] = line[9:]  # Remove "worktree " prefix
-                elif line.startswith("HEAD "):
-                    current_worktree["commit"] = line[5:]
-                elif line.startswith("branch "):
-                    current_worktree["branch"] = line[7:]  # Remove "branch " prefix
-                elif line.startswith("detached"):
-                    current_worktree["status"] = "detached"
-                elif line.startswith("bare"):
-                    current_worktree["status"] = "bare"
-
-            # Add the last worktree if exists
-            if current_worktree:
-                worktrees.append(current_worktree)
+            # NUL separated output keeps paths and lock reasons with
+            # newlines intact
+            with self.runner.timed("worktree list"):
+                worktree_output = self.repo.git.worktree("list", "--porcelain", "-z")
 
+            worktrees = parse_worktree_list(worktree_output)
             logger.info(f"Found {len(worktrees)} worktrees")
             return worktrees
 
@@ -138,6 +142,8 @@ class GitWorktreeManager:
         branch: str,
         checkout_branch: str | None = None,
         force: bool = False,
+        mode: WorktreeCheckoutMode = WorktreeCheckoutMode.FULL,
+        sparse_paths: list[str] | None = None,
     ) -> dict[str, str]:
         """Create a new git worktree.
 
@@ -146,12 +152,20 @@ class GitWorktreeManager:
             branch: Name of the new branch to create for the worktree
             checkout_branch: Existing branch to checkout (defaults to main/master)
             force: Force creation even if path exists
+            mode: How to materialize the worktree's files. ``SPARSE`` checks
+                out only the directories containing ``sparse_paths``;
+                ``NO_CHECKOUT`` checks out only top-level files (an empty
+                cone-mode sparse checkout) until ``populate_worktree``;
+                ``REFLINK`` clones unchanged files from the main worktree
+                copy-on-write and falls back to ``FULL`` where unsupported.
+            sparse_paths: Paths the work touches (required for ``SPARSE``)
 
         Returns:
             Dictionary with worktree information:
             - path: Full path to the created worktree
             - branch: Branch name
             - commit: Current commit SHA
+            - checkout_mode: Checkout mode actually used
 
         Raises:
             GitWorktreeError: If worktree creation fails
@@ -181,22 +195,42 @@ class GitWorktreeManager:
             # Create the worktree
             logger.info(f"Creating worktree at {abs_path} with branch {branch}")
 
+            if mode is WorktreeCheckoutMode.SPARSE and not sparse_paths:
+                raise GitWorktreeError("Sparse checkout requires sparse_paths")
+            if mode is WorktreeCheckoutMode.REFLINK and not reflink_supported(
+                self.repo_path, os.path.dirname(abs_path)
+            ):
+                logger.info("Reflinks unsupported here, using a full checkout")
+                mode = WorktreeCheckoutMode.FULL
+
             cmd_args = ["add"]
             if force:
                 cmd_args.append("--force")
+            if mode is not WorktreeCheckoutMode.FULL:
+                cmd_args.append("--no-checkout")
             cmd_args.extend(["-b", branch, abs_path, checkout_branch])
 
-            self.repo.git.worktree(*cmd_args)
+            with self.runner.timed("worktree add"):
+                self.repo.git.worktree(*cmd_args)
+
+            if mode is WorktreeCheckoutMode.SPARSE:
+                self.populate_worktree(abs_path, sparse_paths)
+            elif mode is WorktreeCheckoutMode.NO_CHECKOUT:
+                # An empty cone still writes the index, so the worktree reads
+                # as clean and can be removed without force
+                self.populate_worktree(abs_path, [])
+            elif mode is WorktreeCheckoutMode.REFLINK:
+                self._reflink_checkout(abs_path)
 
             # Get the commit SHA of the created worktree
-            worktree_repo = Repo(abs_path)
-            commit_sha = worktree_repo.head.commit.hexsha
+            commit_sha = self.resolve_head(abs_path)
 
             result = {
                 "path": abs_path,
                 "branch": branch,
                 "commit": commit_sha,
                 "status": "active",
+                "checkout_mode": mode.value,
             }
 
             logger.info(f"Successfully created worktree: {result}")
@@ -209,6 +243,167 @@ class GitWorktreeManager:
             logger.error(f"Unexpected error creating worktree: {e}")
             raise GitWorktreeError(f"Unexpected error creating worktree: {e}") from e
 
+    def resolve_head(self, path: str, worktree_repo: Repo | None = None) -> str:
+        """Resolve the commit a worktree's HEAD points to.
+
+        Worktrees of this repository are resolved through the runner's
+        persistent ``cat-file --batch-check`` session, which can address any
+        worktree's HEAD from the shared repository as ``worktrees/<name>/HEAD``
+        (or ``main-worktree/HEAD``). Other paths fall back to GitPython.
+
+        Args:
+            path: Path to the worktree
+            worktree_repo: Already opened repository for the fallback
+
+        Returns:
+            The HEAD commit SHA
+        """
+        rev = self._head_revision(path)
+        commit = self.runner.resolve(rev) if rev else None
+        if commit is None:
+            commit = (worktree_repo or Repo(path)).head.commit.hexsha
+        return commit
+
+    def _head_revision(self, path: str) -> str | None:
+        """Name a worktree's HEAD relative to this repository, if it has one."""
+        try:
+            dirs = resolve_git_dirs(path)
+            own_dirs = resolve_git_dirs(self.repo_path)
+            if dirs is None or own_dirs is None:
+                return None
+            git_dir, common_dir = dirs
+            if not os.path.samefile(common_dir, own_dirs[1]):
+                return None
+            if os.path.samefile(git_dir, own_dirs[0]):
+                return "HEAD"
+            if os.path.samefile(git_dir, common_dir):
+                return "main-worktree/HEAD"
+        except OSError:
+            return None
+        return f"worktrees/{os.path.basename(git_dir)}/HEAD"
+
+    def populate_worktree(self, path: str, paths: list[str] | None = None) -> None:
+        """Check out files in a sparse or ``--no-checkout`` worktree.
+
+        With ``paths``, the directories containing them are added to the
+        worktree's cone-mode sparse checkout, so repeated calls widen the
+        checkout incrementally. Without ``paths`` the whole tree is checked
+        out and sparse checkout is turned off.
+
+        Args:
+            path: Worktree path
+            paths: Repository-relative paths that are needed
+
+        Raises:
+            GitWorktreeError: If population fails
+        """
+        abs_path = os.path.abspath(path)
+        try:
+            dirs = resolve_git_dirs(abs_path)
+            populated = dirs is not None and os.path.exists(
+                os.path.join(dirs[0], "index")
+            )
+            sparse = populated and self._is_sparse(abs_path)
+
+            if paths is None:
+                if sparse:
+                    self.runner.run("sparse-checkout", "disable", cwd=abs_path)
+                elif not populated:
+                    self.runner.run("read-tree", "-mu", "HEAD", cwd=abs_path)
+                return
+
+            directories = cone_directories(paths)
+            if sparse:
+                if directories:
+                    self.runner.run(
+                        "sparse-checkout", "add", "--", *directories, cwd=abs_path
+                    )
+                return
+            if populated:
+                # Already a full checkout; nothing is missing
+                return
+
+            self.runner.run(
+                "sparse-checkout", "set", "--cone", "--", *directories, cwd=abs_path
+            )
+            self.runner.run("read-tree", "-mu", "HEAD", cwd=abs_path)
+            logger.info(
+                f"Populated {abs_path} with sparse directories: {directories or '/'}"
+            )
+        except (GitCommandError, OSError) as e:
+            logger.error(f"Failed to populate worktree {abs_path}: {e}")
+            raise GitWorktreeError(f"Failed to populate worktree: {e}") from e
+
+    def _is_sparse(self, path: str) -> bool:
+        try:
+            value = self.runner.run(
+                "config", "--get", "core.sparseCheckout", cwd=path
+            ).strip()
+        except GitCommandError:
+            return False
+        return value == "true"
+
+    def _reflink_checkout(self, path: str) -> int:
+        """Populate a ``--no-checkout`` worktree by cloning unchanged files.
+
+        Files whose blob in the new HEAD matches a clean file in the main
+        worktree are reflinked (sharing extents until written); everything
+        else is checked out normally.
+
+        Returns:
+            Number of files cloned
+        """
+        # Index for the new worktree, without touching the filesystem
+        self.runner.run("read-tree", "HEAD", cwd=path)
+
+        source_blobs = {}
+        for entry in self.runner.run("ls-files", "-s", "-z").split("\0"):
+            if entry:
+                info, _, file_path = entry.partition("\t")
+                _, sha, stage = info.split()
+                if stage == "0":
+                    source_blobs[file_path] = sha
+        modified = set(self.runner.run("diff", "--name-only", "-z").split("\0"))
+
+        cloned = 0
+        missing = []
+        for entry in self.runner.run("ls-tree", "-r", "-z", "HEAD", cwd=path).split(
+            "\0"
+        ):
+            if not entry:
+                continue
+            info, _, file_path = entry.partition("\t")
+            file_mode, object_type, sha = info.split()
+            if object_type != "blob":
+                continue
+            if (
+                file_mode not in ("100644", "100755")
+                or source_blobs.get(file_path) != sha
+                or file_path in modified
+            ):
+                missing.append(file_path)
+                continue
+
+            target = os.path.join(path, file_path)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            try:
+                _clone_file(os.path.join(self.repo_path, file_path), target)
+            except OSError as e:
+                logger.debug(f"Reflink of {file_path} failed, checking out: {e}")
+                missing.append(file_path)
+                continue
+            os.chmod(target, 0o755 if file_mode == "100755" else 0o644)
+            cloned += 1
+
+        # Write whatever was not cloned, then record stat info for clones
+        if missing:
+            self.runner.run(
+                "checkout-index", "-z", "--stdin", cwd=path, input="\0".join(missing)
+            )
+        self.runner.run("update-index", "-q", "--refresh", cwd=path)
+        logger.info(f"Reflinked {cloned} files into {path}")
+        return cloned
+
     def remove_worktree(self, path: str, force: bool = False) -> bool:
         """Remove a git worktree.
 
@@ -250,7 +445,8 @@ class GitWorktreeManager:
                 cmd_args.append("--force")
             cmd_args.append(abs_path)
 
-            self.repo.git.worktree(*cmd_args)
+            with self.runner.timed("worktree remove"):
+                self.repo.git.worktree(*cmd_args)
 
             # Clean up any remaining directory if it still exists
             if os.path.exists(abs_path):
@@ -286,7 +482,7 @@ class GitWorktreeManager:
 
             # Get list of current worktrees
             worktrees = self.list_worktrees()
-            cleaned_paths = []
+            stale_paths = []
 
             for worktree in worktrees:
                 path = worktree.get("path")
@@ -300,13 +496,19 @@ class GitWorktreeManager:
                 # Check if the path exists
                 if not os.path.exists(path):
                     logger.info(f"Found stale worktree reference: {path}")
-                    try:
-                        # Use prune to clean up the reference
-                        self.repo.git.worktree("prune")
-                        cleaned_paths.append(path)
-                        logger.info(f"Cleaned up stale reference: {path}")
-                    except GitCommandError as e:
-                        logger.warning(f"Could not clean up {path}: {e}")
+                    stale_paths.append(path)
+
+            cleaned_paths = []
+            if stale_paths:
+                try:
+                    # One prune clears every stale reference; concurrent
+                    # cleanups share a single run
+                    self.runner.coalesce(
+                        "worktree prune", lambda: self.repo.git.worktree("prune")
+                    )
+                    cleaned_paths = stale_paths
+                except GitCommandError as e:
+                    logger.warning(f"Could not prune stale worktrees: {e}")
 
             if not cleaned_paths:
                 logger.info("No stale worktree references found")
@@ -347,12 +549,14 @@ class GitWorktreeManager:
             if not os.path.exists(abs_path):
                 raise GitWorktreeError(f"Worktree path {abs_path} does not exist")
 
-            # Get repository for this worktree
+            # Get repository for this worktree; its status checks run in the
+            # background and must not rewrite the index
             worktree_repo = Repo(abs_path)
+            worktree_repo.git.update_environment(GIT_OPTIONAL_LOCKS="0")
 
             # Get basic information
             current_branch = worktree_repo.active_branch.name
-            current_commit = worktree_repo.head.commit.hexsha
+            current_commit = self.resolve_head(abs_path, worktree_repo)
             is_dirty = worktree_repo.is_dirty()
 
             # Check for uncommitted changes (including untracked files)
@@ -366,20 +570,11 @@ class GitWorktreeManager:
             ahead = 0
             behind = 0
             try:
-                if worktree_repo.active_branch.tracking_branch():
-                    commits_ahead_behind = list(
-                        worktree_repo.iter_commits(
-                            f"{worktree_repo.active_branch.tracking_branch()}..{current_branch}"
-                        )
+                tracking_branch = worktree_repo.active_branch.tracking_branch()
+                if tracking_branch:
+                    ahead, behind = count_ahead_behind(
+                        worktree_repo, current_commit, tracking_branch.commit.hexsha
                     )
-                    ahead = len(commits_ahead_behind)
-
-                    commits_behind = list(
-                        worktree_repo.iter_commits(
-                            f"{current_branch}..{worktree_repo.active_branch.tracking_branch()}"
-                        )
-                    )
-                    behind = len(commits_behind)
             except Exception as e:
                 logger.debug(f"Could not get remote tracking info for {path}: {e}")
 
@@ -402,6 +597,108 @@ class GitWorktreeManager:
             logger.error(f"Failed to get worktree status for {path}: {e}")
             raise GitWorktreeError(f"Failed to get worktree status: {e}") from e
 
+    def get_worktree_statuses(
+        self, paths: list[str], max_workers: int | None = None
+    ) -> dict[str, dict[str, Any] | Exception]:
+        """Get the status of several worktrees in parallel.
+
+        Each worktree costs one ``git status --porcelain=v2`` process, which
+        reports branch, commit, changes and upstream ahead/behind together.
+
+        Args:
+            paths: Worktree paths
+            max_workers: Maximum concurrent git processes
+
+        Returns:
+            Status per path in the shape of ``get_worktree_status``, or the
+            exception raised while reading it
+        """
+        results: dict[str, dict[str, Any] | Exception] = {}
+        for path, status in self.runner.status_many(paths, max_workers).items():
+            if isinstance(status, Exception):
+                results[path] = GitWorktreeError(
+                    f"Failed to get worktree status: {status}"
+                )
+            else:
+                results[path] = status.to_status_dict()
+        return results
+
+    def get_worktree_fingerprint(self, path: str) -> str | None:
+        """Get a cheap fingerprint of a worktree's git state.
+
+        The fingerprint is built from file reads and stat calls only, without
+        spawning git: the worktree's HEAD, the ref HEAD points to, the index
+        mtime and size, and the mtimes of ``packed-refs`` and ``FETCH_HEAD``
+        in the common git directory. It changes when commits are made, the
+        branch is switched, files are staged or refs are fetched. Unstaged
+        edits to tracked files are not reflected.
+
+        Args:
+            path: Path to the worktree
+
+        Returns:
+            Hex digest of the git state, or None if it cannot be determined
+        """
+        try:
+            dirs = resolve_git_dirs(path)
+            if dirs is None:
+                return None
+            git_dir, common_dir = dirs
+
+            with open(os.path.join(git_dir, "HEAD")) as f:
+                head = f.read().strip()
+
+            parts = [head]
+            if head.startswith("ref: "):
+                parts.append(_read_text(os.path.join(common_dir, head[5:])))
+            parts.append(_stat_key(os.path.join(git_dir, "index")))
+            parts.append(_stat_key(os.path.join(common_dir, "packed-refs")))
+            parts.append(_stat_key(os.path.join(common_dir, "FETCH_HEAD")))
+        except OSError as e:
+            logger.debug(f"Could not fingerprint worktree {path}: {e}")
+            return None
+
+        return hashlib.sha1(
+            "\0".join(parts).encode(), usedforsecurity=False
+        ).hexdigest()
+
+    def write_commit_graph(self) -> bool:
+        """Write or incrementally refresh the repository's commit-graph.
+
+        The commit-graph file lets git walk history without inflating commit
+        objects, which keeps ``rev-list`` based ahead/behind counts fast on
+        large repositories. ``--split`` appends a layer for new commits
+        instead of rewriting the whole graph.
+
+        Returns:
+            True if the commit-graph was written
+        """
+        try:
+            self.repo.git.commit_graph("write", "--reachable", "--split")
+            logger.debug(f"Wrote commit-graph for {self.repo_path}")
+            return True
+        except (GitCommandError, GitWorktreeError) as e:
+            logger.warning(f"Failed to write commit-graph: {e}")
+            return False
+
+    def ensure_commit_graph(self) -> bool:
+        """Write the commit-graph if the repository does not have one yet.
+
+        Returns:
+            True if a commit-graph exists afterwards
+        """
+        try:
+            dirs = resolve_git_dirs(self.repo_path)
+        except OSError:
+            dirs = None
+        if dirs is not None:
+            info_dir = os.path.join(dirs[1], "objects", "info")
+            if os.path.exists(os.path.join(info_dir, "commit-graph")) or os.path.isdir(
+                os.path.join(info_dir, "commit-graphs")
+            ):
+                return True
+        return self.write_commit_graph()
+
     def generate_worktree_path(self, base_dir: str, name: str) -> str:
         """Generate a unique worktree path.
 
@@ -421,3 +718,222 @@ class GitWorktreeManager:
             counter += 1
 
         return str(base_path)
+
+
+def parse_worktree_list(output: str) -> list[dict[str, str]]:
+    """Parse ``git worktree list --porcelain`` output.
+
+    Accepts both the ``-z`` form, where every attribute is NUL terminated and
+    records end with an empty attribute, and the newline separated form.
+
+    Args:
+        output: Raw command output
+
+    Returns:
+        One dictionary per worktree, in the order git lists them
+    """
+    separator = "\0" if "\0" in output else "\n"
+    worktrees: list[dict[str, str]] = []
+    current: dict[str, str] = {}
+
+    for line in output.split(separator):
+        if not line.strip():
+            if current:
+                worktrees.append(current)
+                current = {}
+            continue
+
+        label, _, value = line.partition(" ")
+        if label == "worktree":
+            current["path"] = value
+        elif label == "HEAD":
+            current["commit"] = value
+        elif label == "branch":
+            current["branch"] = value
+        elif label in ("detached", "bare"):
+            current["status"] = label
+        elif label in ("locked", "prunable"):
+            # The reason is optional; an empty string still marks the state
+            current[label] = value
+
+    if current:
+        worktrees.append(current)
+    return worktrees
+
+
+def count_ahead_behind(
+    repo: Repo, local_sha: str, upstream_sha: str
+) -> tuple[int, int]:
+    """Count commits on each side of ``local...upstream``.
+
+    Uses a single ``git rev-list --left-right --count`` rather than
+    materializing commit objects, and memoizes the result by the two SHAs.
+
+    Args:
+        repo: Repository containing both commits
+        local_sha: Commit of the local branch
+        upstream_sha: Commit of the upstream branch
+
+    Returns:
+        ``(ahead, behind)``
+    """
+    if local_sha == upstream_sha:
+        return 0, 0
+
+    key = (local_sha, upstream_sha)
+    with _ahead_behind_lock:
+        cached = _ahead_behind_cache.get(key)
+        if cached is not None:
+            _ahead_behind_cache.move_to_end(key)
+            return cached
+
+    output = repo.git.rev_list(
+        "--left-right", "--count", f"{local_sha}...{upstream_sha}"
+    )
+    ahead, behind = (int(count) for count in output.split())
+
+    with _ahead_behind_lock:
+        _ahead_behind_cache[key] = (ahead, behind)
+        if len(_ahead_behind_cache) > AHEAD_BEHIND_CACHE_SIZE:
+            _ahead_behind_cache.popitem(last=False)
+    return ahead, behind
+
+
+def cone_directories(paths: list[str]) -> list[str]:
+    """Derive cone-mode sparse-checkout directories from touched paths.
+
+    Entries ending in ``/`` are taken as directories; anything else as a file,
+    contributing its parent directory. Top-level files need no entry because
+    cone mode always includes the root. Directories nested in another listed
+    directory are dropped.
+
+    Args:
+        paths: Repository-relative file or directory paths
+
+    Returns:
+        Sorted list of directories
+    """
+    directories = set()
+    for raw in paths:
+        entry = raw.strip().replace("\\", "/").lstrip("/")
+        if not entry or ".." in entry.split("/"):
+            continue
+        directory = entry.rstrip("/") if entry.endswith("/") else os.path.dirname(entry)
+        directory = os.path.normpath(directory) if directory else ""
+        if directory and directory != ".":
+            directories.add(directory)
+
+    result: list[str] = []
+    for directory in sorted(directories):
+        if not any(directory.startswith(kept + "/") for kept in result):
+            result.append(directory)
+    return result
+
+
+def reflink_supported(source_dir: str, target_dir: str) -> bool:
+    """Check whether files can be reflinked from one directory to another.
+
+    Both directories must be on the same filesystem and it must support
+    ``FICLONE``. The probe result is cached per filesystem.
+    """
+    try:
+        os.makedirs(target_dir, exist_ok=True)
+        device = os.stat(source_dir).st_dev
+        if os.stat(target_dir).st_dev != device:
+            return False
+    except OSError:
+        return False
+
+    if device not in _reflink_support:
+        probe_src = os.path.join(target_dir, f".reflink-probe-{os.getpid()}")
+        probe_dst = probe_src + ".clone"
+        try:
+            with open(probe_src, "wb") as f:
+                f.write(b"probe")
+            _clone_file(probe_src, probe_dst)
+            _reflink_support[device] = True
+        except OSError:
+            _reflink_support[device] = False
+        finally:
+            for probe in (probe_src, probe_dst):
+                try:
+                    os.unlink(probe)
+                except FileNotFoundError:
+                    pass
+    return _reflink_support[device]
+
+
+def _clone_file(source: str, target: str) -> None:
+    """Create ``target`` as a copy-on-write clone of ``source``.
+
+    Raises:
+        OSError: If the filesystem cannot clone the file
+    """
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError as e:
+            dst.close()
+            os.unlink(target)
+            if e.errno in (errno.ENOTTY, errno.EINVAL):
+                raise OSError(errno.EOPNOTSUPP, "Reflinks not supported") from e
+            raise
+
+
+def resolve_git_dirs(path: str) -> tuple[str, str] | None:
+    """Locate a worktree's private and common git directories.
+
+    For the main worktree both are ``<path>/.git``. A linked worktree has a
+    ``.git`` file pointing at ``<main>/.git/worktrees/<name>``, which holds
+    its HEAD and index, while refs live in the common directory.
+
+    Args:
+        path: Path to the worktree
+
+    Returns:
+        ``(git_dir, common_dir)``, or None if ``path`` is not a worktree
+
+    Raises:
+        OSError: If the git metadata cannot be read
+    """
+    abs_path = os.path.abspath(path)
+    dot_git = os.path.join(abs_path, ".git")
+
+    if os.path.isfile(dot_git):
+        # Linked worktree: .git is a "gitdir: <path>" pointer file
+        with open(dot_git) as f:
+            pointer = f.read().strip()
+        if not pointer.startswith("gitdir:"):
+            return None
+        git_dir = os.path.normpath(
+            os.path.join(abs_path, pointer[len("gitdir:") :].strip())
+        )
+    elif os.path.isdir(dot_git):
+        git_dir = dot_git
+    else:
+        return None
+
+    common_dir = git_dir
+    commondir_file = os.path.join(git_dir, "commondir")
+    if os.path.isfile(commondir_file):
+        with open(commondir_file) as f:
+            common_dir = os.path.normpath(os.path.join(git_dir, f.read().strip()))
+    return git_dir, common_dir
+
+
+def _read_text(path: str) -> str:
+    """Read a small git metadata file, or return "" if it does not exist."""
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return ""
+
+
+def _stat_key(path: str) -> str:
+    """Describe a file by mtime and size, or return "" if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return ""
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
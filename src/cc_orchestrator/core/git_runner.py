@@ -0,0 +1,531 @@
+"""
+Persistent git command execution.
+
+GitPython spawns one git process per call. This module provides a thin layer
+for the hot paths that can do better:
+
+- ``CatFileSession`` keeps a ``git cat-file --batch`` (or ``--batch-check``)
+  process alive per repository, so object and ref lookups are a pipe round
+  trip instead of a fork/exec.
+- ``GitRunner.status_many`` runs ``git status --porcelain=v2 --branch`` for
+  many worktrees in parallel. One process yields branch, commit, upstream
+  ahead/behind and change counts.
+- ``GitRunner.coalesce`` collapses concurrent requests for an idempotent
+  repository-wide command such as ``git worktree prune`` into one run.
+- Every command is timed into a per-command ``LatencyHistogram`` and runs
+  inside a ``git <command>`` trace span.
+"""
+
+import os
+import subprocess
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import copy_context
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from git.exc import GitCommandError
+
+from ..utils.logging import LogContext, get_logger
+from ..utils.tracing import start_span
+
+logger = get_logger(__name__, LogContext.WORKTREE)
+
+T = TypeVar("T")
+
+# Upper bounds of the latency histogram buckets in milliseconds
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Default concurrency for parallel status checks
+STATUS_MAX_WORKERS = 8
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram for one git command."""
+
+    def __init__(self, buckets_ms: tuple[float, ...] = LATENCY_BUCKETS_MS) -> None:
+        self.buckets_ms = buckets_ms
+        # One extra slot counts observations above the last bucket
+        self.counts = [0] * (len(buckets_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, duration_ms: float) -> None:
+        """Record one command duration."""
+        for i, bound in enumerate(self.buckets_ms):
+            if duration_ms <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def percentile(self, quantile: float) -> float:
+        """Estimate a percentile as the upper bound of its bucket."""
+        if not self.count:
+            return 0.0
+        rank = quantile * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts[:-1]):
+            seen += bucket_count
+            if seen >= rank:
+                return min(float(self.buckets_ms[i]), self.max_ms)
+        return self.max_ms
+
+    def snapshot(self) -> dict[str, Any]:
+        """Summarize the histogram for metrics output."""
+        cumulative = 0
+        buckets = {}
+        for bound, bucket_count in zip(self.buckets_ms, self.counts, strict=False):
+            cumulative += bucket_count
+            buckets[str(bound)] = cumulative
+        buckets["+Inf"] = self.count
+        return {
+            "count": self.count,
+            "sum_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets": buckets,
+        }
+
+
+@dataclass
+class PorcelainStatus:
+    """Worktree state parsed from ``git status --porcelain=v2 --branch``."""
+
+    path: str
+    commit: str | None = None
+    branch: str | None = None
+    upstream: str | None = None
+    ahead: int = 0
+    behind: int = 0
+    changed: int = 0
+    untracked: int = 0
+    conflicted: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether there are staged, unstaged, conflicted or untracked changes."""
+        return bool(self.changed or self.untracked or self.conflicted)
+
+    def to_status_dict(self) -> dict[str, Any]:
+        """Render in the shape returned by ``get_worktree_status``."""
+        is_dirty = bool(self.changed or self.conflicted)
+        return {
+            "path": self.path,
+            "branch": self.branch,
+            "commit": self.commit,
+            "has_changes": self.has_changes,
+            "is_dirty": is_dirty,
+            "ahead": self.ahead,
+            "behind": self.behind,
+        }
+
+
+def parse_porcelain_v2(output: str, path: str) -> PorcelainStatus:
+    """Parse NUL-separated ``git status --porcelain=v2 --branch -z`` output.
+
+    Args:
+        output: Raw command output
+        path: Worktree the status belongs to
+
+    Returns:
+        Parsed status
+    """
+    status = PorcelainStatus(path=path)
+    records = output.split("\0")
+    i = 0
+    while i < len(records):
+        record = records[i]
+        i += 1
+        if not record:
+            continue
+
+        if record.startswith("# "):
+            key, _, value = record[2:].partition(" ")
+            if key == "branch.oid" and value != "(initial)":
+                status.commit = value
+            elif key == "branch.head" and value != "(detached)":
+                status.branch = value
+            elif key == "branch.upstream":
+                status.upstream = value
+            elif key == "branch.ab":
+                ahead, behind = value.split()
+                status.ahead = int(ahead)
+                status.behind = abs(int(behind))
+        elif record.startswith("1 "):
+            status.changed += 1
+        elif record.startswith("2 "):
+            status.changed += 1
+            # Renames and copies carry the original path as an extra record
+            i += 1
+        elif record.startswith("u "):
+            status.conflicted += 1
+        elif record.startswith("? "):
+            status.untracked += 1
+    return status
+
+
+class CatFileSession:
+    """A long-lived ``git cat-file --batch`` process for one repository.
+
+    Requests are serialized with a lock; the process is restarted if it dies.
+    """
+
+    def __init__(
+        self,
+        repo_path: str,
+        check_only: bool = False,
+        runner: "GitRunner | None" = None,
+    ) -> None:
+        """Initialize the session.
+
+        Args:
+            repo_path: Repository to read objects from
+            check_only: Use ``--batch-check`` (type and size, no contents)
+            runner: Runner to record latencies with
+        """
+        self.repo_path = repo_path
+        self.mode = "--batch-check" if check_only else "--batch"
+        self.runner = runner
+        self._process: subprocess.Popen[bytes] | None = None
+        self._lock = threading.Lock()
+
+    def read(self, rev: str) -> tuple[str, str, bytes | None] | None:
+        """Look up an object by revision.
+
+        Args:
+            rev: Any revision ``git cat-file`` accepts (SHA, ref, ``rev:path``)
+
+        Returns:
+            ``(sha, type, contents)``; contents is None in check-only mode.
+            None if the object does not exist.
+        """
+        if "\n" in rev:
+            raise ValueError("Revision must not contain newlines")
+
+        with self._lock:
+            started = time.perf_counter()
+            try:
+                return self._request(rev)
+            except (BrokenPipeError, OSError, ValueError) as e:
+                # The process died; restart it once and retry
+                logger.debug(f"cat-file session for {self.repo_path} restarted: {e}")
+                self._terminate()
+                return self._request(rev)
+            finally:
+                if self.runner is not None:
+                    self.runner.observe(
+                        f"cat-file {self.mode}", time.perf_counter() - started
+                    )
+
+    def resolve(self, rev: str) -> str | None:
+        """Resolve a revision to an object SHA."""
+        result = self.read(rev)
+        return result[0] if result else None
+
+    def close(self) -> None:
+        """Stop the underlying process."""
+        with self._lock:
+            self._terminate()
+
+    def _request(self, rev: str) -> tuple[str, str, bytes | None] | None:
+        process = self._ensure_process()
+        assert process.stdin is not None and process.stdout is not None
+        process.stdin.write(rev.encode() + b"\n")
+        process.stdin.flush()
+
+        header = process.stdout.readline()
+        if not header:
+            raise ValueError("cat-file process closed its output")
+        fields = header.decode().split()
+        if len(fields) < 3 or fields[-1] in ("missing", "ambiguous"):
+            return None
+
+        sha, object_type, size = fields[0], fields[1], int(fields[2])
+        contents = None
+        if self.mode == "--batch":
+            contents = process.stdout.read(size)
+            process.stdout.read(1)  # trailing newline
+        return sha, object_type, contents
+
+    def _ensure_process(self) -> subprocess.Popen[bytes]:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                ["git", "-C", self.repo_path, "cat-file", self.mode],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._process
+
+    def _terminate(self) -> None:
+        if self._process is None:
+            return
+        try:
+            if self._process.stdin:
+                self._process.stdin.close()
+            self._process.wait(timeout=1.0)
+        except (OSError, subprocess.TimeoutExpired):
+            self._process.kill()
+            self._process.wait()
+        self._process = None
+
+
+class _Coalesced:
+    """Bookkeeping for one coalesced command."""
+
+    def __init__(self) -> None:
+        self.condition = threading.Condition()
+        self.requested = 0
+        self.completed = 0
+        self.running = False
+        self.runs = 0
+
+
+class GitRunner:
+    """Executes git commands for one repository and records their latency."""
+
+    def __init__(self, repo_path: str) -> None:
+        """Initialize the runner.
+
+        Args:
+            repo_path: Path to the repository
+        """
+        self.repo_path = os.path.abspath(repo_path)
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._stats_lock = threading.Lock()
+        self._sessions: dict[bool, CatFileSession] = {}
+        self._lock = threading.Lock()
+        self._coalesced: dict[str, _Coalesced] = {}
+
+    def observe(self, command: str, seconds: float) -> None:
+        """Record the latency of a command."""
+        with self._stats_lock:
+            histogram = self._histograms.get(command)
+            if histogram is None:
+                histogram = self._histograms[command] = LatencyHistogram()
+            histogram.observe(seconds * 1000)
+
+    @contextmanager
+    def timed(self, command: str) -> Iterator[None]:
+        """Time a block (e.g. a GitPython call) as ``command``."""
+        started = time.perf_counter()
+        try:
+            with start_span(f"git {command}", repo=self.repo_path):
+                yield
+        finally:
+            self.observe(command, time.perf_counter() - started)
+
+    def latency_stats(self) -> dict[str, dict[str, Any]]:
+        """Latency histogram snapshots keyed by command."""
+        with self._stats_lock:
+            return {
+                command: histogram.snapshot()
+                for command, histogram in sorted(self._histograms.items())
+            }
+
+    def run(self, *args: str, cwd: str | None = None, input: str | None = None) -> str:
+        """Run a git command and return its stdout.
+
+        Args:
+            *args: Git arguments, e.g. ``("status", "--porcelain=v2")``
+            cwd: Directory to run in (defaults to the repository)
+            input: Data written to the command's stdin
+
+        Raises:
+            GitCommandError: If git exits with a non-zero status
+        """
+        command = ["git", *args]
+        # Name the command after its subcommand, past global options
+        name = next((arg for arg in args if not arg.startswith("-")), "git")
+        started = time.perf_counter()
+        try:
+            with start_span(f"git {name}", cwd=cwd or self.repo_path) as span:
+                result = subprocess.run(
+                    command,
+                    cwd=cwd or self.repo_path,
+                    input=input,
+                    capture_output=True,
+                    text=True,
+                )
+                span.set_attribute("exit_code", result.returncode)
+        finally:
+            self.observe(name, time.perf_counter() - started)
+
+        if result.returncode != 0:
+            raise GitCommandError(command, result.returncode, result.stderr)
+        return result.stdout
+
+    def cat_file(self, check_only: bool = False) -> CatFileSession:
+        """Get the persistent cat-file session for this repository."""
+        with self._lock:
+            session = self._sessions.get(check_only)
+            if session is None:
+                session = self._sessions[check_only] = CatFileSession(
+                    self.repo_path, check_only=check_only, runner=self
+                )
+            return session
+
+    def read_object(self, rev: str) -> bytes | None:
+        """Read an object's contents through the persistent cat-file session."""
+        result = self.cat_file().read(rev)
+        return result[2] if result else None
+
+    def resolve(self, rev: str) -> str | None:
+        """Resolve a revision to a SHA through the persistent check session."""
+        return self.cat_file(check_only=True).resolve(rev)
+
+    def status(self, path: str) -> PorcelainStatus:
+        """Get a worktree's status with a single ``git status`` process.
+
+        Status runs in the background, so it takes no optional locks: it
+        never rewrites the index, which would contend with the user's own
+        git commands and wake the worktree watcher.
+
+        Raises:
+            GitCommandError: If the status cannot be read
+        """
+        abs_path = os.path.abspath(path)
+        output = self.run(
+            "--no-optional-locks",
+            "status",
+            "--porcelain=v2",
+            "--branch",
+            "-z",
+            "--untracked-files=normal",
+            cwd=abs_path,
+        )
+        return parse_porcelain_v2(output, abs_path)
+
+    def status_many(
+        self, paths: list[str], max_workers: int | None = None
+    ) -> dict[str, PorcelainStatus | Exception]:
+        """Get the status of several worktrees in parallel.
+
+        Args:
+            paths: Worktree paths
+            max_workers: Maximum concurrent git processes (defaults to
+                ``STATUS_MAX_WORKERS``)
+
+        Returns:
+            Status per path, or the exception raised while reading it
+        """
+        if not paths:
+            return {}
+
+        workers = min(max_workers or STATUS_MAX_WORKERS, len(paths))
+        results: dict[str, PorcelainStatus | Exception] = {}
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="git-status"
+        ) as executor:
+            # Each worker runs in a copy of the caller's context so its span
+            # nests under the caller's
+            futures = {
+                path: executor.submit(copy_context().run, self.status, path)
+                for path in paths
+            }
+            for path, future in futures.items():
+                try:
+                    results[path] = future.result()
+                except Exception as e:
+                    results[path] = e
+        return results
+
+    def coalesce(self, key: str, fn: Callable[[], T]) -> T | None:
+        """Run an idempotent command, sharing runs between concurrent callers.
+
+        A caller whose request arrives while a run is in progress waits for
+        it to finish and then triggers at most one follow-up run, which covers
+        every request queued in the meantime. Callers covered by another
+        thread's run return None without running the command themselves.
+
+        Args:
+            key: Identifies the command (e.g. ``"worktree prune"``)
+            fn: Performs the command
+
+        Returns:
+            The result of ``fn`` if this caller ran it, else None
+        """
+        with self._lock:
+            state = self._coalesced.setdefault(key, _Coalesced())
+
+        with state.condition:
+            state.requested += 1
+            ticket = state.requested
+            while state.running:
+                state.condition.wait()
+            if state.completed >= ticket:
+                return None
+            state.running = True
+            covered = state.requested
+
+        try:
+            with self.timed(key):
+                return fn()
+        finally:
+            with state.condition:
+                state.running = False
+                state.completed = covered
+                state.runs += 1
+                state.condition.notify_all()
+
+    def coalesced_runs(self, key: str) -> int:
+        """Number of times a coalesced command actually ran."""
+        state = self._coalesced.get(key)
+        return state.runs if state else 0
+
+    def close(self) -> None:
+        """Stop persistent cat-file processes."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+
+# Runners keyed by repository path
+_runners: dict[str, GitRunner] = {}
+_runners_lock = threading.Lock()
+
+
+def get_git_runner(repo_path: str) -> GitRunner:
+    """Get the shared runner for a repository.
+
+    Args:
+        repo_path: Path to the repository
+
+    Returns:
+        GitRunner instance
+    """
+    key = os.path.abspath(repo_path)
+    with _runners_lock:
+        runner = _runners.get(key)
+        if runner is None:
+            runner = _runners[key] = GitRunner(key)
+        return runner
+
+
+def get_git_latency_stats() -> dict[str, dict[str, dict[str, Any]]]:
+    """Latency statistics of every runner, keyed by repository path."""
+    with _runners_lock:
+        runners = list(_runners.values())
+    return {runner.repo_path: runner.latency_stats() for runner in runners}
+
+
+def cleanup_git_runners() -> None:
+    """Close all runners and their persistent processes."""
+    with _runners_lock:
+        runners = list(_runners.values())
+        _runners.clear()
+    for runner in runners:
+        runner.close()
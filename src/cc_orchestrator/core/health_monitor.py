@@ -10,7 +10,8 @@ import time
 from datetime import datetime
 from typing import Any
 
-from ..config.loader import OrchestratorConfig, load_config
+from ..config.loader import OrchestratorConfig
+from ..config.service import get_config_service
 from ..database.models import HealthStatus
 from ..utils.logging import LogContext, get_logger
 from ..utils.process import ProcessStatus, get_process_manager
@@ -75,9 +76,17 @@ class RestartManager:
     def __init__(self, config: OrchestratorConfig | None = None) -> None:
         """Initialize the restart manager."""
         if config is None:
-            config = load_config()
+            config = get_config_service().current
 
         self.restart_attempts: dict[str, list[float]] = {}
+        self.apply_config(config)
+
+    def apply_config(self, config: OrchestratorConfig) -> None:
+        """Apply restart limits from a configuration.
+
+        Args:
+            config: Configuration providing the restart settings
+        """
         self.max_attempts = config.restart_max_attempts
         self.base_delay = config.restart_base_delay
         self.max_delay = config.restart_max_delay
@@ -148,27 +157,55 @@ class HealthMonitor:
     """Health monitoring service for Claude Code instances."""
 
     def __init__(self, config: OrchestratorConfig | None = None) -> None:
-        """Initialize the health monitor."""
+        """Initialize the health monitor.
+
+        Args:
+            config: Configuration to use; without one the monitor follows
+                reloads of the global configuration while it runs
+        """
+        self._follows_config = config is None
         if config is None:
-            config = load_config()
+            config = get_config_service().current
 
         self.process_manager = get_process_manager()
         self.alert_system = AlertSystem()
         self.restart_manager = RestartManager(config)
         self.monitoring_task: asyncio.Task | None = None
         self.shutdown_event = asyncio.Event()
+        self.wakeup_event = asyncio.Event()
+        self.enabled = True
+        self._apply_settings(config)
+
+        logger.info(
+            "Health monitor initialized",
+            check_interval=self.check_interval,
+            cpu_threshold=self.cpu_threshold,
+            memory_threshold_mb=self.memory_threshold_mb,
+        )
 
+    def _apply_settings(self, config: OrchestratorConfig) -> None:
         # Configuration from config file/environment
         self.check_interval = config.health_check_interval
-        self.enabled = True
 
         # Health check thresholds from config
         self.cpu_threshold = config.health_cpu_threshold
         self.memory_threshold_mb = config.health_memory_threshold_mb
         self.response_timeout = config.health_response_timeout
 
+    def apply_config(self, config: OrchestratorConfig) -> None:
+        """Apply new thresholds, intervals and restart limits.
+
+        Called on configuration reloads; the next check runs right away with
+        the new settings.
+
+        Args:
+            config: Configuration providing the health settings
+        """
+        self._apply_settings(config)
+        self.restart_manager.apply_config(config)
+        self.wakeup_event.set()
         logger.info(
-            "Health monitor initialized",
+            "Health monitor reconfigured",
             check_interval=self.check_interval,
             cpu_threshold=self.cpu_threshold,
             memory_threshold_mb=self.memory_threshold_mb,
@@ -182,12 +219,17 @@ class HealthMonitor:
 
         logger.info("Starting health monitoring daemon", interval=self.check_interval)
         self.shutdown_event.clear()
+        self.wakeup_event.clear()
+        if self._follows_config:
+            get_config_service().add_listener(self.apply_config)
         self.monitoring_task = asyncio.create_task(self._monitoring_loop())
 
     async def stop(self) -> None:
         """Stop the health monitoring daemon."""
         logger.info("Stopping health monitoring daemon")
+        get_config_service().remove_listener(self.apply_config)
         self.shutdown_event.set()
+        self.wakeup_event.set()
 
         if self.monitoring_task:
             try:
@@ -376,16 +418,15 @@ class HealthMonitor:
                 except Exception as e:
                     logger.error("Error in health monitoring loop", error=str(e))
 
-                # Wait for next check interval or shutdown
+                # Wait for next check interval, a reconfiguration or shutdown
                 try:
                     await asyncio.wait_for(
-                        self.shutdown_event.wait(), timeout=self.check_interval
+                        self.wakeup_event.wait(), timeout=self.check_interval
                     )
-                    # If we reach here, shutdown was requested
-                    break
                 except TimeoutError:
                     # Timeout is expected, continue with next iteration
-                    continue
+                    pass
+                self.wakeup_event.clear()
 
         except asyncio.CancelledError:
             logger.info("Health monitoring loop cancelled")
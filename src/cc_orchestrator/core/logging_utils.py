@@ -171,4 +171,4 @@ def handle_database_errors(
 
 def track_performance(component_name: str) -> Callable[..., Any]:
     """Decorator for performance tracking of core operations."""
-    return log_performance(LogContext.ORCHESTRATOR)
+    return log_performance(LogContext.ORCHESTRATOR, name=component_name)
@@ -0,0 +1,390 @@
+"""
+Data retention and compaction service.
+
+This module prunes expired history (health checks, rollups and pluggable stores
+such as the in-memory log buffer) in bounded-size batches so that no single
+transaction holds the SQLite writer lock for long. Expiring health checks are
+downsampled into ``health_check_rollups`` before deletion, and SQLite databases
+are checkpointed and incrementally vacuumed after each pass.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, select, tuple_
+
+from ..config.loader import OrchestratorConfig, RetentionPolicy, load_config
+from ..database.connection import DatabaseManager, get_database_manager
+from ..database.models import HealthCheck, HealthCheckRollup, HealthStatus
+from ..utils.logging import LogContext, get_logger
+
+logger = get_logger(__name__, LogContext.DATABASE)
+
+# Pruner signature for non-database stores: (cutoff, batch_size) -> rows deleted
+Pruner = Callable[[datetime, int], int]
+
+_EPOCH = datetime(1970, 1, 1)
+
+_STATUS_COUNTERS = {
+    HealthStatus.HEALTHY: "healthy_count",
+    HealthStatus.DEGRADED: "degraded_count",
+    HealthStatus.UNHEALTHY: "unhealthy_count",
+    HealthStatus.CRITICAL: "critical_count",
+    HealthStatus.UNKNOWN: "unknown_count",
+}
+
+
+@dataclass
+class RetentionResult:
+    """Outcome of a retention pass for a single table or store."""
+
+    table: str
+    deleted: int = 0
+    rolled_up: int = 0
+    batches: int = 0
+    duration_ms: float = 0.0
+    error: str | None = None
+
+
+@dataclass
+class _RollupAccumulator:
+    """In-memory aggregate for one (instance, bucket) pair."""
+
+    counts: dict[str, int] = field(default_factory=dict)
+    check_count: int = 0
+    total_duration_ms: float = 0.0
+    max_duration_ms: float = 0.0
+
+
+def bucket_start(timestamp: datetime, bucket_seconds: int) -> datetime:
+    """Floor a timestamp to the start of its rollup bucket.
+
+    Args:
+        timestamp: Timestamp to floor (timezone information is discarded)
+        bucket_seconds: Bucket width in seconds
+
+    Returns:
+        Naive datetime marking the start of the bucket
+    """
+    naive = timestamp.replace(tzinfo=None)
+    elapsed = int((naive - _EPOCH).total_seconds())
+    return _EPOCH + timedelta(seconds=elapsed - elapsed % bucket_seconds)
+
+
+class RetentionService:
+    """Background service applying per-table retention policies."""
+
+    def __init__(
+        self,
+        config: OrchestratorConfig | None = None,
+        db_manager: DatabaseManager | None = None,
+    ) -> None:
+        """Initialize the retention service.
+
+        Args:
+            config: Configuration providing retention policies
+            db_manager: Database manager (defaults to the global manager)
+        """
+        if config is None:
+            config = load_config()
+
+        self._db_manager = db_manager
+        self.policies: dict[str, RetentionPolicy] = dict(config.retention_policies)
+        self.batch_size = max(1, config.retention_batch_size)
+        self.interval = config.retention_interval
+        self.pruners: dict[str, Pruner] = {}
+        self.last_results: list[RetentionResult] = []
+        self.last_run: datetime | None = None
+
+        self.retention_task: asyncio.Task[None] | None = None
+        self.shutdown_event = asyncio.Event()
+
+    @property
+    def db_manager(self) -> DatabaseManager:
+        """Get the database manager, resolving the global one lazily."""
+        if self._db_manager is None:
+            self._db_manager = get_database_manager()
+        return self._db_manager
+
+    def register_pruner(self, table: str, pruner: Pruner) -> None:
+        """Register a pruner for a store that is not a database table.
+
+        Args:
+            table: Policy key the pruner is governed by (e.g. ``"logs"``)
+            pruner: Callable deleting entries older than the cutoff
+        """
+        self.pruners[table] = pruner
+
+    async def start(self) -> None:
+        """Start the periodic retention loop."""
+        if self.retention_task and not self.retention_task.done():
+            logger.warning("Retention service is already running")
+            return
+
+        logger.info("Starting retention service", interval=self.interval)
+        self.shutdown_event.clear()
+        self.retention_task = asyncio.create_task(self._retention_loop())
+
+    async def stop(self) -> None:
+        """Stop the periodic retention loop."""
+        self.shutdown_event.set()
+
+        if self.retention_task:
+            try:
+                await asyncio.wait_for(self.retention_task, timeout=5.0)
+            except TimeoutError:
+                logger.warning("Retention service shutdown timed out, cancelling")
+                self.retention_task.cancel()
+                try:
+                    await self.retention_task
+                except asyncio.CancelledError:
+                    pass
+
+        logger.info("Retention service stopped")
+
+    async def run_once(self, now: datetime | None = None) -> list[RetentionResult]:
+        """Run a single retention pass without blocking the event loop.
+
+        Args:
+            now: Reference time for computing cutoffs (defaults to now)
+
+        Returns:
+            Results for every policy that was applied
+        """
+        return await asyncio.to_thread(self.apply_policies, now)
+
+    def apply_policies(self, now: datetime | None = None) -> list[RetentionResult]:
+        """Apply all enabled retention policies synchronously.
+
+        Args:
+            now: Reference time for computing cutoffs (defaults to now)
+
+        Returns:
+            Results for every policy that was applied
+        """
+        now = now or datetime.now()
+        results: list[RetentionResult] = []
+
+        for table, policy in self.policies.items():
+            if not policy.enabled:
+                continue
+
+            cutoff = now - timedelta(hours=policy.max_age_hours)
+            start = time.perf_counter()
+            result = RetentionResult(table=table)
+
+            try:
+                if table == "health_checks":
+                    self._prune_health_checks(policy, cutoff, result)
+                elif table == "health_check_rollups":
+                    self._delete_in_batches(
+                        HealthCheckRollup,
+                        HealthCheckRollup.bucket_start,
+                        cutoff,
+                        result,
+                    )
+                elif table in self.pruners:
+                    result.deleted = self.pruners[table](cutoff, self.batch_size)
+                    result.batches = 1
+                else:
+                    continue
+            except Exception as e:
+                result.error = str(e)
+                logger.error("Retention pass failed", table=table, error=str(e))
+
+            result.duration_ms = (time.perf_counter() - start) * 1000
+            results.append(result)
+
+        if any(r.deleted for r in results):
+            self.compact()
+
+        self.last_results = results
+        self.last_run = now
+
+        logger.info(
+            "Retention pass completed",
+            deleted={r.table: r.deleted for r in results},
+            rolled_up=sum(r.rolled_up for r in results),
+        )
+        return results
+
+    def compact(self) -> None:
+        """Reclaim space and truncate the WAL on SQLite databases."""
+        engine = self.db_manager.engine
+        if engine.dialect.name != "sqlite":
+            return
+
+        try:
+            with engine.connect() as conn:
+                conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+                conn.exec_driver_sql("PRAGMA incremental_vacuum").fetchall()
+                conn.commit()
+        except Exception as e:
+            logger.warning("SQLite compaction failed", error=str(e))
+
+    def _prune_health_checks(
+        self, policy: RetentionPolicy, cutoff: datetime, result: RetentionResult
+    ) -> None:
+        """Roll up and delete expired health checks one batch at a time."""
+        bucket_seconds = (
+            policy.rollup_bucket_minutes * 60 if policy.rollup_bucket_minutes else None
+        )
+
+        while True:
+            with self.db_manager.get_session() as session:
+                rows = session.execute(
+                    select(
+                        HealthCheck.id,
+                        HealthCheck.instance_id,
+                        HealthCheck.overall_status,
+                        HealthCheck.duration_ms,
+                        HealthCheck.check_timestamp,
+                    )
+                    .where(HealthCheck.check_timestamp < cutoff)
+                    .order_by(HealthCheck.check_timestamp)
+                    .limit(self.batch_size)
+                ).all()
+
+                if not rows:
+                    break
+
+                if bucket_seconds:
+                    self._merge_rollups(session, rows, bucket_seconds)
+                    result.rolled_up += len(rows)
+
+                session.execute(
+                    delete(HealthCheck).where(HealthCheck.id.in_([r.id for r in rows]))
+                )
+
+            result.deleted += len(rows)
+            result.batches += 1
+            if len(rows) < self.batch_size:
+                break
+
+    def _merge_rollups(
+        self, session: Any, rows: Sequence[Any], bucket_seconds: int
+    ) -> None:
+        """Aggregate raw health check rows into their rollup buckets."""
+        buckets: dict[tuple[int, datetime], _RollupAccumulator] = {}
+        for row in rows:
+            key = (row.instance_id, bucket_start(row.check_timestamp, bucket_seconds))
+            acc = buckets.setdefault(key, _RollupAccumulator())
+            counter = _STATUS_COUNTERS.get(row.overall_status, "unknown_count")
+            acc.counts[counter] = acc.counts.get(counter, 0) + 1
+            acc.check_count += 1
+            duration = float(row.duration_ms or 0)
+            acc.total_duration_ms += duration
+            acc.max_duration_ms = max(acc.max_duration_ms, duration)
+
+        existing = {
+            (rollup.instance_id, rollup.bucket_start): rollup
+            for rollup in session.scalars(
+                select(HealthCheckRollup).where(
+                    HealthCheckRollup.bucket_seconds == bucket_seconds,
+                    tuple_(
+                        HealthCheckRollup.instance_id, HealthCheckRollup.bucket_start
+                    ).in_(list(buckets.keys())),
+                )
+            )
+        }
+
+        for (instance_id, start), acc in buckets.items():
+            rollup = existing.get((instance_id, start))
+            if rollup is None:
+                rollup = HealthCheckRollup(
+                    instance_id=instance_id,
+                    bucket_start=start,
+                    bucket_seconds=bucket_seconds,
+                )
+                session.add(rollup)
+
+            rollup.check_count += acc.check_count
+            rollup.total_duration_ms += acc.total_duration_ms
+            rollup.max_duration_ms = max(rollup.max_duration_ms, acc.max_duration_ms)
+            for counter, count in acc.counts.items():
+                setattr(rollup, counter, getattr(rollup, counter) + count)
+
+        session.flush()
+
+    def _delete_in_batches(
+        self,
+        model: Any,
+        timestamp_column: Any,
+        cutoff: datetime,
+        result: RetentionResult,
+    ) -> None:
+        """Delete rows older than the cutoff in bounded-size transactions."""
+        while True:
+            with self.db_manager.get_session() as session:
+                ids = session.scalars(
+                    select(model.id)
+                    .where(timestamp_column < cutoff)
+                    .order_by(timestamp_column)
+                    .limit(self.batch_size)
+                ).all()
+
+                if not ids:
+                    break
+
+                session.execute(delete(model).where(model.id.in_(ids)))
+
+            result.deleted += len(ids)
+            result.batches += 1
+            if len(ids) < self.batch_size:
+                break
+
+    async def _retention_loop(self) -> None:
+        """Run retention passes until shutdown is requested."""
+        try:
+            while not self.shutdown_event.is_set():
+                try:
+                    await asyncio.wait_for(
+                        self.shutdown_event.wait(), timeout=self.interval
+                    )
+                    break
+                except TimeoutError:
+                    pass
+
+                try:
+                    await self.run_once()
+                except Exception as e:
+                    logger.error("Error in retention loop", error=str(e))
+
+        except asyncio.CancelledError:
+            logger.info("Retention loop cancelled")
+            raise
+
+
+# Global retention service instance
+_retention_service: RetentionService | None = None
+
+
+def get_retention_service(
+    config: OrchestratorConfig | None = None,
+    db_manager: DatabaseManager | None = None,
+) -> RetentionService:
+    """Get the global retention service instance.
+
+    Args:
+        config: Optional configuration to use for initialization
+        db_manager: Optional database manager to use for initialization
+
+    Returns:
+        RetentionService instance
+    """
+    global _retention_service
+    if _retention_service is None:
+        _retention_service = RetentionService(config, db_manager)
+    return _retention_service
+
+
+async def cleanup_retention_service() -> None:
+    """Stop and discard the global retention service."""
+    global _retention_service
+    if _retention_service is not None:
+        await _retention_service.stop()
+        _retention_service = None
@@ -0,0 +1,607 @@
+"""
+Priority- and affinity-aware task scheduler.
+
+This module keeps an in-memory priority heap of PENDING tasks and continuously
+dispatches them to RUNNING instances with spare capacity. Tasks are ordered by
+priority, then by their latest start time (``due_date`` minus
+``estimated_duration``), then shortest estimated duration first and finally
+age. A task bound to a worktree prefers the instance that owns that worktree
+and waits a bounded time for it before falling back to the least loaded
+instance. Instance load combines in-progress task counts from the database
+with CPU usage sampled by the process manager.
+
+Dispatch goes through ``TaskCRUD.claim`` so a stale heap entry can never
+double-assign a task; it is simply dropped when the claim misses. Tasks
+already assigned to an instance are only dispatched to that instance. Leases
+of tasks held by instances whose recorded process is still present are
+renewed every cycle before expired leases are requeued; instances without a
+recorded process must renew their own leases through the task lease
+endpoint. Dispatch listeners are told which instance got which task.
+"""
+
+import asyncio
+import heapq
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, overload
+
+import psutil
+from sqlalchemy import func, select
+
+from ..config.loader import OrchestratorConfig, load_config
+from ..database.connection import DatabaseManager, get_database_manager
+from ..database.crud import TaskCRUD
+from ..database.models import Instance, InstanceStatus, Task, TaskStatus, Worktree
+from ..utils.logging import LogContext, get_logger
+from ..utils.process import ProcessManager, ProcessStatus, get_process_manager
+
+logger = get_logger(__name__, LogContext.ORCHESTRATOR)
+
+# Sliding window used for the dispatch throughput metric
+THROUGHPUT_WINDOW_SECONDS = 60.0
+
+_NO_DEADLINE = datetime.max
+
+# Called with (task_id, instance_id) after a dispatched claim is committed
+DispatchListener = Callable[[int, int], None]
+
+
+@dataclass(order=True)
+class QueuedTask:
+    """Heap entry for a pending task; ordering is given by ``sort_key``."""
+
+    sort_key: tuple[Any, ...]
+    task_id: int = field(compare=False)
+    worktree_id: int | None = field(compare=False, default=None)
+    instance_id: int | None = field(compare=False, default=None)
+    created_at: datetime = field(compare=False, default=_NO_DEADLINE)
+    estimated_duration: int | None = field(compare=False, default=None)
+
+
+@dataclass
+class InstanceSlot:
+    """Dispatch capacity and load of one running instance."""
+
+    instance_id: int
+    active_tasks: int = 0
+    cpu_percent: float = 0.0
+    last_dispatch: float = 0.0
+
+
+@dataclass
+class SchedulerMetrics:
+    """Counters describing scheduler throughput and fairness."""
+
+    cycles: int = 0
+    dispatched: int = 0
+    missed_claims: int = 0
+    affinity_hits: int = 0
+    queue_depth: int = 0
+    running_instances: int = 0
+    busy_instances: int = 0
+    last_cycle_ms: float = 0.0
+    total_wait_seconds: float = 0.0
+    per_instance: dict[int, int] = field(default_factory=dict)
+    recent: deque[float] = field(default_factory=deque)
+
+    def record_dispatch(self, instance_id: int, wait_seconds: float) -> None:
+        """Record a successful dispatch."""
+        now = time.monotonic()
+        self.dispatched += 1
+        self.total_wait_seconds += max(0.0, wait_seconds)
+        self.per_instance[instance_id] = self.per_instance.get(instance_id, 0) + 1
+        self.recent.append(now)
+        self._trim(now)
+
+    def throughput_per_minute(self) -> float:
+        """Dispatches within the last throughput window, scaled to a minute."""
+        self._trim(time.monotonic())
+        return len(self.recent) * 60.0 / THROUGHPUT_WINDOW_SECONDS
+
+    def fairness_index(self) -> float:
+        """Jain's fairness index over per-instance dispatch counts.
+
+        1.0 means work was spread evenly; 1/n means one instance got it all.
+        """
+        counts = list(self.per_instance.values())
+        if not counts:
+            return 1.0
+        total = sum(counts)
+        return total * total / (len(counts) * sum(c * c for c in counts))
+
+    def snapshot(self) -> dict[str, Any]:
+        """Serializable view of the metrics."""
+        return {
+            "cycles": self.cycles,
+            "dispatched": self.dispatched,
+            "missed_claims": self.missed_claims,
+            "affinity_hits": self.affinity_hits,
+            "queue_depth": self.queue_depth,
+            "running_instances": self.running_instances,
+            "busy_instances": self.busy_instances,
+            "utilization": (
+                self.busy_instances / self.running_instances
+                if self.running_instances
+                else 0.0
+            ),
+            "last_cycle_ms": round(self.last_cycle_ms, 3),
+            "throughput_per_minute": self.throughput_per_minute(),
+            "average_wait_seconds": (
+                self.total_wait_seconds / self.dispatched if self.dispatched else 0.0
+            ),
+            "fairness_index": self.fairness_index(),
+            "per_instance": dict(self.per_instance),
+        }
+
+    def _trim(self, now: float) -> None:
+        while self.recent and now - self.recent[0] > THROUGHPUT_WINDOW_SECONDS:
+            self.recent.popleft()
+
+
+@overload
+def _naive(value: datetime) -> datetime: ...
+
+
+@overload
+def _naive(value: None) -> None: ...
+
+
+def _naive(value: datetime | None) -> datetime | None:
+    return value.replace(tzinfo=None) if value is not None else None
+
+
+def task_sort_key(
+    priority_value: int,
+    due_date: datetime | None,
+    estimated_duration: int | None,
+    created_at: datetime,
+    task_id: int,
+) -> tuple[Any, ...]:
+    """Build the heap ordering key for a pending task.
+
+    Args:
+        priority_value: ``TaskPriority`` value (higher is more important)
+        due_date: Deadline, if any
+        estimated_duration: Estimated run time in minutes, if known
+        created_at: Creation time used as the final tiebreaker
+        task_id: Task ID making the key unique
+
+    Returns:
+        Tuple that sorts the most urgent task first
+    """
+    latest_start = _NO_DEADLINE
+    if due_date is not None:
+        latest_start = _naive(due_date) - timedelta(minutes=estimated_duration or 0)
+    # Unknown durations sort after known ones of the same urgency
+    duration_key = estimated_duration if estimated_duration is not None else 1 << 30
+    return (-priority_value, latest_start, duration_key, _naive(created_at), task_id)
+
+
+class SchedulerService:
+    """Background service dispatching pending tasks to idle instances."""
+
+    def __init__(
+        self,
+        config: OrchestratorConfig | None = None,
+        db_manager: DatabaseManager | None = None,
+        process_manager: ProcessManager | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            config: Configuration providing scheduler settings
+            db_manager: Database manager (defaults to the global manager)
+            process_manager: Source of instance CPU samples (defaults to the
+                global process manager)
+        """
+        if config is None:
+            config = load_config()
+
+        self._db_manager = db_manager
+        self._process_manager = process_manager
+        self.interval = config.scheduler_interval
+        self.resync_interval = config.scheduler_resync_interval
+        self.max_tasks_per_instance = max(1, config.scheduler_max_tasks_per_instance)
+        self.cpu_threshold = config.scheduler_cpu_threshold
+        self.affinity_wait = config.scheduler_affinity_wait
+        self.lease_seconds = config.scheduler_lease_seconds
+        self.metrics = SchedulerMetrics()
+
+        self._heap: list[QueuedTask] = []
+        self._queued: set[int] = set()
+        self._max_seen_id = 0
+        self._last_resync: float | None = None
+        self._last_dispatch: dict[int, float] = {}
+        self._listeners: list[DispatchListener] = []
+
+        self.scheduler_task: asyncio.Task[None] | None = None
+        self.shutdown_event = asyncio.Event()
+        self.wakeup_event = asyncio.Event()
+
+    @property
+    def db_manager(self) -> DatabaseManager:
+        """Get the database manager, resolving the global one lazily."""
+        if self._db_manager is None:
+            self._db_manager = get_database_manager()
+        return self._db_manager
+
+    @property
+    def process_manager(self) -> ProcessManager:
+        """Get the process manager, resolving the global one lazily."""
+        if self._process_manager is None:
+            self._process_manager = get_process_manager()
+        return self._process_manager
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of tasks currently held in the in-memory heap."""
+        return len(self._queued)
+
+    async def start(self) -> None:
+        """Start the continuous dispatch loop."""
+        if self.scheduler_task and not self.scheduler_task.done():
+            logger.warning("Scheduler is already running")
+            return
+
+        logger.info("Starting task scheduler", interval=self.interval)
+        self.shutdown_event.clear()
+        self.scheduler_task = asyncio.create_task(self._scheduler_loop())
+
+    async def stop(self) -> None:
+        """Stop the dispatch loop."""
+        self.shutdown_event.set()
+        self.wakeup_event.set()
+
+        if self.scheduler_task:
+            try:
+                await asyncio.wait_for(self.scheduler_task, timeout=5.0)
+            except TimeoutError:
+                logger.warning("Scheduler shutdown timed out, cancelling")
+                self.scheduler_task.cancel()
+                try:
+                    await self.scheduler_task
+                except asyncio.CancelledError:
+                    pass
+
+        logger.info("Task scheduler stopped")
+
+    def notify(self) -> None:
+        """Wake the dispatch loop early, e.g. after a task was created."""
+        self.wakeup_event.set()
+
+    def add_listener(self, listener: DispatchListener) -> None:
+        """Register a callback invoked with ``(task_id, instance_id)`` per dispatch.
+
+        Callbacks run on the dispatch thread and must not block.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: DispatchListener) -> None:
+        """Unregister a dispatch callback."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def request_resync(self) -> None:
+        """Force a full reload of the pending queue on the next cycle."""
+        self._last_resync = None
+
+    async def run_once(self) -> int:
+        """Run a single dispatch cycle without blocking the event loop.
+
+        Returns:
+            Number of tasks dispatched
+        """
+        cpu = await self._sample_cpu()
+        return await asyncio.to_thread(self.dispatch, cpu)
+
+    def dispatch(self, cpu_by_issue: dict[str, float] | None = None) -> int:
+        """Sync the queue and dispatch as many tasks as capacity allows.
+
+        Args:
+            cpu_by_issue: Latest CPU percentage per instance issue ID
+
+        Returns:
+            Number of tasks dispatched
+        """
+        start = time.perf_counter()
+        dispatched = 0
+
+        with self.db_manager.get_session() as session:
+            # Work on instances with a live process keeps its lease; the rest
+            # must heartbeat or lose it
+            running, alive = self._running_instances(session)
+            TaskCRUD.renew_leases(session, alive, self.lease_seconds)
+            requeued, _failed = TaskCRUD.requeue_expired(session)
+            if requeued:
+                self.request_resync()
+            self._sync(session)
+
+            slots, owners = self._load_instances(session, running, cpu_by_issue or {})
+            free = {
+                slot.instance_id: slot
+                for slot in slots
+                if slot.active_tasks < self.max_tasks_per_instance
+                and slot.cpu_percent < self.cpu_threshold
+            }
+
+            deferred: list[QueuedTask] = []
+            now = datetime.now()
+            while free and self._heap:
+                entry = heapq.heappop(self._heap)
+                self._queued.discard(entry.task_id)
+
+                owner = owners.get(entry.worktree_id) if entry.worktree_id else None
+                slot = free.get(owner) if owner is not None else None
+                if entry.instance_id is not None:
+                    # Already assigned: only its instance may take it
+                    slot = free.get(entry.instance_id)
+                    if slot is None:
+                        if entry.instance_id in running:
+                            deferred.append(entry)
+                        continue
+                    affinity = False
+                elif slot is not None:
+                    affinity = True
+                elif (
+                    owner in running
+                    and (now - _naive(entry.created_at)).total_seconds()
+                    < self.affinity_wait
+                ):
+                    # The owning instance is busy; keep the task for it a while
+                    deferred.append(entry)
+                    continue
+                else:
+                    affinity = False
+                    slot = min(
+                        free.values(),
+                        key=lambda s: (
+                            s.active_tasks,
+                            s.cpu_percent,
+                            s.last_dispatch,
+                            s.instance_id,
+                        ),
+                    )
+
+                lease = max(
+                    self.lease_seconds, 2 * 60 * (entry.estimated_duration or 0)
+                )
+                if not TaskCRUD.claim(session, entry.task_id, slot.instance_id, lease):
+                    # Someone else took it, or it is no longer pending
+                    self.metrics.missed_claims += 1
+                    continue
+                session.commit()
+                self._notify(entry.task_id, slot.instance_id)
+
+                dispatched += 1
+                self.metrics.record_dispatch(
+                    slot.instance_id, (now - _naive(entry.created_at)).total_seconds()
+                )
+                if affinity:
+                    self.metrics.affinity_hits += 1
+
+                slot.active_tasks += 1
+                slot.last_dispatch = time.monotonic()
+                self._last_dispatch[slot.instance_id] = slot.last_dispatch
+                if slot.active_tasks >= self.max_tasks_per_instance:
+                    del free[slot.instance_id]
+
+            for entry in deferred:
+                self._push(entry)
+
+        self.metrics.cycles += 1
+        self.metrics.queue_depth = self.queue_depth
+        self.metrics.running_instances = len(slots)
+        self.metrics.busy_instances = len(slots) - len(free)
+        self.metrics.last_cycle_ms = (time.perf_counter() - start) * 1000
+
+        if dispatched:
+            logger.info(
+                "Dispatched tasks",
+                dispatched=dispatched,
+                queue_depth=self.queue_depth,
+                busy_instances=self.metrics.busy_instances,
+            )
+        return dispatched
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get throughput and fairness metrics.
+
+        Returns:
+            Dictionary of scheduler metrics
+        """
+        return self.metrics.snapshot()
+
+    def _sync(self, session: Any) -> None:
+        """Bring the heap in line with the pending tasks in the database.
+
+        New tasks are picked up incrementally by ID on every cycle. A full
+        reload runs periodically (and after requeues) to account for
+        reprioritised, requeued and deleted tasks.
+        """
+        now = time.monotonic()
+        full = (
+            self._last_resync is None or now - self._last_resync >= self.resync_interval
+        )
+
+        stmt = select(
+            Task.id,
+            Task.priority,
+            Task.due_date,
+            Task.estimated_duration,
+            Task.worktree_id,
+            Task.instance_id,
+            Task.created_at,
+        ).where(Task.status == TaskStatus.PENDING)
+        if not full:
+            stmt = stmt.where(Task.id > self._max_seen_id)
+
+        rows = session.execute(stmt).all()
+        entries = [
+            QueuedTask(
+                sort_key=task_sort_key(
+                    row.priority.value,
+                    row.due_date,
+                    row.estimated_duration,
+                    row.created_at,
+                    row.id,
+                ),
+                task_id=row.id,
+                worktree_id=row.worktree_id,
+                instance_id=row.instance_id,
+                created_at=row.created_at,
+                estimated_duration=row.estimated_duration,
+            )
+            for row in rows
+        ]
+
+        if full:
+            self._heap = entries
+            heapq.heapify(self._heap)
+            self._queued = {entry.task_id for entry in entries}
+            self._last_resync = now
+            max_id = session.execute(select(func.max(Task.id))).scalar()
+            self._max_seen_id = max_id or 0
+        else:
+            for entry in entries:
+                self._push(entry)
+                self._max_seen_id = max(self._max_seen_id, entry.task_id)
+
+    def _push(self, entry: QueuedTask) -> None:
+        if entry.task_id not in self._queued:
+            heapq.heappush(self._heap, entry)
+            self._queued.add(entry.task_id)
+
+    def _notify(self, task_id: int, instance_id: int) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(task_id, instance_id)
+            except Exception as e:
+                logger.warning("Dispatch listener failed", error=str(e))
+
+    def _running_instances(self, session: Any) -> tuple[dict[int, str], set[int]]:
+        """Find the instances that can take work and those known to be alive.
+
+        Returns:
+            Issue IDs of running instances whose process is not known to be
+            gone, and the IDs of those whose recorded process exists
+        """
+        rows = session.execute(
+            select(Instance.id, Instance.issue_id, Instance.process_id).where(
+                Instance.status == InstanceStatus.RUNNING
+            )
+        ).all()
+        running: dict[int, str] = {}
+        alive: set[int] = set()
+        for row in rows:
+            if row.process_id is None:
+                running[row.id] = row.issue_id
+            elif psutil.pid_exists(row.process_id):
+                running[row.id] = row.issue_id
+                alive.add(row.id)
+        return running, alive
+
+    def _load_instances(
+        self, session: Any, running: dict[int, str], cpu_by_issue: dict[str, float]
+    ) -> tuple[list[InstanceSlot], dict[int, int]]:
+        """Read active task counts and worktrees of the running instances."""
+        active = dict(
+            session.execute(
+                select(Task.instance_id, func.count(Task.id))
+                .where(
+                    Task.status == TaskStatus.IN_PROGRESS,
+                    Task.instance_id.is_not(None),
+                )
+                .group_by(Task.instance_id)
+            ).all()
+        )
+        owners = dict(
+            session.execute(
+                select(Worktree.id, Worktree.instance_id).where(
+                    Worktree.instance_id.is_not(None)
+                )
+            ).all()
+        )
+
+        slots = [
+            InstanceSlot(
+                instance_id=instance_id,
+                active_tasks=active.get(instance_id, 0),
+                cpu_percent=cpu_by_issue.get(issue_id, 0.0),
+                last_dispatch=self._last_dispatch.get(instance_id, 0.0),
+            )
+            for instance_id, issue_id in running.items()
+        ]
+        return slots, owners
+
+    async def _sample_cpu(self) -> dict[str, float]:
+        """Collect the latest CPU sample of every running managed process."""
+        try:
+            processes = await self.process_manager.list_processes()
+        except Exception as e:
+            logger.debug("Could not sample instance load", error=str(e))
+            return {}
+
+        return {
+            issue_id: info.cpu_percent
+            for issue_id, info in processes.items()
+            if info.status == ProcessStatus.RUNNING
+        }
+
+    async def _scheduler_loop(self) -> None:
+        """Dispatch continuously until shutdown is requested."""
+        try:
+            while not self.shutdown_event.is_set():
+                try:
+                    dispatched = await self.run_once()
+                except Exception as e:
+                    logger.error("Error in scheduler loop", error=str(e))
+                    dispatched = 0
+
+                # Keep going while work is flowing; otherwise idle until woken
+                if dispatched and self._heap:
+                    continue
+                try:
+                    await asyncio.wait_for(
+                        self.wakeup_event.wait(), timeout=self.interval
+                    )
+                except TimeoutError:
+                    pass
+                self.wakeup_event.clear()
+
+        except asyncio.CancelledError:
+            logger.info("Scheduler loop cancelled")
+            raise
+
+
+# Global scheduler instance
+_scheduler_service: SchedulerService | None = None
+
+
+def get_scheduler_service(
+    config: OrchestratorConfig | None = None,
+    db_manager: DatabaseManager | None = None,
+) -> SchedulerService:
+    """Get the global scheduler instance.
+
+    Args:
+        config: Optional configuration to use for initialization
+        db_manager: Optional database manager to use for initialization
+
+    Returns:
+        SchedulerService instance
+    """
+    global _scheduler_service
+    if _scheduler_service is None:
+        _scheduler_service = SchedulerService(config, db_manager)
+    return _scheduler_service
+
+
+async def cleanup_scheduler_service() -> None:
+    """Stop and discard the global scheduler."""
+    global _scheduler_service
+    if _scheduler_service is not None:
+        await _scheduler_service.stop()
+        _scheduler_service = None
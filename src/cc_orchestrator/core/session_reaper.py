@@ -0,0 +1,200 @@
+"""
+Orphaned tmux session reaper.
+
+An orchestrator that crashes or is restarted leaves its ``cc-orchestrator-*``
+tmux sessions behind, each holding a shell and whatever ran inside it. The
+reaper periodically lists the sessions on the tmux server, cross-references
+them against the instance registry and destroys the ones no live instance
+claims, all in one bulk destroy. Only sessions whose ``@cc-orchestrator-owner``
+option names this database are considered, so sessions created by hand or by
+orchestrators on other databases are never touched. Sessions younger than a
+grace period (an instance may be creating them right now) and sessions with
+attached clients are left alone.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+
+from sqlalchemy import select
+
+from ..config.loader import OrchestratorConfig, load_config
+from ..database.connection import DatabaseManager, get_database_manager
+from ..database.models import Instance
+from ..tmux.control import TmuxSessionState
+from ..tmux.service import TmuxService, get_tmux_service
+from ..utils.logging import LogContext, get_logger
+from .enums import InstanceStatus
+
+logger = get_logger(__name__, LogContext.TMUX)
+
+# Instances in these states still own their tmux session
+_LIVE_STATUSES = (InstanceStatus.INITIALIZING, InstanceStatus.RUNNING)
+
+
+class SessionReaperService:
+    """Background service destroying tmux sessions no instance claims."""
+
+    def __init__(
+        self,
+        config: OrchestratorConfig | None = None,
+        db_manager: DatabaseManager | None = None,
+        tmux_service: TmuxService | None = None,
+    ) -> None:
+        """Initialize the session reaper.
+
+        Args:
+            config: Configuration providing the reap interval and grace period
+            db_manager: Database manager (defaults to the global manager)
+            tmux_service: Tmux service (defaults to the global service)
+        """
+        if config is None:
+            config = load_config()
+
+        self._db_manager = db_manager
+        self._tmux_service = tmux_service
+        self.interval = config.tmux_reap_interval
+        self.min_age = config.tmux_reap_min_age
+        self.last_reaped: list[str] = []
+        self.last_run: datetime | None = None
+
+        self.reaper_task: asyncio.Task[None] | None = None
+        self.shutdown_event = asyncio.Event()
+
+    @property
+    def db_manager(self) -> DatabaseManager:
+        """Get the database manager, resolving the global one lazily."""
+        if self._db_manager is None:
+            self._db_manager = get_database_manager()
+        return self._db_manager
+
+    @property
+    def tmux_service(self) -> TmuxService:
+        """Get the tmux service, resolving the global one lazily."""
+        if self._tmux_service is None:
+            self._tmux_service = get_tmux_service()
+        return self._tmux_service
+
+    async def start(self) -> None:
+        """Start the periodic reap loop."""
+        if self.reaper_task and not self.reaper_task.done():
+            logger.warning("Session reaper is already running")
+            return
+
+        logger.info("Starting session reaper", interval=self.interval)
+        self.shutdown_event.clear()
+        self.reaper_task = asyncio.create_task(self._reaper_loop())
+
+    async def stop(self) -> None:
+        """Stop the periodic reap loop."""
+        self.shutdown_event.set()
+
+        if self.reaper_task:
+            try:
+                await asyncio.wait_for(self.reaper_task, timeout=5.0)
+            except TimeoutError:
+                logger.warning("Session reaper shutdown timed out, cancelling")
+                self.reaper_task.cancel()
+                try:
+                    await self.reaper_task
+                except asyncio.CancelledError:
+                    pass
+
+        logger.info("Session reaper stopped")
+
+    async def run_once(self, now: float | None = None) -> list[str]:
+        """Find and destroy orphaned sessions once.
+
+        Args:
+            now: Reference wall-clock time for session ages (defaults to now)
+
+        Returns:
+            Names of the sessions that were destroyed
+        """
+        now = time.time() if now is None else now
+        states = await self.tmux_service.list_session_states()
+        claimed = await asyncio.to_thread(self._claimed_sessions)
+        orphaned = self.find_orphans(states, claimed, now)
+
+        reaped = []
+        if orphaned:
+            logger.warning(
+                "Reaping orphaned tmux sessions", count=len(orphaned), sessions=orphaned
+            )
+            reaped = await self.tmux_service.destroy_sessions(orphaned)
+
+        self.last_reaped = reaped
+        self.last_run = datetime.now()
+        return reaped
+
+    def find_orphans(
+        self, states: list[TmuxSessionState], claimed: set[str], now: float
+    ) -> list[str]:
+        """Select the sessions to reap.
+
+        Args:
+            states: Sessions on the tmux server
+            claimed: Session names and instance IDs owned by live instances
+            now: Reference wall-clock time for session ages
+
+        Returns:
+            Names of sessions owned by this database that are unclaimed,
+            unattached and older than the grace period
+        """
+        service = self.tmux_service
+        owner = self.db_manager.database_id
+        orphaned = []
+        for state in states:
+            name = state.name
+            if not service.is_managed_session(name):
+                continue
+            if state.owner != owner:
+                continue
+            if service.is_tracked_session(name) or name in claimed:
+                continue
+            if service.session_instance_id(name) in claimed:
+                continue
+            if state.attached_clients:
+                continue
+            # Unknown creation time counts as new rather than risk a live one
+            if not state.created or now - state.created < self.min_age:
+                continue
+            orphaned.append(name)
+        return sorted(orphaned)
+
+    def _claimed_sessions(self) -> set[str]:
+        """Collect the session names and instance IDs of live instances."""
+        service = self.tmux_service
+        claimed: set[str] = set()
+        with self.db_manager.get_session() as session:
+            rows = session.execute(
+                select(Instance.issue_id, Instance.tmux_session).where(
+                    Instance.status.in_(_LIVE_STATUSES)
+                )
+            ).all()
+        for issue_id, tmux_session in rows:
+            claimed.add(issue_id)
+            if tmux_session:
+                claimed.add(service.normalize_session_name(tmux_session))
+        return claimed
+
+    async def _reaper_loop(self) -> None:
+        """Reap orphaned sessions until shutdown is requested."""
+        try:
+            while not self.shutdown_event.is_set():
+                try:
+                    await asyncio.wait_for(
+                        self.shutdown_event.wait(), timeout=self.interval
+                    )
+                    break
+                except TimeoutError:
+                    pass
+
+                try:
+                    await self.run_once()
+                except Exception as e:
+                    logger.error("Error in session reaper loop", error=str(e))
+
+        except asyncio.CancelledError:
+            logger.info("Session reaper loop cancelled")
+            raise
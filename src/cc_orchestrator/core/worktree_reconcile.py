@@ -0,0 +1,129 @@
+"""Set-based reconciliation of git worktrees against database records.
+
+A single ``git worktree list --porcelain -z`` listing is diffed against the
+``worktrees`` table by path. The resulting plan is applied with bulk
+statements: one INSERT for adopted worktrees, one UPDATE for records whose
+worktree disappeared and one executemany for moved HEADs, instead of a query
+per row.
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..database.models import WorktreeStatus
+
+
+@dataclass
+class ReconcilePlan:
+    """Differences between git's worktree list and the database."""
+
+    # Database rows whose worktree git still knows about
+    present: list[Any] = field(default_factory=list)
+    # Column values for worktrees git knows about but the database does not
+    to_add: list[dict[str, Any]] = field(default_factory=list)
+    # Rows whose worktree is gone or prunable and are not yet inactive
+    missing_ids: list[int] = field(default_factory=list)
+    # Inactive rows whose worktree is back
+    reactivate_ids: list[int] = field(default_factory=list)
+    # Recorded commit is behind the HEAD git reports, keyed by row ID
+    head_updates: dict[int, str] = field(default_factory=dict)
+    # Listed worktrees git considers prunable
+    prunable: list[str] = field(default_factory=list)
+    # Listed worktrees that are locked, with their (possibly empty) reason
+    locked: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether applying the plan would write anything."""
+        return not (
+            self.to_add or self.missing_ids or self.reactivate_ids or self.head_updates
+        )
+
+
+def _path_key(path: str) -> str:
+    """Normalize a path so git's and the database's spelling compare equal."""
+    return os.path.realpath(path)
+
+
+def _branch_name(entry: dict[str, str]) -> str:
+    """Short branch name for a listed worktree, ``HEAD`` when detached."""
+    branch = entry.get("branch")
+    if not branch:
+        return "HEAD"
+    return branch.removeprefix("refs/heads/")
+
+
+def plan_reconciliation(
+    git_worktrees: list[dict[str, str]],
+    db_worktrees: list[Any],
+    main_path: str | None = None,
+) -> ReconcilePlan:
+    """Diff git's worktree list against database rows.
+
+    The main worktree and bare entries are never recorded. Prunable
+    worktrees (their directory is gone and they are not locked) count as
+    missing; locked worktrees stay present even when their directory is
+    unavailable, as git itself keeps them.
+
+    Args:
+        git_worktrees: Entries from ``GitWorktreeManager.list_worktrees``
+        db_worktrees: Worktree rows from the database
+        main_path: Path of the main worktree to leave out
+
+    Returns:
+        The reconciliation plan
+    """
+    plan = ReconcilePlan()
+    main_key = _path_key(main_path) if main_path else None
+
+    listed: dict[str, dict[str, str]] = {}
+    for entry in git_worktrees:
+        path = entry.get("path")
+        if not path or entry.get("status") == "bare":
+            continue
+        key = _path_key(path)
+        if key == main_key:
+            continue
+        if "prunable" in entry:
+            plan.prunable.append(path)
+            continue
+        if "locked" in entry:
+            plan.locked[path] = entry["locked"]
+        listed[key] = entry
+
+    recorded: set[str] = set()
+    for worktree in db_worktrees:
+        key = _path_key(worktree.path)
+        recorded.add(key)
+        found = listed.get(key)
+
+        if found is None:
+            if worktree.status != WorktreeStatus.INACTIVE:
+                plan.missing_ids.append(worktree.id)
+            continue
+
+        plan.present.append(worktree)
+        if worktree.status == WorktreeStatus.INACTIVE:
+            plan.reactivate_ids.append(worktree.id)
+        commit = found.get("commit")
+        if commit and commit != worktree.current_commit:
+            plan.head_updates[worktree.id] = commit
+
+    for key in listed.keys() - recorded:
+        entry = listed[key]
+        metadata: dict[str, Any] = {"adopted": True}
+        if "locked" in entry:
+            metadata["locked"] = entry["locked"]
+        plan.to_add.append(
+            {
+                "name": os.path.basename(entry["path"].rstrip(os.sep)),
+                "path": entry["path"],
+                "branch_name": _branch_name(entry),
+                "current_commit": entry.get("commit"),
+                "extra_metadata": metadata,
+            }
+        )
+    plan.to_add.sort(key=lambda row: row["path"])
+
+    return plan
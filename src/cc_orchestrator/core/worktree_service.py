@@ -1,6 +1,7 @@
 """Worktree service that integrates git operations with database management."""
 
 import os
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
@@ -8,10 +9,20 @@ from ..database.connection import get_db_session
 from ..database.crud import WorktreeCRUD
 from ..database.models import WorktreeStatus
 from ..utils.logging import LogContext, get_logger
+from .enums import WorktreeCheckoutMode
 from .git_operations import GitWorktreeError, GitWorktreeManager
+from .worktree_reconcile import ReconcilePlan, plan_reconciliation
+from .worktree_watcher import WorktreeStatusCache
 
 logger = get_logger(__name__, LogContext.WORKTREE)
 
+# Concurrent git status checks during sync
+SYNC_MAX_WORKERS = 8
+
+# Unchanged worktrees are still re-checked once their last sync is this old,
+# so unstaged edits (which the fingerprint cannot see) are picked up eventually
+SYNC_MAX_SKIP_SECONDS = 300
+
 
 class WorktreeServiceError(Exception):
     """Base exception for worktree service operations."""
@@ -23,7 +34,10 @@ class WorktreeService:
     """Service for managing git worktrees with database persistence."""
 
     def __init__(
-        self, repo_path: str | None = None, base_worktree_dir: str | None = None
+        self,
+        repo_path: str | None = None,
+        base_worktree_dir: str | None = None,
+        status_cache: WorktreeStatusCache | None = None,
     ):
         """Initialize the WorktreeService.
 
@@ -31,8 +45,11 @@ class WorktreeService:
             repo_path: Path to the git repository. If None, uses current directory.
             base_worktree_dir: Base directory for creating worktrees.
                              If None, uses ../worktrees relative to repo.
+            status_cache: Watcher-maintained status cache consulted before
+                          running git for status lookups.
         """
         self.git_manager = GitWorktreeManager(repo_path)
+        self.status_cache = status_cache
 
         if base_worktree_dir is None:
             repo_parent = Path(self.git_manager.repo_path).parent
@@ -90,6 +107,8 @@ class WorktreeService:
         custom_path: str | None = None,
         instance_id: int | None = None,
         force: bool = False,
+        checkout_mode: WorktreeCheckoutMode = WorktreeCheckoutMode.FULL,
+        sparse_paths: list[str] | None = None,
     ) -> dict[str, Any]:
         """Create a new git worktree and register it in the database.
 
@@ -100,6 +119,9 @@ class WorktreeService:
             custom_path: Custom path for the worktree (overrides default)
             instance_id: Associate with an instance
             force: Force creation even if path exists
+            checkout_mode: How to materialize files (see
+                ``GitWorktreeManager.create_worktree``)
+            sparse_paths: Paths the work touches, for sparse checkouts
 
         Returns:
             Dictionary with created worktree information
@@ -124,7 +146,10 @@ class WorktreeService:
                 branch=branch,
                 checkout_branch=checkout_branch,
                 force=force,
+                mode=checkout_mode,
+                sparse_paths=sparse_paths,
             )
+            used_mode = git_info.get("checkout_mode", checkout_mode.value)
 
             # Store in database
             with get_db_session() as session:
@@ -138,6 +163,8 @@ class WorktreeService:
                     git_config={
                         "checkout_branch": checkout_branch,
                         "created_from": checkout_branch or "HEAD",
+                        "checkout_mode": used_mode,
+                        "sparse_paths": sparse_paths,
                     },
                 )
 
@@ -160,6 +187,7 @@ class WorktreeService:
                     "status": worktree.status.value,
                     "commit": git_info["commit"],
                     "instance_id": worktree.instance_id,
+                    "checkout_mode": used_mode,
                 }
 
                 logger.info(f"Successfully created worktree: {result}")
@@ -172,6 +200,31 @@ class WorktreeService:
             logger.error(f"Unexpected error creating worktree: {e}")
             raise WorktreeServiceError(f"Unexpected error: {e}") from e
 
+    def populate_worktree(
+        self, path_or_id: str | int, paths: list[str] | None = None
+    ) -> None:
+        """Check out more of a sparse or ``--no-checkout`` worktree.
+
+        Args:
+            path_or_id: Worktree path or database ID
+            paths: Paths now needed; None checks out everything
+
+        Raises:
+            WorktreeServiceError: If population fails
+        """
+        try:
+            if isinstance(path_or_id, int):
+                with get_db_session() as session:
+                    worktree = WorktreeCRUD.get_by_id(session, path_or_id)
+                    path = worktree.path
+            else:
+                path = os.path.abspath(path_or_id)
+
+            self.git_manager.populate_worktree(path, paths)
+        except Exception as e:
+            logger.error(f"Failed to populate worktree: {e}")
+            raise WorktreeServiceError(f"Failed to populate worktree: {e}") from e
+
     def remove_worktree(self, path_or_id: str | int, force: bool = False) -> bool:
         """Remove a worktree and its database record.
 
@@ -260,86 +313,121 @@ class WorktreeService:
             logger.error(f"Cleanup failed: {e}")
             raise WorktreeServiceError(f"Cleanup failed: {e}") from e
 
-    def sync_worktrees(self) -> dict[str, int]:
+    def sync_worktrees(
+        self, force: bool = False, max_workers: int | None = None
+    ) -> dict[str, int]:
         """Sync database worktrees with actual git worktrees.
 
+        One ``git worktree list --porcelain -z`` listing is reconciled
+        against the database with bulk statements: worktrees git knows about
+        but the database does not are adopted, records whose worktree is
+        gone or prunable are marked inactive, returning ones are reactivated
+        and moved HEADs are recorded.
+
+        Worktrees whose git fingerprint (HEAD, index mtime and refs) matches
+        the one recorded at their last sync are then skipped, unless that
+        sync is older than ``SYNC_MAX_SKIP_SECONDS``. The remaining status
+        checks run concurrently and all updates are committed in a single
+        transaction.
+
+        Args:
+            force: Check every worktree even if its fingerprint is unchanged
+            max_workers: Maximum concurrent status checks (defaults to
+                ``SYNC_MAX_WORKERS``)
+
         Returns:
             Dictionary with sync statistics:
             - updated: Number of worktrees updated with new status
             - added: Number of new worktrees found and added
             - marked_missing: Number of worktrees marked as missing
+            - reactivated: Number of inactive worktrees found again
+            - skipped: Number of worktrees skipped as unchanged
         """
         updated = 0
-        added = 0
-        marked_missing = 0
+        skipped = 0
 
         try:
             # Get current git worktrees
             git_worktrees = self.git_manager.list_worktrees()
-            git_paths = {wt.get("path") for wt in git_worktrees if wt.get("path")}
 
             with get_db_session() as session:
                 # Get database worktrees
                 db_worktrees = WorktreeCRUD.list_all(session)
+                now = datetime.now()
+
+                plan = plan_reconciliation(
+                    git_worktrees, db_worktrees, self.git_manager.repo_path
+                )
+                self._apply_reconcile_plan(session, plan)
+
+                to_check = []
+                for worktree in plan.present:
+                    fingerprint = self.git_manager.get_worktree_fingerprint(
+                        worktree.path
+                    )
+                    if not force and self._is_unchanged(worktree, fingerprint, now):
+                        skipped += 1
+                        continue
+                    to_check.append(worktree)
+
+                if to_check:
+                    # Keeps rev-list based ahead/behind counts cheap
+                    self.git_manager.ensure_commit_graph()
+
+                statuses = self._collect_statuses(
+                    [worktree.path for worktree in to_check], max_workers
+                )
 
                 # Update existing worktrees with current status
-                for worktree in db_worktrees:
-                    if worktree.path in git_paths:
-                        # Get detailed status
-                        try:
-                            status_info = self.git_manager.get_worktree_status(
-                                worktree.path
-                            )
-
-                            # Determine status
-                            if status_info["has_changes"]:
-                                new_status = WorktreeStatus.DIRTY
-                            else:
-                                new_status = WorktreeStatus.ACTIVE
-
-                            # Update if changed
-                            if (
-                                worktree.status != new_status
-                                or worktree.current_commit != status_info["commit"]
-                                or worktree.has_uncommitted_changes
-                                != status_info["has_changes"]
-                            ):
-                                WorktreeCRUD.update_status(
-                                    session=session,
-                                    worktree_id=worktree.id,
-                                    status=new_status,
-                                    current_commit=status_info["commit"],
-                                    has_uncommitted_changes=status_info["has_changes"],
-                                )
-                                updated += 1
-
-                        except Exception as e:
-                            logger.warning(
-                                f"Could not get status for {worktree.path}: {e}"
-                            )
+                for worktree in to_check:
+                    if worktree.path not in statuses:
+                        continue
+                    status_info, fingerprint = statuses[worktree.path]
+                    # The status update below records the new commit itself
+                    plan.head_updates.pop(worktree.id, None)
+
+                    # Determine status
+                    if status_info["has_changes"]:
+                        new_status = WorktreeStatus.DIRTY
                     else:
-                        # Mark as missing/inactive
-                        if worktree.status != WorktreeStatus.INACTIVE:
-                            WorktreeCRUD.update_status(
-                                session=session,
-                                worktree_id=worktree.id,
-                                status=WorktreeStatus.INACTIVE,
-                            )
-                            marked_missing += 1
-
-                # TODO: Add logic to discover new worktrees not in database
-                # This would require additional logic to determine names and metadata
+                        new_status = WorktreeStatus.ACTIVE
+
+                    # Update if changed
+                    if (
+                        worktree.status != new_status
+                        or worktree.current_commit != status_info["commit"]
+                        or worktree.has_uncommitted_changes
+                        != status_info["has_changes"]
+                    ):
+                        WorktreeCRUD.update_status(
+                            session=session,
+                            worktree_id=worktree.id,
+                            status=new_status,
+                            current_commit=status_info["commit"],
+                            has_uncommitted_changes=status_info["has_changes"],
+                        )
+                        updated += 1
+                    else:
+                        worktree.last_sync = now
+                    worktree.sync_fingerprint = fingerprint
+
+                # HEADs that moved on worktrees whose status was not re-read
+                WorktreeCRUD.bulk_update_commits(session, plan.head_updates)
 
                 session.commit()
 
             result = {
                 "updated": updated,
-                "added": added,
-                "marked_missing": marked_missing,
+                "added": len(plan.to_add),
+                "marked_missing": len(plan.missing_ids),
+                "reactivated": len(plan.reactivate_ids),
+                "skipped": skipped,
             }
 
             logger.info(
-                f"Sync completed: {updated} updated, {added} added, {marked_missing} marked missing"
+                f"Sync completed: {updated} updated, {len(plan.to_add)} added, "
+                f"{len(plan.missing_ids)} marked missing, "
+                f"{len(plan.reactivate_ids)} reactivated, {skipped} unchanged"
             )
             return result
 
@@ -347,6 +435,66 @@ class WorktreeService:
             logger.error(f"Sync failed: {e}")
             raise WorktreeServiceError(f"Sync failed: {e}") from e
 
+    def _apply_reconcile_plan(self, session: Any, plan: ReconcilePlan) -> None:
+        """Write the set-based part of a reconciliation plan."""
+        if plan.to_add:
+            repository_url = self._get_repository_url()
+            for row in plan.to_add:
+                row["repository_url"] = repository_url
+            WorktreeCRUD.bulk_create(session, plan.to_add)
+            logger.info(
+                f"Adopted {len(plan.to_add)} worktrees created outside the orchestrator"
+            )
+
+        WorktreeCRUD.bulk_update_status(
+            session, plan.missing_ids, WorktreeStatus.INACTIVE
+        )
+        WorktreeCRUD.bulk_update_status(
+            session, plan.reactivate_ids, WorktreeStatus.ACTIVE
+        )
+        if plan.prunable:
+            logger.info(f"{len(plan.prunable)} worktrees are prunable")
+
+    def _is_unchanged(
+        self, worktree: Any, fingerprint: str | None, now: datetime
+    ) -> bool:
+        """Check whether a worktree can skip its status check."""
+        if fingerprint is None or worktree.sync_fingerprint != fingerprint:
+            return False
+        if not isinstance(worktree.last_sync, datetime):
+            return False
+        age = (now - worktree.last_sync).total_seconds()
+        return age < SYNC_MAX_SKIP_SECONDS
+
+    def _collect_statuses(
+        self, paths: list[str], max_workers: int | None = None
+    ) -> dict[str, tuple[dict[str, Any], str | None]]:
+        """Get git status and fingerprint for several worktrees concurrently.
+
+        Statuses come from parallel ``git status --porcelain=v2`` runs. The
+        fingerprint is taken after the status check because ``git status``
+        may refresh the index. Worktrees whose status cannot be read are
+        logged and left out.
+        """
+        if not paths:
+            return {}
+
+        results = self.git_manager.get_worktree_statuses(
+            paths, max_workers or SYNC_MAX_WORKERS
+        )
+        statuses: dict[str, tuple[dict[str, Any], str | None]] = {}
+        for path in paths:
+            status = results.get(path)
+            if status is None or isinstance(status, Exception):
+                logger.warning(f"Could not get status for {path}: {status}")
+                continue
+            statuses[path] = (
+                status,
+                self.git_manager.get_worktree_fingerprint(path),
+            )
+
+        return statuses
+
     def get_worktree_status(self, path_or_id: str | int) -> dict[str, Any]:
         """Get detailed status of a worktree.
 
@@ -365,8 +513,12 @@ class WorktreeService:
                     worktree_path = os.path.abspath(path_or_id)
                     worktree = WorktreeCRUD.get_by_path(session, worktree_path)
 
-                # Get git status
-                git_status = self.git_manager.get_worktree_status(worktree.path)
+                # Get git status, preferring the watcher's cached copy
+                git_status = None
+                if self.status_cache is not None:
+                    git_status = self.status_cache.get_status(worktree.path)
+                if git_status is None:
+                    git_status = self.git_manager.get_worktree_status(worktree.path)
 
                 # Combine database and git information
                 result = {
@@ -0,0 +1,626 @@
+"""
+Filesystem-watcher driven worktree status cache.
+
+A watchdog observer watches each managed worktree's working tree (recursively,
+honoring ``.gitignore``) and its git directory (HEAD and index). Events are
+debounced per worktree; once a worktree has been quiet for the debounce window
+its git status is refreshed once and stored in ``WorktreeStatusCache``. Readers
+such as ``WorktreeService.get_worktree_status`` and the ``/worktrees`` API look
+status up in O(1) instead of running git on demand, and listeners registered
+on the cache (e.g. the websocket bridge) are told about every change.
+"""
+
+import asyncio
+import fnmatch
+import os
+import re
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import select
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+
+from ..config.loader import OrchestratorConfig, load_config
+from ..database.connection import DatabaseManager, get_database_manager
+from ..database.models import Worktree, WorktreeStatus
+from ..utils.logging import LogContext, get_logger
+from .git_operations import resolve_git_dirs
+from .git_runner import get_git_runner
+
+logger = get_logger(__name__, LogContext.WORKTREE)
+
+# Quiet period after the last event before a worktree's status is refreshed
+DEFAULT_DEBOUNCE_SECONDS = 0.5
+
+# Files in a worktree's git directory whose changes affect status
+_GIT_DIR_FILES = frozenset({"HEAD", "index", "ORIG_HEAD", "MERGE_HEAD"})
+
+StatusListener = Callable[[str, "CachedWorktreeStatus | None"], None]
+
+
+@dataclass
+class CachedWorktreeStatus:
+    """Last known git status of a watched worktree."""
+
+    path: str
+    branch: str | None = None
+    commit: str | None = None
+    has_changes: bool = False
+    ahead: int = 0
+    behind: int = 0
+    stale: bool = True
+    updated_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def status(self) -> WorktreeStatus:
+        """Worktree status implied by the cached git state."""
+        return WorktreeStatus.DIRTY if self.has_changes else WorktreeStatus.ACTIVE
+
+    def to_git_status(self) -> dict[str, Any]:
+        """Render in the shape returned by ``get_worktree_status``."""
+        return {
+            "path": self.path,
+            "branch": self.branch,
+            "commit": self.commit,
+            "has_changes": self.has_changes,
+            "is_dirty": self.has_changes,
+            "ahead": self.ahead,
+            "behind": self.behind,
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializable view used for websocket pushes."""
+        return {
+            **self.to_git_status(),
+            "status": self.status.value,
+            "stale": self.stale,
+            "updated_at": self.updated_at.isoformat(),
+        }
+
+
+class WorktreeStatusCache:
+    """Thread-safe in-memory map of worktree path to cached status."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, CachedWorktreeStatus] = {}
+        self._lock = threading.Lock()
+        self._listeners: list[StatusListener] = []
+
+    def get(self, path: str) -> CachedWorktreeStatus | None:
+        """Get the cached status for a worktree path."""
+        return self._entries.get(os.path.abspath(path))
+
+    def get_status(self, path: str) -> dict[str, Any] | None:
+        """Get fresh cached git status for a path, or None if unknown or stale."""
+        entry = self.get(path)
+        if entry is None or entry.stale:
+            return None
+        return entry.to_git_status()
+
+    def put(self, path: str, git_status: dict[str, Any]) -> CachedWorktreeStatus:
+        """Store a freshly computed git status and notify listeners on change.
+
+        Args:
+            path: Worktree path
+            git_status: Result of ``GitWorktreeManager.get_worktree_status``
+
+        Returns:
+            The new cache entry
+        """
+        key = os.path.abspath(path)
+        entry = CachedWorktreeStatus(
+            path=key,
+            branch=git_status.get("branch"),
+            commit=git_status.get("commit"),
+            has_changes=bool(git_status.get("has_changes")),
+            ahead=git_status.get("ahead", 0),
+            behind=git_status.get("behind", 0),
+            stale=False,
+        )
+        with self._lock:
+            previous = self._entries.get(key)
+            self._entries[key] = entry
+
+        if previous is None or previous.to_git_status() != entry.to_git_status():
+            self._notify(key, entry)
+        return entry
+
+    def mark_stale(self, path: str) -> None:
+        """Flag a worktree as changed on disk but not yet refreshed."""
+        key = os.path.abspath(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._entries[key] = CachedWorktreeStatus(path=key)
+            else:
+                entry.stale = True
+
+    def remove(self, path: str) -> None:
+        """Forget a worktree."""
+        key = os.path.abspath(path)
+        with self._lock:
+            removed = self._entries.pop(key, None)
+        if removed is not None:
+            self._notify(key, None)
+
+    def add_listener(self, listener: StatusListener) -> None:
+        """Register a callback invoked with ``(path, entry)`` on every change.
+
+        ``entry`` is None when a worktree stops being watched. Callbacks run on
+        the watcher thread and must not block.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: StatusListener) -> None:
+        """Unregister a change callback."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _notify(self, path: str, entry: CachedWorktreeStatus | None) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(path, entry)
+            except Exception as e:
+                logger.warning(f"Worktree status listener failed: {e}")
+
+
+class GitIgnoreRules:
+    """Minimal ``.gitignore`` matcher for filtering watcher events.
+
+    Supports comments, negation (``!``), directory-only patterns (trailing
+    ``/``), anchored patterns (leading or embedded ``/``) and ``**``. Rules are
+    read from the worktree's top-level ``.gitignore`` and ``info/exclude``.
+    """
+
+    def __init__(self, root: str, lines: list[str] | None = None) -> None:
+        self.root = os.path.abspath(root)
+        self._rules: list[tuple[re.Pattern[str], bool, bool]] = []
+        for line in lines or []:
+            self.add(line)
+
+    @classmethod
+    def for_worktree(cls, root: str, common_dir: str | None = None) -> "GitIgnoreRules":
+        """Load the ignore rules that apply to a worktree."""
+        lines: list[str] = []
+        sources = [os.path.join(root, ".gitignore")]
+        if common_dir:
+            sources.append(os.path.join(common_dir, "info", "exclude"))
+        for source in sources:
+            try:
+                with open(source) as f:
+                    lines.extend(f.read().splitlines())
+            except OSError:
+                continue
+        return cls(root, lines)
+
+    def add(self, line: str) -> None:
+        """Add a single ``.gitignore`` pattern line."""
+        pattern = line.rstrip()
+        if not pattern or pattern.startswith("#"):
+            return
+
+        negate = pattern.startswith("!")
+        if negate:
+            pattern = pattern[1:]
+        dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        if not pattern:
+            return
+
+        regex = _translate_glob(pattern)
+        if not anchored:
+            regex = f"(?:.*/)?{regex}"
+        self._rules.append((re.compile(f"^{regex}$"), negate, dir_only))
+
+    def is_ignored(self, path: str, is_dir: bool = False) -> bool:
+        """Check whether a path inside the worktree is ignored."""
+        rel = os.path.relpath(os.path.abspath(path), self.root)
+        if rel.startswith(".."):
+            return False
+        parts = rel.replace(os.sep, "/").split("/")
+
+        # A path is ignored if it or any parent directory is ignored
+        for depth in range(1, len(parts) + 1):
+            candidate = "/".join(parts[:depth])
+            candidate_is_dir = is_dir or depth < len(parts)
+            if self._match(candidate, candidate_is_dir):
+                return True
+        return False
+
+    def _match(self, rel: str, is_dir: bool) -> bool:
+        ignored = False
+        for regex, negate, dir_only in self._rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel):
+                ignored = not negate
+        return ignored
+
+
+def _translate_glob(pattern: str) -> str:
+    """Translate a gitignore glob (with ``**``) into a regex fragment."""
+    pieces = []
+    for i, chunk in enumerate(pattern.split("**")):
+        if i:
+            pieces.append(".*")
+        # fnmatch.translate wraps the result as (?s:...)\Z; keep only the body
+        translated = fnmatch.translate(chunk)[4:-3] if chunk else ""
+        pieces.append(translated.replace(".*", "[^/]*"))
+    return "".join(pieces)
+
+
+class _WorktreeEventHandler(FileSystemEventHandler):
+    """Forwards relevant filesystem events for one worktree to the watcher."""
+
+    def __init__(
+        self,
+        watcher: "WorktreeWatcher",
+        worktree_path: str,
+        ignore: GitIgnoreRules,
+        git_dir: str | None,
+    ) -> None:
+        self.watcher = watcher
+        self.worktree_path = worktree_path
+        self.ignore = ignore
+        self.git_dir = git_dir
+
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        if event.event_type in ("opened", "closed", "closed_no_write"):
+            return
+        if event.is_directory and event.event_type == "modified":
+            # Directory mtime bumps accompany the child events we already get
+            return
+        paths = [os.fsdecode(event.src_path)]
+        dest = getattr(event, "dest_path", "")
+        if dest:
+            paths.append(os.fsdecode(dest))
+        if any(self._is_relevant(path, event.is_directory) for path in paths):
+            self.watcher.notify_changed(self.worktree_path)
+
+    def _is_relevant(self, path: str, is_dir: bool) -> bool:
+        if self.git_dir and os.path.dirname(path) == self.git_dir:
+            name = os.path.basename(path)
+            if name == "index":
+                return self.watcher.index_changed(self.worktree_path)
+            return name in _GIT_DIR_FILES
+
+        rel = os.path.relpath(path, self.worktree_path)
+        if rel == ".git" or rel.startswith(".git" + os.sep):
+            return False
+        return not self.ignore.is_ignored(path, is_dir)
+
+
+def _porcelain_status(path: str) -> dict[str, Any]:
+    """Compute a worktree's git status with a single git process."""
+    return get_git_runner(path).status(path).to_status_dict()
+
+
+def _index_stat(git_dir: str) -> tuple[int, int, int] | None:
+    """Identity of a git index file as (inode, size, mtime), None if missing."""
+    try:
+        st = os.stat(os.path.join(git_dir, "index"))
+    except OSError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+class WorktreeWatcher:
+    """Watches worktrees and keeps a ``WorktreeStatusCache`` up to date."""
+
+    def __init__(
+        self,
+        cache: "WorktreeStatusCache | None" = None,
+        status_fn: Callable[[str], dict[str, Any]] | None = None,
+        debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+    ) -> None:
+        """Initialize the watcher.
+
+        Args:
+            cache: Cache to populate (defaults to the global cache)
+            status_fn: Computes git status for a path (defaults to one
+                ``git status --porcelain=v2`` run per refresh)
+            debounce_seconds: Quiet period before a refresh
+        """
+        self.cache = cache if cache is not None else get_worktree_status_cache()
+        self.status_fn = status_fn or _porcelain_status
+        self.debounce_seconds = debounce_seconds
+
+        self._observer: Any = None
+        self._watches: dict[str, list[Any]] = {}
+        self._git_dirs: dict[str, str] = {}
+        self._index_stats: dict[str, tuple[int, int, int] | None] = {}
+        self._pending: dict[str, float] = {}
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def watched_paths(self) -> set[str]:
+        """Paths currently being watched."""
+        return set(self._watches)
+
+    def start(self) -> None:
+        """Start the observer and the debounce thread."""
+        if self._running:
+            return
+
+        self._observer = Observer()
+        self._observer.daemon = True
+        self._observer.start()
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._debounce_loop, name="worktree-watcher", daemon=True
+        )
+        self._thread.start()
+        logger.info("Worktree watcher started")
+
+    def stop(self) -> None:
+        """Stop watching and wait for the background threads to exit."""
+        if not self._running:
+            return
+
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread:
+            self._thread.join(timeout=5.0)
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5.0)
+        self._watches.clear()
+        logger.info("Worktree watcher stopped")
+
+    def watch(self, path: str) -> bool:
+        """Start watching a worktree and schedule an initial status refresh.
+
+        Args:
+            path: Worktree path
+
+        Returns:
+            True if the worktree is now watched
+        """
+        key = os.path.abspath(path)
+        if key in self._watches:
+            return True
+        if self._observer is None or not os.path.isdir(key):
+            return False
+
+        try:
+            dirs = resolve_git_dirs(key)
+        except OSError:
+            dirs = None
+        git_dir = dirs[0] if dirs else None
+        ignore = GitIgnoreRules.for_worktree(key, dirs[1] if dirs else None)
+        handler = _WorktreeEventHandler(self, key, ignore, git_dir)
+
+        watches = [self._observer.schedule(handler, key, recursive=True)]
+        if git_dir and not git_dir.startswith(key + os.sep):
+            # Linked worktrees keep HEAD and index outside the working tree
+            watches.append(self._observer.schedule(handler, git_dir, recursive=False))
+        self._watches[key] = watches
+        if git_dir:
+            self._git_dirs[key] = git_dir
+
+        self.cache.mark_stale(key)
+        self._schedule(key, delay=0.0)
+        return True
+
+    def unwatch(self, path: str) -> None:
+        """Stop watching a worktree and drop its cached status."""
+        key = os.path.abspath(path)
+        for watch in self._watches.pop(key, []):
+            try:
+                self._observer.unschedule(watch)
+            except (KeyError, ValueError):
+                pass
+        with self._condition:
+            self._pending.pop(key, None)
+        self._git_dirs.pop(key, None)
+        self._index_stats.pop(key, None)
+        self.cache.remove(key)
+
+    def sync(self, paths: list[str]) -> None:
+        """Watch exactly the given worktree paths."""
+        wanted = {os.path.abspath(path) for path in paths}
+        for path in self.watched_paths - wanted:
+            self.unwatch(path)
+        for path in wanted - self.watched_paths:
+            self.watch(path)
+
+    def notify_changed(self, path: str) -> None:
+        """Record a change in a worktree; the refresh is debounced."""
+        self.cache.mark_stale(path)
+        self._schedule(os.path.abspath(path), delay=self.debounce_seconds)
+
+    def index_changed(self, path: str) -> bool:
+        """Whether a worktree's index differs from the one its last refresh saw.
+
+        Index events that only stem from the refresh itself (git may rewrite
+        the index while computing status) are ignored this way, so a refresh
+        never triggers another one.
+        """
+        git_dir = self._git_dirs.get(path)
+        if git_dir is None or path not in self._index_stats:
+            return True
+        return _index_stat(git_dir) != self._index_stats[path]
+
+    def refresh(self, path: str) -> CachedWorktreeStatus | None:
+        """Recompute and cache a worktree's git status immediately."""
+        try:
+            return self.cache.put(path, self.status_fn(path))
+        except Exception as e:
+            logger.debug(f"Could not refresh worktree status for {path}: {e}")
+            return None
+        finally:
+            git_dir = self._git_dirs.get(path)
+            if git_dir is not None:
+                self._index_stats[path] = _index_stat(git_dir)
+
+    def _schedule(self, path: str, delay: float) -> None:
+        with self._condition:
+            self._pending[path] = time.monotonic() + delay
+            self._condition.notify()
+
+    def _debounce_loop(self) -> None:
+        while True:
+            with self._condition:
+                if not self._running:
+                    return
+                now = time.monotonic()
+                due = [p for p, deadline in self._pending.items() if deadline <= now]
+                for path in due:
+                    del self._pending[path]
+                if not due:
+                    timeout = (
+                        min(self._pending.values()) - now if self._pending else None
+                    )
+                    self._condition.wait(timeout)
+                    continue
+
+            for path in due:
+                if path in self._watches:
+                    self.refresh(path)
+
+
+class WorktreeWatcherService:
+    """Runs a ``WorktreeWatcher`` over the worktrees recorded in the database.
+
+    The set of watched paths is reconciled with the ``worktrees`` table on
+    start and then periodically, so worktrees created or removed through any
+    code path are picked up without explicit registration.
+    """
+
+    def __init__(
+        self,
+        config: OrchestratorConfig | None = None,
+        db_manager: DatabaseManager | None = None,
+        cache: WorktreeStatusCache | None = None,
+    ) -> None:
+        """Initialize the watcher service.
+
+        Args:
+            config: Configuration providing watcher settings
+            db_manager: Database manager (defaults to the global manager)
+            cache: Status cache to populate (defaults to the global cache)
+        """
+        if config is None:
+            config = load_config()
+
+        self._db_manager = db_manager
+        self.interval = config.worktree_watch_reconcile_interval
+        self.watcher = WorktreeWatcher(
+            cache=cache, debounce_seconds=config.worktree_watch_debounce
+        )
+
+        self.reconcile_task: asyncio.Task | None = None
+        self.shutdown_event = asyncio.Event()
+
+    @property
+    def db_manager(self) -> DatabaseManager:
+        """Get the database manager, resolving the global one lazily."""
+        if self._db_manager is None:
+            self._db_manager = get_database_manager()
+        return self._db_manager
+
+    @property
+    def cache(self) -> WorktreeStatusCache:
+        """Status cache maintained by the watcher."""
+        return self.watcher.cache
+
+    async def start(self) -> None:
+        """Start watching and the periodic reconcile loop."""
+        if self.reconcile_task and not self.reconcile_task.done():
+            logger.warning("Worktree watcher service is already running")
+            return
+
+        self.watcher.start()
+        await self.run_once()
+        self.shutdown_event.clear()
+        self.reconcile_task = asyncio.create_task(self._reconcile_loop())
+
+    async def stop(self) -> None:
+        """Stop the reconcile loop and the watcher."""
+        self.shutdown_event.set()
+
+        if self.reconcile_task:
+            try:
+                await asyncio.wait_for(self.reconcile_task, timeout=5.0)
+            except TimeoutError:
+                logger.warning("Worktree watcher shutdown timed out, cancelling")
+                self.reconcile_task.cancel()
+                try:
+                    await self.reconcile_task
+                except asyncio.CancelledError:
+                    pass
+
+        await asyncio.to_thread(self.watcher.stop)
+
+    async def run_once(self) -> set[str]:
+        """Reconcile watched paths with the database without blocking the loop.
+
+        Returns:
+            Paths being watched afterwards
+        """
+        return await asyncio.to_thread(self.reconcile)
+
+    def reconcile(self) -> set[str]:
+        """Watch every worktree recorded in the database, and nothing else."""
+        with self.db_manager.get_session() as session:
+            paths = session.scalars(
+                select(Worktree.path).where(Worktree.status != WorktreeStatus.INACTIVE)
+            ).all()
+        self.watcher.sync(list(paths))
+        return self.watcher.watched_paths
+
+    async def _reconcile_loop(self) -> None:
+        """Reconcile watched paths until shutdown is requested."""
+        try:
+            while not self.shutdown_event.is_set():
+                try:
+                    await asyncio.wait_for(
+                        self.shutdown_event.wait(), timeout=self.interval
+                    )
+                    break
+                except TimeoutError:
+                    pass
+
+                try:
+                    await self.run_once()
+                except Exception as e:
+                    logger.error(f"Error reconciling watched worktrees: {e}")
+
+        except asyncio.CancelledError:
+            logger.info("Worktree watcher loop cancelled")
+            raise
+
+
+# Global status cache instance
+_status_cache: WorktreeStatusCache | None = None
+
+
+def get_worktree_status_cache() -> WorktreeStatusCache:
+    """Get the global worktree status cache.
+
+    Returns:
+        WorktreeStatusCache instance
+    """
+    global _status_cache
+    if _status_cache is None:
+        _status_cache = WorktreeStatusCache()
+    return _status_cache
+
+
+def cleanup_worktree_status_cache() -> None:
+    """Discard the global worktree status cache."""
+    global _status_cache
+    _status_cache = None
@@ -0,0 +1,30 @@
+"""
+Orchestrator daemon.
+
+A long-running process hosts the orchestrator, health monitor, process
+manager and task scheduler in one event loop and serves RPCs from the CLI
+and the web app over a Unix domain socket. Monitoring and scheduling keep
+running between commands, and commands reuse the daemon's warm state instead
+of building a fresh orchestrator each time.
+
+Only the lightweight client side is exported here. Import the server and
+the service from ``.server`` and ``.service``.
+"""
+
+from .client import (
+    AsyncDaemonClient,
+    DaemonClient,
+    connect_daemon,
+    connect_daemon_async,
+    get_socket_path,
+)
+from .protocol import RPCError
+
+__all__ = [
+    "AsyncDaemonClient",
+    "DaemonClient",
+    "RPCError",
+    "connect_daemon",
+    "connect_daemon_async",
+    "get_socket_path",
+]
@@ -0,0 +1,218 @@
+"""
+Client side of the daemon RPC protocol.
+
+The CLI uses this module on every command, so it only depends on the
+standard library: talking to a running daemon must not pay for importing the
+database, git, tmux or web stacks. The web app uses the asyncio client so
+forwarding a request does not block its event loop.
+"""
+
+import asyncio
+import itertools
+import os
+import socket
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from .protocol import (
+    HEADER,
+    RPCError,
+    decode_payload,
+    encode_frame,
+    payload_size,
+    read_frame,
+)
+
+# Environment variable overriding the socket path; empty disables the daemon
+SOCKET_ENV_VAR = "CC_ORCHESTRATOR_DAEMON_SOCKET"
+
+# Seconds to wait for a response before giving up on the daemon
+DEFAULT_TIMEOUT = 300.0
+
+
+def get_socket_path() -> Path | None:
+    """Get the daemon socket path, or None when daemon use is disabled."""
+    configured = os.environ.get(SOCKET_ENV_VAR)
+    if configured is None:
+        return Path.home() / ".cc-orchestrator" / "orchestrator.sock"
+    if not configured:
+        return None
+    return Path(configured).expanduser()
+
+
+class DaemonClient:
+    """Blocking connection to the orchestrator daemon."""
+
+    def __init__(self, sock: socket.socket) -> None:
+        """Initialize the client.
+
+        Args:
+            sock: Connected Unix domain socket
+        """
+        self._sock = sock
+        self._ids = itertools.count(1)
+
+    def call(self, method: str, **params: Any) -> Any:
+        """Invoke an RPC method and wait for its result.
+
+        Args:
+            method: Method name, e.g. ``instances.list``
+            **params: Method parameters
+
+        Returns:
+            The method result
+
+        Raises:
+            RPCError: If the method failed on the daemon
+        """
+        request_id = next(self._ids)
+        self._sock.sendall(
+            encode_frame({"id": request_id, "method": method, "params": params})
+        )
+        return _unwrap(read_frame(self._sock), request_id)
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._sock.close()
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class AsyncDaemonClient:
+    """Asyncio connection to the orchestrator daemon."""
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            reader: Stream reading from the daemon socket
+            writer: Stream writing to the daemon socket
+            timeout: Seconds to wait for each response
+        """
+        self._reader = reader
+        self._writer = writer
+        self._timeout = timeout
+        self._ids = itertools.count(1)
+
+    async def call(self, method: str, **params: Any) -> Any:
+        """Invoke an RPC method and wait for its result.
+
+        Args:
+            method: Method name, e.g. ``instances.list``
+            **params: Method parameters
+
+        Returns:
+            The method result
+
+        Raises:
+            RPCError: If the method failed on the daemon
+        """
+        request_id = next(self._ids)
+        self._writer.write(
+            encode_frame({"id": request_id, "method": method, "params": params})
+        )
+        await self._writer.drain()
+        response = await asyncio.wait_for(self._read_frame(), self._timeout)
+        return _unwrap(response, request_id)
+
+    async def _read_frame(self) -> dict[str, Any]:
+        try:
+            header = await self._reader.readexactly(HEADER.size)
+            payload = await self._reader.readexactly(payload_size(header))
+        except asyncio.IncompleteReadError as e:
+            raise ConnectionError("Connection closed in the middle of a frame") from e
+        return decode_payload(payload)
+
+    async def close(self) -> None:
+        """Close the connection."""
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    async def __aenter__(self) -> "AsyncDaemonClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+
+def _unwrap(response: dict[str, Any], request_id: int) -> Any:
+    """Get the result of a response, raising the error it carries."""
+    if response.get("id") != request_id:
+        raise RPCError("Response does not match the request", "ProtocolError")
+    error = response.get("error")
+    if error is not None:
+        raise RPCError(error.get("message", ""), error.get("type", "RPCError"))
+    return response.get("result")
+
+
+def connect_daemon(
+    socket_path: str | Path | None = None, timeout: float = DEFAULT_TIMEOUT
+) -> DaemonClient | None:
+    """Connect to the daemon if one is running.
+
+    Args:
+        socket_path: Socket to connect to; defaults to ``get_socket_path()``
+        timeout: Seconds to wait for each response
+
+    Returns:
+        A connected client, or None when no daemon listens on the socket
+    """
+    path = Path(socket_path) if socket_path is not None else get_socket_path()
+    if path is None or not path.exists():
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        # Stale socket file left behind by a daemon that is gone
+        sock.close()
+        return None
+    return DaemonClient(sock)
+
+
+async def connect_daemon_async(
+    socket_path: str | Path | None = None, timeout: float = DEFAULT_TIMEOUT
+) -> AsyncDaemonClient | None:
+    """Connect to the daemon from an event loop if one is running.
+
+    Args:
+        socket_path: Socket to connect to; defaults to ``get_socket_path()``
+        timeout: Seconds to wait for each response
+
+    Returns:
+        A connected client, or None when no daemon listens on the socket
+    """
+    path = Path(socket_path) if socket_path is not None else get_socket_path()
+    if path is None or not path.exists():
+        return None
+
+    try:
+        reader, writer = await asyncio.open_unix_connection(str(path))
+    except OSError:
+        return None
+    return AsyncDaemonClient(reader, writer, timeout)
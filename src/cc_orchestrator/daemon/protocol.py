@@ -0,0 +1,88 @@
+"""
+Wire format of the daemon RPC protocol.
+
+Every message is a frame: a 4-byte big-endian payload length followed by
+that many bytes of UTF-8 JSON.
+
+- Requests are ``{"id": int, "method": str, "params": {...}}``.
+- Responses echo the request id and carry either ``"result"`` or
+  ``"error": {"type": str, "message": str}``.
+
+This module only depends on the standard library so that clients stay cheap
+to import.
+"""
+
+import json
+import socket
+import struct
+from typing import Any
+
+# Frame header: payload length as an unsigned 32-bit big-endian integer
+HEADER = struct.Struct(">I")
+
+# Largest payload either side accepts
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+
+class RPCError(Exception):
+    """Error raised by an RPC method or by the protocol itself."""
+
+    def __init__(self, message: str, error_type: str = "RPCError"):
+        """Initialize RPC error.
+
+        Args:
+            message: Error message
+            error_type: Name of the error kind, e.g. the server exception class
+        """
+        super().__init__(message)
+        self.message = message
+        self.error_type = error_type
+
+    def to_dict(self) -> dict[str, str]:
+        """Error member of a response."""
+        return {"type": self.error_type, "message": self.message}
+
+
+def encode_frame(message: dict[str, Any]) -> bytes:
+    """Encode a message as one frame."""
+    payload = json.dumps(message, separators=(",", ":"), default=str).encode()
+    if len(payload) > MAX_FRAME_SIZE:
+        raise RPCError(f"Message of {len(payload)} bytes is too large", "FrameTooLarge")
+    return HEADER.pack(len(payload)) + payload
+
+
+def decode_payload(payload: bytes) -> dict[str, Any]:
+    """Decode the payload of a frame."""
+    try:
+        message = json.loads(payload)
+    except ValueError as e:
+        raise RPCError(f"Invalid frame payload: {e}", "ProtocolError") from e
+    if not isinstance(message, dict):
+        raise RPCError("Frame payload must be a JSON object", "ProtocolError")
+    return message
+
+
+def payload_size(header: bytes) -> int:
+    """Read and check the payload length from a frame header."""
+    (size,) = HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise RPCError(f"Frame of {size} bytes exceeds the limit", "FrameTooLarge")
+    return size
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = sock.recv(min(remaining, 65536))
+        if not chunk:
+            raise ConnectionError("Connection closed in the middle of a frame")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def read_frame(sock: socket.socket) -> dict[str, Any]:
+    """Read one frame from a blocking socket."""
+    size = payload_size(_recv_exactly(sock, HEADER.size))
+    return decode_payload(_recv_exactly(sock, size))
@@ -0,0 +1,197 @@
+"""Unix domain socket server of the orchestrator daemon."""
+
+import asyncio
+import os
+import signal
+from pathlib import Path
+from typing import Any
+
+from ..config.service import get_config_service
+from ..core.orchestrator import Orchestrator
+from ..core.scheduler import SchedulerService
+from ..database.connection import get_database_manager
+from ..tmux.capture import PaneOutputChunk
+from ..tmux.service import start_output_capture, stop_output_capture
+from ..utils.logging import LogContext, get_logger
+from .client import connect_daemon, get_socket_path
+from .protocol import HEADER, RPCError, decode_payload, encode_frame, payload_size
+from .service import OrchestratorService
+
+logger = get_logger(__name__, LogContext.ORCHESTRATOR)
+
+
+class DaemonServer:
+    """Serves RPCs of a service to clients on a Unix domain socket."""
+
+    def __init__(self, service: OrchestratorService, socket_path: str | Path) -> None:
+        """Initialize the server.
+
+        Args:
+            service: Service whose methods are exposed
+            socket_path: Path of the listening socket
+        """
+        self.service = service
+        self.socket_path = Path(socket_path).expanduser()
+        self._server: asyncio.AbstractServer | None = None
+        self._connections: set[asyncio.Task[None]] = set()
+
+    async def start(self) -> None:
+        """Start listening.
+
+        Raises:
+            RuntimeError: If another daemon already listens on the socket
+        """
+        if self.socket_path.exists():
+            client = connect_daemon(self.socket_path, timeout=1.0)
+            if client is not None:
+                client.close()
+                raise RuntimeError(
+                    f"A daemon is already listening on {self.socket_path}"
+                )
+            self.socket_path.unlink()
+
+        self.socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self._server = await asyncio.start_unix_server(
+            self._serve_connection, path=str(self.socket_path)
+        )
+        # The socket grants full control over instances; keep it private
+        os.chmod(self.socket_path, 0o600)
+        logger.info("Daemon listening", socket=str(self.socket_path))
+
+    async def close(self) -> None:
+        """Stop listening, drop open connections and remove the socket."""
+        if self._server is None:
+            return
+        self._server.close()
+        for task in list(self._connections):
+            task.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+        self.socket_path.unlink(missing_ok=True)
+
+    async def _serve_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        self._connections.add(task)
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(HEADER.size)
+                except asyncio.IncompleteReadError:
+                    break
+                try:
+                    size = payload_size(header)
+                except RPCError as e:
+                    # The stream is out of sync; answer once and hang up
+                    writer.write(encode_frame({"id": None, "error": e.to_dict()}))
+                    await writer.drain()
+                    break
+                payload = await reader.readexactly(size)
+                writer.write(encode_frame(await self._respond(payload)))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+    async def _respond(self, payload: bytes) -> dict[str, Any]:
+        request_id = None
+        try:
+            request = decode_payload(payload)
+            request_id = request.get("id")
+            method = request.get("method")
+            params = request.get("params") or {}
+            if not isinstance(method, str) or not isinstance(params, dict):
+                raise RPCError(
+                    "Request needs a method and object params", "ProtocolError"
+                )
+            return {"id": request_id, "result": await self.service.call(method, params)}
+        except RPCError as e:
+            return {"id": request_id, "error": e.to_dict()}
+        except Exception as e:
+            logger.error("RPC failed", request_id=request_id, error=str(e))
+            return {
+                "id": request_id,
+                "error": {"type": type(e).__name__, "message": str(e)},
+            }
+
+
+def _log_pane_output(chunk: PaneOutputChunk) -> None:
+    """Write captured pane output to the daemon log."""
+    logger.info(
+        chunk.text,
+        instance_id=chunk.instance_id,
+        session=chunk.session_name,
+        pane=chunk.pane_id,
+        truncated_bytes=chunk.truncated_bytes,
+        dropped_bytes=chunk.dropped_bytes,
+    )
+
+
+async def run_daemon(socket_path: str | Path | None = None) -> None:
+    """Run the daemon until SIGINT or SIGTERM.
+
+    The daemon hosts the orchestrator with its health monitor and process
+    manager, plus the task scheduler and pane output capture when they are
+    enabled, so monitoring, dispatching and capture continue while no command
+    is running. Configuration edits are reloaded into the health monitor
+    while it runs.
+
+    Args:
+        socket_path: Socket to listen on; defaults to ``get_socket_path()``
+    """
+    path = socket_path if socket_path is not None else get_socket_path()
+    if path is None:
+        raise RuntimeError("The daemon socket is disabled by the environment")
+
+    config_service = get_config_service()
+    config = config_service.current
+    orchestrator = Orchestrator()
+    await orchestrator.initialize()
+
+    scheduler = None
+    if config.scheduler_enabled:
+        scheduler = SchedulerService(config)
+        await scheduler.start()
+
+    output_capture = None
+    try:
+        output_capture = await start_output_capture(config, _log_pane_output)
+    except Exception as e:
+        logger.error("Failed to start pane output capture", error=str(e))
+
+    server = DaemonServer(
+        OrchestratorService(
+            orchestrator,
+            scheduler=scheduler,
+            output_capture=output_capture,
+            database_id=get_database_manager().database_id,
+        ),
+        path,
+    )
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    try:
+        await server.start()
+        # Running services follow edits of the config file
+        await config_service.start()
+        await stop.wait()
+    finally:
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.remove_signal_handler(signum)
+        await config_service.stop()
+        await server.close()
+        if scheduler is not None:
+            await scheduler.stop()
+        if output_capture is not None:
+            await stop_output_capture()
+        await orchestrator.cleanup()
+        logger.info("Daemon stopped")
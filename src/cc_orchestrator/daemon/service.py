@@ -0,0 +1,384 @@
+"""
+RPC methods of the orchestrator daemon.
+
+``OrchestratorService`` implements the instance and health commands against
+the components hosted by the daemon: one initialized orchestrator, its
+health monitor and process manager, and the task scheduler. The daemon keeps
+a single service alive across requests; the CLI falls back to running the
+same service over throwaway components when no daemon is running, so both
+paths return identical results.
+"""
+
+import inspect
+import os
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from ..core import health_monitor as health_monitor_module
+from ..core.health_monitor import HealthMonitor
+from ..core.orchestrator import Orchestrator
+from ..core.scheduler import SchedulerService
+from ..database.models import HealthStatus
+from ..tmux.capture import PaneOutputCapture
+from .protocol import RPCError
+
+
+class OrchestratorService:
+    """Instance operations exposed over RPC."""
+
+    def __init__(
+        self,
+        orchestrator: Orchestrator | None = None,
+        health_monitor: HealthMonitor | None = None,
+        scheduler: SchedulerService | None = None,
+        output_capture: PaneOutputCapture | None = None,
+        database_id: str | None = None,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            orchestrator: Initialized orchestrator the instance methods
+                operate on
+            health_monitor: Health monitor of the health methods (defaults to
+                the orchestrator's)
+            scheduler: Running task scheduler, if the host runs one
+            output_capture: Pane output capture, if the host runs one
+            database_id: Identifier of the database the host works on
+        """
+        self._orchestrator = orchestrator
+        if health_monitor is None and orchestrator is not None:
+            health_monitor = orchestrator.health_monitor
+        self._health_monitor = health_monitor
+        self.scheduler = scheduler
+        self.output_capture = output_capture
+        self.database_id = database_id
+        self.started_at = time.time()
+        self._methods: dict[str, Callable[..., Awaitable[Any]]] = {
+            "ping": self.ping,
+            "instances.list": self.list_instances,
+            "instances.start": self.start_instance,
+            "instances.stop": self.stop_instance,
+            "health.check": self.check_health,
+            "health.summary": self.health_summary,
+            "health.history": self.health_history,
+            "health.overview": self.health_overview,
+            "health.configure": self.configure_health,
+            "scheduler.metrics": self.scheduler_metrics,
+        }
+
+    @property
+    def orchestrator(self) -> Orchestrator:
+        """Orchestrator of the instance methods."""
+        if self._orchestrator is None:
+            raise RPCError("No orchestrator is running", "Unavailable")
+        return self._orchestrator
+
+    @property
+    def health_monitor(self) -> HealthMonitor:
+        """Health monitor of the health methods."""
+        if self._health_monitor is None:
+            raise RPCError("No health monitor is running", "Unavailable")
+        return self._health_monitor
+
+    @property
+    def methods(self) -> list[str]:
+        """Names of the RPC methods."""
+        return sorted(self._methods)
+
+    async def call(self, method: str, params: dict[str, Any] | None = None) -> Any:
+        """Dispatch an RPC.
+
+        Args:
+            method: Method name
+            params: Keyword parameters of the method
+
+        Returns:
+            The JSON-serializable method result
+
+        Raises:
+            RPCError: If the method does not exist or the parameters do not fit
+        """
+        handler = self._methods.get(method)
+        if handler is None:
+            raise RPCError(f"Unknown method: {method}", "MethodNotFound")
+        params = params or {}
+        try:
+            inspect.signature(handler).bind(**params)
+        except TypeError as e:
+            raise RPCError(
+                f"Invalid parameters for {method}: {e}", "InvalidParams"
+            ) from e
+        return await handler(**params)
+
+    async def ping(self) -> dict[str, Any]:
+        """Report that the daemon is alive, its database and its services."""
+        monitor = self._health_monitor
+        return {
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.time() - self.started_at, 3),
+            "database_id": self.database_id,
+            "services": {
+                "orchestrator": self._orchestrator is not None,
+                "health_monitor": monitor is not None and bool(monitor.enabled),
+                "scheduler": self.scheduler is not None,
+                "pane_capture": self.output_capture is not None,
+            },
+        }
+
+    async def list_instances(self, running_only: bool = False) -> dict[str, Any]:
+        """List instances with their process status.
+
+        Args:
+            running_only: Only include running instances
+        """
+        instances = self.orchestrator.list_instances()
+        if running_only:
+            instances = [i for i in instances if i.is_running()]
+
+        instance_data: list[dict[str, Any]] = []
+        for instance in instances:
+            info = instance.get_info()
+            process_info = await instance.get_process_status()
+
+            if process_info:
+                info.update(
+                    {
+                        "process_status": process_info.status.value,
+                        "cpu_percent": process_info.cpu_percent,
+                        "memory_mb": process_info.memory_mb,
+                    }
+                )
+
+            instance_data.append(info)
+
+        return {"instances": instance_data, "total": len(instance_data)}
+
+    async def start_instance(
+        self,
+        issue_id: str,
+        workspace_path: str | None = None,
+        branch_name: str | None = None,
+        tmux_session: str | None = None,
+    ) -> dict[str, Any]:
+        """Start the instance for an issue, creating it if needed.
+
+        Args:
+            issue_id: Issue identifier
+            workspace_path: Workspace directory of a new instance
+            branch_name: Git branch of a new instance
+            tmux_session: Tmux session name of a new instance
+        """
+        instance = self.orchestrator.get_instance(issue_id)
+        if instance:
+            if instance.is_running():
+                return {
+                    "error": f"Instance for issue {issue_id} is already running",
+                    "issue_id": issue_id,
+                }
+            message = f"Started existing instance for issue {issue_id}"
+            failure = f"Failed to start existing instance for issue {issue_id}"
+        else:
+            kwargs: dict[str, Any] = {}
+            if workspace_path:
+                kwargs["workspace_path"] = Path(workspace_path)
+            if branch_name:
+                kwargs["branch_name"] = branch_name
+            if tmux_session:
+                kwargs["tmux_session"] = tmux_session
+
+            instance = await self.orchestrator.create_instance(issue_id, **kwargs)
+            message = f"Successfully started Claude instance for issue {issue_id}"
+            failure = f"Failed to start instance for issue {issue_id}"
+
+        if not await instance.start():
+            return {"error": failure, "issue_id": issue_id}
+
+        persistence = self._sync(instance)
+        return {
+            "status": "started",
+            "message": message,
+            "instance": instance.get_info(),
+            **persistence,
+        }
+
+    async def stop_instance(self, issue_id: str) -> dict[str, Any]:
+        """Stop the instance for an issue.
+
+        Args:
+            issue_id: Issue identifier
+        """
+        instance = self.orchestrator.get_instance(issue_id)
+        if not instance:
+            return {
+                "error": f"No instance found for issue {issue_id}",
+                "issue_id": issue_id,
+            }
+
+        if not instance.is_running():
+            return {"status": "already_stopped", "issue_id": issue_id}
+
+        if not await instance.stop():
+            return {
+                "error": f"Failed to stop instance for issue {issue_id}",
+                "issue_id": issue_id,
+            }
+
+        return {"status": "stopped", "issue_id": issue_id, **self._sync(instance)}
+
+    async def check_health(self, issue_id: str) -> dict[str, Any]:
+        """Run a health check on an instance.
+
+        Args:
+            issue_id: Issue identifier
+        """
+        return _jsonable_health(
+            await self.health_monitor.check_instance_health(issue_id)
+        )
+
+    async def health_summary(self) -> dict[str, Any]:
+        """Check the health of every monitored process."""
+        monitor = self.health_monitor
+        processes = await monitor.process_manager.list_processes()
+
+        instance_health: list[dict[str, Any]] = []
+        for instance_id in processes:
+            health_result = await monitor.check_instance_health(instance_id)
+            checks = health_result["checks"]
+            instance_health.append(
+                {
+                    "issue_id": instance_id,
+                    "health_status": health_result["overall_status"].value,
+                    "process_status": checks.get("process_status", "unknown"),
+                    "cpu_percent": checks.get("cpu_percent", 0.0),
+                    "memory_mb": checks.get("memory_mb", 0.0),
+                    "duration_ms": health_result["duration_ms"],
+                }
+            )
+
+        return {"instances": instance_health, "total": len(instance_health)}
+
+    async def health_history(self, issue_id: str, days: int = 7) -> dict[str, Any]:
+        """Get the health history of an instance.
+
+        Only the current check is available until history is persisted.
+
+        Args:
+            issue_id: Issue identifier
+            days: Number of days of history
+        """
+        result = await self.health_monitor.check_instance_health(issue_id)
+        if "error" in result:
+            return {"error": result["error"], "instance_id": issue_id}
+
+        return _jsonable_health(
+            {
+                "instance_id": issue_id,
+                "history": [
+                    {
+                        "timestamp": result["timestamp"],
+                        "status": result["overall_status"].value,
+                        "duration_ms": result["duration_ms"],
+                        "checks": result["checks"],
+                    }
+                ],
+                "total": 1,
+                "note": "Full history requires database integration",
+            }
+        )
+
+    async def health_overview(self) -> dict[str, Any]:
+        """Summarize the health distribution of the monitored processes."""
+        monitor = self.health_monitor
+        processes = await monitor.process_manager.list_processes()
+        if not processes:
+            return {"total_instances": 0, "health_percentage": 100.0}
+
+        status_counts = {status.value: 0 for status in HealthStatus}
+        total_instances = len(processes)
+
+        for instance_id in processes:
+            try:
+                health_result = await monitor.check_instance_health(instance_id)
+                status_counts[health_result["overall_status"].value] += 1
+            except Exception:
+                status_counts["unknown"] += 1
+
+        healthy_count = status_counts.get("healthy", 0)
+        return {
+            "total_instances": total_instances,
+            "overall_health_percentage": healthy_count / total_instances * 100,
+            "status_distribution": status_counts,
+            "timestamp": datetime.now().isoformat(),
+            "note": "Based on current running processes. Full metrics require database integration.",
+        }
+
+    async def configure_health(
+        self, enabled: bool = True, interval: float | None = None
+    ) -> dict[str, Any]:
+        """Change the health monitoring settings and restart monitoring.
+
+        Args:
+            enabled: Whether monitoring runs
+            interval: New check interval in seconds
+        """
+        monitor = self.health_monitor
+        if interval is not None:
+            monitor.check_interval = float(interval)
+        monitor.enabled = enabled
+
+        await monitor.stop()
+        if enabled:
+            await monitor.start()
+        return {"enabled": enabled, "interval": interval}
+
+    async def scheduler_metrics(self) -> dict[str, Any]:
+        """Get the task scheduler's metrics."""
+        if self.scheduler is None:
+            raise RPCError("The task scheduler is not running", "Unavailable")
+        return self.scheduler.get_metrics()
+
+    def _sync(self, instance: Any) -> dict[str, str]:
+        """Persist an instance's new state and report whether it worked."""
+        if self.orchestrator.sync_instance_to_database(instance):
+            return {"persistence_status": "success"}
+        return {"warning": "state_not_persisted", "persistence_status": "failed"}
+
+
+def _jsonable_health(result: dict[str, Any]) -> dict[str, Any]:
+    """Replace the health status enum of a check result by its value."""
+    result = dict(result)
+    status = result.get("overall_status")
+    if hasattr(status, "value"):
+        result["overall_status"] = status.value
+    return result
+
+
+async def call_local(method: str, params: dict[str, Any] | None = None) -> Any:
+    """Run one RPC in-process over throwaway components.
+
+    This is what every command did before the daemon existed: instance
+    methods build the database engine and start monitoring for a single
+    call, health methods use this process's health monitor.
+
+    Args:
+        method: Method name
+        params: Keyword parameters of the method
+
+    Returns:
+        The method result
+    """
+    if method.startswith("health."):
+        service = OrchestratorService(
+            health_monitor=health_monitor_module.get_health_monitor()
+        )
+        return await service.call(method, params)
+
+    orchestrator = Orchestrator()
+    await orchestrator.initialize()
+    try:
+        return await OrchestratorService(orchestrator).call(method, params)
+    finally:
+        await orchestrator.cleanup()
@@ -1,15 +1,17 @@
 """Database connection and session management."""
 
+import hashlib
 import os
 from collections.abc import Generator
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import MetaData, create_engine, event, inspect
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateColumn
 
 from .models import Base
 
@@ -56,6 +58,11 @@ class DatabaseManager:
             self._engine = self._create_engine()
         return self._engine
 
+    @property
+    def database_id(self) -> str:
+        """Stable identifier of the database, derived from its URL."""
+        return hashlib.sha256(self.database_url.encode()).hexdigest()[:16]
+
     @property
     def session_factory(self) -> sessionmaker[Session]:
         """Get the session factory, creating it if necessary."""
@@ -92,6 +99,8 @@ class DatabaseManager:
             ) -> None:
                 cursor = dbapi_connection.cursor()
                 cursor.execute("PRAGMA foreign_keys=ON")
+                # Only takes effect for new databases; lets retention reclaim pages
+                cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
                 cursor.execute(
                     "PRAGMA journal_mode=WAL"
                 )  # Enable WAL mode for better concurrency
@@ -102,6 +111,38 @@ class DatabaseManager:
     def create_tables(self) -> None:
         """Create all database tables."""
         Base.metadata.create_all(self.engine)
+        self._upgrade_existing_tables()
+
+    def _upgrade_existing_tables(self, metadata: MetaData | None = None) -> None:
+        """Add columns and indexes that postdate an existing database file.
+
+        ``create_all`` skips tables that already exist, so a database created
+        by an older release would otherwise be missing newly added nullable or
+        defaulted columns (for example the task lease columns).
+
+        Args:
+            metadata: Schema to upgrade to. Defaults to the model metadata.
+        """
+        metadata = metadata if metadata is not None else Base.metadata
+        inspector = inspect(self.engine)
+        existing_tables = set(inspector.get_table_names())
+
+        with self.engine.begin() as conn:
+            for table in metadata.sorted_tables:
+                if table.name not in existing_tables:
+                    continue
+
+                existing = {c["name"] for c in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.name in existing:
+                        continue
+                    if not column.nullable and column.server_default is None:
+                        continue
+                    spec = CreateColumn(column).compile(dialect=self.engine.dialect)
+                    conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {spec}")
+
+                for index in table.indexes:
+                    index.create(conn, checkfirst=True)
 
     async def initialize(self) -> None:
         """Initialize the database asynchronously."""
@@ -1,10 +1,12 @@
 """CRUD operations for database entities."""
 
-from datetime import UTC, datetime
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
+from sqlalchemy import Row, case, func, insert, or_, select, tuple_, update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from .models import (
     ConfigScope,
@@ -39,6 +41,114 @@ class NotFoundError(CRUDError):
     pass
 
 
+# Eager-loading strategies for relationships callers may ask to include.
+# Collections use selectinload (one extra IN query per relationship, independent
+# of page size); scalar relationships use joinedload (no extra query).
+RELATIONSHIP_LOADERS: dict[type, dict[str, Any]] = {
+    Instance: {
+        "tasks": selectinload(Instance.tasks),
+        "worktree": joinedload(Instance.worktree),
+    },
+    Task: {
+        "instance": joinedload(Task.instance),
+        "worktree": joinedload(Task.worktree),
+    },
+    Worktree: {
+        "instance": joinedload(Worktree.instance),
+        "tasks": selectinload(Worktree.tasks),
+    },
+}
+
+
+def loader_options(model: type, include: Iterable[str] | None) -> list[Any]:
+    """Build eager-loading options for the requested relationships.
+
+    Args:
+        model: Model class being queried.
+        include: Relationship names to load eagerly.
+
+    Returns:
+        Loader options to pass to ``Query.options``.
+
+    Raises:
+        ValidationError: If a relationship name is not supported for the model.
+    """
+    if not include:
+        return []
+
+    loaders = RELATIONSHIP_LOADERS.get(model, {})
+    options = []
+    for name in dict.fromkeys(include):
+        if name not in loaders:
+            raise ValidationError(
+                f"Cannot include '{name}' for {model.__name__}; "
+                f"expected one of: {', '.join(sorted(loaders))}"
+            )
+        options.append(loaders[name])
+    return options
+
+
+# Large JSON columns left out of list projections unless explicitly requested.
+DEFERRED_COLUMNS: dict[type, tuple[str, ...]] = {
+    Instance: ("extra_metadata",),
+    Task: ("requirements", "results", "extra_metadata"),
+    Worktree: ("git_config", "extra_metadata"),
+}
+
+
+def projection_columns(model: type, fields: Iterable[str] | None = None) -> list[Any]:
+    """Select the table columns needed for a lightweight list projection.
+
+    Args:
+        model: Model class being queried.
+        fields: Field names to project. Names that are not columns of the
+            model are ignored, so response-level field names can be passed
+            straight through. Defaults to every column except the deferred
+            JSON columns.
+
+    Returns:
+        Column expressions to pass to ``select``; the primary key is always
+        included.
+    """
+    columns = model.__table__.columns
+    if fields is None:
+        deferred = DEFERRED_COLUMNS.get(model, ())
+        names = [name for name in columns.keys() if name not in deferred]
+    else:
+        names = ["id", *(name for name in fields if name in columns and name != "id")]
+
+    return [getattr(model, name) for name in dict.fromkeys(names)]
+
+
+# Task queue defaults: how long a claim is valid without renewal, how many
+# claims a task gets before it is failed, and the candidate page size.
+DEFAULT_LEASE_SECONDS = 900
+DEFAULT_MAX_ATTEMPTS = 3
+CLAIM_BATCH_SIZE = 32
+
+
+def _satisfies(requirements: dict[str, Any] | None, capabilities: set[str]) -> bool:
+    """Check whether a task's required capabilities are all offered."""
+    required = (requirements or {}).get("capabilities") or []
+    return set(required) <= capabilities
+
+
+def _claimable_by(instance_id: int) -> Any:
+    """Filter for tasks that are unassigned or already assigned to an instance."""
+    return or_(Task.instance_id.is_(None), Task.instance_id == instance_id)
+
+
+def _task_priority_order() -> Any:
+    """Order expression ranking tasks by priority (4=URGENT ... 1=LOW)."""
+    return case(
+        (Task.priority == TaskPriority.URGENT, 4),
+        (Task.priority == TaskPriority.HIGH, 3),
+        (Task.priority == TaskPriority.MEDIUM, 2),
+        (Task.priority == TaskPriority.LOW, 1),
+        else_=0,
+    )
+
+
 class InstanceCRUD:
     """CRUD operations for Instance entities."""
 
@@ -131,6 +241,7 @@ class InstanceCRUD:
         status: InstanceStatus | None = None,
         limit: int | None = None,
         offset: int = 0,
+        include: Iterable[str] | None = None,
     ) -> list[Instance]:
         """List instances with optional filtering.
 
@@ -139,11 +250,12 @@ class InstanceCRUD:
             status: Filter by status.
             limit: Maximum number of results.
             offset: Number of results to skip.
+            include: Relationships to load eagerly (``tasks``, ``worktree``).
 
         Returns:
             List of instances.
         """
-        query = session.query(Instance)
+        query = session.query(Instance).options(*loader_options(Instance, include))
 
         if status:
             query = query.filter(Instance.status == status)
@@ -157,6 +269,56 @@ class InstanceCRUD:
 
         return query.all()
 
+    @staticmethod
+    def list_rows(
+        session: Session,
+        status: InstanceStatus | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        fields: Iterable[str] | None = None,
+    ) -> Sequence[Row[Any]]:
+        """List instances as column-projected rows without hydrating models.
+
+        Args:
+            session: Database session.
+            status: Filter by status.
+            limit: Maximum number of results.
+            offset: Number of results to skip.
+            fields: Fields to select (see ``projection_columns``).
+
+        Returns:
+            Rows exposing the selected columns as attributes.
+        """
+        stmt = select(*projection_columns(Instance, fields))
+
+        if status:
+            stmt = stmt.where(Instance.status == status)
+
+        stmt = stmt.order_by(Instance.created_at.desc())
+
+        if offset:
+            stmt = stmt.offset(offset)
+        if limit:
+            stmt = stmt.limit(limit)
+
+        return session.execute(stmt).all()
+
+    @staticmethod
+    def count(session: Session, status: InstanceStatus | None = None) -> int:
+        """Count instances with optional filtering.
+
+        Args:
+            session: Database session.
+            status: Filter by status.
+
+        Returns:
+            Number of matching instances.
+        """
+        stmt = select(func.count(Instance.id))
+        if status:
+            stmt = stmt.where(Instance.status == status)
+        return session.execute(stmt).scalar_one()
+
     @staticmethod
     def update(
         session: Session,
@@ -296,6 +458,7 @@ class TaskCRUD:
         session: Session,
         instance_id: int,
         status: TaskStatus | None = None,
+        include: Iterable[str] | None = None,
     ) -> list[Task]:
         """List tasks for an instance.
 
@@ -303,11 +466,16 @@ class TaskCRUD:
             session: Database session.
             instance_id: Instance ID.
             status: Filter by status.
+            include: Relationships to load eagerly (``instance``, ``worktree``).
 
         Returns:
             List of tasks.
         """
-        query = session.query(Task).filter(Task.instance_id == instance_id)
+        query = (
+            session.query(Task)
+            .options(*loader_options(Task, include))
+            .filter(Task.instance_id == instance_id)
+        )
 
         if status:
             query = query.filter(Task.status == status)
@@ -325,17 +493,26 @@ class TaskCRUD:
         return query.order_by(priority_order.desc(), Task.created_at.asc()).all()
 
     @staticmethod
-    def list_pending(session: Session, limit: int | None = None) -> list[Task]:
+    def list_pending(
+        session: Session,
+        limit: int | None = None,
+        include: Iterable[str] | None = None,
+    ) -> list[Task]:
         """List pending tasks across all instances.
 
         Args:
             session: Database session.
             limit: Maximum number of results.
+            include: Relationships to load eagerly (``instance``, ``worktree``).
 
         Returns:
             List of pending tasks.
         """
-        query = session.query(Task).filter(Task.status == TaskStatus.PENDING)
+        query = (
+            session.query(Task)
+            .options(*loader_options(Task, include))
+            .filter(Task.status == TaskStatus.PENDING)
+        )
         # Use CASE to order by priority value (4=URGENT, 3=HIGH, 2=MEDIUM, 1=LOW)
         from sqlalchemy import case
 
@@ -353,6 +530,99 @@ class TaskCRUD:
 
         return query.all()
 
+    @staticmethod
+    def list_by_status(
+        session: Session,
+        status: TaskStatus,
+        limit: int | None = None,
+        offset: int = 0,
+        include: Iterable[str] | None = None,
+    ) -> list[Task]:
+        """List tasks with a status across all instances, highest priority first.
+
+        Args:
+            session: Database session.
+            status: Task status to filter by.
+            limit: Maximum number of results.
+            offset: Number of results to skip.
+            include: Relationships to load eagerly (``instance``, ``worktree``).
+
+        Returns:
+            List of tasks with the specified status.
+        """
+        query = (
+            session.query(Task)
+            .options(*loader_options(Task, include))
+            .filter(Task.status == status)
+            .order_by(_task_priority_order().desc(), Task.created_at.asc())
+        )
+        if offset:
+            query = query.offset(offset)
+        if limit:
+            query = query.limit(limit)
+        return query.all()
+
+    @staticmethod
+    def list_rows(
+        session: Session,
+        instance_id: int | None = None,
+        status: TaskStatus | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        fields: Iterable[str] | None = None,
+    ) -> Sequence[Row[Any]]:
+        """List tasks as column-projected rows, highest priority first.
+
+        Args:
+            session: Database session.
+            instance_id: Filter by assigned instance.
+            status: Filter by status.
+            limit: Maximum number of results.
+            offset: Number of results to skip.
+            fields: Fields to select (see ``projection_columns``).
+
+        Returns:
+            Rows exposing the selected columns as attributes.
+        """
+        stmt = select(*projection_columns(Task, fields))
+
+        if instance_id is not None:
+            stmt = stmt.where(Task.instance_id == instance_id)
+        if status:
+            stmt = stmt.where(Task.status == status)
+
+        stmt = stmt.order_by(_task_priority_order().desc(), Task.created_at.asc())
+
+        if offset:
+            stmt = stmt.offset(offset)
+        if limit:
+            stmt = stmt.limit(limit)
+
+        return session.execute(stmt).all()
+
+    @staticmethod
+    def count(
+        session: Session,
+        instance_id: int | None = None,
+        status: TaskStatus | None = None,
+    ) -> int:
+        """Count tasks with optional filtering.
+
+        Args:
+            session: Database session.
+            instance_id: Filter by assigned instance.
+            status: Filter by status.
+
+        Returns:
+            Number of matching tasks.
+        """
+        stmt = select(func.count(Task.id))
+        if instance_id is not None:
+            stmt = stmt.where(Task.instance_id == instance_id)
+        if status:
+            stmt = stmt.where(Task.status == status)
+        return session.execute(stmt).scalar_one()
+
     @staticmethod
     def update_status(
         session: Session,
@@ -372,6 +642,10 @@ class TaskCRUD:
         task = TaskCRUD.get_by_id(session, task_id)
         task.status = status
 
+        # A lease only guards a task while it is being worked on
+        if status != TaskStatus.IN_PROGRESS:
+            task.lease_expires_at = None
+
         # Update timestamps based on status
 
         now = datetime.now(UTC)
@@ -440,6 +714,312 @@ class TaskCRUD:
         session.flush()
         return task
 
+    @staticmethod
+    def assign(
+        session: Session,
+        task_id: int,
+        instance_id: int | None,
+        expected_instance_id: int | None,
+    ) -> Task | None:
+        """Reassign a task only if nobody else changed its assignment.
+
+        The update is a compare-and-set on ``instance_id`` so two workers
+        acting on the same read cannot both win.
+
+        Args:
+            session: Database session.
+            task_id: Task ID.
+            instance_id: Instance to assign (None to unassign).
+            expected_instance_id: Assignment the caller last observed.
+
+        Returns:
+            Updated task, or None if the assignment changed concurrently.
+        """
+        current = (
+            Task.instance_id.is_(None)
+            if expected_instance_id is None
+            else Task.instance_id == expected_instance_id
+        )
+        result = session.execute(
+            update(Task)
+            .where(Task.id == task_id, current)
+            .values(instance_id=instance_id, updated_at=datetime.now(UTC))
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            return None
+        return session.get(Task, task_id, populate_existing=True)
+
+    @staticmethod
+    def claim(
+        session: Session,
+        task_id: int,
+        instance_id: int,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        now: datetime | None = None,
+    ) -> bool:
+        """Atomically claim a specific task if it is still pending.
+
+        A task already assigned to another instance is never claimed, so a
+        manual assignment cannot be taken over by a different worker.
+
+        Args:
+            session: Database session.
+            task_id: Task ID.
+            instance_id: Instance claiming the task.
+            lease_seconds: How long the claim stays valid without renewal.
+            now: Reference time (defaults to now).
+
+        Returns:
+            True if the task was claimed, False if it is no longer pending or
+            is assigned to another instance.
+        """
+        now = now or datetime.now(UTC)
+        stmt = (
+            update(Task)
+            .where(
+                Task.id == task_id,
+                Task.status == TaskStatus.PENDING,
+                _claimable_by(instance_id),
+            )
+            .values(
+                status=TaskStatus.IN_PROGRESS,
+                instance_id=instance_id,
+                lease_expires_at=now + timedelta(seconds=lease_seconds),
+                started_at=func.coalesce(Task.started_at, now),
+                attempts=Task.attempts + 1,
+                updated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if session.get_bind().dialect.update_returning:
+            return session.execute(stmt.returning(Task.id)).first() is not None
+        return session.execute(stmt).rowcount == 1
+
+    @staticmethod
+    def claim_next(
+        session: Session,
+        instance_id: int,
+        capabilities: Iterable[str] | None = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        now: datetime | None = None,
+    ) -> Task | None:
+        """Atomically claim the next pending task for an instance.
+
+        Candidates are read per priority level, highest priority first, from
+        the ``(status, priority, created_at)`` index, so each probe is an index
+        seek rather than a table scan. A candidate is claimed with a
+        conditional ``UPDATE ... WHERE status = PENDING`` (with ``RETURNING``
+        where the dialect supports it); if another worker got there first the
+        update matches no row and the next candidate is tried. On databases
+        with row locks the candidate read uses ``FOR UPDATE SKIP LOCKED``.
+        Expired leases are requeued before claiming. Tasks assigned to another
+        instance are skipped.
+
+        Args:
+            session: Database session.
+            instance_id: Instance claiming the task.
+            capabilities: Capabilities the instance offers. Tasks listing
+                ``requirements["capabilities"]`` are only claimed when all of
+                them are offered; None disables capability matching.
+            lease_seconds: How long the claim stays valid without renewal.
+            max_attempts: Claims allowed before an expired task is failed.
+            now: Reference time (defaults to now).
+
+        Returns:
+            The claimed task, or None if nothing claimable is pending.
+        """
+        now = now or datetime.now(UTC)
+        offered = set(capabilities) if capabilities is not None else None
+        TaskCRUD.requeue_expired(session, now=now, max_attempts=max_attempts)
+
+        for priority in sorted(TaskPriority, key=lambda p: p.value, reverse=True):
+            after: tuple[datetime, int] | None = None
+            while True:
+                stmt = select(Task.id, Task.created_at, Task.requirements).where(
+                    Task.status == TaskStatus.PENDING,
+                    Task.priority == priority,
+                    _claimable_by(instance_id),
+                )
+                if after is not None:
+                    stmt = stmt.where(tuple_(Task.created_at, Task.id) > after)
+                candidates = session.execute(
+                    stmt.order_by(Task.created_at, Task.id)
+                    .limit(CLAIM_BATCH_SIZE)
+                    .with_for_update(skip_locked=True)
+                ).all()
+
+                for candidate in candidates:
+                    if offered is not None and not _satisfies(
+                        candidate.requirements, offered
+                    ):
+                        continue
+                    if TaskCRUD.claim(
+                        session, candidate.id, instance_id, lease_seconds, now
+                    ):
+                        return session.get(Task, candidate.id, populate_existing=True)
+
+                if len(candidates) < CLAIM_BATCH_SIZE:
+                    break
+                after = (candidates[-1].created_at, candidates[-1].id)
+
+        return None
+
+    @staticmethod
+    def renew_lease(
+        session: Session,
+        task_id: int,
+        instance_id: int,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        now: datetime | None = None,
+    ) -> bool:
+        """Extend the lease on a task the instance still holds.
+
+        Args:
+            session: Database session.
+            task_id: Task ID.
+            instance_id: Instance holding the lease.
+            lease_seconds: New lease duration from now.
+            now: Reference time (defaults to now).
+
+        Returns:
+            True if the lease was extended, False if it was lost.
+        """
+        now = now or datetime.now(UTC)
+        result = session.execute(
+            update(Task)
+            .where(
+                Task.id == task_id,
+                Task.instance_id == instance_id,
+                Task.status == TaskStatus.IN_PROGRESS,
+            )
+            .values(
+                lease_expires_at=now + timedelta(seconds=lease_seconds),
+                updated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    @staticmethod
+    def renew_leases(
+        session: Session,
+        instance_ids: Iterable[int],
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        now: datetime | None = None,
+    ) -> int:
+        """Extend the leases of every task held by the given instances.
+
+        Only leases expiring within half of ``lease_seconds`` are touched, so
+        calling this on every scheduler cycle does not rewrite each row, and
+        longer leases are never shortened.
+
+        Args:
+            session: Database session.
+            instance_ids: Instances known to be alive.
+            lease_seconds: New lease duration from now.
+            now: Reference time (defaults to now).
+
+        Returns:
+            Number of renewed leases.
+        """
+        ids = list(instance_ids)
+        if not ids:
+            return 0
+        now = now or datetime.now(UTC)
+        result = session.execute(
+            update(Task)
+            .where(
+                Task.instance_id.in_(ids),
+                Task.status == TaskStatus.IN_PROGRESS,
+                Task.lease_expires_at.is_not(None),
+                Task.lease_expires_at < now + timedelta(seconds=lease_seconds / 2),
+            )
+            .values(
+                lease_expires_at=now + timedelta(seconds=lease_seconds),
+                updated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    @staticmethod
+    def release(session: Session, task_id: int, instance_id: int) -> bool:
+        """Return a claimed task to the queue.
+
+        Args:
+            session: Database session.
+            task_id: Task ID.
+            instance_id: Instance holding the lease.
+
+        Returns:
+            True if the task was requeued, False if the instance did not hold it.
+        """
+        result = session.execute(
+            update(Task)
+            .where(
+                Task.id == task_id,
+                Task.instance_id == instance_id,
+                Task.status == TaskStatus.IN_PROGRESS,
+            )
+            .values(
+                status=TaskStatus.PENDING,
+                instance_id=None,
+                lease_expires_at=None,
+                updated_at=datetime.now(UTC),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    @staticmethod
+    def requeue_expired(
+        session: Session,
+        now: datetime | None = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> tuple[int, int]:
+        """Requeue tasks whose lease expired, failing those out of attempts.
+
+        Args:
+            session: Database session.
+            now: Reference time (defaults to now).
+            max_attempts: Claims allowed before a task is failed instead.
+
+        Returns:
+            Tuple of (requeued count, failed count).
+        """
+        now = now or datetime.now(UTC)
+        expired = (
+            Task.status == TaskStatus.IN_PROGRESS,
+            Task.lease_expires_at.is_not(None),
+            Task.lease_expires_at < now,
+        )
+
+        failed = session.execute(
+            update(Task)
+            .where(*expired, Task.attempts >= max_attempts)
+            .values(
+                status=TaskStatus.FAILED,
+                lease_expires_at=None,
+                completed_at=now,
+                updated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        requeued = session.execute(
+            update(Task)
+            .where(*expired)
+            .values(
+                status=TaskStatus.PENDING,
+                instance_id=None,
+                lease_expires_at=None,
+                updated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        return requeued, failed
+
 
 class WorktreeCRUD:
     """CRUD operations for Worktree entities."""
@@ -536,30 +1116,44 @@ class WorktreeCRUD:
         return worktree
 
     @staticmethod
-    def list_all(session: Session) -> list[Worktree]:
+    def list_all(
+        session: Session, include: Iterable[str] | None = None
+    ) -> list[Worktree]:
         """List all worktrees.
 
         Args:
             session: Database session.
+            include: Relationships to load eagerly (``instance``, ``tasks``).
 
         Returns:
             List of all worktrees.
         """
-        return session.query(Worktree).order_by(Worktree.created_at).all()
+        return (
+            session.query(Worktree)
+            .options(*loader_options(Worktree, include))
+            .order_by(Worktree.created_at)
+            .all()
+        )
 
     @staticmethod
-    def list_by_status(session: Session, status: WorktreeStatus) -> list[Worktree]:
+    def list_by_status(
+        session: Session,
+        status: WorktreeStatus,
+        include: Iterable[str] | None = None,
+    ) -> list[Worktree]:
         """List worktrees by status.
 
         Args:
             session: Database session.
             status: Worktree status to filter by.
+            include: Relationships to load eagerly (``instance``, ``tasks``).
 
         Returns:
             List of worktrees with the specified status.
         """
         return (
             session.query(Worktree)
+            .options(*loader_options(Worktree, include))
             .filter(Worktree.status == status)
             .order_by(Worktree.created_at)
             .all()
@@ -604,6 +1198,93 @@ class WorktreeCRUD:
         session.flush()
         return worktree
 
+    @staticmethod
+    def bulk_create(session: Session, rows: Sequence[dict[str, Any]]) -> int:
+        """Insert several worktrees in one executemany statement.
+
+        Rows bypass the identity map, so callers that need the new objects
+        must query for them afterwards.
+
+        Args:
+            session: Database session.
+            rows: Column values per worktree (``name``, ``path`` and
+                ``branch_name`` are required).
+
+        Returns:
+            Number of rows inserted.
+
+        Raises:
+            ValidationError: If a path already exists.
+        """
+        if not rows:
+            return 0
+        now = datetime.now()
+        values = [
+            {
+                "status": WorktreeStatus.ACTIVE,
+                "has_uncommitted_changes": False,
+                "git_config": {},
+                "extra_metadata": {},
+                "last_sync": now,
+                **row,
+            }
+            for row in rows
+        ]
+        try:
+            session.execute(insert(Worktree), values)
+        except IntegrityError as e:
+            raise ValidationError(f"Worktree path already exists: {e}") from e
+        return len(values)
+
+    @staticmethod
+    def bulk_update_status(
+        session: Session, worktree_ids: Iterable[int], status: WorktreeStatus
+    ) -> int:
+        """Set the status of several worktrees in one UPDATE.
+
+        Args:
+            session: Database session.
+            worktree_ids: Worktrees to update.
+            status: New status.
+
+        Returns:
+            Number of rows updated.
+        """
+        ids = list(worktree_ids)
+        if not ids:
+            return 0
+        now = datetime.now()
+        result = session.execute(
+            update(Worktree)
+            .where(Worktree.id.in_(ids))
+            .values(status=status, last_sync=now, updated_at=now)
+            .execution_options(synchronize_session="fetch")
+        )
+        return result.rowcount
+
+    @staticmethod
+    def bulk_update_commits(session: Session, commits: dict[int, str]) -> int:
+        """Record new HEAD commits for several worktrees in one executemany.
+
+        Args:
+            session: Database session.
+            commits: Commit SHA keyed by worktree ID.
+
+        Returns:
+            Number of rows updated.
+        """
+        if not commits:
+            return 0
+        now = datetime.now()
+        session.execute(
+            update(Worktree),
+            [
+                {"id": worktree_id, "current_commit": commit, "updated_at": now}
+                for worktree_id, commit in commits.items()
+            ],
+        )
+        return len(commits)
+
     @staticmethod
     def delete(session: Session, worktree_id: int) -> bool:
         """Delete a worktree record.
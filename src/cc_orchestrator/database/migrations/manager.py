@@ -70,7 +70,7 @@ class MigrationManager:
             result = session.execute(
                 text(
                     "SELECT version, description, applied_at, checksum "
-                    "FROM schema_migrations ORDER BY applied_at"
+                    "FROM schema_migrations ORDER BY applied_at, version"
                 )
             )
 
@@ -188,6 +188,8 @@ class MigrationManager:
         Returns:
             True if successful, False otherwise.
         """
+        from datetime import datetime
+
         try:
             with self.engine.begin() as conn:
                 # Apply the migration
@@ -203,7 +205,8 @@ class MigrationManager:
                     {
                         "version": migration.version,
                         "description": migration.description,
-                        "applied_at": migration.created_at,
+                        # Stamp when applied; created_at is when the file was loaded
+                        "applied_at": datetime.now(),
                     },
                 )
 
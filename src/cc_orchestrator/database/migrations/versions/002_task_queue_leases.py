@@ -0,0 +1,47 @@
+"""Task queue lease columns migration."""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+from cc_orchestrator.database.migrations.migration import Migration
+from cc_orchestrator.database.models import idx_tasks_lease, idx_tasks_queue
+
+# Columns added to ``tasks``; databases created from the current models
+# already have them, so each one is only added when missing.
+_TASK_COLUMNS = {
+    "lease_expires_at": "DATETIME",
+    "attempts": "INTEGER NOT NULL DEFAULT 0",
+}
+
+
+class TaskQueueLeasesMigration(Migration):
+    """Add lease tracking and the queue index to tasks."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            version="002",
+            description="Add task lease columns and queue indexes for atomic claims",
+        )
+
+    def upgrade(self, engine: Engine) -> None:
+        """Add lease columns and queue indexes."""
+        existing = {column["name"] for column in inspect(engine).get_columns("tasks")}
+
+        with engine.begin() as conn:
+            for name, ddl in _TASK_COLUMNS.items():
+                if name not in existing:
+                    conn.execute(text(f"ALTER TABLE tasks ADD COLUMN {name} {ddl}"))
+
+        idx_tasks_queue.create(engine, checkfirst=True)
+        idx_tasks_lease.create(engine, checkfirst=True)
+
+    def downgrade(self, engine: Engine) -> None:
+        """Drop the queue indexes and lease columns."""
+        idx_tasks_lease.drop(engine, checkfirst=True)
+        idx_tasks_queue.drop(engine, checkfirst=True)
+
+        existing = {column["name"] for column in inspect(engine).get_columns("tasks")}
+        with engine.begin() as conn:
+            for name in _TASK_COLUMNS:
+                if name in existing:
+                    conn.execute(text(f"ALTER TABLE tasks DROP COLUMN {name}"))
@@ -0,0 +1,34 @@
+"""Worktree sync fingerprint migration."""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+from cc_orchestrator.database.migrations.migration import Migration
+
+
+class WorktreeSyncFingerprintMigration(Migration):
+    """Add the git-state fingerprint used by incremental worktree sync."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            version="003",
+            description="Add worktree sync fingerprint for incremental sync",
+        )
+
+    def upgrade(self, engine: Engine) -> None:
+        """Add the sync_fingerprint column if it is missing."""
+        existing = {c["name"] for c in inspect(engine).get_columns("worktrees")}
+        if "sync_fingerprint" not in existing:
+            with engine.begin() as conn:
+                conn.execute(
+                    text(
+                        "ALTER TABLE worktrees ADD COLUMN sync_fingerprint VARCHAR(64)"
+                    )
+                )
+
+    def downgrade(self, engine: Engine) -> None:
+        """Drop the sync_fingerprint column."""
+        existing = {c["name"] for c in inspect(engine).get_columns("worktrees")}
+        if "sync_fingerprint" in existing:
+            with engine.begin() as conn:
+                conn.execute(text("ALTER TABLE worktrees DROP COLUMN sync_fingerprint"))
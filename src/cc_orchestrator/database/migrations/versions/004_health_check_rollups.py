@@ -0,0 +1,34 @@
+"""Health check rollup table migration."""
+
+from typing import cast
+
+from sqlalchemy import Table
+from sqlalchemy.engine import Engine
+
+from cc_orchestrator.database.migrations.migration import Migration
+from cc_orchestrator.database.models import (
+    HealthCheckRollup,
+    idx_health_check_rollups_bucket,
+)
+
+_ROLLUPS = cast(Table, HealthCheckRollup.__table__)
+
+
+class HealthCheckRollupsMigration(Migration):
+    """Add the table holding downsampled health check history."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            version="004",
+            description="Add health check rollups for retention downsampling",
+        )
+
+    def upgrade(self, engine: Engine) -> None:
+        """Create the rollup table and its bucket index if missing."""
+        _ROLLUPS.create(engine, checkfirst=True)
+        idx_health_check_rollups_bucket.create(engine, checkfirst=True)
+
+    def downgrade(self, engine: Engine) -> None:
+        """Drop the rollup table."""
+        idx_health_check_rollups_bucket.drop(engine, checkfirst=True)
+        _ROLLUPS.drop(engine, checkfirst=True)
@@ -8,6 +8,7 @@ from sqlalchemy import (
     JSON,
     Boolean,
     DateTime,
+    Float,
     ForeignKey,
     Index,
     Integer,
@@ -183,6 +184,12 @@ class Task(Base):
     estimated_duration: Mapped[int | None] = mapped_column(Integer)  # minutes
     actual_duration: Mapped[int | None] = mapped_column(Integer)  # minutes
 
+    # Queue leasing (set when a worker claims the task)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime)
+    attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
     # JSON fields
     requirements: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict)
     results: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict)
@@ -202,6 +209,8 @@ class Task(Base):
             kwargs["status"] = TaskStatus.PENDING
         if "priority" not in kwargs:
             kwargs["priority"] = TaskPriority.MEDIUM
+        if "attempts" not in kwargs:
+            kwargs["attempts"] = 0
         if "requirements" not in kwargs:
             kwargs["requirements"] = {}
         if "results" not in kwargs:
@@ -247,6 +256,8 @@ class Worktree(Base):
         DateTime, nullable=False, default=datetime.now, onupdate=datetime.now
     )
     last_sync: Mapped[datetime | None] = mapped_column(DateTime)
+    # Cheap git-state fingerprint recorded at last_sync; lets sync skip unchanged trees
+    sync_fingerprint: Mapped[str | None] = mapped_column(String(64))
 
     # JSON metadata
     git_config: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict)
@@ -307,6 +318,70 @@ class HealthCheck(Base):
         return f"<HealthCheck(id={self.id}, instance_id={self.instance_id}, status='{self.overall_status.value}')>"
 
 
+class HealthCheckRollup(Base):
+    """Downsampled health check history for a fixed time bucket."""
+
+    __tablename__ = "health_check_rollups"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    instance_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("instances.id"), nullable=False
+    )
+    bucket_start: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    bucket_seconds: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # Aggregated counts per health status
+    check_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    healthy_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    degraded_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    unhealthy_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    critical_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    unknown_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Aggregated durations
+    total_duration_ms: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    max_duration_ms: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.now
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.now, onupdate=datetime.now
+    )
+
+    # Relationships
+    instance: Mapped["Instance"] = relationship("Instance")
+
+    def __init__(self, **kwargs):
+        # Set Python-level defaults for counters if not provided
+        for field in (
+            "check_count",
+            "healthy_count",
+            "degraded_count",
+            "unhealthy_count",
+            "critical_count",
+            "unknown_count",
+            "total_duration_ms",
+            "max_duration_ms",
+        ):
+            kwargs.setdefault(field, 0)
+        super().__init__(**kwargs)
+
+    @property
+    def avg_duration_ms(self) -> float:
+        """Average check duration within the bucket."""
+        if not self.check_count:
+            return 0.0
+        return self.total_duration_ms / self.check_count
+
+    def __repr__(self) -> str:
+        return (
+            f"<HealthCheckRollup(instance_id={self.instance_id}, "
+            f"bucket_start='{self.bucket_start}', checks={self.check_count})>"
+        )
+
+
 class Configuration(Base):
     """Configuration settings model."""
 
@@ -374,6 +449,8 @@ idx_tasks_priority = Index("idx_tasks_priority", Task.priority)
 idx_tasks_instance_id = Index("idx_tasks_instance_id", Task.instance_id)
 idx_tasks_created_at = Index("idx_tasks_created_at", Task.created_at)
 idx_tasks_due_date = Index("idx_tasks_due_date", Task.due_date)
+idx_tasks_queue = Index("idx_tasks_queue", Task.status, Task.priority, Task.created_at)
+idx_tasks_lease = Index("idx_tasks_lease", Task.status, Task.lease_expires_at)
 
 # Worktree indexes
 idx_worktrees_path = Index("idx_worktrees_path", Worktree.path)
@@ -395,3 +472,12 @@ idx_health_checks_instance_id = Index(
 idx_health_checks_timestamp = Index(
     "idx_health_checks_timestamp", HealthCheck.check_timestamp
 )
+
+# Health check rollup indexes
+idx_health_check_rollups_bucket = Index(
+    "idx_health_check_rollups_bucket",
+    HealthCheckRollup.instance_id,
+    HealthCheckRollup.bucket_start,
+    HealthCheckRollup.bucket_seconds,
+    unique=True,
+)
@@ -4,7 +4,15 @@ from sqlalchemy import MetaData
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import DeclarativeBase
 
-from .models import Base, Configuration, HealthCheck, Instance, Task, Worktree
+from .models import (
+    Base,
+    Configuration,
+    HealthCheck,
+    HealthCheckRollup,
+    Instance,
+    Task,
+    Worktree,
+)
 
 
 def get_schema_version() -> str:
@@ -51,7 +59,7 @@ def get_model_classes() -> list[type[DeclarativeBase]]:
     Returns:
         List of model classes.
     """
-    return [Instance, Task, Worktree, Configuration, HealthCheck]
+    return [Instance, Task, Worktree, Configuration, HealthCheck, HealthCheckRollup]
 
 
 def validate_schema(engine: Engine) -> dict[str, bool | list[str]]:
@@ -7,8 +7,10 @@ This package provides comprehensive tmux session management including:
 - Multi-user session support
 - Integration with process management
 - Session discovery and cleanup
+- Control-mode client serving session queries without forking
 """
 
+from .control import TmuxControlClient, TmuxControlError
 from .service import (
     LayoutTemplate,
     SessionConfig,
@@ -18,6 +20,8 @@ from .service import (
     TmuxService,
     cleanup_tmux_service,
     get_tmux_service,
+    start_output_capture,
+    stop_output_capture,
 )
 
 __all__ = [
@@ -25,8 +29,12 @@ __all__ = [
     "SessionConfig",
     "SessionInfo",
     "SessionStatus",
+    "TmuxControlClient",
+    "TmuxControlError",
     "TmuxError",
     "TmuxService",
     "cleanup_tmux_service",
     "get_tmux_service",
+    "start_output_capture",
+    "stop_output_capture",
 ]
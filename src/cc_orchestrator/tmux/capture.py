@@ -0,0 +1,327 @@
+"""
+Pane output capture for tmux sessions.
+
+Each captured pane is connected with ``pipe-pane`` to a FIFO that this module
+reads without blocking from the event loop. Output is stripped of terminal
+escape sequences, split into lines and grouped into ``PaneOutputChunk``
+records tagged with the owning instance, which are handed to registered
+listeners (the web app feeds them into the log stream).
+
+A token bucket per instance bounds the bytes forwarded per second, and
+over-long lines are truncated, so a single noisy pane cannot flood the log
+store. Dropped and truncated byte counts are reported on the next chunk.
+"""
+
+import asyncio
+import os
+import re
+import shutil
+import stat
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from .logging_utils import tmux_logger
+
+# Defaults for the per-instance output budget and record sizes
+DEFAULT_RATE_BYTES = 64 * 1024
+DEFAULT_BURST_BYTES = 256 * 1024
+DEFAULT_MAX_LINE_BYTES = 4096
+DEFAULT_CHUNK_BYTES = 16 * 1024
+
+# Bytes read from a FIFO per read call
+_READ_SIZE = 64 * 1024
+
+# CSI and OSC sequences, then any other two-byte escape
+_ESCAPE_SEQUENCE = re.compile(
+    rb"\x1b\[[0-?]*[ -/]*[@-~]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)|\x1b[@-Z\\-_]"
+)
+# Control bytes other than tab and newline
+_CONTROL_BYTES = re.compile(rb"[\x00-\x08\x0b-\x1f\x7f]")
+
+
+@dataclass
+class PaneOutputChunk:
+    """A run of output lines from one pane."""
+
+    instance_id: str
+    session_name: str
+    pane_id: str
+    text: str
+    timestamp: datetime = field(default_factory=datetime.now)
+    # Bytes cut from over-long lines in this chunk
+    truncated_bytes: int = 0
+    # Bytes dropped by the rate limit since the previous chunk
+    dropped_bytes: int = 0
+
+
+OutputListener = Callable[[PaneOutputChunk], None]
+
+
+def clean_output(data: bytes) -> bytes:
+    """Strip terminal escape sequences and control bytes from pane output.
+
+    Carriage returns become line breaks, so redrawn status lines show up as
+    separate lines rather than being glued together.
+    """
+    data = _ESCAPE_SEQUENCE.sub(b"", data)
+    data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return _CONTROL_BYTES.sub(b"", data)
+
+
+class _ByteBudget:
+    """Token bucket measured in bytes."""
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def take(self, size: int, now: float | None = None) -> bool:
+        """Consume ``size`` bytes if the budget allows it."""
+        now = time.monotonic() if now is None else now
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if size > self.tokens:
+            return False
+        self.tokens -= size
+        return True
+
+
+@dataclass
+class _PaneStream:
+    """Read state of one captured pane."""
+
+    session_name: str
+    pane_id: str
+    instance_id: str
+    path: Path
+    fd: int
+    # Held open so the FIFO never reports EOF between writers
+    writer_fd: int
+    pending: bytearray = field(default_factory=bytearray)
+    dropped_bytes: int = 0
+
+
+class PaneOutputCapture:
+    """Reads piped pane output and forwards it to listeners."""
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        rate_bytes: float = DEFAULT_RATE_BYTES,
+        burst_bytes: float = DEFAULT_BURST_BYTES,
+        max_line_bytes: int = DEFAULT_MAX_LINE_BYTES,
+        chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    ) -> None:
+        """Initialize the capture.
+
+        Args:
+            directory: Directory for the FIFOs (a private temporary directory
+                is created on first use when not given)
+            rate_bytes: Sustained bytes per second forwarded per instance
+            burst_bytes: Bytes an instance may forward in a burst
+            max_line_bytes: Longest line forwarded before truncation
+            chunk_bytes: Largest chunk handed to listeners
+        """
+        self._directory = Path(directory) if directory else None
+        self._owns_directory = directory is None
+        self.rate_bytes = rate_bytes
+        self.burst_bytes = max(burst_bytes, max_line_bytes)
+        self.max_line_bytes = max_line_bytes
+        self.chunk_bytes = max(chunk_bytes, max_line_bytes)
+        self._streams: dict[tuple[str, str], _PaneStream] = {}
+        self._budgets: dict[str, _ByteBudget] = {}
+        self._listeners: list[OutputListener] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def add_listener(self, listener: OutputListener) -> None:
+        """Register a callback invoked with every output chunk.
+
+        Callbacks run on the event loop and must not block.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: OutputListener) -> None:
+        """Unregister an output callback."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def is_captured(self, session_name: str, pane_id: str) -> bool:
+        """Check whether a pane's output is being read."""
+        return (session_name, pane_id) in self._streams
+
+    def captured_sessions(self) -> list[str]:
+        """Names of the sessions with at least one captured pane."""
+        return sorted({key[0] for key in self._streams})
+
+    def open_pane(self, session_name: str, pane_id: str, instance_id: str) -> Path:
+        """Create and start reading the FIFO for a pane.
+
+        Must be called from the event loop. The caller connects the pane to
+        the returned path with ``pipe-pane``.
+
+        Args:
+            session_name: Session the pane belongs to
+            pane_id: Pane ID (e.g. ``%3``)
+            instance_id: Instance the output is attributed to
+
+        Returns:
+            Path of the FIFO
+        """
+        key = (session_name, pane_id)
+        if key in self._streams:
+            return self._streams[key].path
+
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        path = self._session_directory(session_name) / f"{pane_id.lstrip('%')}.fifo"
+        if path.exists():
+            path.unlink()
+        os.mkfifo(path, 0o600)
+
+        fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+        writer_fd = os.open(path, os.O_WRONLY | os.O_NONBLOCK)
+        stream = _PaneStream(session_name, pane_id, instance_id, path, fd, writer_fd)
+        self._streams[key] = stream
+        loop.add_reader(fd, self._on_readable, stream)
+        return path
+
+    def close_session(self, session_name: str) -> list[str]:
+        """Stop reading every pane of a session and remove its FIFOs.
+
+        Args:
+            session_name: Session to release
+
+        Returns:
+            IDs of the panes that were being captured
+        """
+        panes = []
+        for key in [key for key in self._streams if key[0] == session_name]:
+            stream = self._streams.pop(key)
+            self._drain(stream)
+            self._flush(stream, final=True)
+            self._close_stream(stream)
+            panes.append(stream.pane_id)
+
+        if self._directory is not None:
+            shutil.rmtree(self._directory / session_name, ignore_errors=True)
+        return panes
+
+    def close(self) -> None:
+        """Stop all capture and remove the FIFO directory if it was created."""
+        for session_name in {key[0] for key in self._streams}:
+            self.close_session(session_name)
+        if self._owns_directory and self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+
+    def _session_directory(self, session_name: str) -> Path:
+        """Get (creating if needed) the private FIFO directory of a session."""
+        if self._directory is None:
+            self._directory = Path(tempfile.mkdtemp(prefix="cc-orchestrator-capture-"))
+        directory = self._directory / session_name
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if stat.S_IMODE(directory.stat().st_mode) & 0o077:
+            directory.chmod(0o700)
+        return directory
+
+    def _on_readable(self, stream: _PaneStream) -> None:
+        """Read everything available from a pane's FIFO."""
+        self._drain(stream)
+        self._flush(stream)
+
+    def _drain(self, stream: _PaneStream) -> None:
+        """Move all buffered FIFO bytes into the stream's pending buffer."""
+        while True:
+            try:
+                data = os.read(stream.fd, _READ_SIZE)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                tmux_logger.warning(
+                    f"Pane output read failed - {stream.session_name} "
+                    f"{stream.pane_id}: {e}"
+                )
+                return
+            if not data:
+                return
+            stream.pending += data
+
+    def _flush(self, stream: _PaneStream, final: bool = False) -> None:
+        """Turn complete lines into chunks and hand them to listeners.
+
+        Args:
+            stream: Pane stream to flush
+            final: Also flush a trailing partial line
+        """
+        pending = stream.pending
+        end = pending.rfind(b"\n") + 1
+        if final or len(pending) - end > self.max_line_bytes:
+            # No line break in sight; treat what is buffered as a line
+            end = len(pending)
+        if not end:
+            return
+        raw = bytes(pending[:end])
+        del pending[:end]
+
+        budget = self._budgets.get(stream.instance_id)
+        if budget is None:
+            budget = _ByteBudget(self.rate_bytes, self.burst_bytes)
+            self._budgets[stream.instance_id] = budget
+
+        now = time.monotonic()
+        lines: list[bytes] = []
+        size = 0
+        truncated = 0
+        for line in clean_output(raw).split(b"\n"):
+            if not line.strip():
+                continue
+            if len(line) > self.max_line_bytes:
+                truncated += len(line) - self.max_line_bytes
+                line = line[: self.max_line_bytes]
+            if not budget.take(len(line), now):
+                stream.dropped_bytes += len(line)
+                continue
+            if size + len(line) > self.chunk_bytes:
+                self._emit(stream, lines, truncated)
+                lines, size, truncated = [], 0, 0
+            lines.append(line)
+            size += len(line) + 1
+        if lines:
+            self._emit(stream, lines, truncated)
+
+    def _emit(self, stream: _PaneStream, lines: list[bytes], truncated: int) -> None:
+        """Deliver one chunk to the listeners."""
+        chunk = PaneOutputChunk(
+            instance_id=stream.instance_id,
+            session_name=stream.session_name,
+            pane_id=stream.pane_id,
+            text=b"\n".join(lines).decode("utf-8", errors="replace"),
+            truncated_bytes=truncated,
+            dropped_bytes=stream.dropped_bytes,
+        )
+        stream.dropped_bytes = 0
+        for listener in list(self._listeners):
+            try:
+                listener(chunk)
+            except Exception as e:
+                tmux_logger.error(f"Pane output listener failed: {e}")
+
+    def _close_stream(self, stream: _PaneStream) -> None:
+        """Stop watching a stream and release its FIFO."""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.remove_reader(stream.fd)
+        for fd in (stream.fd, stream.writer_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        try:
+            stream.path.unlink()
+        except OSError:
+            pass
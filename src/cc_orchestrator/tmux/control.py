@@ -0,0 +1,502 @@
+"""
+Tmux control-mode client.
+
+Keeps a single ``tmux -C`` connection open to the tmux server and maintains an
+in-memory model of its sessions and windows. Structural notifications such as
+``%sessions-changed`` or ``%window-add`` trigger one ``list-windows -a`` over
+the same connection, so reads are served from memory without forking a tmux
+process per query.
+"""
+
+import os
+import subprocess
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+
+from .logging_utils import tmux_logger
+
+# Prefix of the per-process session each control client attaches to. It does
+# not carry the managed session prefix, so it never shows up as a managed or
+# orphaned session
+CONTROL_SESSION_PREFIX = "_cc-orchestrator-control"
+
+# Session user option naming the orchestrator database a session belongs to
+OWNER_OPTION = "@cc-orchestrator-owner"
+
+# Notifications after which the session/window model is re-read
+REFRESH_NOTIFICATIONS = frozenset(
+    {
+        "%sessions-changed",
+        "%session-changed",
+        "%session-renamed",
+        "%session-window-changed",
+        "%window-add",
+        "%window-close",
+        "%window-renamed",
+        "%unlinked-window-add",
+        "%unlinked-window-close",
+        "%unlinked-window-renamed",
+        "%client-session-changed",
+        "%client-detached",
+    }
+)
+
+# One line per window across all sessions; the path goes last since it is the
+# field most likely to contain the separator
+_LISTING_FORMAT = "\t".join(
+    [
+        "#{session_id}",
+        "#{session_name}",
+        "#{session_created}",
+        "#{session_attached}",
+        "#{window_index}",
+        "#{window_active}",
+        "#{window_name}",
+        f"#{{{OWNER_OPTION}}}",
+        "#{session_path}",
+    ]
+)
+
+_SAFE_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_./=:@%+,"
+)
+
+
+class TmuxControlError(Exception):
+    """Exception raised for control-mode connection and command errors."""
+
+    pass
+
+
+@dataclass
+class TmuxSessionState:
+    """Snapshot of one tmux session as seen by the control client."""
+
+    session_id: str
+    name: str
+    created: float
+    attached_clients: int
+    path: str | None = None
+    windows: list[str] = field(default_factory=list)
+    active_window: str | None = None
+    owner: str | None = None
+
+
+class _PendingCommand:
+    """Reply slot for a command sent over the control connection."""
+
+    def __init__(
+        self, on_done: Callable[["_PendingCommand"], None] | None = None
+    ) -> None:
+        self.done = threading.Event()
+        self.lines: list[str] = []
+        self.error = False
+        # Runs on the reader thread, in reply order
+        self.on_done = on_done
+
+
+def quote_argument(argument: str) -> str:
+    """Quote an argument for the tmux command parser.
+
+    Args:
+        argument: Raw argument
+
+    Returns:
+        Argument safe to place on a control-mode command line
+    """
+    if argument and all(ch in _SAFE_CHARS for ch in argument):
+        return argument
+    return "'" + argument.replace("'", "'\\''") + "'"
+
+
+def parse_listing(lines: list[str]) -> dict[str, TmuxSessionState]:
+    """Build the session model from ``list-windows -a`` output.
+
+    Args:
+        lines: Output lines in ``_LISTING_FORMAT``
+
+    Returns:
+        Session states keyed by session name, windows in index order
+    """
+    sessions: dict[str, TmuxSessionState] = {}
+    indexed: dict[str, list[tuple[int, str]]] = {}
+
+    for line in lines:
+        fields = line.split("\t", 8)
+        if len(fields) != 9:
+            continue
+        session_id, name, created, attached, index, active, window, owner, path = fields
+
+        state = sessions.get(name)
+        if state is None:
+            state = sessions[name] = TmuxSessionState(
+                session_id=session_id,
+                name=name,
+                created=float(created or 0),
+                attached_clients=int(attached or 0),
+                path=path or None,
+                owner=owner or None,
+            )
+            indexed[name] = []
+        indexed[name].append((int(index or 0), window))
+        if active == "1":
+            state.active_window = window
+
+    for name, windows in indexed.items():
+        sessions[name].windows = [window for _, window in sorted(windows)]
+    return sessions
+
+
+class TmuxControlClient:
+    """Persistent tmux control-mode connection with a live session model."""
+
+    def __init__(
+        self,
+        socket_name: str | None = None,
+        session_name: str | None = None,
+        tmux_bin: str = "tmux",
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            socket_name: tmux socket name (``-L``), None for the default
+            session_name: Session the control client attaches to (defaults
+                to one per process)
+            tmux_bin: tmux executable
+        """
+        self.socket_name = socket_name
+        self.session_name = session_name or f"{CONTROL_SESSION_PREFIX}-{os.getpid()}"
+        self.tmux_bin = tmux_bin
+
+        self._process: subprocess.Popen[str] | None = None
+        self._reader: threading.Thread | None = None
+        self._write_lock = threading.Lock()
+        self._pending: deque[_PendingCommand] = deque()
+
+        # Model state
+        self._lock = threading.Lock()
+        self._sessions: dict[str, TmuxSessionState] = {}
+        self._refresh_in_flight = False
+        self._refresh_dirty = False
+        self.generation = 0
+        self.refreshes = 0
+
+    @property
+    def connected(self) -> bool:
+        """Whether the control connection is up."""
+        return self._process is not None and self._process.poll() is None
+
+    def start(self, timeout: float = 5.0) -> bool:
+        """Open the control connection and load the initial model.
+
+        Args:
+            timeout: Seconds to wait for the initial model
+
+        Returns:
+            True if the client is connected and the model is loaded
+        """
+        if self.connected:
+            return True
+
+        command = [self.tmux_bin]
+        if self.socket_name:
+            command += ["-L", self.socket_name]
+        command += ["-C", "new-session", "-A", "-s", self.session_name]
+
+        try:
+            self._process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+            )
+        except OSError as e:
+            tmux_logger.warning(f"Could not start tmux control client: {e}")
+            self._process = None
+            return False
+
+        self._reader = threading.Thread(
+            target=self._read_loop, name="tmux-control", daemon=True
+        )
+        self._reader.start()
+
+        if not self.refresh(timeout=timeout):
+            tmux_logger.warning("tmux control client did not respond; closing it")
+            self.close()
+            return False
+
+        tmux_logger.info(
+            f"tmux control client connected - {len(self._sessions)} sessions"
+        )
+        return True
+
+    def close(self) -> None:
+        """Close the connection and remove the control session."""
+        process = self._process
+        if process is None:
+            return
+        if process.poll() is None:
+            try:
+                self._submit(
+                    self._command_line(("kill-session", "-t", f"={self.session_name}"))
+                )
+                process.stdin.close()  # type: ignore[union-attr]
+                process.wait(timeout=2)
+            except Exception:
+                process.kill()
+                process.wait()
+        if self._reader is not None:
+            self._reader.join(timeout=2)
+        self._process = None
+        self._fail_pending()
+
+    def command(self, *args: str, timeout: float = 5.0) -> list[str]:
+        """Run a tmux command over the control connection.
+
+        Args:
+            *args: Command name and arguments
+            timeout: Seconds to wait for the reply
+
+        Returns:
+            Output lines of the command
+
+        Raises:
+            TmuxControlError: If the command fails or no reply arrives
+        """
+        return self._wait(self._submit(self._command_line(args)), timeout)
+
+    def batch(
+        self, commands: Sequence[Sequence[str]], timeout: float = 5.0
+    ) -> list[list[str]]:
+        """Run several tmux commands with a single write.
+
+        Each command goes on its own line, so tmux replies to every one of
+        them even if an earlier one fails; the whole batch costs one round
+        trip.
+
+        Args:
+            commands: Commands, each a sequence of name and arguments
+            timeout: Seconds to wait for all replies
+
+        Returns:
+            Output lines per command
+
+        Raises:
+            TmuxControlError: If any command fails (after all replies arrived)
+                or the replies do not arrive in time
+        """
+        pending = self._submit_many(
+            [self._command_line(tuple(command)) for command in commands]
+        )
+        deadline = time.monotonic() + timeout
+        results = []
+        failure: TmuxControlError | None = None
+        for command, item in zip(commands, pending, strict=True):
+            try:
+                results.append(self._wait(item, max(0.0, deadline - time.monotonic())))
+            except TmuxControlError as e:
+                if not item.done.is_set():
+                    raise
+                failure = failure or TmuxControlError(f"{command[0]}: {e}")
+                results.append(item.lines)
+        if failure is not None:
+            raise failure
+        return results
+
+    def refresh(self, timeout: float = 5.0) -> bool:
+        """Re-read the model and wait until it is applied.
+
+        Use after changing tmux state outside this connection to make the
+        change visible to subsequent reads.
+
+        Args:
+            timeout: Seconds to wait
+
+        Returns:
+            True if the model was refreshed
+        """
+        try:
+            pending = self._submit(
+                self._command_line(("list-windows", "-a", "-F", _LISTING_FORMAT)),
+                on_done=self._apply_reply,
+            )
+            self._wait(pending, timeout)
+        except TmuxControlError as e:
+            tmux_logger.debug(f"tmux model refresh failed: {e}")
+            return False
+        return True
+
+    def _wait(self, pending: _PendingCommand, timeout: float) -> list[str]:
+        """Wait for a reply and raise if the command failed."""
+        if not pending.done.wait(timeout):
+            raise TmuxControlError("tmux command timed out")
+        if pending.error:
+            raise TmuxControlError(f"tmux command failed: {' '.join(pending.lines)}")
+        return pending.lines
+
+    @staticmethod
+    def _command_line(args: tuple[str, ...]) -> str:
+        """Join command arguments into one control-mode input line."""
+        return " ".join(quote_argument(arg) for arg in args)
+
+    def sessions(self) -> dict[str, TmuxSessionState]:
+        """Get the current sessions, excluding control sessions.
+
+        Returns:
+            Session states keyed by name
+        """
+        with self._lock:
+            return dict(self._sessions)
+
+    def get_session(self, session_name: str) -> TmuxSessionState | None:
+        """Get one session from the model.
+
+        Args:
+            session_name: Session name
+
+        Returns:
+            Session state or None if there is no such session
+        """
+        with self._lock:
+            return self._sessions.get(session_name)
+
+    def has_session(self, session_name: str) -> bool:
+        """Check whether a session exists according to the model."""
+        return self.get_session(session_name) is not None
+
+    def _send(self, line: str) -> None:
+        """Write one command line to the control connection."""
+        process = self._process
+        if process is None or process.stdin is None:
+            raise TmuxControlError("tmux control client is not connected")
+        try:
+            process.stdin.write(line + "\n")
+            process.stdin.flush()
+        except (BrokenPipeError, ValueError) as e:
+            raise TmuxControlError(f"tmux control connection lost: {e}") from e
+
+    def _submit(
+        self,
+        line: str,
+        on_done: Callable[[_PendingCommand], None] | None = None,
+    ) -> _PendingCommand:
+        """Send a command and queue its reply slot."""
+        return self._submit_many([line], on_done)[0]
+
+    def _submit_many(
+        self,
+        lines: list[str],
+        on_done: Callable[[_PendingCommand], None] | None = None,
+    ) -> list[_PendingCommand]:
+        """Send command lines in one write and queue their reply slots.
+
+        tmux answers the commands of one client in order, so replies are
+        matched to requests first in, first out.
+        """
+        pending = [_PendingCommand(on_done) for _ in lines]
+        with self._write_lock:
+            self._pending.extend(pending)
+            try:
+                self._send("\n".join(lines))
+            except TmuxControlError:
+                for item in pending:
+                    self._pending.remove(item)
+                raise
+        return pending
+
+    def _request_refresh(self) -> None:
+        """Refresh asynchronously, coalescing notifications that arrive meanwhile."""
+        with self._lock:
+            if self._refresh_in_flight:
+                self._refresh_dirty = True
+                return
+            self._refresh_in_flight = True
+            self._refresh_dirty = False
+
+        try:
+            self._submit(
+                self._command_line(("list-windows", "-a", "-F", _LISTING_FORMAT)),
+                on_done=self._on_async_refresh,
+            )
+        except TmuxControlError:
+            with self._lock:
+                self._refresh_in_flight = False
+
+    def _on_async_refresh(self, pending: _PendingCommand) -> None:
+        """Apply an asynchronous refresh and re-issue it if more changes arrived."""
+        self._apply_reply(pending)
+        with self._lock:
+            self._refresh_in_flight = False
+            again = self._refresh_dirty
+        if again:
+            self._request_refresh()
+
+    def _apply_reply(self, pending: _PendingCommand) -> None:
+        """Replace the model with a fresh listing."""
+        if pending.error:
+            return
+        sessions = parse_listing(pending.lines)
+        for name in [n for n in sessions if n.startswith(CONTROL_SESSION_PREFIX)]:
+            del sessions[name]
+        with self._lock:
+            self._sessions = sessions
+            self.generation += 1
+            self.refreshes += 1
+
+    def _read_loop(self) -> None:
+        """Consume command replies and notifications until the connection ends."""
+        process = self._process
+        assert process is not None and process.stdout is not None
+
+        block: list[str] | None = None
+        own_block = False
+        for raw in process.stdout:
+            line = raw.rstrip("\n")
+
+            if block is not None:
+                if line.startswith(("%end ", "%error ")):
+                    if own_block:
+                        self._complete(block, error=line.startswith("%error"))
+                    block = None
+                else:
+                    block.append(line)
+                continue
+
+            if line.startswith("%begin "):
+                block = []
+                # The last field flags commands sent by this client, as
+                # opposed to the command that attached it
+                own_block = line.rsplit(" ", 1)[-1] == "1"
+            elif line.startswith("%exit"):
+                break
+            elif line.split(" ", 1)[0] in REFRESH_NOTIFICATIONS:
+                self._request_refresh()
+
+        tmux_logger.info("tmux control connection closed")
+        self._fail_pending()
+
+    def _complete(self, lines: list[str], error: bool) -> None:
+        """Deliver a reply to the oldest pending command."""
+        with self._write_lock:
+            if not self._pending:
+                return
+            pending = self._pending.popleft()
+        pending.lines = lines
+        pending.error = error
+        if pending.on_done is not None:
+            pending.on_done(pending)
+        pending.done.set()
+
+    def _fail_pending(self) -> None:
+        """Release every waiter after the connection ended."""
+        with self._write_lock:
+            pending, self._pending = list(self._pending), deque()
+        for item in pending:
+            item.error = True
+            item.lines = ["tmux control connection closed"]
+            item.done.set()
@@ -6,6 +6,11 @@ including session creation, lifecycle management, layout templates, and multi-us
 """
 
 import asyncio
+import atexit
+import functools
+import shlex
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -13,6 +18,16 @@ from typing import Any
 
 import libtmux
 
+from ..config.loader import OrchestratorConfig, load_config
+from ..database.connection import get_database_manager
+from ..utils.tracing import traced
+from .capture import OutputListener, PaneOutputCapture
+from .control import (
+    OWNER_OPTION,
+    TmuxControlClient,
+    TmuxControlError,
+    TmuxSessionState,
+)
 from .logging_utils import (
     log_layout_setup,
     log_orphaned_sessions,
@@ -29,6 +44,122 @@ MAX_WINDOWS_PER_SESSION = 20
 MAX_PANES_PER_WINDOW = 10
 MAX_TEMPLATE_NAME_LENGTH = 100
 
+# Minimum seconds between attempts to (re)connect the control client
+CONTROL_RETRY_SECONDS = 30.0
+
+# Sessions destroyed at once when falling back to one libtmux kill per session
+DEFAULT_CLEANUP_CONCURRENCY = 8
+
+
+# Pane command screening; see _pane_command_rejection
+_DANGEROUS_PATTERNS = (
+    ";",
+    "|",
+    "&",
+    "$",
+    "`",
+    "$(",
+    "&&",
+    "||",
+    "rm ",
+    "del ",
+    "format",
+    "mkfs",
+    "dd ",
+    "sudo",
+    "su ",
+    "chmod",
+    "chown",
+    "/etc/",
+    "shutdown",
+    "reboot",
+    "halt",
+    "init ",
+    ">/dev/",
+    "<",
+    ">",
+    ">>",
+    "curl",
+    "wget",
+    "ssh",
+    "scp",
+    "rsync",
+    "nc ",
+    "netcat",
+)
+
+# Allow common safe commands and their variations
+_SAFE_COMMANDS = (
+    "bash",
+    "sh",
+    "zsh",
+    "fish",
+    "cd ",
+    "ls",
+    "pwd",
+    "echo",
+    "cat",
+    "less",
+    "more",
+    "tail",
+    "head",
+    "grep",
+    "find",
+    "ps",
+    "top",
+    "htop",
+    "git",
+    "vim",
+    "nano",
+    "emacs",
+    "python",
+    "node",
+    "npm",
+    "yarn",
+    "make",
+    "cmake",
+    "gcc",
+    "clang",
+    "docker",
+    "kubectl",
+    "helm",
+    "claude",
+)
+
+# Allow test commands for testing purposes
+_TEST_COMMANDS = ("failing-command",)
+
+
+@functools.lru_cache(maxsize=1024)
+def _pane_command_rejection(command: str) -> str | None:
+    """Screen a pane command, caching the verdict per command string.
+
+    Args:
+        command: Command to screen
+
+    Returns:
+        None if the command is allowed, otherwise the rejection message
+        (empty for blank commands)
+    """
+    if not command or not command.strip():
+        return ""
+
+    # Check for potentially dangerous patterns
+    command_lower = command.lower()
+    for pattern in _DANGEROUS_PATTERNS:
+        if pattern in command_lower:
+            return (
+                f"Rejected potentially dangerous command pattern '{pattern}' in: "
+                f"{command}"
+            )
+
+    # Check if command starts with a safe command
+    if command_lower.startswith(_SAFE_COMMANDS + _TEST_COMMANDS):
+        return None
+
+    # If no safe command match, be conservative and reject
+    return f"Rejected unrecognized command: {command}"
+
 
 class SessionStatus(Enum):
     """Status of a tmux session."""
@@ -96,18 +227,101 @@ class LayoutTemplate:
         self.default_pane_command = default_pane_command
 
 
+# Placeholders in compiled layouts, substituted for each new session
+_SESSION_NAME = "\0session"
+_SESSION_TARGET = "\0target"
+_FIRST_WINDOW = "\0first"
+_START_DIRECTORY = "\0directory"
+
+
+@dataclass(frozen=True)
+class CompiledLayout:
+    """Layout template compiled into a tmux command batch.
+
+    The batch creates the session with its first window, sends pane commands,
+    splits panes and adds the remaining windows. It is built once per
+    template; ``render`` only substitutes the session name and directory.
+    """
+
+    template: LayoutTemplate
+    is_valid: bool
+    error: str
+    windows: tuple[str, ...]
+    commands: tuple[tuple[str, ...], ...]
+
+    def render(
+        self,
+        session_name: str,
+        working_directory: Path,
+        environment: dict[str, str] | None = None,
+    ) -> list[list[str]]:
+        """Build the command batch for one session.
+
+        Args:
+            session_name: Name of the session to create
+            working_directory: Start directory for windows and panes
+            environment: Session environment variables
+
+        Returns:
+            Commands to run in order, creation first
+        """
+        values = {
+            _SESSION_NAME: session_name,
+            _SESSION_TARGET: f"={session_name}:",
+            _FIRST_WINDOW: f"={session_name}:^",
+            _START_DIRECTORY: str(working_directory),
+        }
+        rendered = [
+            [values.get(arg, arg) for arg in command] for command in self.commands
+        ]
+        # Environment goes right after creation, before further panes start
+        for key, value in (environment or {}).items():
+            rendered.insert(
+                1, ["set-environment", "-t", f"={session_name}", key, value]
+            )
+        return rendered
+
+
 class TmuxService:
     """Comprehensive tmux session management service."""
 
-    def __init__(self) -> None:
-        """Initialize tmux service."""
+    def __init__(
+        self,
+        control_client: TmuxControlClient | None = None,
+        cleanup_concurrency: int = DEFAULT_CLEANUP_CONCURRENCY,
+        output_capture: PaneOutputCapture | None = None,
+        owner: str | Callable[[], str | None] | None = None,
+    ) -> None:
+        """Initialize tmux service.
+
+        Args:
+            control_client: Control-mode client to serve session queries
+                from. It connects on first use; without one, or while it is
+                disconnected, queries go through libtmux.
+            cleanup_concurrency: Maximum sessions destroyed in parallel when
+                bulk cleanup cannot use the control client
+            output_capture: Capture to pipe the panes of created sessions
+                into; without one, pane output is not captured
+            owner: Identifier of the orchestrator database, recorded on
+                created sessions in the ``@cc-orchestrator-owner`` option so
+                the session reaper only ever touches its own sessions. A
+                callable is resolved on first use, when a session is created.
+        """
         self._server = libtmux.Server()
+        self._control = control_client
+        self._cleanup_concurrency = max(1, cleanup_concurrency)
+        self._capture = output_capture
+        self._owner_source = owner
+        self._owner = owner if isinstance(owner, str) else None
+        self._control_attempted_at: float | None = None
         self._sessions: dict[str, SessionInfo] = {}
         self._layout_templates: dict[str, LayoutTemplate] = {}
+        self._compiled_layouts: dict[str, CompiledLayout] = {}
         self._session_prefix = "cc-orchestrator"
         self._init_default_templates()
         tmux_logger.info("Tmux service initialized")
 
+    @traced("tmux.create_session")
     async def create_session(self, config: SessionConfig) -> SessionInfo:
         """Create a new tmux session.
 
@@ -131,6 +345,21 @@ class TmuxService:
             # Ensure working directory exists
             config.working_directory.mkdir(parents=True, exist_ok=True)
 
+            control = await self._live_model()
+            if control is not None:
+                session_info = await self._create_session_batched(
+                    control, session_name, config
+                )
+                await self._capture_new_session(session_name, config.instance_id)
+                if config.auto_attach:
+                    await self.attach_session(session_name)
+                log_session_operation("create", session_name, "success")
+                tmux_logger.info(
+                    f"Tmux session created successfully - {session_name} "
+                    f"(instance: {config.instance_id}, layout: {config.layout_template})"
+                )
+                return session_info
+
             # Create tmux session
             session = self._server.new_session(
                 session_name=session_name,
@@ -138,6 +367,9 @@ class TmuxService:
                 detach=True,  # Always create detached
             )
 
+            if self.owner:
+                session.cmd("set-option", OWNER_OPTION, self.owner)
+
             # Configure environment if provided
             if config.environment:
                 for key, value in config.environment.items():
@@ -167,6 +399,8 @@ class TmuxService:
 
             # Store session info
             self._sessions[session_name] = session_info
+            await self._sync_model()
+            await self._capture_new_session(session_name, config.instance_id)
 
             # Auto-attach if requested
             if config.auto_attach:
@@ -184,6 +418,7 @@ class TmuxService:
             log_session_operation("create", session_name, "error", {"error": str(e)})
             raise TmuxError(f"Failed to create session {session_name}: {e}")
 
+    @traced("tmux.destroy_session")
     async def destroy_session(self, session_name: str, force: bool = False) -> bool:
         """Destroy a tmux session.
 
@@ -203,22 +438,40 @@ class TmuxService:
         log_session_cleanup(session_name, force, "manual")
 
         try:
-            session = self._server.sessions.get(session_name=session_name)
-            if not session:
-                return False
+            control = await self._live_model()
+            if control is not None:
+                state = control.get_session(session_name)
+                if state is None:
+                    return False
+                attached = state.attached_clients > 0
+            else:
+                session = await asyncio.to_thread(
+                    self._server.sessions.get, session_name=session_name
+                )
+                if not session:
+                    return False
+                attached = getattr(session, "attached", False)
 
             # Check for attached clients
-            if not force and getattr(session, "attached", False):
+            if not force and attached:
                 raise TmuxError(
                     f"Session {session_name} has attached clients. Use force=True to destroy anyway."
                 )
 
             # Kill session
-            session.kill()
+            if control is not None:
+                await asyncio.to_thread(
+                    control.command, "kill-session", "-t", f"={session_name}"
+                )
+                await asyncio.to_thread(control.refresh)
+            else:
+                await asyncio.to_thread(session.kill)
 
             # Remove from tracking
             if session_name in self._sessions:
                 del self._sessions[session_name]
+            if self._capture is not None:
+                self._capture.close_session(session_name)
 
             log_session_operation("destroy", session_name, "success")
             tmux_logger.info(f"Tmux session destroyed - {session_name}")
@@ -249,9 +502,10 @@ class TmuxService:
             return False
 
         try:
-            session = self._server.sessions.get(session_name=session_name)
-            if not session:
-                return False
+            if await self._live_model() is None:
+                session = self._server.sessions.get(session_name=session_name)
+                if not session:
+                    return False
 
             # Update session info
             if session_name in self._sessions:
@@ -284,12 +538,22 @@ class TmuxService:
         session_name = self._normalize_session_name(session_name)
 
         try:
-            session = self._server.sessions.get(session_name=session_name)
-            if not session:
-                return False
+            control = await self._live_model()
+            if control is not None:
+                if not control.has_session(session_name):
+                    return False
+
+                # Detach all clients from this session
+                await asyncio.to_thread(
+                    control.command, "detach-client", "-s", f"={session_name}"
+                )
+            else:
+                session = self._server.sessions.get(session_name=session_name)
+                if not session:
+                    return False
 
-            # Detach all clients from this session
-            session.cmd("detach-client", "-a")
+                # Detach all clients from this session
+                session.cmd("detach-client", "-a")
 
             # Update session info
             if session_name in self._sessions:
@@ -320,12 +584,16 @@ class TmuxService:
             True if session exists
         """
         session_name = self._normalize_session_name(session_name)
+        control = await self._live_model()
+        if control is not None:
+            return control.has_session(session_name)
         try:
             session = self._server.sessions.get(session_name=session_name)
             return session is not None
         except Exception:
             return False
 
+    @traced("tmux.list_sessions")
     async def list_sessions(self, include_orphaned: bool = False) -> list[SessionInfo]:
         """List all tmux sessions.
 
@@ -338,15 +606,21 @@ class TmuxService:
         sessions = []
 
         try:
-            # Get all tmux sessions
-            tmux_sessions = self._server.sessions
+            control = await self._live_model()
+            if control is not None:
+                for state in control.sessions().values():
+                    if state.name.startswith(self._session_prefix):
+                        sessions.append(self._session_info_from_state(state))
+            else:
+                # Get all tmux sessions
+                tmux_sessions = self._server.sessions
 
-            # Process managed sessions
-            for session in tmux_sessions:
-                if session.name and session.name.startswith(self._session_prefix):
-                    session_info = await self._get_session_info(session)
-                    if session_info:
-                        sessions.append(session_info)
+                # Process managed sessions
+                for session in tmux_sessions:
+                    if session.name and session.name.startswith(self._session_prefix):
+                        session_info = await self._get_session_info(session)
+                        if session_info:
+                            sessions.append(session_info)
 
             # Detect orphaned sessions if requested
             if include_orphaned:
@@ -360,6 +634,7 @@ class TmuxService:
             tmux_logger.error(f"Failed to list sessions: {e}")
             return []
 
+    @traced("tmux.get_session_info")
     async def get_session_info(self, session_name: str) -> SessionInfo | None:
         """Get information about a specific session.
 
@@ -374,6 +649,11 @@ class TmuxService:
         if session_name in self._sessions:
             return self._sessions[session_name]
 
+        control = await self._live_model()
+        if control is not None:
+            state = control.get_session(session_name)
+            return self._session_info_from_state(state) if state else None
+
         # Try to get info from tmux directly
         try:
             session = self._server.sessions.get(session_name=session_name)
@@ -410,9 +690,8 @@ class TmuxService:
                 # Clean up all managed sessions
                 sessions_to_cleanup = list(self._sessions.keys())
 
-            for session_name in sessions_to_cleanup:
-                if await self.destroy_session(session_name, force=force):
-                    cleaned_up += 1
+            destroyed = await self.destroy_sessions(sessions_to_cleanup, force=force)
+            cleaned_up = len(destroyed)
 
             tmux_logger.info(
                 f"Session cleanup completed - cleaned: {cleaned_up}, "
@@ -425,6 +704,307 @@ class TmuxService:
             tmux_logger.error(f"Session cleanup failed: {e}")
             return cleaned_up
 
+    @traced("tmux.destroy_sessions")
+    async def destroy_sessions(
+        self, session_names: list[str], force: bool = False
+    ) -> list[str]:
+        """Destroy several tmux sessions at once.
+
+        With a connected control client every kill goes out in one command
+        batch. Otherwise sessions are destroyed individually, at most
+        ``cleanup_concurrency`` at a time. A session that cannot be destroyed
+        (including one with attached clients when not forced) is logged and
+        skipped rather than failing the rest.
+
+        Args:
+            session_names: Names of sessions to destroy
+            force: Force destruction even if clients are attached
+
+        Returns:
+            Names of the sessions that were destroyed
+        """
+        names = list(
+            dict.fromkeys(self._normalize_session_name(name) for name in session_names)
+        )
+        if not names:
+            return []
+
+        control = await self._live_model()
+        if control is not None:
+            return await self._destroy_batched(control, names, force)
+
+        semaphore = asyncio.Semaphore(self._cleanup_concurrency)
+
+        async def destroy(name: str) -> bool:
+            async with semaphore:
+                return await self.destroy_session(name, force=force)
+
+        results = await asyncio.gather(
+            *(destroy(name) for name in names), return_exceptions=True
+        )
+        destroyed = []
+        for name, result in zip(names, results, strict=True):
+            if isinstance(result, BaseException):
+                tmux_logger.error(f"Failed to destroy session - {name}: {result}")
+            elif result:
+                destroyed.append(name)
+        return destroyed
+
+    async def _destroy_batched(
+        self, control: TmuxControlClient, names: list[str], force: bool
+    ) -> list[str]:
+        """Kill sessions with a single control-mode command batch.
+
+        Args:
+            control: Connected control client
+            names: Normalized session names
+            force: Kill sessions even if clients are attached
+
+        Returns:
+            Names of the sessions that were destroyed
+        """
+        targets = []
+        for name in names:
+            state = control.get_session(name)
+            if state is None:
+                tmux_logger.warning(f"Session {name} does not exist")
+            elif state.attached_clients and not force:
+                tmux_logger.warning(
+                    f"Session {name} has attached clients, not destroying"
+                )
+            else:
+                targets.append(name)
+        if not targets:
+            return []
+
+        for name in targets:
+            log_session_cleanup(name, force, "bulk")
+
+        def kill() -> None:
+            try:
+                control.batch([("kill-session", "-t", f"={name}") for name in targets])
+            except TmuxControlError as e:
+                # Sessions that vanished meanwhile fail their kill; the rest ran
+                tmux_logger.warning(f"Bulk session kill reported an error: {e}")
+            control.refresh()
+
+        await asyncio.to_thread(kill)
+
+        destroyed = [name for name in targets if not control.has_session(name)]
+        for name in destroyed:
+            self._sessions.pop(name, None)
+            if self._capture is not None:
+                self._capture.close_session(name)
+            log_session_operation("destroy", name, "success")
+        tmux_logger.info(f"Tmux sessions destroyed - {len(destroyed)}")
+        return destroyed
+
+    @property
+    def output_capture(self) -> PaneOutputCapture | None:
+        """Pane output capture in use, if any."""
+        return self._capture
+
+    def set_output_capture(self, capture: PaneOutputCapture | None) -> None:
+        """Pipe the panes of sessions created from now on into a capture.
+
+        Args:
+            capture: Capture to use, or None to stop capturing new sessions
+        """
+        self._capture = capture
+
+    @traced("tmux.capture_sessions")
+    async def capture_sessions(self) -> list[str]:
+        """Start capturing every managed session this orchestrator owns.
+
+        Long-lived hosts call this at startup to pick up sessions created by
+        other processes, such as one-shot CLI commands.
+
+        Returns:
+            Names of the sessions with newly captured panes
+        """
+        if self._capture is None:
+            return []
+
+        owner = self.owner
+        captured = []
+        for state in await self.list_session_states():
+            if not self.is_managed_session(state.name):
+                continue
+            if owner is not None and state.owner != owner:
+                continue
+            try:
+                if await self.start_capture(state.name):
+                    captured.append(state.name)
+            except TmuxError as e:
+                tmux_logger.warning(str(e))
+        return captured
+
+    async def release_output_capture(self) -> None:
+        """Close the pane pipes of every captured session and stop capturing.
+
+        The capture's FIFOs, and its directory if it created one, are removed.
+        """
+        capture = self._capture
+        if capture is None:
+            return
+        for session_name in capture.captured_sessions():
+            await self.stop_capture(session_name)
+        capture.close()
+        self._capture = None
+
+    @traced("tmux.start_capture")
+    async def start_capture(
+        self, session_name: str, instance_id: str | None = None
+    ) -> list[str]:
+        """Pipe the output of a session's panes into the output capture.
+
+        Panes that are already captured are left alone, so this can be called
+        again to pick up panes added after the session was created.
+
+        Args:
+            session_name: Name of the session
+            instance_id: Instance the output is attributed to (defaults to
+                the one the session was created for)
+
+        Returns:
+            IDs of the panes newly captured
+
+        Raises:
+            TmuxError: If capture is not configured or tmux fails
+        """
+        capture = self._capture
+        if capture is None:
+            raise TmuxError("Pane output capture is not enabled", session_name)
+
+        session_name = self._normalize_session_name(session_name)
+        if instance_id is None:
+            info = self._sessions.get(session_name)
+            instance_id = (
+                info.instance_id if info else self._extract_instance_id(session_name)
+            )
+
+        try:
+            pane_ids = await self._run_tmux_commands(
+                [("list-panes", "-s", "-t", f"={session_name}", "-F", "#{pane_id}")]
+            )
+            started = [
+                pane_id
+                for pane_id in pane_ids[0]
+                if not capture.is_captured(session_name, pane_id)
+            ]
+            commands = []
+            for pane_id in started:
+                path = capture.open_pane(session_name, pane_id, instance_id)
+                pipe = f"exec cat >> {shlex.quote(str(path))}"
+                commands.append(("pipe-pane", "-O", "-t", pane_id, pipe))
+            if commands:
+                await self._run_tmux_commands(commands)
+        except Exception as e:
+            raise TmuxError(f"Failed to capture output of {session_name}: {e}")
+
+        tmux_logger.info(
+            f"Pane output capture started - {session_name} (panes: {started})"
+        )
+        return started
+
+    async def stop_capture(self, session_name: str) -> list[str]:
+        """Stop piping a session's pane output.
+
+        Args:
+            session_name: Name of the session
+
+        Returns:
+            IDs of the panes that were captured
+        """
+        if self._capture is None:
+            return []
+
+        session_name = self._normalize_session_name(session_name)
+        pane_ids = self._capture.close_session(session_name)
+        if pane_ids and await self.session_exists(session_name):
+            try:
+                # pipe-pane without a command closes the pane's pipe
+                await self._run_tmux_commands(
+                    [("pipe-pane", "-t", pane_id) for pane_id in pane_ids]
+                )
+            except Exception as e:
+                tmux_logger.debug(f"Failed to close pane pipes - {session_name}: {e}")
+        return pane_ids
+
+    async def _capture_new_session(self, session_name: str, instance_id: str) -> None:
+        """Start capturing a newly created session, if capture is enabled."""
+        if self._capture is None:
+            return
+        try:
+            await self.start_capture(session_name, instance_id)
+        except TmuxError as e:
+            # The session is usable without captured output
+            tmux_logger.warning(str(e))
+
+    async def _run_tmux_commands(
+        self, commands: list[tuple[str, ...]]
+    ) -> list[list[str]]:
+        """Run tmux commands over the control client, or through libtmux.
+
+        Args:
+            commands: Commands, each a tuple of name and arguments
+
+        Returns:
+            Output lines per command
+
+        Raises:
+            TmuxError: If a command fails
+        """
+        control = await self._live_model()
+        if control is not None:
+            try:
+                return await asyncio.to_thread(control.batch, commands)
+            except TmuxControlError as e:
+                raise TmuxError(str(e))
+
+        def run() -> list[list[str]]:
+            results = []
+            for command in commands:
+                result = self._server.cmd(*command)
+                if result.stderr:
+                    raise TmuxError(f"{command[0]}: {' '.join(result.stderr)}")
+                results.append(result.stdout)
+            return results
+
+        return await asyncio.to_thread(run)
+
+    @traced("tmux.list_session_states")
+    async def list_session_states(self) -> list[TmuxSessionState]:
+        """Get a snapshot of every session on the tmux server.
+
+        Returns:
+            Session states, including sessions not managed by this service
+        """
+        control = await self._live_model()
+        if control is not None:
+            return list(control.sessions().values())
+
+        def snapshot() -> list[TmuxSessionState]:
+            listing = self._server.cmd(
+                "list-sessions", "-F", f"#{{session_id}}\t#{{{OWNER_OPTION}}}"
+            ).stdout
+            owners = dict(line.split("\t", 1) for line in listing if "\t" in line)
+            return [
+                TmuxSessionState(
+                    session_id=session.session_id or "",
+                    name=session.name or "",
+                    created=float(getattr(session, "session_created", None) or 0),
+                    attached_clients=int(
+                        getattr(session, "session_attached", None) or 0
+                    ),
+                    path=getattr(session, "session_path", None),
+                    owner=owners.get(session.session_id or "") or None,
+                )
+                for session in self._server.sessions
+            ]
+
+        return await asyncio.to_thread(snapshot)
+
     def add_layout_template(self, template: LayoutTemplate) -> None:
         """Add a custom layout template.
 
@@ -432,6 +1012,7 @@ class TmuxService:
             template: LayoutTemplate object
         """
         self._layout_templates[template.name] = template
+        self._compiled_layouts.pop(template.name, None)
         tmux_logger.info(
             f"Layout template added - {template.name}: {template.description}"
         )
@@ -444,6 +1025,57 @@ class TmuxService:
         """
         return self._layout_templates.copy()
 
+    @property
+    def owner(self) -> str | None:
+        """Owner recorded on created sessions, resolving it on first use."""
+        if self._owner is None and callable(self._owner_source):
+            self._owner = self._owner_source()
+        return self._owner
+
+    def is_managed_session(self, session_name: str) -> bool:
+        """Check whether a session name carries the orchestrator prefix.
+
+        Args:
+            session_name: Tmux session name
+
+        Returns:
+            True if the session is named like an orchestrator session
+        """
+        return session_name.startswith(self._session_prefix)
+
+    def is_tracked_session(self, session_name: str) -> bool:
+        """Check whether this service created a session and still tracks it.
+
+        Args:
+            session_name: Session name, with or without the prefix
+
+        Returns:
+            True if the session is tracked by this service
+        """
+        return self._normalize_session_name(session_name) in self._sessions
+
+    def normalize_session_name(self, session_name: str) -> str:
+        """Get the full tmux name of a session.
+
+        Args:
+            session_name: Session name, with or without the prefix
+
+        Returns:
+            Session name with the orchestrator prefix
+        """
+        return self._normalize_session_name(session_name)
+
+    def session_instance_id(self, session_name: str) -> str:
+        """Get the instance ID a session name was derived from.
+
+        Args:
+            session_name: Tmux session name
+
+        Returns:
+            Instance ID
+        """
+        return self._extract_instance_id(session_name)
+
     def _normalize_session_name(self, session_name: str) -> str:
         """Normalize session name with prefix.
 
@@ -524,6 +1156,7 @@ class TmuxService:
             }
         )
 
+    @traced("tmux.apply_layout_template")
     async def _apply_layout_template(
         self, session: libtmux.Session, template: LayoutTemplate
     ) -> None:
@@ -743,6 +1376,219 @@ class TmuxService:
             tmux_logger.debug(f"Error getting session info: {e}")
             return None
 
+    async def _create_session_batched(
+        self, control: TmuxControlClient, session_name: str, config: SessionConfig
+    ) -> SessionInfo:
+        """Create a session and apply its layout in one control-mode batch.
+
+        Args:
+            control: Connected control client
+            session_name: Normalized session name
+            config: Session configuration
+
+        Returns:
+            SessionInfo object with session details
+
+        Raises:
+            TmuxError: If the template is invalid or a tmux command fails
+        """
+        layout_template = self._layout_templates.get(
+            config.layout_template, self._layout_templates["default"]
+        )
+        compiled = self._compile_layout(layout_template)
+        if not compiled.is_valid:
+            raise TmuxError(f"Template validation failed: {compiled.error}")
+
+        commands = compiled.render(
+            session_name, config.working_directory, config.environment
+        )
+        if self.owner:
+            commands.insert(
+                1, ["set-option", "-t", f"={session_name}:", OWNER_OPTION, self.owner]
+            )
+
+        def build() -> None:
+            try:
+                control.batch(commands)
+            except TmuxControlError as e:
+                # Do not leave a half-built session behind
+                try:
+                    control.command("kill-session", "-t", f"={session_name}")
+                except TmuxControlError:
+                    pass
+                raise TmuxError(
+                    f"Failed to apply layout template {compiled.template.name}: {e}"
+                )
+            control.refresh()
+
+        await asyncio.to_thread(build)
+
+        log_layout_setup(session_name, compiled.template.name, list(compiled.windows))
+        state = control.get_session(session_name)
+        windows = state.windows if state else list(compiled.windows)
+        session_info = SessionInfo(
+            session_name=session_name,
+            instance_id=config.instance_id,
+            status=SessionStatus.ACTIVE,
+            working_directory=config.working_directory,
+            layout_template=config.layout_template,
+            created_at=asyncio.get_event_loop().time(),
+            windows=windows,
+            current_window=windows[0] if windows else None,
+            environment=config.environment,
+        )
+        self._sessions[session_name] = session_info
+        return session_info
+
+    def _compile_layout(self, template: LayoutTemplate) -> CompiledLayout:
+        """Compile a layout template into a command batch, once per template.
+
+        Validation runs as part of compilation, so its result is cached with
+        the batch. Unsafe pane commands are left out.
+
+        Args:
+            template: Layout template
+
+        Returns:
+            Compiled layout
+        """
+        compiled = self._compiled_layouts.get(template.name)
+        if compiled is not None and compiled.template is template:
+            return compiled
+
+        is_valid, error = self._validate_template(template)
+        windows: list[str] = []
+        commands: list[tuple[str, ...]] = []
+        create = ["new-session", "-d", "-s", _SESSION_NAME, "-c", _START_DIRECTORY]
+
+        for i, window_config in enumerate(template.windows if is_valid else []):
+            window_name = window_config.get("name", f"window-{i}")
+            window_command = window_config.get("command", template.default_pane_command)
+            windows.append(window_name)
+            if i == 0:
+                commands.append((*create, "-n", window_name))
+            else:
+                # Without -d the new window becomes current, so the pane
+                # commands below can target the session
+                commands.append(
+                    (
+                        "new-window",
+                        "-t",
+                        _SESSION_TARGET,
+                        "-c",
+                        _START_DIRECTORY,
+                        "-n",
+                        window_name,
+                    )
+                )
+
+            panes_config = window_config.get("panes", [{"command": window_command}])
+            for j, pane_config in enumerate(panes_config):
+                pane_command = pane_config.get("command", template.default_pane_command)
+                if j > 0:
+                    split = "-v"
+                    if pane_config.get("split", "vertical") == "horizontal":
+                        split = "-h"
+                    commands.append(
+                        (
+                            "split-window",
+                            split,
+                            "-t",
+                            _SESSION_TARGET,
+                            "-c",
+                            _START_DIRECTORY,
+                        )
+                    )
+                elif pane_command == "bash":
+                    # The first pane already runs the default shell
+                    continue
+                if pane_command and self._validate_pane_command(pane_command):
+                    commands.append(
+                        ("send-keys", "-t", _SESSION_TARGET, "-l", pane_command)
+                    )
+                    commands.append(("send-keys", "-t", _SESSION_TARGET, "Enter"))
+
+        if not commands:
+            commands.append(tuple(create))
+        elif len(windows) > 1:
+            # Leave the first window current, as creating detached windows would
+            commands.append(("select-window", "-t", _FIRST_WINDOW))
+
+        compiled = CompiledLayout(
+            template=template,
+            is_valid=is_valid,
+            error=error,
+            windows=tuple(windows),
+            commands=tuple(commands),
+        )
+        self._compiled_layouts[template.name] = compiled
+        return compiled
+
+    def _session_info_from_state(self, state: TmuxSessionState) -> SessionInfo:
+        """Get session info from the control client's model.
+
+        Args:
+            state: Session state from the control client
+
+        Returns:
+            SessionInfo object
+        """
+        if state.name in self._sessions:
+            session_info = self._sessions[state.name]
+            # Update dynamic info
+            session_info.windows = list(state.windows)
+            session_info.current_window = state.active_window
+            session_info.attached_clients = state.attached_clients
+            return session_info
+
+        return SessionInfo(
+            session_name=state.name,
+            instance_id=self._extract_instance_id(state.name),
+            status=(
+                SessionStatus.ACTIVE
+                if state.attached_clients
+                else SessionStatus.DETACHED
+            ),
+            working_directory=Path(state.path or "/"),
+            layout_template="unknown",
+            created_at=0.0,  # tmux reports wall-clock time, not loop time
+            windows=list(state.windows),
+            current_window=state.active_window,
+            attached_clients=state.attached_clients,
+        )
+
+    async def _live_model(self) -> TmuxControlClient | None:
+        """Get the control client to serve queries from, connecting it if needed.
+
+        Returns:
+            The connected control client, or None to fall back to libtmux
+        """
+        control = self._control
+        if control is None:
+            return None
+        if control.connected:
+            return control
+
+        now = time.monotonic()
+        if (
+            self._control_attempted_at is not None
+            and now - self._control_attempted_at < CONTROL_RETRY_SECONDS
+        ):
+            return None
+        self._control_attempted_at = now
+        return control if await asyncio.to_thread(control.start) else None
+
+    async def _sync_model(self) -> None:
+        """Make changes made through libtmux visible to model queries."""
+        control = self._control
+        if control is not None and control.connected:
+            await asyncio.to_thread(control.refresh)
+
+    def close(self) -> None:
+        """Close the control-mode connection, if any."""
+        if self._control is not None:
+            self._control.close()
+
     def _extract_instance_id(self, session_name: str) -> str:
         """Extract instance ID from session name.
 
@@ -765,15 +1611,18 @@ class TmuxService:
         """
         orphaned = []
         try:
-            all_sessions = self._server.sessions
-            for session in all_sessions:
+            control = await self._live_model()
+            if control is not None:
+                names = list(control.sessions())
+            else:
+                names = [session.name for session in self._server.sessions]
+            for name in names:
                 if (
-                    session.name
-                    and session.name.startswith(self._session_prefix)
-                    and session.name not in self._sessions
+                    name
+                    and name.startswith(self._session_prefix)
+                    and name not in self._sessions
                 ):
-                    if session.name:
-                        orphaned.append(session.name)
+                    orphaned.append(name)
         except Exception as e:
             tmux_logger.debug(f"Error detecting orphaned sessions: {e}")
 
@@ -788,108 +1637,11 @@ class TmuxService:
         Returns:
             True if command is safe, False otherwise
         """
-        if not command or not command.strip():
-            return False
-
-        # Check for potentially dangerous patterns
-        dangerous_patterns = [
-            ";",
-            "|",
-            "&",
-            "$",
-            "`",
-            "$(",
-            "&&",
-            "||",
-            "rm ",
-            "del ",
-            "format",
-            "mkfs",
-            "dd ",
-            "sudo",
-            "su ",
-            "chmod",
-            "chown",
-            "/etc/",
-            "shutdown",
-            "reboot",
-            "halt",
-            "init ",
-            ">/dev/",
-            "<",
-            ">",
-            ">>",
-            "curl",
-            "wget",
-            "ssh",
-            "scp",
-            "rsync",
-            "nc ",
-            "netcat",
-        ]
-
-        command_lower = command.lower()
-        for pattern in dangerous_patterns:
-            if pattern in command_lower:
-                tmux_logger.warning(
-                    f"Rejected potentially dangerous command pattern '{pattern}' in: {command}"
-                )
-                return False
-
-        # Allow common safe commands and their variations
-        safe_commands = [
-            "bash",
-            "sh",
-            "zsh",
-            "fish",
-            "cd ",
-            "ls",
-            "pwd",
-            "echo",
-            "cat",
-            "less",
-            "more",
-            "tail",
-            "head",
-            "grep",
-            "find",
-            "ps",
-            "top",
-            "htop",
-            "git",
-            "vim",
-            "nano",
-            "emacs",
-            "python",
-            "node",
-            "npm",
-            "yarn",
-            "make",
-            "cmake",
-            "gcc",
-            "clang",
-            "docker",
-            "kubectl",
-            "helm",
-            "claude",
-        ]
-
-        # Check if command starts with a safe command
-        for safe_cmd in safe_commands:
-            if command_lower.startswith(safe_cmd):
-                return True
-
-        # Allow test commands for testing purposes
-        test_commands = [
-            "failing-command",
-        ]
-
-        for test_cmd in test_commands:
-            if command_lower.startswith(test_cmd):
-                return True
-
-        # If no safe command match, be conservative and reject
-        tmux_logger.warning(f"Rejected unrecognized command: {command}")
+        reason = _pane_command_rejection(command)
+        if reason is None:
+            return True
+        if reason:
+            tmux_logger.warning(reason)
         return False
 
     def _validate_template(self, template: LayoutTemplate) -> tuple[bool, str]:
@@ -1019,13 +1771,74 @@ def get_tmux_service() -> TmuxService:
     """
     global _tmux_service
     if _tmux_service is None:
-        _tmux_service = TmuxService()
+        config = load_config()
+        control_client = None
+        if config.tmux_control_mode:
+            control_client = TmuxControlClient()
+            # Remove the control session even if cleanup is never called
+            atexit.register(control_client.close)
+        _tmux_service = TmuxService(
+            control_client=control_client,
+            cleanup_concurrency=config.tmux_cleanup_concurrency,
+            owner=lambda: get_database_manager().database_id,
+        )
     return _tmux_service
 
 
+async def start_output_capture(
+    config: OrchestratorConfig | None = None,
+    listener: OutputListener | None = None,
+) -> PaneOutputCapture | None:
+    """Capture the pane output of orchestrator sessions in this process.
+
+    Only long-lived hosts (the web app and the daemon) call this: captured
+    output is read by this process's event loop, so a process that exits
+    right away would leave panes piping into FIFOs nobody reads. Sessions
+    that already exist are captured too. Call ``stop_output_capture`` on
+    shutdown.
+
+    Args:
+        config: Configuration providing capture settings
+        listener: Output callback, registered before any pane is captured
+
+    Returns:
+        The capture, or None if capture is disabled
+    """
+    if config is None:
+        config = load_config()
+    if not config.tmux_capture_enabled:
+        return None
+
+    service = get_tmux_service()
+    capture = service.output_capture
+    if capture is None:
+        capture = PaneOutputCapture(
+            directory=config.tmux_capture_dir,
+            rate_bytes=config.tmux_capture_rate,
+            burst_bytes=config.tmux_capture_burst,
+            max_line_bytes=config.tmux_capture_max_line,
+        )
+        # Remove the FIFO directory even if shutdown never runs
+        atexit.register(capture.close)
+        service.set_output_capture(capture)
+    if listener is not None:
+        capture.add_listener(listener)
+    await service.capture_sessions()
+    return capture
+
+
+async def stop_output_capture() -> None:
+    """Close the pane pipes started by ``start_output_capture``."""
+    if _tmux_service is not None:
+        await _tmux_service.release_output_capture()
+
+
 async def cleanup_tmux_service() -> None:
     """Clean up the global tmux service."""
     global _tmux_service
     if _tmux_service is not None:
         await _tmux_service.cleanup_sessions(force=True)
+        _tmux_service.close()
+        if _tmux_service.output_capture is not None:
+            _tmux_service.output_capture.close()
         _tmux_service = None
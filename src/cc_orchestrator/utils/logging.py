@@ -7,13 +7,18 @@ This module provides:
 - Error handling decorators
 - Context-aware logging utilities
 - Performance and audit logging
+- An asynchronous, queue-backed handler pipeline
 """
 
+import atexit
 import functools
 import json
 import logging
 import logging.config
+import logging.handlers
+import queue
 import sys
+import threading
 import time
 import traceback
 from collections.abc import Callable
@@ -22,6 +27,13 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from .metrics import get_metrics_registry
+
+try:
+    import orjson
+except ImportError:  # Optional accelerated JSON backend
+    orjson = None
+
 
 class LogLevel(str, Enum):
     """Log level enumeration for type safety."""
@@ -101,12 +113,157 @@ class TmuxError(CCOrchestratorException):
     pass
 
 
+# LogRecord attributes (and our own context fields) never emitted as extras
+_RECORD_ATTRIBUTES = frozenset(
+    logging.LogRecord("", 0, "", 0, "", None, None).__dict__
+) | {
+    "message",
+    "asctime",
+    "taskName",
+    "getMessage",
+    "context",
+    "instance_id",
+    "task_id",
+}
+
+# Context fields emitted right after the standard ones, in this order
+_CONTEXT_FIELDS = ("context", "instance_id", "task_id")
+
+# Distinct record attribute layouts remembered by a formatter
+_MAX_FIELD_PLANS = 512
+
+_encode_string = json.encoder.encode_basestring_ascii
+
+
+def _dumps(value: Any) -> str:
+    """Encode any value as JSON, falling back to ``str`` for unknown types."""
+    return json.dumps(value, default=str)
+
+
+def _encode_value(value: Any) -> str:
+    """Encode a field value as JSON, with fast paths for common types."""
+    kind = type(value)
+    if kind is str:
+        return _encode_string(value)
+    if kind is int:
+        return int.__repr__(value)
+    if kind is float and value - value == 0.0:
+        # Finite floats; json.dumps spells NaN and infinities specially
+        return float.__repr__(value)
+    if value is None:
+        return "null"
+    if kind is bool:
+        return "true" if value else "false"
+    return _dumps(value)
+
+
 class StructuredFormatter(logging.Formatter):
-    """Custom formatter for structured JSON logging."""
+    """Custom formatter for structured JSON logging.
+
+    Records are encoded by appending pre-encoded keys and values rather than
+    building a dict for ``json.dumps``; with ``orjson`` installed the dict is
+    handed to it instead. The encoded line is cached on the record, so
+    several handlers sharing the format encode each record once.
+    """
+
+    def __init__(self, backend: str | None = None) -> None:
+        """Initialize the formatter.
+
+        Args:
+            backend: ``"orjson"`` or ``"json"`` (defaults to ``orjson`` when
+                it is installed)
+        """
+        super().__init__()
+        if backend is None:
+            backend = "orjson" if orjson is not None else "json"
+        if backend == "orjson" and orjson is None:
+            raise ValueError("orjson is not installed")
+        self.backend = backend
+        # (epoch second, ISO-8601 prefix) of the last formatted second
+        self._second: tuple[int, str] = (-1, "")
+        self._plans: dict[tuple[str, ...], tuple[tuple[str, str], ...]] = {}
 
     def format(self, record: logging.LogRecord) -> str:
+        fields = record.__dict__
+        cached = fields.get("_structured_json")
+        if cached is not None:
+            return cached
+
+        if self.backend == "orjson":
+            line = self._encode_orjson(record)
+        else:
+            line = self._encode(record)
+        record._structured_json = line
+        return line
+
+    def _timestamp(self, created: float) -> str:
+        """Format an epoch time as ISO-8601 UTC, reusing the seconds prefix."""
+        second, micro = divmod(round(created * 1_000_000), 1_000_000)
+        cached = self._second
+        if cached[0] != second:
+            cached = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+            self._second = cached
+        return f"{cached[1]}.{micro:06d}"
+
+    def _encode(self, record: logging.LogRecord) -> str:
+        """Encode a record by appending JSON fragments."""
+        fields = record.__dict__
+        parts = [
+            '{"timestamp": "',
+            self._timestamp(record.created),
+            '", "level": ',
+            _encode_string(record.levelname),
+            ', "logger": ',
+            _encode_value(record.name),
+            ', "message": ',
+            _encode_value(record.getMessage()),
+            ', "module": ',
+            _encode_value(record.module),
+            ', "function": ',
+            _encode_value(record.funcName),
+            ', "line": ',
+            _encode_value(record.lineno),
+        ]
+
+        for key, prefix in self._field_plan(fields):
+            parts += (prefix, _encode_value(fields[key]))
+
+        exception = self._exception(record)
+        if exception is not None:
+            parts += (', "exception": ', _dumps(exception))
+
+        parts.append("}")
+        return "".join(parts)
+
+    def _field_plan(self, fields: dict[str, Any]) -> tuple[tuple[str, str], ...]:
+        """Get the context and extra fields to emit for a record's attributes.
+
+        Records from the same call site share the same attribute names, so
+        the plan is compiled once per set of names (in attribute order).
+
+        Returns:
+            ``(attribute, encoded key prefix)`` pairs in output order
+        """
+        shape = tuple(fields)
+        plan = self._plans.get(shape)
+        if plan is None:
+            keys = [key for key in _CONTEXT_FIELDS if key in fields]
+            keys += [
+                key
+                for key in shape
+                if key not in _RECORD_ATTRIBUTES and not key.startswith("_")
+            ]
+            plan = tuple((key, f", {_encode_string(key)}: ") for key in keys)
+            if len(self._plans) >= _MAX_FIELD_PLANS:
+                self._plans.clear()
+            self._plans[shape] = plan
+        return plan
+
+    def _encode_orjson(self, record: logging.LogRecord) -> str:
+        """Encode a record through orjson."""
+        fields = record.__dict__
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -114,68 +271,29 @@ class StructuredFormatter(logging.Formatter):
             "function": record.funcName,
             "line": record.lineno,
         }
-
-        # Add context if available
-        if hasattr(record, "context"):
-            log_data["context"] = record.context
-
-        # Add instance_id if available
-        if hasattr(record, "instance_id"):
-            log_data["instance_id"] = record.instance_id
-
-        # Add task_id if available
-        if hasattr(record, "task_id"):
-            log_data["task_id"] = record.task_id
-
-        # Add all other extra fields from the record
-        # Exclude standard LogRecord attributes and our own fields
-        standard_fields = {
-            "name",
-            "msg",
-            "args",
-            "levelname",
-            "levelno",
-            "pathname",
-            "filename",
-            "module",
-            "exc_info",
-            "exc_text",
-            "stack_info",
-            "lineno",
-            "funcName",
-            "created",
-            "msecs",
-            "relativeCreated",
-            "thread",
-            "threadName",
-            "processName",
-            "process",
-            "getMessage",
-            "context",
-            "instance_id",
-            "task_id",
+        for key, _ in self._field_plan(fields):
+            log_data[key] = fields[key]
+
+        exception = self._exception(record)
+        if exception is not None:
+            log_data["exception"] = exception
+
+        return orjson.dumps(
+            log_data, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+    @staticmethod
+    def _exception(record: logging.LogRecord) -> dict[str, Any] | None:
+        """Describe the record's exception, if it carries a valid one."""
+        if not record.exc_info or record.exc_info[0] is None:
+            return None
+        exc_type, exc_value, exc_traceback = record.exc_info
+        return {
+            "type": exc_type.__name__,
+            "message": str(exc_value) if exc_value is not None else "",
+            "traceback": traceback.format_exception(exc_type, exc_value, exc_traceback),
         }
 
-        for key, value in record.__dict__.items():
-            if key not in standard_fields and not key.startswith("_"):
-                log_data[key] = value
-
-        # Add exception info if present and valid
-        if record.exc_info and record.exc_info[0] is not None:
-            exc_type = record.exc_info[0]
-            exc_value = record.exc_info[1]
-            exc_traceback = record.exc_info[2]
-
-            log_data["exception"] = {
-                "type": exc_type.__name__,
-                "message": str(exc_value) if exc_value is not None else "",
-                "traceback": traceback.format_exception(
-                    exc_type, exc_value, exc_traceback
-                ),
-            }
-
-        return json.dumps(log_data)
-
 
 class ContextualLogger:
     """Logger with context management for structured logging."""
@@ -198,6 +316,10 @@ class ContextualLogger:
         self, level: int, message: str, extra_context: dict[str, Any] | None = None
     ) -> None:
         """Internal logging method with context injection."""
+        # Skip building the extra dict when nothing would be emitted
+        if not self.logger.isEnabledFor(level):
+            return
+
         extra = {
             "context": self.context,
         }
@@ -241,6 +363,8 @@ class ContextualLogger:
     ) -> None:
         """Log error message with context and optional exception."""
         if exception:
+            if not self.logger.isEnabledFor(logging.ERROR):
+                return
             self.logger.error(
                 message,
                 exc_info=exception,
@@ -259,6 +383,8 @@ class ContextualLogger:
     ) -> None:
         """Log critical message with context and optional exception."""
         if exception:
+            if not self.logger.isEnabledFor(logging.CRITICAL):
+                return
             self.logger.critical(
                 message,
                 exc_info=exception,
@@ -278,11 +404,234 @@ def get_logger(name: str, context: LogContext) -> ContextualLogger:
     return ContextualLogger(name, context)
 
 
+# Records buffered between the logging call sites and the writer thread
+DEFAULT_LOG_QUEUE_SIZE = 10000
+
+# Records written per batch by the writer thread
+LOG_BATCH_SIZE = 256
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records instead of blocking when full.
+
+    Only the message is rendered on the calling thread; formatting and I/O
+    happen on the ``BatchingQueueListener`` thread.
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self._dropped = 0
+        self._lock = threading.Lock()
+
+    @property
+    def dropped(self) -> int:
+        """Number of records dropped because the queue was full."""
+        return self._dropped
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge the message arguments so the record no longer references them."""
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue a record, counting it as dropped if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that writes whatever is queued in one batch.
+
+    Stream handlers (including rotating file handlers) receive the batch as
+    a single write and flush; other handlers handle records one by one.
+    Records dropped by the queue handler are reported with a warning.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        *handlers: logging.Handler,
+        queue_handler: BoundedQueueHandler | None = None,
+        batch_size: int = LOG_BATCH_SIZE,
+    ) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.queue_handler = queue_handler
+        self.batch_size = batch_size
+        self._reported_drops = 0
+
+    def enqueue_sentinel(self) -> None:
+        """Queue the stop sentinel, waiting for room rather than failing."""
+        self.queue.put(self._sentinel)
+
+    def _monitor(self) -> None:
+        """Dequeue records in batches until the sentinel arrives."""
+        log_queue = self.queue
+        stopping = False
+        while not stopping:
+            batch = []
+            record = self.dequeue(True)
+            while True:
+                if record is self._sentinel:
+                    stopping = True
+                else:
+                    batch.append(record)
+                log_queue.task_done()
+                if stopping or len(batch) >= self.batch_size:
+                    break
+                try:
+                    record = self.dequeue(False)
+                except queue.Empty:
+                    break
+            self._report_drops(batch)
+            if batch:
+                self.handle_batch(batch)
+
+    def _report_drops(self, batch: list[logging.LogRecord]) -> None:
+        """Append a warning about records dropped since the last batch."""
+        if self.queue_handler is None:
+            return
+        dropped = self.queue_handler.dropped
+        if dropped > self._reported_drops:
+            batch.append(
+                logging.LogRecord(
+                    __name__,
+                    logging.WARNING,
+                    __file__,
+                    0,
+                    f"Log queue full, dropped {dropped - self._reported_drops} records",
+                    None,
+                    None,
+                )
+            )
+            self._reported_drops = dropped
+
+    def handle_batch(self, records: list[logging.LogRecord]) -> None:
+        """Pass a batch of records to every handler."""
+        for handler in self.handlers:
+            if isinstance(handler, logging.StreamHandler):
+                _write_batch(handler, records)
+            else:
+                for record in records:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+
+
+def _write_batch(
+    handler: logging.StreamHandler, records: list[logging.LogRecord]
+) -> None:
+    """Format records and write them to a stream handler in one write."""
+    rotating = isinstance(handler, logging.handlers.BaseRotatingHandler)
+    lines: list[str] = []
+    pending = 0
+    handler.acquire()
+    try:
+        for record in records:
+            if record.levelno < handler.level or not handler.filter(record):
+                continue
+            try:
+                line = handler.format(record) + handler.terminator
+                if rotating and _should_rollover(handler, record, pending + len(line)):
+                    _flush_lines(handler, lines)
+                    pending = 0
+                    handler.doRollover()
+                lines.append(line)
+                pending += len(line)
+            except Exception:
+                handler.handleError(record)
+        _flush_lines(handler, lines)
+    finally:
+        handler.release()
+
+
+def _should_rollover(
+    handler: logging.StreamHandler, record: logging.LogRecord, pending: int
+) -> bool:
+    """Check for rollover, counting lines buffered but not yet written."""
+    if not isinstance(handler, logging.handlers.RotatingFileHandler):
+        return bool(handler.shouldRollover(record))
+    if handler.maxBytes <= 0:
+        return False
+    if handler.stream is None:
+        handler.stream = handler._open()
+    handler.stream.seek(0, 2)
+    return handler.stream.tell() + pending >= handler.maxBytes
+
+
+def _flush_lines(handler: logging.StreamHandler, lines: list[str]) -> None:
+    """Write buffered lines to a handler's stream and clear the buffer."""
+    if not lines:
+        return
+    if handler.stream is None:
+        # File handlers with delay=True open the stream on first use
+        handler.stream = handler._open()
+    try:
+        handler.stream.write("".join(lines))
+        handler.flush()
+    except Exception:
+        handler.handleError(logging.makeLogRecord({"msg": "batched log write"}))
+    lines.clear()
+
+
+# Writer thread of the asynchronous pipeline, if one is running
+_log_listener: BatchingQueueListener | None = None
+_log_queue_handler: BoundedQueueHandler | None = None
+_shutdown_registered = False
+
+
+def shutdown_logging() -> None:
+    """Stop the asynchronous pipeline, writing out everything queued."""
+    global _log_listener, _log_queue_handler
+    listener, _log_listener = _log_listener, None
+    queue_handler, _log_queue_handler = _log_queue_handler, None
+    if queue_handler is not None:
+        logging.getLogger().removeHandler(queue_handler)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+def get_logging_stats() -> dict[str, int]:
+    """Get queue statistics of the asynchronous pipeline.
+
+    Returns:
+        Queued and dropped record counts (zero when logging is synchronous)
+    """
+    handler = _log_queue_handler
+    if handler is None:
+        return {"queued": 0, "dropped": 0}
+    return {"queued": handler.queue.qsize(), "dropped": handler.dropped}
+
+
+def _file_handler(
+    log_file: Path, max_bytes: int, backup_count: int, rotate_when: str | None
+) -> logging.FileHandler:
+    """Create a file handler, rotating by size or time if requested."""
+    if max_bytes > 0:
+        return logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=max_bytes, backupCount=backup_count
+        )
+    if rotate_when:
+        return logging.handlers.TimedRotatingFileHandler(
+            log_file, when=rotate_when, backupCount=backup_count
+        )
+    return logging.FileHandler(log_file)
+
+
 def setup_logging(
     log_level: str | LogLevel = LogLevel.INFO,
     log_file: Path | None = None,
     enable_structured: bool = True,
     enable_console: bool = True,
+    asynchronous: bool = False,
+    queue_size: int = DEFAULT_LOG_QUEUE_SIZE,
+    max_bytes: int = 0,
+    backup_count: int = 5,
+    rotate_when: str | None = None,
 ) -> None:
     """
     Setup comprehensive logging configuration.
@@ -292,10 +641,22 @@ def setup_logging(
         log_file: Optional file path for log output
         enable_structured: Use JSON structured logging format
         enable_console: Enable console output
+        asynchronous: Hand records to a bounded queue drained by a writer
+            thread, so formatting and I/O stay off the calling thread
+        queue_size: Records buffered before new ones are dropped
+        max_bytes: Rotate the log file when it reaches this size (0: never)
+        backup_count: Rotated log files to keep
+        rotate_when: Rotate the log file on this interval instead (as for
+            ``TimedRotatingFileHandler``, e.g. ``"midnight"``)
     """
+    global _log_listener, _log_queue_handler, _shutdown_registered
+
     if isinstance(log_level, LogLevel):
         log_level = log_level.value
 
+    # Stop a previously configured pipeline before replacing it
+    shutdown_logging()
+
     # Create logs directory if using file logging
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
@@ -317,7 +678,7 @@ def setup_logging(
 
     # File handler
     if log_file:
-        file_handler = logging.FileHandler(log_file)
+        file_handler = _file_handler(log_file, max_bytes, backup_count, rotate_when)
         if enable_structured:
             file_handler.setFormatter(StructuredFormatter())
         else:
@@ -337,8 +698,20 @@ def setup_logging(
 
     # Set level and add our handlers
     root_logger.setLevel(getattr(logging, log_level.upper()))
-    for handler in handlers:
-        root_logger.addHandler(handler)
+    if asynchronous and handlers:
+        log_queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        _log_queue_handler = BoundedQueueHandler(log_queue)
+        _log_listener = BatchingQueueListener(
+            log_queue, *handlers, queue_handler=_log_queue_handler
+        )
+        _log_listener.start()
+        root_logger.addHandler(_log_queue_handler)
+        if not _shutdown_registered:
+            atexit.register(shutdown_logging)
+            _shutdown_registered = True
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
 
     # Suppress noisy third-party loggers
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -426,48 +799,55 @@ def handle_errors(
     return decorator
 
 
+_FUNCTION_DURATION = get_metrics_registry().histogram(
+    "cc_orchestrator_function_duration_seconds",
+    "Execution time of functions decorated with log_performance",
+    ("function", "status"),
+)
+
+
 def log_performance(
     log_context: LogContext = LogContext.ORCHESTRATOR,
+    name: str | None = None,
 ) -> Callable[..., Any]:
-    """Decorator to log function performance metrics."""
+    """Decorator recording function execution time as a metric.
+
+    Durations go into the ``cc_orchestrator_function_duration_seconds``
+    histogram, labeled by function and outcome. Only failures are logged.
+
+    Args:
+        log_context: Context of the logger reporting failures
+        name: Function label (defaults to the qualified function name)
+    """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        label = name or f"{func.__module__}.{func.__qualname__}"
+        succeeded = _FUNCTION_DURATION.labels(label, "success")
+        failed = _FUNCTION_DURATION.labels(label, "error")
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            logger = get_logger(func.__module__, log_context)
-
-            start_time = time.time()
-            logger.debug(
-                f"Performance tracking started for {func.__name__}",
-                function=func.__name__,
-            )
-
+            start = time.perf_counter_ns()
             try:
                 result = func(*args, **kwargs)
-                execution_time = time.time() - start_time
-
-                logger.info(
-                    f"Performance: {func.__name__} completed",
-                    function=func.__name__,
-                    execution_time=execution_time,
-                    status="success",
-                )
-
-                return result
-
             except Exception as e:
-                execution_time = time.time() - start_time
+                elapsed = time.perf_counter_ns() - start
+                failed.observe_ns(elapsed)
 
+                logger = get_logger(func.__module__, log_context)
                 logger.warning(
                     f"Performance: {func.__name__} failed",
                     function=func.__name__,
-                    execution_time=execution_time,
+                    execution_time=elapsed / 1e9,
                     status="error",
                     error=str(e),
                 )
 
                 raise
 
+            succeeded.observe_ns(time.perf_counter_ns() - start)
+            return result
+
         return wrapper
 
     return decorator
@@ -0,0 +1,358 @@
+"""
+In-process metrics registry.
+
+Counters, gauges and fixed-bucket histograms kept in memory and rendered in
+the Prometheus text exposition format. Recording is meant for hot paths:
+callers resolve a labeled child once (typically when a decorator is applied)
+and each observation is then a couple of integer updates with no lock and
+no allocation beyond the values themselves. Updates are plain in-place
+additions, which the GIL does not interleave because no call happens between
+the read and the write.
+
+Histograms store durations as integer nanoseconds so timing code can feed
+``time.perf_counter_ns()`` differences straight in.
+"""
+
+import math
+import re
+import threading
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+# Content type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds of the default latency histogram buckets in seconds
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_NAME_RE = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+_LABEL_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value the way Prometheus parses it."""
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label(value)}"'
+        for name, value in zip(names, values, strict=True)
+    )
+    return "{" + pairs + "}"
+
+
+class CounterValue:
+    """One labeled series of a counter."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def inc(self, amount: int | float = 1) -> None:
+        """Increase the counter.
+
+        Args:
+            amount: Non-negative increment
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        self.value += amount
+
+
+class GaugeValue:
+    """One labeled series of a gauge."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value: int | float = 0
+
+    def set(self, value: int | float) -> None:
+        """Set the gauge to a value."""
+        self.value = value
+
+    def inc(self, amount: int | float = 1) -> None:
+        """Increase the gauge."""
+        self.value += amount
+
+    def dec(self, amount: int | float = 1) -> None:
+        """Decrease the gauge."""
+        self.value -= amount
+
+
+class HistogramValue:
+    """One labeled series of a histogram."""
+
+    __slots__ = ("_bounds_ns", "counts", "sum_ns")
+
+    def __init__(self, bounds_ns: tuple[int, ...]) -> None:
+        self._bounds_ns = bounds_ns
+        # One extra slot counts observations above the last bucket
+        self.counts = [0] * (len(bounds_ns) + 1)
+        self.sum_ns = 0
+
+    def observe_ns(self, duration_ns: int) -> None:
+        """Record one duration in nanoseconds."""
+        self.counts[bisect_left(self._bounds_ns, duration_ns)] += 1
+        self.sum_ns += duration_ns
+
+    def observe(self, seconds: float) -> None:
+        """Record one duration in seconds."""
+        self.observe_ns(int(seconds * 1_000_000_000))
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return sum(self.counts)
+
+    @property
+    def sum(self) -> float:
+        """Sum of the observations in seconds."""
+        return self.sum_ns / 1_000_000_000
+
+
+class Metric:
+    """A named metric family with a fixed set of label names."""
+
+    type_name = ""
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        """Initialize the metric.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Names of the labels distinguishing its series
+        """
+        if not _NAME_RE.match(name):
+            raise ValueError(f"Invalid metric name: {name!r}")
+        for label in labelnames:
+            if not _LABEL_RE.match(label) or label.startswith("__"):
+                raise ValueError(f"Invalid label name: {label!r}")
+
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: Any) -> Any:
+        """Get the series for a set of label values, creating it if needed.
+
+        Resolve the series once and keep it; the lookup is the only part of
+        recording that hashes and may allocate.
+
+        Args:
+            *values: Label values in the order of the label names
+
+        Returns:
+            The series object
+        """
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} expects labels {self.labelnames}, got {values}"
+                )
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+    def _series(self) -> list[tuple[tuple[str, ...], Any]]:
+        with self._lock:
+            return sorted(self._children.items())
+
+    def render(self) -> Iterator[str]:
+        """Yield the exposition lines for the family."""
+        yield f"# HELP {self.name} {_escape_help(self.documentation)}"
+        yield f"# TYPE {self.name} {self.type_name}"
+        for values, child in self._series():
+            labels = _format_labels(self.labelnames, values)
+            yield f"{self.name}{labels} {_format_value(child.value)}"
+
+
+class Counter(Metric):
+    """Monotonically increasing count."""
+
+    type_name = "counter"
+
+    def _new_child(self) -> CounterValue:
+        return CounterValue()
+
+    def inc(self, amount: int | float = 1) -> None:
+        """Increase an unlabeled counter."""
+        self.labels().inc(amount)
+
+
+class Gauge(Metric):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def _new_child(self) -> GaugeValue:
+        return GaugeValue()
+
+    def set(self, value: int | float) -> None:
+        """Set an unlabeled gauge."""
+        self.labels().set(value)
+
+
+class Histogram(Metric):
+    """Fixed-bucket distribution of durations."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize the histogram.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Names of the labels distinguishing its series
+            buckets: Increasing bucket upper bounds in seconds
+        """
+        if "le" in labelnames:
+            raise ValueError("Histograms reserve the 'le' label")
+        if not buckets or list(buckets) != sorted(set(buckets)):
+            raise ValueError("Histogram buckets must be increasing")
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(float(bound) for bound in buckets)
+        self._bounds_ns = tuple(int(bound * 1_000_000_000) for bound in buckets)
+
+    def _new_child(self) -> HistogramValue:
+        return HistogramValue(self._bounds_ns)
+
+    def observe(self, seconds: float) -> None:
+        """Record a duration in an unlabeled histogram."""
+        self.labels().observe(seconds)
+
+    def render(self) -> Iterator[str]:
+        """Yield the exposition lines for the family."""
+        yield f"# HELP {self.name} {_escape_help(self.documentation)}"
+        yield f"# TYPE {self.name} {self.type_name}"
+        labelnames = (*self.labelnames, "le")
+        bounds = [_format_value(bound) for bound in self.buckets] + ["+Inf"]
+        for values, child in self._series():
+            counts = child.counts[:]
+            sum_ns = child.sum_ns
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, counts, strict=True):
+                cumulative += bucket_count
+                labels = _format_labels(labelnames, (*values, bound))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, values)
+            yield f"{self.name}_sum{labels} {_format_value(sum_ns / 1e9)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric_type: type[Metric], name: str, *args: Any) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_type(name, *args)
+        if type(metric) is not metric_type or metric.labelnames != tuple(args[1]):
+            raise ValueError(f"Metric {name} is already registered differently")
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        """Get or create a gauge."""
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._register(Histogram, name, documentation, labelnames, buckets)
+
+    def get(self, name: str) -> Metric | None:
+        """Look up a registered metric by name."""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format."""
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+        lines = []
+        for _, metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+# Global registry instance
+_metrics_registry: MetricsRegistry | None = None
+_metrics_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the global metrics registry."""
+    global _metrics_registry
+    if _metrics_registry is None:
+        with _metrics_registry_lock:
+            if _metrics_registry is None:
+                _metrics_registry = MetricsRegistry()
+    return _metrics_registry
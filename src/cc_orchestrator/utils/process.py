@@ -11,6 +11,7 @@ from typing import Any
 import psutil
 
 from .logging import LogContext, get_logger
+from .tracing import start_span, traced
 
 logger = get_logger(__name__, LogContext.PROCESS)
 
@@ -53,6 +54,7 @@ class ProcessManager:
         self._shutdown_event = asyncio.Event()
         logger.info("Process manager initialized")
 
+    @traced("process.spawn")
     async def spawn_claude_process(
         self,
         instance_id: str,
@@ -141,6 +143,7 @@ class ProcessManager:
             )
             raise ProcessError(f"Failed to spawn process for {instance_id}: {e}")
 
+    @traced("process.terminate")
     async def terminate_process(self, instance_id: str, timeout: float = 30.0) -> bool:
         """Terminate a Claude Code process gracefully.
 
@@ -419,12 +422,13 @@ class ProcessManager:
             pid: Process ID
         """
         try:
-            process = psutil.Process(pid)
-            process_info = self._processes[instance_id]
+            with start_span("process.sample_resources", instance_id=instance_id):
+                process = psutil.Process(pid)
+                process_info = self._processes[instance_id]
 
-            # Get CPU and memory usage
-            process_info.cpu_percent = process.cpu_percent()
-            process_info.memory_mb = process.memory_info().rss / 1024 / 1024
+                # Get CPU and memory usage
+                process_info.cpu_percent = process.cpu_percent()
+                process_info.memory_mb = process.memory_info().rss / 1024 / 1024
 
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             # Process no longer accessible
@@ -0,0 +1,247 @@
+"""
+Profiling helpers.
+
+- ``StackSampler`` is a statistical profiler. A background thread reads the
+  stack of every other thread from ``sys._current_frames()`` at a fixed
+  interval and counts identical stacks. The result renders as collapsed
+  stacks, the input format of ``flamegraph.pl``, speedscope and similar
+  flame graph tools. Sampling does not slow the profiled code beyond the GIL
+  time the sampler itself takes.
+- ``CommandProfiler`` runs a block under ``cProfile`` and ``tracemalloc`` and
+  writes a text report plus the raw ``.prof`` data.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from types import CodeType
+from typing import Any
+
+# Default seconds between stack samples
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+# Longest profile the web endpoint will run
+MAX_PROFILE_SECONDS = 60.0
+
+# Innermost Python frames of threads that are blocked waiting for work
+_IDLE_FRAMES = frozenset(
+    {
+        ("selectors.py", "select"),
+        ("threading.py", "wait"),
+        ("thread.py", "_worker"),
+        ("queue.py", "get"),
+    }
+)
+
+
+def _short_path(filename: str) -> str:
+    """Shorten a source path to the part that identifies the module."""
+    marker = "site-packages" + os.sep
+    index = filename.rfind(marker)
+    if index != -1:
+        return filename[index + len(marker) :]
+    marker = os.sep + "cc_orchestrator" + os.sep
+    index = filename.rfind(marker)
+    if index != -1:
+        return filename[index + 1 :]
+    return filename
+
+
+class StackSampler:
+    """Samples the stacks of all other threads from a background thread."""
+
+    def __init__(
+        self, interval: float = DEFAULT_SAMPLE_INTERVAL, include_idle: bool = False
+    ) -> None:
+        """Initialize the sampler.
+
+        Args:
+            interval: Seconds between samples
+            include_idle: Keep samples of threads blocked waiting for work
+        """
+        self.interval = interval
+        self.include_idle = include_idle
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self.duration = 0.0
+        self._labels: dict[CodeType, str] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def run(self, seconds: float) -> Counter[str]:
+        """Sample for a fixed time.
+
+        Args:
+            seconds: How long to sample
+
+        Returns:
+            Sample counts keyed by collapsed stack
+        """
+        self.start()
+        self._stop.wait(seconds)
+        self.stop()
+        return self.stacks
+
+    def _run(self) -> None:
+        started = time.perf_counter()
+        while not self._stop.is_set():
+            self.sample()
+            self._stop.wait(self.interval)
+        self.duration += time.perf_counter() - started
+
+    def sample(self) -> None:
+        """Take one sample of every other thread's stack."""
+        own = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            code = frame.f_code
+            if not self.include_idle and (
+                (os.path.basename(code.co_filename), code.co_name) in _IDLE_FRAMES
+            ):
+                continue
+
+            labels = []
+            current: Any = frame
+            while current is not None:
+                labels.append(self._label(current.f_code))
+                current = current.f_back
+            labels.append(names.get(ident, f"thread-{ident}"))
+            labels.reverse()
+            self.stacks[";".join(labels)] += 1
+        self.samples += 1
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            path = _short_path(code.co_filename)
+            label = f"{code.co_qualname} ({path}:{code.co_firstlineno})"
+            # Collapsed stacks use ';' between frames and ' ' before the count
+            label = label.replace(";", ":").replace(" ", "_")
+            self._labels[code] = label
+        return label
+
+    def collapsed(self) -> str:
+        """Render the samples as collapsed stacks, most frequent first."""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.stacks.most_common()
+        )
+
+    def to_dict(self, limit: int = 100) -> dict[str, Any]:
+        """Summarize the samples with the most frequent stacks and functions.
+
+        Args:
+            limit: Maximum stacks and functions listed
+        """
+        leaves: Counter[str] = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return {
+            "samples": self.samples,
+            "duration_seconds": round(self.duration, 3),
+            "interval_seconds": self.interval,
+            "stacks": [
+                {"stack": stack.split(";"), "count": count}
+                for stack, count in self.stacks.most_common(limit)
+            ],
+            "top_functions": [
+                {"function": function, "count": count}
+                for function, count in leaves.most_common(limit)
+            ],
+        }
+
+
+class CommandProfiler:
+    """Profiles CPU time and memory allocations between start and stop."""
+
+    def __init__(
+        self,
+        report_path: str | Path,
+        title: str = "",
+        top: int = 40,
+        trace_frames: int = 1,
+    ) -> None:
+        """Initialize the profiler.
+
+        Args:
+            report_path: Text report destination; the raw profile is written
+                next to it with a ``.prof`` suffix
+            title: Heading of the report, e.g. the profiled command line
+            top: Functions and allocation sites listed in the report
+            trace_frames: Frames kept per allocation traceback
+        """
+        self.report_path = Path(report_path).expanduser()
+        self.title = title
+        self.top = top
+        self.trace_frames = trace_frames
+        self._profile = cProfile.Profile()
+        self._started_tracemalloc = False
+        self._started = 0.0
+
+    def start(self) -> None:
+        """Start profiling."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.trace_frames)
+            self._started_tracemalloc = True
+        self._started = time.perf_counter()
+        self._profile.enable()
+
+    def stop(self) -> Path:
+        """Stop profiling and write the report.
+
+        Returns:
+            Path of the text report
+        """
+        self._profile.disable()
+        elapsed = time.perf_counter() - self._started
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+
+        self.report_path.parent.mkdir(parents=True, exist_ok=True)
+        self._profile.dump_stats(str(self.report_path.with_suffix(".prof")))
+
+        stats_output = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=stats_output)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+
+        lines = [
+            f"Profile: {self.title}" if self.title else "Profile",
+            f"Wall time: {elapsed:.3f}s",
+            f"Traced memory: {current / 1024:.1f} KiB current, "
+            f"{peak / 1024:.1f} KiB peak",
+            "",
+            f"== CPU (top {self.top} by cumulative time) ==",
+            stats_output.getvalue().strip(),
+            "",
+            f"== Allocations (top {self.top} sites still allocated) ==",
+        ]
+        for statistic in snapshot.statistics("lineno")[: self.top]:
+            lines.append(str(statistic))
+
+        self.report_path.write_text("\n".join(lines) + "\n")
+        return self.report_path
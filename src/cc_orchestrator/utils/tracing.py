@@ -0,0 +1,557 @@
+"""
+Lightweight request tracing.
+
+Spans are opened with ``start_span`` (or the ``traced`` decorator) and
+propagate through ``contextvars``, so a span opened by the web middleware is
+the parent of spans opened in the handler, in ``asyncio.to_thread`` workers
+and in tasks created while it is current. The spans of one root operation
+form a trace; when the root span ends the trace is handed to the exporters:
+
+- ``InMemoryTraceExporter`` keeps the most recent traces in a ring buffer,
+  queryable at ``/debug/traces``.
+- ``OTLPJsonFileExporter`` appends each trace as one line of OTLP/JSON
+  (``ExportTraceServiceRequest``), which OpenTelemetry collectors can ingest.
+
+The sampling decision is made once per root span. Spans below an unsampled
+root cost a context variable lookup and nothing else. A span opened after its
+root has ended, e.g. by a background task started during a request, begins a
+new trace instead.
+"""
+
+import functools
+import inspect
+import json
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+
+from .logging import LogContext, get_logger
+
+logger = get_logger(__name__, LogContext.ORCHESTRATOR)
+
+# Spans recorded per trace before further spans are dropped
+MAX_SPANS_PER_TRACE = 1000
+
+# OTLP span kinds
+_OTLP_KINDS = {"internal": 1, "server": 2, "client": 3}
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = (
+        "attributes",
+        "end_ns",
+        "error",
+        "kind",
+        "name",
+        "parent_id",
+        "span_id",
+        "start_ns",
+        "trace",
+    )
+
+    recording = True
+
+    def __init__(
+        self,
+        trace: "Trace",
+        name: str,
+        parent_id: str | None,
+        kind: str,
+        attributes: dict[str, Any],
+    ) -> None:
+        self.trace = trace
+        self.name = name
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.kind = kind
+        self.attributes = attributes
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+        self.error: str | None = None
+
+    @property
+    def trace_id(self) -> str:
+        """ID of the trace the span belongs to."""
+        return self.trace.trace_id
+
+    @property
+    def duration_ms(self) -> float:
+        """Span duration in milliseconds, up to now if still open."""
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute to the span."""
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarize the span without its children."""
+        return {
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time_ns": self.start_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "status": "error" if self.error else "ok",
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class _NonRecordingSpan:
+    """Stand-in span for unsampled operations."""
+
+    __slots__ = ("finished",)
+
+    recording = False
+    trace_id = None
+    span_id = None
+
+    def __init__(self) -> None:
+        self.finished = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Discard the attribute."""
+
+
+# Returned for spans that are not recorded under a sampled root
+_NON_RECORDING = _NonRecordingSpan()
+
+_current_span: ContextVar[Span | _NonRecordingSpan | None] = ContextVar(
+    "cc_orchestrator_current_span", default=None
+)
+
+
+class Trace:
+    """The spans recorded under one root span."""
+
+    __slots__ = ("dropped_spans", "finished", "spans", "trace_id")
+
+    def __init__(self) -> None:
+        self.trace_id = f"{random.getrandbits(128):032x}"
+        self.spans: list[Span] = []
+        self.dropped_spans = 0
+        self.finished = False
+
+    @property
+    def root(self) -> Span:
+        """The span that started the trace."""
+        return self.spans[0]
+
+    @property
+    def duration_ms(self) -> float:
+        """Duration of the root span in milliseconds."""
+        return self.root.duration_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        """Render the trace with its spans nested as a tree."""
+        nodes = {}
+        for span in self.spans:
+            node = span.to_dict()
+            node["children"] = []
+            nodes[span.span_id] = node
+        for span in self.spans[1:]:
+            parent = nodes.get(span.parent_id)
+            if parent is not None:
+                parent["children"].append(nodes[span.span_id])
+        root = self.root
+        return {
+            "trace_id": self.trace_id,
+            "name": root.name,
+            "start_time_ns": root.start_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "span_count": len(self.spans),
+            "dropped_spans": self.dropped_spans,
+            "root": nodes[root.span_id],
+        }
+
+
+class _SpanScope:
+    """Context manager opening a span and making it current."""
+
+    __slots__ = (
+        "_attributes",
+        "_kind",
+        "_name",
+        "_parent",
+        "_span",
+        "_token",
+        "_tracer",
+    )
+
+    def __init__(
+        self, tracer: "Tracer", name: str, kind: str, attributes: dict[str, Any]
+    ) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._kind = kind
+        self._attributes = attributes
+        self._token = None
+        self._parent: Span | _NonRecordingSpan | None = None
+        self._span: Span | _NonRecordingSpan = _NON_RECORDING
+
+    def __enter__(self) -> Span | _NonRecordingSpan:
+        parent = _current_span.get()
+        if parent is not None:
+            if parent.recording:
+                if parent.trace.finished:
+                    parent = None
+            elif parent.finished:
+                parent = None
+            else:
+                return _NON_RECORDING
+
+        if parent is None:
+            if not self._tracer.should_sample():
+                # Mark the context so nested spans skip the sampling decision
+                self._span = _NonRecordingSpan()
+                self._token = _current_span.set(self._span)
+                return self._span
+            trace = Trace()
+        else:
+            trace = parent.trace
+            if len(trace.spans) >= self._tracer.max_spans:
+                trace.dropped_spans += 1
+                return _NON_RECORDING
+        self._parent = parent
+
+        span = self._span = Span(
+            trace,
+            self._name,
+            parent.span_id if parent is not None else None,
+            self._kind,
+            self._attributes,
+        )
+        trace.spans.append(span)
+        self._token = _current_span.set(span)
+        return span
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if self._token is None:
+            return
+        _current_span.reset(self._token)
+        span = self._span
+        if isinstance(span, _NonRecordingSpan):
+            span.finished = True
+            return
+        span.end_ns = time.time_ns()
+        if exc_type is not None:
+            span.error = (
+                f"{exc_type.__name__}: {exc}" if str(exc) else exc_type.__name__
+            )
+        if self._parent is None:
+            span.trace.finished = True
+            self._tracer.export(span.trace)
+
+
+class InMemoryTraceExporter:
+    """Ring buffer of recently finished traces."""
+
+    def __init__(self, capacity: int = 256) -> None:
+        """Initialize the exporter.
+
+        Args:
+            capacity: Traces kept before the oldest are discarded
+        """
+        self._traces: deque[Trace] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of traces kept."""
+        return self._traces.maxlen or 0
+
+    def export(self, trace: Trace) -> None:
+        """Store a finished trace."""
+        with self._lock:
+            self._traces.append(trace)
+
+    def traces(
+        self,
+        limit: int = 50,
+        min_duration_ms: float = 0.0,
+        name: str | None = None,
+    ) -> list[Trace]:
+        """Query stored traces, newest first.
+
+        Args:
+            limit: Maximum number of traces returned
+            min_duration_ms: Only traces at least this slow
+            name: Only traces whose root span name contains this text
+        """
+        with self._lock:
+            traces = list(self._traces)
+        found = []
+        for trace in reversed(traces):
+            if trace.duration_ms < min_duration_ms:
+                continue
+            if name and name not in trace.root.name:
+                continue
+            found.append(trace)
+            if len(found) >= limit:
+                break
+        return found
+
+    def get(self, trace_id: str) -> Trace | None:
+        """Look up a stored trace by ID."""
+        with self._lock:
+            for trace in self._traces:
+                if trace.trace_id == trace_id:
+                    return trace
+        return None
+
+    def clear(self) -> None:
+        """Discard all stored traces."""
+        with self._lock:
+            self._traces.clear()
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [
+        {"key": key, "value": _otlp_value(value)}
+        for key, value in attributes.items()
+        if value is not None
+    ]
+
+
+def trace_to_otlp(trace: Trace, service_name: str) -> dict[str, Any]:
+    """Convert a trace to an OTLP/JSON ``ExportTraceServiceRequest``."""
+    spans = []
+    for span in trace.spans:
+        otlp_span: dict[str, Any] = {
+            "traceId": trace.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": _OTLP_KINDS.get(span.kind, 1),
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns or span.start_ns),
+            "attributes": _otlp_attributes(span.attributes),
+            "status": {"code": 2, "message": span.error} if span.error else {},
+        }
+        if span.parent_id:
+            otlp_span["parentSpanId"] = span.parent_id
+        spans.append(otlp_span)
+
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": _otlp_attributes({"service.name": service_name})
+                },
+                "scopeSpans": [{"scope": {"name": "cc_orchestrator"}, "spans": spans}],
+            }
+        ]
+    }
+
+
+class OTLPJsonFileExporter:
+    """Appends finished traces to a file as OTLP/JSON lines."""
+
+    def __init__(self, path: str | Path, service_name: str = "cc-orchestrator") -> None:
+        """Initialize the exporter.
+
+        Args:
+            path: File the traces are appended to
+            service_name: ``service.name`` resource attribute
+        """
+        self.path = Path(path).expanduser()
+        self.service_name = service_name
+        self._file: Any = None
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        """Append a finished trace."""
+        line = json.dumps(trace_to_otlp(trace, self.service_name), default=str)
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8", buffering=1)
+            self._file.write(line + "\n")
+
+    def close(self) -> None:
+        """Close the output file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class Tracer:
+    """Creates spans, samples root operations and exports finished traces."""
+
+    def __init__(
+        self,
+        sample_rate: float = 0.0,
+        exporters: list[Any] | None = None,
+        max_spans: int = MAX_SPANS_PER_TRACE,
+    ) -> None:
+        """Initialize the tracer.
+
+        Args:
+            sample_rate: Fraction of root spans recorded, from 0 to 1
+            exporters: Receivers of finished traces (each has ``export``
+                and ``close``)
+            max_spans: Spans recorded per trace before the rest are dropped
+        """
+        self.sample_rate = max(0.0, min(1.0, sample_rate))
+        self.exporters = list(exporters or [])
+        self.max_spans = max_spans
+
+    @property
+    def memory_exporter(self) -> InMemoryTraceExporter | None:
+        """The ring buffer exporter, if one is configured."""
+        for exporter in self.exporters:
+            if isinstance(exporter, InMemoryTraceExporter):
+                return exporter
+        return None
+
+    def should_sample(self) -> bool:
+        """Decide whether a new root span is recorded."""
+        rate = self.sample_rate
+        return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+    def span(self, name: str, kind: str = "internal", **attributes: Any) -> _SpanScope:
+        """Open a span as a child of the current one.
+
+        Args:
+            name: Operation name
+            kind: ``"internal"``, ``"server"`` or ``"client"``
+            **attributes: Span attributes
+
+        Returns:
+            Context manager yielding the span
+        """
+        return _SpanScope(self, name, kind, attributes)
+
+    def export(self, trace: Trace) -> None:
+        """Hand a finished trace to every exporter."""
+        for exporter in self.exporters:
+            try:
+                exporter.export(trace)
+            except Exception as e:
+                logger.warning(
+                    "Trace export failed",
+                    exporter=type(exporter).__name__,
+                    error=str(e),
+                )
+
+    def close(self) -> None:
+        """Close every exporter."""
+        for exporter in self.exporters:
+            exporter.close()
+
+
+def current_span() -> Span | None:
+    """Get the recording span of the current context, if any."""
+    span = _current_span.get()
+    return span if span is not None and span.recording else None
+
+
+# Global tracer instance
+_tracer: Tracer | None = None
+
+
+def get_tracer() -> Tracer:
+    """Get the global tracer (recording nothing until configured)."""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(exporters=[InMemoryTraceExporter()])
+    return _tracer
+
+
+def configure_tracing(
+    sample_rate: float,
+    buffer_size: int = 256,
+    otlp_file: str | Path | None = None,
+) -> Tracer:
+    """Replace the global tracer.
+
+    Args:
+        sample_rate: Fraction of root spans recorded, from 0 to 1
+        buffer_size: Traces kept in memory for ``/debug/traces``
+        otlp_file: File to append OTLP/JSON traces to, if any
+
+    Returns:
+        The new global tracer
+    """
+    global _tracer
+    exporters: list[Any] = [InMemoryTraceExporter(buffer_size)]
+    if otlp_file:
+        exporters.append(OTLPJsonFileExporter(otlp_file))
+
+    previous = _tracer
+    _tracer = Tracer(sample_rate=sample_rate, exporters=exporters)
+    if previous is not None:
+        previous.close()
+    return _tracer
+
+
+def cleanup_tracer() -> None:
+    """Close the global tracer's exporters and reset it."""
+    global _tracer
+    if _tracer is not None:
+        _tracer.close()
+        _tracer = None
+
+
+def start_span(name: str, kind: str = "internal", **attributes: Any) -> _SpanScope:
+    """Open a span on the global tracer.
+
+    Example:
+        with start_span("git worktree add", path=path) as span:
+            ...
+            span.set_attribute("branch", branch)
+    """
+    return get_tracer().span(name, kind, **attributes)
+
+
+def traced(
+    name: str | None = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator running a sync or async function inside a span.
+
+    Args:
+        name: Span name (defaults to the function's qualified name)
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with get_tracer().span(span_name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            with get_tracer().span(span_name):
+                return func(*args, **kwargs)
+
+        return sync_wrapper
+
+    return decorator
@@ -1,29 +1,187 @@
 """FastAPI web application for CC-Orchestrator dashboard."""
 
+import asyncio
 import os
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
-
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse
+
+from ..config.loader import load_config
+from ..config.service import get_config_service
+from ..core.retention import RetentionService
+from ..core.scheduler import SchedulerService
+from ..core.session_reaper import SessionReaperService
+from ..core.worktree_watcher import CachedWorktreeStatus, WorktreeWatcherService
+from ..daemon.client import connect_daemon_async
 from ..database.connection import DatabaseManager
+from ..tmux.capture import PaneOutputChunk
+from ..tmux.service import start_output_capture, stop_output_capture
+from ..utils.logging import setup_logging, shutdown_logging
+from ..utils.metrics import PROMETHEUS_CONTENT_TYPE, get_metrics_registry
+from ..utils.tracing import cleanup_tracer, configure_tracing
 from .exceptions import CCOrchestratorAPIException
 from .logging_utils import api_logger
-from .middleware import LoggingMiddleware, RequestIDMiddleware
+from .middleware import LoggingMiddleware, RequestIDMiddleware, TracingMiddleware
 from .middlewares.rate_limiter import RateLimitMiddleware, rate_limiter
-from .routers import auth_router
+from .routers import auth_router, debug_router
 from .routers.v1 import api_router_v1
+from .routers.v1.logs import (
+    LogEntryType,
+    LogLevelEnum,
+    add_log_entry,
+    prune_log_storage,
+)
+from .websocket.manager import WebSocketMessage, connection_manager
 from .websocket.router import router as websocket_router
 
 
+def _worktree_status_pusher(
+    loop: asyncio.AbstractEventLoop,
+) -> Callable[[str, CachedWorktreeStatus | None], None]:
+    """Build a cache listener that pushes worktree status over websockets.
+
+    Cache listeners run on the watcher thread, so broadcasts are handed to the
+    event loop rather than awaited.
+    """
+
+    def push(path: str, entry: CachedWorktreeStatus | None) -> None:
+        data = entry.to_dict() if entry else {"path": path, "removed": True}
+        message = WebSocketMessage(
+            type="worktree_status", data=data, timestamp=datetime.now()
+        )
+        loop.call_soon_threadsafe(
+            lambda: loop.create_task(
+                connection_manager.broadcast_message(message, topic="worktrees")
+            )
+        )
+
+    return push
+
+
+def _task_dispatch_pusher(
+    loop: asyncio.AbstractEventLoop,
+) -> Callable[[int, int], None]:
+    """Build a scheduler listener that tells instances about dispatched tasks.
+
+    The message goes to the ``instance:<id>`` topic the instance's websocket
+    subscribes to, and to the dashboard's ``tasks`` topic. Dispatch listeners
+    run on the scheduler thread, so broadcasts are handed to the event loop.
+    """
+
+    def broadcast(message: WebSocketMessage, topic: str) -> None:
+        loop.create_task(connection_manager.broadcast_message(message, topic=topic))
+
+    def push(task_id: int, instance_id: int) -> None:
+        message = WebSocketMessage(
+            type="task_dispatched",
+            data={"task_id": task_id, "instance_id": instance_id},
+            timestamp=datetime.now(),
+        )
+        for topic in (f"instance:{instance_id}", "tasks"):
+            loop.call_soon_threadsafe(broadcast, message, topic)
+
+    return push
+
+
+def _pane_output_logger(
+    loop: asyncio.AbstractEventLoop,
+) -> Callable[[PaneOutputChunk], None]:
+    """Build a capture listener that adds pane output to the log stream.
+
+    Capture listeners run on the event loop, so entries are scheduled rather
+    than awaited.
+    """
+
+    def log(chunk: PaneOutputChunk) -> None:
+        metadata: dict[str, object] = {
+            "session": chunk.session_name,
+            "pane": chunk.pane_id,
+        }
+        if chunk.truncated_bytes:
+            metadata["truncated_bytes"] = chunk.truncated_bytes
+        if chunk.dropped_bytes:
+            metadata["dropped_bytes"] = chunk.dropped_bytes
+        loop.create_task(
+            add_log_entry(
+                LogLevelEnum.INFO,
+                "tmux.pane",
+                chunk.text,
+                context=LogEntryType.TMUX,
+                instance_id=chunk.instance_id,
+                metadata=metadata,
+            )
+        )
+
+    return log
+
+
+async def _daemon_services(database_id: str) -> dict[str, bool]:
+    """Get the services a running orchestrator daemon hosts.
+
+    A daemon working on another database hosts nothing for this app.
+
+    Args:
+        database_id: Identifier of the app's database
+    """
+    client = await connect_daemon_async(timeout=5.0)
+    if client is None:
+        return {}
+    async with client:
+        status = await client.call("ping")
+    if status.get("database_id") != database_id:
+        api_logger.warning(
+            "Ignoring orchestrator daemon of another database",
+            daemon_database_id=status.get("database_id"),
+        )
+        return {}
+    return dict(status.get("services", {}))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Manage application lifespan events."""
     # Startup
+    # Keep log formatting and I/O off the event loop and start sampling
+    # request traces (skipped during testing)
+    logging_configured = False
+    if os.getenv("TESTING", "false").lower() != "true":
+        try:
+            config = load_config()
+            setup_logging(
+                log_level=config.log_level,
+                log_file=Path(config.log_file) if config.log_file else None,
+                asynchronous=config.log_async,
+                queue_size=config.log_queue_size,
+                max_bytes=config.log_max_bytes,
+                backup_count=config.log_backup_count,
+                rotate_when=config.log_rotate_when,
+            )
+            logging_configured = True
+            configure_tracing(
+                sample_rate=config.tracing_sample_rate,
+                buffer_size=config.tracing_buffer_size,
+                otlp_file=config.tracing_otlp_file,
+            )
+        except Exception as e:
+            api_logger.error("Failed to configure logging or tracing", error=str(e))
+
     api_logger.info("Starting CC-Orchestrator API server")
 
+    # Reload configuration edits into running services (skipped during testing)
+    config_watcher = None
+    if os.getenv("TESTING", "false").lower() != "true":
+        try:
+            config_watcher = get_config_service()
+            await config_watcher.start()
+        except Exception as e:
+            api_logger.error("Failed to start configuration watcher", error=str(e))
+            config_watcher = None
+
     # Initialize database connection (only if not already set for testing)
     if not hasattr(app.state, "db_manager"):
         try:
@@ -43,6 +201,90 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         api_logger.error("Failed to initialize rate limiter", error=str(e))
 
+    # Start data retention (skipped during testing)
+    retention_service = None
+    if app.state.db_manager and os.getenv("TESTING", "false").lower() != "true":
+        try:
+            retention_service = RetentionService(db_manager=app.state.db_manager)
+            retention_service.register_pruner("logs", prune_log_storage)
+            await retention_service.start()
+            api_logger.info("Retention service started")
+        except Exception as e:
+            api_logger.error("Failed to start retention service", error=str(e))
+            retention_service = None
+
+    # Services the orchestrator daemon already hosts (skipped during testing)
+    daemon_services: dict[str, bool] = {}
+    if app.state.db_manager and os.getenv("TESTING", "false").lower() != "true":
+        try:
+            daemon_services = await _daemon_services(app.state.db_manager.database_id)
+        except Exception as e:
+            api_logger.error("Failed to query the orchestrator daemon", error=str(e))
+
+    # Start the task scheduler unless the orchestrator daemon already runs
+    # one (skipped during testing)
+    app.state.scheduler = None
+    if app.state.db_manager and os.getenv("TESTING", "false").lower() != "true":
+        try:
+            config = load_config()
+            if config.scheduler_enabled and daemon_services.get("scheduler"):
+                api_logger.info("Task scheduler runs in the orchestrator daemon")
+            elif config.scheduler_enabled:
+                scheduler = SchedulerService(config, db_manager=app.state.db_manager)
+                scheduler.add_listener(
+                    _task_dispatch_pusher(asyncio.get_running_loop())
+                )
+                await scheduler.start()
+                app.state.scheduler = scheduler
+                api_logger.info("Task scheduler started")
+        except Exception as e:
+            api_logger.error("Failed to start task scheduler", error=str(e))
+
+    # Watch worktrees for status changes (skipped during testing)
+    app.state.worktree_watcher = None
+    if app.state.db_manager and os.getenv("TESTING", "false").lower() != "true":
+        try:
+            config = load_config()
+            if config.worktree_watcher_enabled:
+                watcher = WorktreeWatcherService(
+                    config, db_manager=app.state.db_manager
+                )
+                watcher.cache.add_listener(
+                    _worktree_status_pusher(asyncio.get_running_loop())
+                )
+                await watcher.start()
+                app.state.worktree_watcher = watcher
+                api_logger.info("Worktree watcher started")
+        except Exception as e:
+            api_logger.error("Failed to start worktree watcher", error=str(e))
+
+    # Reap orphaned tmux sessions (skipped during testing)
+    app.state.session_reaper = None
+    if app.state.db_manager and os.getenv("TESTING", "false").lower() != "true":
+        try:
+            config = load_config()
+            if config.tmux_reaper_enabled:
+                reaper = SessionReaperService(config, db_manager=app.state.db_manager)
+                await reaper.start()
+                app.state.session_reaper = reaper
+                api_logger.info("Session reaper started")
+        except Exception as e:
+            api_logger.error("Failed to start session reaper", error=str(e))
+
+    # Feed captured pane output into the log stream unless the orchestrator
+    # daemon already captures it (skipped during testing)
+    pane_capture = None
+    if os.getenv("TESTING", "false").lower() != "true":
+        try:
+            if daemon_services.get("pane_capture"):
+                api_logger.info("Pane output is captured by the orchestrator daemon")
+            else:
+                pane_capture = await start_output_capture(
+                    load_config(), _pane_output_logger(asyncio.get_running_loop())
+                )
+        except Exception as e:
+            api_logger.error("Failed to start pane output capture", error=str(e))
+
     api_logger.info("CC-Orchestrator API server started successfully")
 
     yield
@@ -50,6 +292,42 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     api_logger.info("Shutting down CC-Orchestrator API server")
 
+    if config_watcher is not None:
+        await config_watcher.stop()
+
+    # Close pane pipes so no pane keeps writing into an unread FIFO
+    if pane_capture is not None:
+        try:
+            await stop_output_capture()
+        except Exception as e:
+            api_logger.error("Failed to stop pane output capture", error=str(e))
+
+    if app.state.session_reaper is not None:
+        try:
+            await app.state.session_reaper.stop()
+        except Exception as e:
+            api_logger.error("Failed to stop session reaper", error=str(e))
+
+    if app.state.worktree_watcher is not None:
+        try:
+            await app.state.worktree_watcher.stop()
+        except Exception as e:
+            api_logger.error("Failed to stop worktree watcher", error=str(e))
+
+    # Stop dispatching before closing the database
+    if app.state.scheduler is not None:
+        try:
+            await app.state.scheduler.stop()
+        except Exception as e:
+            api_logger.error("Failed to stop task scheduler", error=str(e))
+
+    # Stop data retention before closing the database
+    if retention_service is not None:
+        try:
+            await retention_service.stop()
+        except Exception as e:
+            api_logger.error("Failed to stop retention service", error=str(e))
+
     # Close database connections
     if hasattr(app.state, "db_manager") and app.state.db_manager:
         try:
@@ -65,6 +343,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         api_logger.error("Failed to cleanup rate limiter", error=str(e))
 
+    # Flush trace exporters
+    cleanup_tracer()
+
+    # Write out queued log records
+    if logging_configured:
+        shutdown_logging()
+
     api_logger.info("CC-Orchestrator API server shutdown complete")
 
 
@@ -124,7 +409,8 @@ def create_app() -> FastAPI:
         allow_headers=["Content-Type", "Authorization", "Accept"],
     )
 
-    # Add custom middleware
+    # Add custom middleware (the last added runs first)
+    app.add_middleware(TracingMiddleware)
     app.add_middleware(RequestIDMiddleware)
     app.add_middleware(LoggingMiddleware)
 
@@ -151,6 +437,7 @@ def create_app() -> FastAPI:
     app.include_router(auth_router, prefix="/auth")
     app.include_router(api_router_v1, prefix="/api/v1")
     app.include_router(websocket_router, prefix="/ws")
+    app.include_router(debug_router, prefix="/debug")
 
     @app.get("/", response_class=HTMLResponse)
     async def root() -> str:
@@ -174,6 +461,13 @@ def create_app() -> FastAPI:
         """Health check endpoint."""
         return {"status": "healthy"}
 
+    @app.get("/metrics", response_class=PlainTextResponse)
+    async def metrics() -> PlainTextResponse:
+        """Expose in-process metrics in the Prometheus text format."""
+        return PlainTextResponse(
+            get_metrics_registry().render(), media_type=PROMETHEUS_CONTENT_TYPE
+        )
+
     @app.get("/ping")
     async def ping() -> dict[str, str]:
         """Ping endpoint for simple health check."""
@@ -6,8 +6,9 @@ to make them compatible with FastAPI's async model.
 """
 
 import asyncio
+from collections.abc import Callable, Sequence
 from datetime import datetime
-from typing import Any
+from typing import Any, TypeVar
 
 from sqlalchemy.orm import Session
 
@@ -26,6 +27,19 @@ from ..database.models import (
     Task,
     Worktree,
 )
+from ..utils.tracing import start_span
+
+T = TypeVar("T")
+
+
+async def _run_blocking(operation: Callable[[], T]) -> T:
+    """Run a blocking CRUD operation in a worker thread inside a trace span.
+
+    The span is named after the operation, e.g. ``_get_instance`` is traced as
+    ``crud.get_instance``, and includes the wait for a free worker thread.
+    """
+    with start_span("crud." + operation.__name__.lstrip("_")):
+        return await asyncio.to_thread(operation)
 
 
 # Placeholder classes for models that don't exist yet
@@ -64,11 +78,20 @@ class CRUDBase:
 
     # Instance operations
     async def list_instances(
-        self, offset: int = 0, limit: int = 20, filters: dict[str, Any] | None = None
-    ) -> tuple[list[Instance], int]:
-        """List instances with pagination and filtering."""
-
-        def _list_instances() -> tuple[list[Instance], int]:
+        self,
+        offset: int = 0,
+        limit: int = 20,
+        filters: dict[str, Any] | None = None,
+        include: Sequence[str] | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> tuple[list[Any], int]:
+        """List instances with pagination, filtering and eager-loaded relationships.
+
+        When ``fields`` is given and no relationships are requested, instances
+        are returned as column-projected rows instead of hydrated models.
+        """
+
+        def _list_instances() -> tuple[list[Any], int]:
             # Convert filters to appropriate parameters for InstanceCRUD.list_all
             status = None
             if filters and "status" in filters:
@@ -81,8 +104,22 @@ class CRUDBase:
                 else:
                     status = status_value
 
+            if fields is not None and not include:
+                rows = InstanceCRUD.list_rows(
+                    self.session,
+                    status=status,
+                    limit=limit,
+                    offset=offset,
+                    fields=fields,
+                )
+                return list(rows), InstanceCRUD.count(self.session, status=status)
+
             instances = InstanceCRUD.list_all(
-                self.session, status=status, limit=limit, offset=offset
+                self.session,
+                status=status,
+                limit=limit,
+                offset=offset,
+                include=include,
             )
 
             # Get total count for pagination
@@ -90,7 +127,7 @@ class CRUDBase:
 
             return instances, total_count
 
-        return await asyncio.to_thread(_list_instances)
+        return await _run_blocking(_list_instances)
 
     async def create_instance(self, instance_data: dict[str, Any]) -> Instance:
         """Create a new instance."""
@@ -121,7 +158,7 @@ class CRUDBase:
 
             return instance
 
-        return await asyncio.to_thread(_create_instance)
+        return await _run_blocking(_create_instance)
 
     async def get_instance(self, instance_id: int) -> Instance | None:
         """Get instance by ID."""
@@ -136,7 +173,7 @@ class CRUDBase:
                 # Return None for any exception (including NotFoundError)
                 return None
 
-        return await asyncio.to_thread(_get_instance)
+        return await _run_blocking(_get_instance)
 
     async def get_instance_by_issue_id(self, issue_id: str) -> Instance | None:
         """Get instance by issue ID."""
@@ -147,7 +184,7 @@ class CRUDBase:
             except Exception:
                 return None
 
-        return await asyncio.to_thread(_get_instance_by_issue_id)
+        return await _run_blocking(_get_instance_by_issue_id)
 
     async def update_instance(
         self, instance_id: int, update_data: dict[str, Any]
@@ -167,7 +204,7 @@ class CRUDBase:
 
             return InstanceCRUD.update(self.session, instance_id, **update_data)
 
-        return await asyncio.to_thread(_update_instance)
+        return await _run_blocking(_update_instance)
 
     async def delete_instance(self, instance_id: int) -> None:
         """Delete an instance."""
@@ -175,30 +212,42 @@ class CRUDBase:
         def _delete_instance() -> None:
             InstanceCRUD.delete(self.session, instance_id)
 
-        await asyncio.to_thread(_delete_instance)
+        await _run_blocking(_delete_instance)
 
     # Task operations
     async def list_tasks(
-        self, offset: int = 0, limit: int = 20, filters: dict[str, Any] | None = None
-    ) -> tuple[list[Task], int]:
-        """List tasks with pagination and filtering."""
+        self,
+        offset: int = 0,
+        limit: int = 20,
+        filters: dict[str, Any] | None = None,
+        include: Sequence[str] | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> tuple[list[Any], int]:
+        """List tasks with pagination, filtering and eager-loaded relationships.
+
+        When ``fields`` is given and no relationships are requested, tasks are
+        returned as column-projected rows instead of hydrated models.
+        """
+
+        def _status_filter() -> Any:
+            from ..database.models import TaskStatus
+
+            status_value = (filters or {}).get("status")
+            if isinstance(status_value, str):
+                return TaskStatus(status_value)
+            return status_value
+
+        def _list_tasks() -> tuple[list[Any], int]:
+            if fields is not None and not include:
+                return _list_task_rows()
+
+            status_filter = _status_filter()
 
-        def _list_tasks() -> tuple[list[Task], int]:
             # Handle instance_id filter for list_by_instance
             if filters and "instance_id" in filters:
                 instance_id = filters["instance_id"]
-                status_filter = None
-                if "status" in filters:
-                    from ..database.models import TaskStatus
-
-                    status_value = filters["status"]
-                    if isinstance(status_value, str):
-                        status_filter = TaskStatus(status_value)
-                    else:
-                        status_filter = status_value
-
                 tasks = TaskCRUD.list_by_instance(
-                    self.session, instance_id, status=status_filter
+                    self.session, instance_id, status=status_filter, include=include
                 )
 
                 # Apply pagination manually
@@ -208,16 +257,50 @@ class CRUDBase:
                 paginated_tasks = tasks[start:end]
 
                 return paginated_tasks, total_count
+            elif status_filter is not None:
+                tasks = TaskCRUD.list_by_status(
+                    self.session,
+                    status_filter,
+                    limit=limit,
+                    offset=offset,
+                    include=include,
+                )
+                return tasks, TaskCRUD.count(self.session, status=status_filter)
             else:
                 # For general task listing, use list_pending
-                tasks = TaskCRUD.list_pending(self.session, limit=limit)
+                tasks = TaskCRUD.list_pending(
+                    self.session, limit=limit, include=include
+                )
                 # Skip offset manually since the CRUD doesn't support it
                 if offset > 0:
                     tasks = tasks[offset:]
                 total_count = len(TaskCRUD.list_pending(self.session))
                 return tasks, total_count
 
-        return await asyncio.to_thread(_list_tasks)
+        def _list_task_rows() -> tuple[list[Any], int]:
+            from ..database.models import TaskStatus
+
+            # Mirror the model path: listings honour the status filter, and
+            # general listings without one cover pending tasks only
+            instance_id = (filters or {}).get("instance_id")
+            status_filter = _status_filter()
+            if status_filter is None and instance_id is None:
+                status_filter = TaskStatus.PENDING
+
+            rows = TaskCRUD.list_rows(
+                self.session,
+                instance_id=instance_id,
+                status=status_filter,
+                limit=limit,
+                offset=offset,
+                fields=fields,
+            )
+            total_count = TaskCRUD.count(
+                self.session, instance_id=instance_id, status=status_filter
+            )
+            return list(rows), total_count
+
+        return await _run_blocking(_list_tasks)
 
     async def create_task(self, task_data: dict[str, Any]) -> Task:
         """Create a new task."""
@@ -261,7 +344,7 @@ class CRUDBase:
                 extra_metadata=task_data.get("extra_metadata", {}),
             )
 
-        return await asyncio.to_thread(_create_task)
+        return await _run_blocking(_create_task)
 
     async def get_task(self, task_id: int) -> Task | None:
         """Get task by ID."""
@@ -272,7 +355,7 @@ class CRUDBase:
             except Exception:
                 return None
 
-        return await asyncio.to_thread(_get_task)
+        return await _run_blocking(_get_task)
 
     async def update_task(self, task_id: int, update_data: dict[str, Any]) -> Task:
         """Update a task."""
@@ -293,7 +376,60 @@ class CRUDBase:
                 # Use general update for other fields like instance_id
                 return TaskCRUD.update(self.session, task_id, **update_data)
 
-        return await asyncio.to_thread(_update_task)
+        return await _run_blocking(_update_task)
+
+    async def assign_task(
+        self, task_id: int, instance_id: int | None, expected_instance_id: int | None
+    ) -> Task | None:
+        """Assign a task unless its assignment changed since it was read."""
+
+        def _assign_task() -> Task | None:
+            return TaskCRUD.assign(
+                self.session, task_id, instance_id, expected_instance_id
+            )
+
+        return await _run_blocking(_assign_task)
+
+    async def claim_task(
+        self,
+        instance_id: int,
+        capabilities: Sequence[str] | None = None,
+        lease_seconds: float | None = None,
+    ) -> Task | None:
+        """Atomically claim the next pending task for an instance."""
+
+        def _claim_task() -> Task | None:
+            kwargs: dict[str, Any] = {"capabilities": capabilities}
+            if lease_seconds is not None:
+                kwargs["lease_seconds"] = lease_seconds
+            return TaskCRUD.claim_next(self.session, instance_id, **kwargs)
+
+        return await _run_blocking(_claim_task)
+
+    async def renew_task_lease(
+        self, task_id: int, instance_id: int, lease_seconds: float | None = None
+    ) -> Task | None:
+        """Extend the lease on a task the instance holds."""
+
+        def _renew_task_lease() -> Task | None:
+            kwargs: dict[str, Any] = {}
+            if lease_seconds is not None:
+                kwargs["lease_seconds"] = lease_seconds
+            if not TaskCRUD.renew_lease(self.session, task_id, instance_id, **kwargs):
+                return None
+            return self.session.get(Task, task_id, populate_existing=True)
+
+        return await _run_blocking(_renew_task_lease)
+
+    async def release_task(self, task_id: int, instance_id: int) -> Task | None:
+        """Return a task the instance holds to the queue."""
+
+        def _release_task() -> Task | None:
+            if not TaskCRUD.release(self.session, task_id, instance_id):
+                return None
+            return self.session.get(Task, task_id, populate_existing=True)
+
+        return await _run_blocking(_release_task)
 
     async def delete_task(self, task_id: int) -> None:
         """Delete a task."""
@@ -304,13 +440,17 @@ class CRUDBase:
             TaskCRUD.get_by_id(self.session, task_id)
             # TODO: Implement task deletion in TaskCRUD
 
-        await asyncio.to_thread(_delete_task)
+        await _run_blocking(_delete_task)
 
     # Worktree operations
     async def list_worktrees(
-        self, offset: int = 0, limit: int = 20, filters: dict[str, Any] | None = None
+        self,
+        offset: int = 0,
+        limit: int = 20,
+        filters: dict[str, Any] | None = None,
+        include: Sequence[str] | None = None,
     ) -> tuple[list[Worktree], int]:
-        """List worktrees with pagination and filtering."""
+        """List worktrees with pagination, filtering and eager-loaded relationships."""
 
         def _list_worktrees() -> tuple[list[Worktree], int]:
             # Handle status filter
@@ -322,9 +462,11 @@ class CRUDBase:
                     status = WorktreeStatus(status_value)
                 else:
                     status = status_value
-                worktrees = WorktreeCRUD.list_by_status(self.session, status)
+                worktrees = WorktreeCRUD.list_by_status(
+                    self.session, status, include=include
+                )
             else:
-                worktrees = WorktreeCRUD.list_all(self.session)
+                worktrees = WorktreeCRUD.list_all(self.session, include=include)
 
             # Apply pagination manually
             total_count = len(worktrees)
@@ -334,7 +476,7 @@ class CRUDBase:
 
             return paginated_worktrees, total_count
 
-        return await asyncio.to_thread(_list_worktrees)
+        return await _run_blocking(_list_worktrees)
 
     async def create_worktree(self, worktree_data: dict[str, Any]) -> Worktree:
         """Create a new worktree."""
@@ -351,7 +493,7 @@ class CRUDBase:
                 extra_metadata=worktree_data.get("extra_metadata", {}),
             )
 
-        return await asyncio.to_thread(_create_worktree)
+        return await _run_blocking(_create_worktree)
 
     async def get_worktree(self, worktree_id: int) -> Worktree | None:
         """Get worktree by ID."""
@@ -362,7 +504,7 @@ class CRUDBase:
             except Exception:
                 return None
 
-        return await asyncio.to_thread(_get_worktree)
+        return await _run_blocking(_get_worktree)
 
     async def get_worktree_by_path(self, path: str) -> Worktree | None:
         """Get worktree by path."""
@@ -373,7 +515,7 @@ class CRUDBase:
             except Exception:
                 return None
 
-        return await asyncio.to_thread(_get_worktree_by_path)
+        return await _run_blocking(_get_worktree_by_path)
 
     async def update_worktree(
         self, worktree_id: int, update_data: dict[str, Any]
@@ -413,7 +555,7 @@ class CRUDBase:
                 # TODO: Implement general worktree update in WorktreeCRUD
                 return WorktreeCRUD.get_by_id(self.session, worktree_id)
 
-        return await asyncio.to_thread(_update_worktree)
+        return await _run_blocking(_update_worktree)
 
     async def delete_worktree(self, worktree_id: int) -> None:
         """Delete a worktree."""
@@ -421,7 +563,7 @@ class CRUDBase:
         def _delete_worktree() -> None:
             WorktreeCRUD.delete(self.session, worktree_id)
 
-        await asyncio.to_thread(_delete_worktree)
+        await _run_blocking(_delete_worktree)
 
     # Configuration operations
     async def list_configurations(
@@ -434,7 +576,7 @@ class CRUDBase:
             # TODO: Implement list_all method in ConfigurationCRUD
             return [], 0
 
-        return await asyncio.to_thread(_list_configurations)
+        return await _run_blocking(_list_configurations)
 
     async def create_configuration(self, config_data: dict[str, Any]) -> Configuration:
         """Create a new configuration."""
@@ -467,7 +609,7 @@ class CRUDBase:
                 extra_metadata=config_data.get("extra_metadata", {}),
             )
 
-        return await asyncio.to_thread(_create_configuration)
+        return await _run_blocking(_create_configuration)
 
     async def get_configuration(self, config_id: int) -> Configuration | None:
         """Get configuration by ID."""
@@ -477,7 +619,7 @@ class CRUDBase:
             # TODO: Implement get_by_id method in ConfigurationCRUD
             return None
 
-        return await asyncio.to_thread(_get_configuration)
+        return await _run_blocking(_get_configuration)
 
     async def get_configuration_by_key_scope(
         self, key: str, scope: Any, instance_id: int | None = None
@@ -510,7 +652,7 @@ class CRUDBase:
             except Exception:
                 return None
 
-        return await asyncio.to_thread(_get_configuration_by_key_scope)
+        return await _run_blocking(_get_configuration_by_key_scope)
 
     async def get_exact_configuration_by_key_scope(
         self, key: str, scope: Any, instance_id: int | None = None
@@ -543,7 +685,7 @@ class CRUDBase:
             except Exception:
                 return None
 
-        return await asyncio.to_thread(_get_exact_configuration_by_key_scope)
+        return await _run_blocking(_get_exact_configuration_by_key_scope)
 
     async def update_configuration(
         self, config_id: int, update_data: dict[str, Any]
@@ -571,7 +713,7 @@ class CRUDBase:
                     setattr(config, key, value)
             return config
 
-        return await asyncio.to_thread(_update_configuration)
+        return await _run_blocking(_update_configuration)
 
     async def delete_configuration(self, config_id: int) -> None:
         """Delete a configuration."""
@@ -581,7 +723,7 @@ class CRUDBase:
             # TODO: Implement delete method in ConfigurationCRUD
             pass
 
-        await asyncio.to_thread(_delete_configuration)
+        await _run_blocking(_delete_configuration)
 
     # Health check operations
     async def list_health_checks(
@@ -604,7 +746,7 @@ class CRUDBase:
                 # For now, return empty if no instance filter
                 return [], 0
 
-        return await asyncio.to_thread(_list_health_checks)
+        return await _run_blocking(_list_health_checks)
 
     async def create_health_check(self, check_data: dict[str, Any]) -> HealthCheck:
         """Create a new health check record."""
@@ -624,7 +766,7 @@ class CRUDBase:
                 check_timestamp=check_data["check_timestamp"],
             )
 
-        return await asyncio.to_thread(_create_health_check)
+        return await _run_blocking(_create_health_check)
 
     # Alert operations
     async def list_alerts(
@@ -5,7 +5,7 @@ This module provides dependency injection functions for database
 sessions, authentication, and other shared resources.
 """
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable
 from typing import cast
 
 from fastapi import Depends, HTTPException, Request, status
@@ -27,6 +27,12 @@ async def get_database_manager(request: Request) -> DatabaseManager:
     return cast(DatabaseManager, request.app.state.db_manager)
 
 
+def get_database_id(request: Request) -> str | None:
+    """Get the identifier of the app's database, or None without one."""
+    db_manager = getattr(request.app.state, "db_manager", None)
+    return db_manager.database_id if db_manager is not None else None
+
+
 async def get_db_session(
     db_manager: DatabaseManager = Depends(get_database_manager),
 ) -> AsyncGenerator[Session, None]:
@@ -303,3 +309,60 @@ def validate_config_id(config_id: int) -> int:
             detail="Configuration ID must be a positive integer",
         )
     return config_id
+
+
+def parse_include(include: str | None, allowed: Iterable[str]) -> list[str]:
+    """Parse a comma-separated ``include`` query parameter.
+
+    Args:
+        include: Raw query parameter value, e.g. ``"tasks,worktree"``
+        allowed: Relationship names the endpoint can embed
+
+    Returns:
+        Requested relationship names in request order, without duplicates
+
+    Raises:
+        HTTPException: If an unknown relationship is requested
+    """
+    if not include:
+        return []
+
+    allowed_fields = set(allowed)
+    fields = list(dict.fromkeys(f.strip() for f in include.split(",") if f.strip()))
+    unknown = [f for f in fields if f not in allowed_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Cannot include {', '.join(unknown)}; "
+            f"expected one of: {', '.join(sorted(allowed_fields))}",
+        )
+    return fields
+
+
+def parse_fields(fields: str | None, allowed: Iterable[str]) -> list[str] | None:
+    """Parse a comma-separated ``fields`` query parameter.
+
+    Args:
+        fields: Raw query parameter value, e.g. ``"title,status,results"``
+        allowed: Field names the endpoint can return
+
+    Returns:
+        Requested field names in request order without duplicates, or None
+        when the parameter was not given
+
+    Raises:
+        HTTPException: If an unknown field is requested
+    """
+    if not fields:
+        return None
+
+    allowed_fields = set(allowed)
+    names = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in names if f not in allowed_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown fields {', '.join(unknown)}; "
+            f"expected any of: {', '.join(sorted(allowed_fields))}",
+        )
+    return names
@@ -18,12 +18,19 @@ from ..utils.logging import (
     LogContext,
     get_logger,
 )
+from ..utils.metrics import get_metrics_registry
 
 # Web component loggers
 api_logger = get_logger(__name__ + ".api", LogContext.WEB)
 websocket_logger = get_logger(__name__ + ".websocket", LogContext.WEB)
 auth_logger = get_logger(__name__ + ".auth", LogContext.WEB)
 
+_API_HANDLER_DURATION = get_metrics_registry().histogram(
+    "cc_orchestrator_api_handler_duration_seconds",
+    "Execution time of API handlers decorated with track_api_performance",
+    ("handler", "status"),
+)
+
 
 def log_api_request(
     method: str,
@@ -265,69 +272,53 @@ def handle_api_errors(
 
 
 def track_api_performance() -> Callable[[Callable[..., Any]], Callable[..., Any]]:
-    """Async-aware decorator for API performance tracking."""
+    """Async-aware decorator recording API handler execution time.
+
+    Durations go into the ``cc_orchestrator_api_handler_duration_seconds``
+    histogram, labeled by handler and outcome. Only failures are logged.
+    """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        handler = f"{func.__module__}.{func.__qualname__}"
+        succeeded = _API_HANDLER_DURATION.labels(handler, "success")
+        failed = _API_HANDLER_DURATION.labels(handler, "error")
+
+        def record_failure(elapsed_ns: int, error: Exception) -> None:
+            failed.observe_ns(elapsed_ns)
+            api_logger.warning(
+                f"Performance: {func.__name__} failed",
+                function=func.__name__,
+                execution_time_ms=elapsed_ns / 1e6,
+                status="error",
+                error=str(error),
+            )
+
         if asyncio.iscoroutinefunction(func):
 
             @functools.wraps(func)
             async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-                start_time = time.time()
-                api_logger.debug(
-                    f"Performance tracking started for {func.__name__}",
-                    function=func.__name__,
-                )
+                start = time.perf_counter_ns()
                 try:
                     result = await func(*args, **kwargs)
-                    execution_time = (time.time() - start_time) * 1000  # ms
-                    api_logger.info(
-                        f"Performance: {func.__name__} completed",
-                        function=func.__name__,
-                        execution_time_ms=execution_time,
-                        status="success",
-                    )
-                    return result
                 except Exception as e:
-                    execution_time = (time.time() - start_time) * 1000  # ms
-                    api_logger.warning(
-                        f"Performance: {func.__name__} failed",
-                        function=func.__name__,
-                        execution_time_ms=execution_time,
-                        status="error",
-                        error=str(e),
-                    )
+                    record_failure(time.perf_counter_ns() - start, e)
                     raise
+                succeeded.observe_ns(time.perf_counter_ns() - start)
+                return result
 
             return async_wrapper
         else:
 
             @functools.wraps(func)
             def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-                start_time = time.time()
-                api_logger.debug(
-                    f"Performance tracking started for {func.__name__}",
-                    function=func.__name__,
-                )
+                start = time.perf_counter_ns()
                 try:
                     result = func(*args, **kwargs)
-                    execution_time = (time.time() - start_time) * 1000  # ms
-                    api_logger.info(
-                        f"Performance: {func.__name__} completed",
-                        function=func.__name__,
-                        execution_time_ms=execution_time,
-                        status="success",
-                    )
-                    return result
                 except Exception as e:
-                    execution_time = (time.time() - start_time) * 1000  # ms
-                    api_logger.warning(
-                        f"Performance: {func.__name__} failed",
-                        function=func.__name__,
-                        execution_time_ms=execution_time,
-                        status="error",
-                        error=str(e),
-                    )
+                    record_failure(time.perf_counter_ns() - start, e)
                     raise
+                succeeded.observe_ns(time.perf_counter_ns() - start)
+                return result
 
             return sync_wrapper
 
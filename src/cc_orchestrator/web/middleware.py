@@ -5,17 +5,18 @@ This module provides custom middleware for logging, rate limiting,
 request tracking, and other cross-cutting concerns.
 """
 
+import math
 import time
 import uuid
-from collections import defaultdict
 from collections.abc import Callable
-from datetime import datetime, timedelta
 from typing import Any, cast
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from ..utils.tracing import Span, start_span
 from .logging_utils import log_api_request, log_api_response
+from .rate_limit_engine import Quota, RateLimitEngine
 
 
 class RequestIDMiddleware(BaseHTTPMiddleware):
@@ -34,6 +35,55 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class TracingMiddleware(BaseHTTPMiddleware):
+    """Open the root trace span of each request."""
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[..., Any]
+    ) -> Response:
+        """Trace the request and expose the trace ID in a response header."""
+        method = request.method
+        with start_span(
+            f"{method} {request.url.path}",
+            kind="server",
+            request_id=getattr(request.state, "request_id", None),
+        ) as span:
+            span.set_attribute("http.method", method)
+            span.set_attribute("http.target", request.url.path)
+
+            response = cast(Response, await call_next(request))
+
+            if isinstance(span, Span):
+                # Name the span after the matched route, not the raw path
+                route = self._route_template(request)
+                if route is not None:
+                    span.name = f"{method} {route}"
+                    span.set_attribute("http.route", route)
+                span.set_attribute("http.status_code", response.status_code)
+                response.headers["X-Trace-ID"] = span.trace_id
+
+        return response
+
+    @staticmethod
+    def _route_template(request: Request) -> str | None:
+        """Rebuild the full path template of the matched route.
+
+        Routes of included routers only know their path below the router
+        prefix, so the prefix is recovered from the request path.
+        """
+        path_format = getattr(request.scope.get("route"), "path_format", None)
+        if path_format is None:
+            return None
+        try:
+            concrete = path_format.format(**request.path_params)
+        except (KeyError, IndexError, ValueError):
+            return path_format
+        path = request.url.path
+        if not path.endswith(concrete):
+            return path_format
+        return path[: len(path) - len(concrete)] + path_format
+
+
 class LoggingMiddleware(BaseHTTPMiddleware):
     """Log API requests and responses with timing information."""
 
@@ -98,11 +148,17 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """Simple rate limiting middleware based on client IP."""
 
-    def __init__(self, app: Any, requests_per_minute: int = 60):
+    def __init__(
+        self,
+        app: Any,
+        requests_per_minute: int = 60,
+        engine: RateLimitEngine | None = None,
+    ):
         """Initialize rate limiter with requests per minute limit."""
         super().__init__(app)
         self.requests_per_minute = requests_per_minute
-        self.client_requests: dict[str, list[datetime]] = defaultdict(list)
+        self.quota = Quota(limit=requests_per_minute, period=60.0)
+        self.engine = engine if engine is not None else RateLimitEngine()
 
     async def dispatch(
         self, request: Request, call_next: Callable[..., Any]
@@ -110,38 +166,23 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         """Check rate limit and process request if allowed."""
         client_ip = self._get_client_ip(request)
 
-        # Clean old requests (older than 1 minute)
-        now = datetime.now()
-        cutoff = now - timedelta(minutes=1)
-        self.client_requests[client_ip] = [
-            req_time
-            for req_time in self.client_requests[client_ip]
-            if req_time > cutoff
-        ]
-
-        # Check if rate limit exceeded
-        if len(self.client_requests[client_ip]) >= self.requests_per_minute:
+        decision = self.engine.hit(client_ip, self.quota)
+        if not decision.allowed:
             return Response(
                 content='{"error": "Rate limit exceeded", "message": "Too many requests"}',
                 status_code=429,
                 media_type="application/json",
-                headers={"Retry-After": "60"},
+                headers={"Retry-After": str(math.ceil(decision.retry_after))},
             )
 
-        # Record this request
-        self.client_requests[client_ip].append(now)
-
         # Process request
         response = cast(Response, await call_next(request))
 
         # Add rate limit headers
-        remaining = max(
-            0, self.requests_per_minute - len(self.client_requests[client_ip])
-        )
         response.headers["X-RateLimit-Limit"] = str(self.requests_per_minute)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
+        response.headers["X-RateLimit-Remaining"] = str(decision.remaining)
         response.headers["X-RateLimit-Reset"] = str(
-            int((now + timedelta(minutes=1)).timestamp())
+            int(time.time() + decision.reset_after)
         )
 
         return response
@@ -1,12 +1,13 @@
 """
 Rate limiting middleware for API endpoints and WebSocket connections.
 
-Implements token bucket algorithm with IP-based and user-based rate limiting.
+Limits are enforced per client IP by the shared ``RateLimitEngine``, with
+stricter rules for expensive endpoints matched by route pattern.
 """
 
 import asyncio
+import math
 import time
-from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any
 
@@ -15,6 +16,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
 
 from ...utils.logging import LogContext, get_logger
+from ..rate_limit_engine import Decision, Quota, RateLimitEngine, RouteRules
 
 logger = get_logger(__name__, LogContext.WEB)
 
@@ -27,56 +29,14 @@ class RateLimitRule:
     burst_allowance: int = 0  # Additional requests allowed in burst
     block_duration_seconds: int = 60  # How long to block after limit exceeded
 
-
-class TokenBucket:
-    """Token bucket implementation for rate limiting."""
-
-    def __init__(self, capacity: int, refill_rate: float):
-        """
-        Initialize token bucket.
-
-        Args:
-            capacity: Maximum number of tokens
-            refill_rate: Tokens per second refill rate
-        """
-        self.capacity = capacity
-        self.tokens = capacity
-        self.refill_rate = refill_rate
-        self.last_refill = time.time()
-        self.blocked_until = 0.0
-
-    def consume(self, tokens: int = 1) -> bool:
-        """
-        Try to consume tokens from bucket.
-
-        Args:
-            tokens: Number of tokens to consume
-
-        Returns:
-            True if tokens were consumed, False if rate limited
-        """
-        now = time.time()
-
-        # Check if still blocked
-        if now < self.blocked_until:
-            return False
-
-        # Refill tokens
-        time_passed = now - self.last_refill
-        self.tokens = min(self.capacity, self.tokens + (time_passed * self.refill_rate))
-        self.last_refill = now
-
-        # Try to consume tokens
-        if self.tokens >= tokens:
-            self.tokens -= tokens
-            return True
-        else:
-            # Block for the configured duration
-            self.blocked_until = now + 60  # 1 minute block
-            logger.warning(
-                "Rate limit exceeded, blocking access", blocked_until=self.blocked_until
-            )
-            return False
+    def to_quota(self) -> Quota:
+        """Get the engine quota enforcing this rule."""
+        return Quota(
+            limit=self.requests_per_minute,
+            period=60.0,
+            burst=self.burst_allowance,
+            block=self.block_duration_seconds,
+        )
 
 
 class RateLimiter:
@@ -90,34 +50,30 @@ class RateLimiter:
     - Different rules for different endpoint patterns
     """
 
-    def __init__(self):
-        # IP-based rate limiting
-        self.ip_buckets: dict[str, TokenBucket] = defaultdict(
-            lambda: TokenBucket(
-                capacity=100, refill_rate=100 / 60
-            )  # 100 requests per minute
+    def __init__(self, engine: RateLimitEngine | None = None):
+        self.engine = engine if engine is not None else RateLimitEngine()
+
+        # IP-based rate limiting: 100 requests per minute
+        self.default_rule = RateLimitRule(requests_per_minute=100)
+
+        # WebSocket connection rate limiting: 5 connections per minute
+        self.websocket_rule = RateLimitRule(requests_per_minute=5)
+
+        # API endpoint specific limits, keyed by route pattern
+        self.endpoint_rules: RouteRules[RateLimitRule] = RouteRules(
+            {
+                "/api/v1/logs/search": RateLimitRule(
+                    requests_per_minute=20, burst_allowance=5
+                ),
+                "/api/v1/logs/export": RateLimitRule(
+                    requests_per_minute=5, burst_allowance=2
+                ),
+                "/api/v1/logs/stream/start": RateLimitRule(
+                    requests_per_minute=10, burst_allowance=3
+                ),
+            }
         )
 
-        # WebSocket connection rate limiting
-        self.websocket_ip_buckets: dict[str, TokenBucket] = defaultdict(
-            lambda: TokenBucket(
-                capacity=5, refill_rate=5 / 60
-            )  # 5 connections per minute
-        )
-
-        # API endpoint specific limits
-        self.endpoint_rules = {
-            "/api/v1/logs/search": RateLimitRule(
-                requests_per_minute=20, burst_allowance=5
-            ),
-            "/api/v1/logs/export": RateLimitRule(
-                requests_per_minute=5, burst_allowance=2
-            ),
-            "/api/v1/logs/stream/start": RateLimitRule(
-                requests_per_minute=10, burst_allowance=3
-            ),
-        }
-
         # Cleanup task
         self.cleanup_task: asyncio.Task[None] | None = None
 
@@ -133,36 +89,40 @@ class RateLimiter:
                 await self.cleanup_task
             except asyncio.CancelledError:
                 pass
+        self.engine.reset()
 
-    def check_api_rate_limit(self, request: Request, client_ip: str) -> bool:
+    def check_api_request(self, request: Request, client_ip: str) -> Decision:
         """
-        Check rate limit for API requests.
+        Count an API request against the limits of its client.
 
         Args:
             request: FastAPI request object
             client_ip: Client IP address
 
         Returns:
-            True if request is allowed, False if rate limited
+            Decision with the client's remaining quota
         """
-        # Get the appropriate bucket for this IP
-        bucket = self.ip_buckets[client_ip]
+        key, rule = self._resolve(client_ip, request.url.path)
+        decision = self.engine.hit(key, rule.to_quota())
+        if not decision.allowed:
+            logger.warning(
+                "Rate limit exceeded, blocking access",
+                blocked_for=round(decision.retry_after, 1),
+            )
+        return decision
 
-        # Check endpoint-specific limits
-        path = request.url.path
-        if path in self.endpoint_rules:
-            rule = self.endpoint_rules[path]
-            # Create or get specific bucket for this endpoint
-            endpoint_key = f"{client_ip}:{path}"
-            if endpoint_key not in self.ip_buckets:
-                capacity = rule.requests_per_minute + rule.burst_allowance
-                refill_rate = rule.requests_per_minute / 60
-                self.ip_buckets[endpoint_key] = TokenBucket(capacity, refill_rate)
+    def check_api_rate_limit(self, request: Request, client_ip: str) -> bool:
+        """
+        Check rate limit for API requests.
 
-            return self.ip_buckets[endpoint_key].consume()
+        Args:
+            request: FastAPI request object
+            client_ip: Client IP address
 
-        # Use general rate limiting
-        return bucket.consume()
+        Returns:
+            True if request is allowed, False if rate limited
+        """
+        return self.check_api_request(request, client_ip).allowed
 
     def check_websocket_rate_limit(self, client_ip: str) -> bool:
         """
@@ -174,8 +134,8 @@ class RateLimiter:
         Returns:
             True if connection is allowed, False if rate limited
         """
-        bucket = self.websocket_ip_buckets[client_ip]
-        return bucket.consume()
+        quota = self.websocket_rule.to_quota()
+        return self.engine.hit(("ws", client_ip), quota).allowed
 
     def get_rate_limit_info(
         self, client_ip: str, endpoint: str | None = None
@@ -190,55 +150,28 @@ class RateLimiter:
         Returns:
             Dict with rate limit information
         """
-        key = (
-            f"{client_ip}:{endpoint}"
-            if endpoint and endpoint in self.endpoint_rules
-            else client_ip
-        )
-        bucket = self.ip_buckets.get(key, self.ip_buckets[client_ip])
-
-        return {
-            "remaining_tokens": int(bucket.tokens),
-            "capacity": bucket.capacity,
-            "reset_time": bucket.last_refill + 60,  # Next minute boundary
-            "blocked_until": (
-                bucket.blocked_until if bucket.blocked_until > time.time() else None
-            ),
-        }
+        key, rule = self._resolve(client_ip, endpoint)
+        return rate_limit_info(self.engine.peek(key, rule.to_quota()))
+
+    def _resolve(
+        self, client_ip: str, path: str | None
+    ) -> tuple[tuple[str, ...], RateLimitRule]:
+        match = self.endpoint_rules.match(path) if path else None
+        if match is None:
+            return ("api", client_ip), self.default_rule
+        pattern, rule = match
+        return ("api", client_ip, pattern), rule
 
     async def _cleanup_old_buckets(self) -> None:
-        """Cleanup old unused token buckets periodically."""
+        """Drop state of idle clients periodically."""
         while True:
             try:
                 await asyncio.sleep(300)  # Cleanup every 5 minutes
 
-                current_time = time.time()
-                cutoff_time = current_time - 600  # Remove buckets unused for 10 minutes
-
-                # Cleanup IP buckets
-                old_keys = [
-                    key
-                    for key, bucket in self.ip_buckets.items()
-                    if bucket.last_refill < cutoff_time
-                ]
-                for key in old_keys:
-                    del self.ip_buckets[key]
-
-                # Cleanup WebSocket buckets
-                old_ws_keys = [
-                    key
-                    for key, bucket in self.websocket_ip_buckets.items()
-                    if bucket.last_refill < cutoff_time
-                ]
-                for key in old_ws_keys:
-                    del self.websocket_ip_buckets[key]
-
-                if old_keys or old_ws_keys:
-                    logger.info(
-                        "Cleaned up old rate limit buckets",
-                        ip_buckets_removed=len(old_keys),
-                        websocket_buckets_removed=len(old_ws_keys),
-                    )
+                # Forget clients unseen for 10 minutes
+                removed = self.engine.expire(idle=600)
+                if removed:
+                    logger.info("Cleaned up old rate limit buckets", removed=removed)
 
             except asyncio.CancelledError:
                 break
@@ -246,6 +179,25 @@ class RateLimiter:
                 logger.error("Rate limiter cleanup failed", exception=e)
 
 
+def rate_limit_info(decision: Decision) -> dict[str, Any]:
+    """
+    Describe a rate limit decision.
+
+    Args:
+        decision: Decision of the engine
+
+    Returns:
+        Dict with rate limit information
+    """
+    now = time.time()
+    return {
+        "remaining_tokens": decision.remaining,
+        "capacity": decision.limit,
+        "reset_time": now + decision.reset_after,
+        "blocked_until": now + decision.retry_after if not decision.allowed else None,
+    }
+
+
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """FastAPI middleware for rate limiting."""
 
@@ -263,7 +215,9 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
 
         # Check rate limit
-        if not self.rate_limiter.check_api_rate_limit(request, client_ip):
+        decision = self.rate_limiter.check_api_request(request, client_ip)
+        rate_info = rate_limit_info(decision)
+        if not decision.allowed:
             logger.warning(
                 "Rate limit exceeded for API request",
                 client_ip=client_ip,
@@ -271,18 +225,13 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 method=request.method,
             )
 
-            # Get rate limit info for headers
-            rate_info = self.rate_limiter.get_rate_limit_info(
-                client_ip, request.url.path
-            )
-
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail="Rate limit exceeded. Please try again later.",
                 headers={
-                    "Retry-After": "60",
+                    "Retry-After": str(math.ceil(decision.retry_after)),
                     "X-RateLimit-Limit": str(rate_info["capacity"]),
-                    "X-RateLimit-Remaining": str(max(0, rate_info["remaining_tokens"])),
+                    "X-RateLimit-Remaining": str(rate_info["remaining_tokens"]),
                     "X-RateLimit-Reset": str(int(rate_info["reset_time"])),
                 },
             )
@@ -291,11 +240,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         response = await call_next(request)
 
         # Add rate limit headers to response
-        rate_info = self.rate_limiter.get_rate_limit_info(client_ip, request.url.path)
         response.headers["X-RateLimit-Limit"] = str(rate_info["capacity"])
-        response.headers["X-RateLimit-Remaining"] = str(
-            max(0, rate_info["remaining_tokens"])
-        )
+        response.headers["X-RateLimit-Remaining"] = str(rate_info["remaining_tokens"])
         response.headers["X-RateLimit-Reset"] = str(int(rate_info["reset_time"]))
 
         return response
@@ -0,0 +1,366 @@
+"""
+Rate limiting engine shared by every limiter of the web API.
+
+- Counters use GCRA (the generic cell rate algorithm). A key's whole state
+  is its theoretical arrival time, so a decision is a few float operations
+  and memory per key is constant, unlike a log of request timestamps.
+- Keys live in a fixed-capacity LRU. When it is full the least recently
+  used key is evicted, which at worst forgets part of a client's debt.
+- A timing wheel expires keys once their counters have fully recovered, so
+  cleanup costs O(1) per expired key instead of periodic full scans. Idle
+  keys can also be pruned from the head of the LRU, which is ordered by
+  last use.
+- Per-route rules are compiled into a path trie (``RouteRules``) matched
+  segment by segment, where ``*`` matches any single segment.
+
+The engine is not thread-safe; all limiters use it from the event loop.
+"""
+
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import dataclass
+from typing import Generic, NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+# Relative slack for float rounding when a request exactly fills the quota
+_EPSILON = 1e-9
+
+
+@dataclass(frozen=True, slots=True)
+class Quota:
+    """Allow ``limit`` requests per ``period`` seconds plus ``burst`` extra.
+
+    After a refused request the key stays refused for ``block`` seconds. A
+    quota without a positive ``limit`` refuses everything and one without a
+    positive ``period`` allows everything.
+    """
+
+    limit: int
+    period: float = 60.0
+    burst: int = 0
+    block: float = 0.0
+
+    @property
+    def capacity(self) -> int:
+        """Requests allowed back to back by a fully recovered key."""
+        return self.limit + self.burst
+
+    @property
+    def interval(self) -> float:
+        """Seconds for one request's worth of the quota to recover."""
+        return self.period / self.limit
+
+
+class Decision(NamedTuple):
+    """Outcome of a rate limit check."""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float
+    reset_after: float
+
+
+class _Entry:
+    __slots__ = ("tat", "blocked_until", "seen", "tick")
+
+    def __init__(self, now: float) -> None:
+        self.tat = now
+        self.blocked_until = 0.0
+        self.seen = now
+        self.tick: int | None = None
+
+    @property
+    def expires(self) -> float:
+        return max(self.tat, self.blocked_until)
+
+
+class RateLimitEngine:
+    """GCRA counters in a bounded LRU with timing-wheel expiry."""
+
+    def __init__(
+        self,
+        capacity: int = 100_000,
+        tick_seconds: float = 1.0,
+        wheel_size: int = 512,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            capacity: Maximum number of tracked keys
+            tick_seconds: Resolution of key expiry
+            wheel_size: Slots of the timing wheel; keys expiring further
+                ahead than ``wheel_size * tick_seconds`` are rescheduled
+                when their slot comes up
+            clock: Monotonic time source in seconds
+        """
+        self.capacity = capacity
+        self.tick_seconds = tick_seconds
+        self.clock = clock
+        self.evictions = 0
+        self.expirations = 0
+
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._wheel: list[list[tuple[Hashable, _Entry]]] = [
+            [] for _ in range(wheel_size)
+        ]
+        self._tick = int(clock() // tick_seconds)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def hit(self, key: Hashable, quota: Quota, cost: int = 1) -> Decision:
+        """Count a request against a key's quota.
+
+        Args:
+            key: Identity of the limited client and route
+            quota: Quota to enforce
+            cost: Requests this hit accounts for
+
+        Returns:
+            Whether the request is allowed and the key's remaining quota
+        """
+        now = self.clock()
+        self._advance(now)
+        if quota.capacity <= 0 or quota.limit <= 0:
+            return Decision(False, max(quota.capacity, 0), 0, math.inf, math.inf)
+        if quota.period <= 0:
+            return Decision(True, quota.capacity, quota.capacity, 0.0, 0.0)
+
+        entries = self._entries
+        entry = entries.get(key)
+        if entry is None:
+            entry = _Entry(now)
+            entries[key] = entry
+            if len(entries) > self.capacity:
+                entries.popitem(last=False)
+                self.evictions += 1
+        else:
+            entries.move_to_end(key)
+            entry.seen = now
+
+        interval = quota.interval
+        window = quota.capacity * interval * (1 + _EPSILON)
+        if now < entry.blocked_until:
+            decision = Decision(
+                False,
+                quota.capacity,
+                0,
+                entry.blocked_until - now,
+                entry.expires - now,
+            )
+        else:
+            tat = max(entry.tat, now) + interval * cost
+            if tat - now <= window:
+                entry.tat = tat
+                decision = Decision(
+                    True,
+                    quota.capacity,
+                    int((window - (tat - now)) / interval),
+                    0.0,
+                    tat - now,
+                )
+            else:
+                if quota.block:
+                    entry.blocked_until = now + quota.block
+                retry_after = max(tat - window - now, entry.blocked_until - now)
+                decision = Decision(
+                    False, quota.capacity, 0, retry_after, entry.expires - now
+                )
+
+        if entry.tick is None:
+            self._schedule(key, entry)
+        return decision
+
+    def peek(self, key: Hashable, quota: Quota) -> Decision:
+        """Report a key's quota without counting a request or tracking it.
+
+        Args:
+            key: Identity of the limited client and route
+            quota: Quota the key is checked against
+
+        Returns:
+            Whether a request would be allowed right now
+        """
+        now = self.clock()
+        if quota.capacity <= 0 or quota.limit <= 0:
+            return Decision(False, max(quota.capacity, 0), 0, math.inf, math.inf)
+        if quota.period <= 0:
+            return Decision(True, quota.capacity, quota.capacity, 0.0, 0.0)
+        entry = self._entries.get(key)
+        if entry is None:
+            return Decision(True, quota.capacity, quota.capacity, 0.0, 0.0)
+
+        interval = quota.interval
+        window = quota.capacity * interval * (1 + _EPSILON)
+        debt = max(entry.tat - now, 0.0)
+        remaining = int((window - debt) / interval)
+        blocked = max(entry.blocked_until - now, 0.0)
+        retry_after = max(debt + interval - window, blocked, 0.0)
+        return Decision(
+            remaining > 0 and not blocked,
+            quota.capacity,
+            remaining if not blocked else 0,
+            retry_after,
+            max(entry.expires - now, 0.0),
+        )
+
+    def reset(self, key: Hashable | None = None) -> None:
+        """Forget one key, or every key."""
+        if key is None:
+            self._entries.clear()
+            for slot in self._wheel:
+                slot.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def expire(self, idle: float | None = None) -> int:
+        """Drop keys that have fully recovered.
+
+        Expiry also happens on every hit; calling this only matters when
+        traffic stops.
+
+        Args:
+            idle: Also drop keys not hit for this many seconds, even if
+                they are still limited
+
+        Returns:
+            Number of keys dropped
+        """
+        before = self.expirations
+        now = self.clock()
+        self._advance(now)
+        if idle is not None:
+            entries = self._entries
+            cutoff = now - idle
+            while entries:
+                key = next(iter(entries))
+                if entries[key].seen > cutoff:
+                    break
+                del entries[key]
+                self.expirations += 1
+        return self.expirations - before
+
+    def _schedule(self, key: Hashable, entry: _Entry) -> None:
+        size = len(self._wheel)
+        target = math.ceil(entry.expires / self.tick_seconds)
+        target = min(max(target, self._tick + 1), self._tick + size - 1)
+        entry.tick = target
+        self._wheel[target % size].append((key, entry))
+
+    def _advance(self, now: float) -> None:
+        now_tick = int(now // self.tick_seconds)
+        previous = self._tick
+        if now_tick <= previous:
+            return
+        self._tick = now_tick
+
+        size = len(self._wheel)
+        entries = self._entries
+        for tick in range(previous + 1, previous + 1 + min(now_tick - previous, size)):
+            index = tick % size
+            due = self._wheel[index]
+            if not due:
+                continue
+            self._wheel[index] = []
+            for key, entry in due:
+                # Evicted or replaced keys leave stale slots behind
+                if entries.get(key) is not entry:
+                    continue
+                entry.tick = None
+                if entry.expires <= now:
+                    del entries[key]
+                    self.expirations += 1
+                else:
+                    self._schedule(key, entry)
+
+
+class _RouteNode(Generic[T]):
+    __slots__ = ("children", "wildcard", "pattern", "value")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _RouteNode[T]] = {}
+        self.wildcard: _RouteNode[T] | None = None
+        self.pattern: str | None = None
+        self.value: T | None = None
+
+
+class RouteRules(Generic[T]):
+    """Per-route values compiled into a path trie.
+
+    Patterns are paths whose ``*`` segments match any single segment, e.g.
+    ``/api/v1/instances/*/start``. Literal segments win over wildcards.
+    """
+
+    def __init__(self, rules: Mapping[str, T] | None = None) -> None:
+        """Initialize the rules.
+
+        Args:
+            rules: Values keyed by route pattern
+        """
+        self._root: _RouteNode[T] = _RouteNode()
+        self._patterns: dict[str, T] = {}
+        for pattern, value in (rules or {}).items():
+            self.add(pattern, value)
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def __contains__(self, pattern: object) -> bool:
+        return pattern in self._patterns
+
+    def items(self) -> list[tuple[str, T]]:
+        """Get the patterns with their values."""
+        return list(self._patterns.items())
+
+    def add(self, pattern: str, value: T) -> None:
+        """Add or replace the value of a route pattern."""
+        node = self._root
+        for segment in pattern.split("/"):
+            if segment == "*":
+                if node.wildcard is None:
+                    node.wildcard = _RouteNode()
+                node = node.wildcard
+            else:
+                node = node.children.setdefault(segment, _RouteNode())
+        node.pattern = pattern
+        node.value = value
+        self._patterns[pattern] = value
+
+    def match(self, path: str) -> tuple[str, T] | None:
+        """Find the most specific pattern matching a path.
+
+        Args:
+            path: Request path
+
+        Returns:
+            The matching pattern and its value, or None
+        """
+        if not self._patterns:
+            return None
+        node = self._match(self._root, path.split("/"), 0)
+        if node is None:
+            return None
+        assert node.pattern is not None and node.value is not None
+        return node.pattern, node.value
+
+    def _match(
+        self, node: _RouteNode[T], segments: list[str], index: int
+    ) -> _RouteNode[T] | None:
+        if index == len(segments):
+            return node if node.pattern is not None else None
+        child = node.children.get(segments[index])
+        if child is not None:
+            found = self._match(child, segments, index + 1)
+            if found is not None:
+                return found
+        if node.wildcard is not None:
+            return self._match(node.wildcard, segments, index + 1)
+        return None
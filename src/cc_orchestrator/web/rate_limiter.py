@@ -1,6 +1,5 @@
 """Rate limiting functionality for API endpoints."""
 
-import time
 from collections import defaultdict
 from collections.abc import Callable
 from typing import Any
@@ -8,59 +7,34 @@ from typing import Any
 from fastapi import Request
 
 from .exceptions import RateLimitExceededError
+from .rate_limit_engine import Quota, RateLimitEngine
 
 
 class InMemoryRateLimiter:
     """Simple in-memory rate limiter implementation."""
 
-    def __init__(self) -> None:
-        # Store request counts per client IP
-        # Format: {ip: {endpoint: [timestamp, ...]}}
-        self.request_history: dict[str, dict[str, list[float]]] = defaultdict(
-            lambda: defaultdict(list)
-        )
+    def __init__(self, engine: RateLimitEngine | None = None) -> None:
+        # Counters per (client IP, endpoint)
+        self.engine = engine if engine is not None else RateLimitEngine()
 
     def check_rate_limit(
         self, client_ip: str, endpoint: str, limit: int, window_seconds: int
     ) -> None:
         """Check if request is within rate limit."""
-        current_time = time.time()
-        window_start = current_time - window_seconds
-
-        # Clean old requests outside the window
-        client_history = self.request_history[client_ip][endpoint]
-        self.request_history[client_ip][endpoint] = [
-            req for req in client_history if req > window_start
-        ]
-
-        # Count requests in current window
-        current_requests = len(self.request_history[client_ip][endpoint])
-
-        if current_requests >= limit:
+        quota = Quota(limit=limit, period=window_seconds)
+        if not self.engine.hit((client_ip, endpoint), quota).allowed:
             raise RateLimitExceededError(limit, f"{window_seconds}s")
 
-        # Record this request
-        self.request_history[client_ip][endpoint].append(current_time)
+    def remaining(
+        self, client_ip: str, endpoint: str, limit: int, window_seconds: int
+    ) -> int:
+        """Get how many more requests are allowed right now."""
+        quota = Quota(limit=limit, period=window_seconds)
+        return self.engine.peek((client_ip, endpoint), quota).remaining
 
     def cleanup_old_entries(self, max_age_seconds: int = 3600) -> None:
         """Clean up old entries to prevent memory bloat."""
-        cutoff_time = time.time() - max_age_seconds
-
-        for client_ip in list(self.request_history.keys()):
-            for endpoint in list(self.request_history[client_ip].keys()):
-                self.request_history[client_ip][endpoint] = [
-                    req
-                    for req in self.request_history[client_ip][endpoint]
-                    if req > cutoff_time
-                ]
-
-                # Remove empty endpoint entries
-                if not self.request_history[client_ip][endpoint]:
-                    del self.request_history[client_ip][endpoint]
-
-            # Remove empty client entries
-            if not self.request_history[client_ip]:
-                del self.request_history[client_ip]
+        self.engine.expire(idle=max_age_seconds)
 
 
 # Global rate limiter instance
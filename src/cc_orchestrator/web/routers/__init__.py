@@ -2,6 +2,7 @@
 
 from .api import router as api_router
 from .auth import router as auth_router
+from .debug import router as debug_router
 from .websocket import router as websocket_router
 
-__all__ = ["api_router", "auth_router", "websocket_router"]
+__all__ = ["api_router", "auth_router", "debug_router", "websocket_router"]
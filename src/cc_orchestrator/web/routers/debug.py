@@ -0,0 +1,104 @@
+"""Diagnostic endpoints for operators."""
+
+import asyncio
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from ...utils.profiling import MAX_PROFILE_SECONDS, StackSampler
+from ...utils.tracing import get_tracer
+from ..dependencies import CurrentUser, get_current_user
+
+
+async def require_admin(
+    current_user: CurrentUser = Depends(get_current_user),
+) -> CurrentUser:
+    """Restrict diagnostics to users with the admin permission."""
+    if "admin" not in current_user.permissions:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Permission 'admin' required",
+        )
+    return current_user
+
+
+router = APIRouter(tags=["debug"], dependencies=[Depends(require_admin)])
+
+# Held while a profile runs; profiles do not overlap
+_profile_lock = asyncio.Lock()
+
+
+@router.get("/traces")
+async def list_traces(
+    limit: int = Query(50, ge=1, le=500, description="Maximum traces returned"),
+    min_duration_ms: float = Query(
+        0.0, ge=0.0, description="Only traces at least this slow"
+    ),
+    name: str | None = Query(
+        None, description="Only traces whose root span name contains this text"
+    ),
+) -> dict[str, Any]:
+    """List recently finished traces, newest first, as span trees."""
+    tracer = get_tracer()
+    exporter = tracer.memory_exporter
+    traces = exporter.traces(limit, min_duration_ms, name) if exporter else []
+    return {
+        "sample_rate": tracer.sample_rate,
+        "capacity": exporter.capacity if exporter else 0,
+        "traces": [trace.to_dict() for trace in traces],
+    }
+
+
+@router.get("/traces/{trace_id}")
+async def get_trace(trace_id: str) -> dict[str, Any]:
+    """Get one trace as a span tree."""
+    exporter = get_tracer().memory_exporter
+    trace = exporter.get(trace_id) if exporter else None
+    if trace is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Trace {trace_id} not found",
+        )
+    return trace.to_dict()
+
+
+@router.get("/profile", response_model=None)
+async def profile(
+    seconds: float = Query(
+        5.0, gt=0.0, le=MAX_PROFILE_SECONDS, description="How long to sample"
+    ),
+    interval_ms: float = Query(
+        5.0, ge=1.0, le=1000.0, description="Milliseconds between samples"
+    ),
+    output: str = Query(
+        "collapsed",
+        pattern="^(collapsed|json)$",
+        description="'collapsed' stacks for flame graph tools, or a 'json' summary",
+    ),
+    include_idle: bool = Query(
+        False, description="Keep samples of threads blocked waiting for work"
+    ),
+) -> PlainTextResponse | dict[str, Any]:
+    """Sample the stacks of the server's threads for a while.
+
+    The event loop keeps serving requests while the sampler runs on its own
+    thread, so the profile shows the server under its real load.
+    """
+    if _profile_lock.locked():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A profile is already running",
+        )
+
+    async with _profile_lock:
+        sampler = StackSampler(interval=interval_ms / 1000, include_idle=include_idle)
+        sampler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            await asyncio.to_thread(sampler.stop)
+
+    if output == "json":
+        return sampler.to_dict()
+    return PlainTextResponse(sampler.collapsed())
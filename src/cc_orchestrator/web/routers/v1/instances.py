@@ -5,18 +5,24 @@ This module provides REST API endpoints for managing Claude Code instances,
 including CRUD operations, status updates, and health monitoring.
 """
 
-from typing import Any
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from ....database.models import InstanceStatus
+from ....daemon.client import connect_daemon_async
+from ....database.crud import DEFERRED_COLUMNS
+from ....database.models import Instance, InstanceStatus
 from ...crud_adapter import CRUDBase
 from ...dependencies import (
     PaginationParams,
     get_crud,
+    get_database_id,
     get_pagination_params,
+    parse_fields,
+    parse_include,
     validate_instance_id,
 )
+from ...exceptions import InstanceOperationError
 from ...logging_utils import handle_api_errors, track_api_performance
 from ...schemas import (
     APIResponse,
@@ -24,10 +30,49 @@ from ...schemas import (
     InstanceResponse,
     InstanceUpdate,
     PaginatedResponse,
+    compile_row_encoder,
+    expand_relationships,
+    list_fields,
 )
 
 router = APIRouter()
 
+# Relationships the list endpoint can embed via ``?include=``
+INSTANCES_INCLUDES = ("tasks", "worktree")
+
+
+async def _run_on_daemon(
+    method: str, instance: Instance, database_id: str | None, **params: Any
+) -> dict[str, Any] | None:
+    """Run an instance operation on the orchestrator daemon.
+
+    Args:
+        method: RPC method name
+        instance: Instance the operation applies to
+        database_id: Identifier of the database the instance is stored in;
+            without one no daemon can be trusted with it
+        **params: Further method parameters
+
+    Returns:
+        The operation result, or None when no daemon of this database is
+        running
+
+    Raises:
+        InstanceOperationError: If the daemon could not perform the operation
+    """
+    client = await connect_daemon_async()
+    if client is None:
+        return None
+    async with client:
+        # A daemon working on another database does not own the instance
+        status = await client.call("ping")
+        if database_id is None or status.get("database_id") != database_id:
+            return None
+        result = await client.call(method, issue_id=instance.issue_id, **params)
+    if "error" in result:
+        raise InstanceOperationError(result["error"], instance.id)
+    return result
+
 
 @router.get("/", response_model=PaginatedResponse)
 @track_api_performance()
@@ -36,6 +81,14 @@ async def list_instances(
     pagination: PaginationParams = Depends(get_pagination_params),
     status_filter: InstanceStatus | None = Query(None, alias="status"),
     branch_name: str | None = Query(None, alias="branch"),
+    include: Annotated[
+        str | None,
+        Query(description="Comma-separated relationships to embed: tasks, worktree"),
+    ] = None,
+    fields: Annotated[
+        str | None,
+        Query(description="Comma-separated instance fields to return"),
+    ] = None,
     crud: CRUDBase = Depends(get_crud),
 ) -> dict[str, Any]:
     """
@@ -45,7 +98,16 @@ async def list_instances(
     - **size**: Items per page (default: 20, max: 100)
     - **status**: Filter by instance status
     - **branch**: Filter by branch name
+    - **include**: Relationships to embed (tasks, worktree)
+    - **fields**: Instance fields to return (default: all but large JSON fields)
     """
+    include_fields = parse_include(include, INSTANCES_INCLUDES)
+    item_fields = list_fields(
+        InstanceResponse,
+        deferred=DEFERRED_COLUMNS[Instance],
+        requested=parse_fields(fields, InstanceResponse.model_fields),
+    )
+
     # Build filter criteria
     filters = {}
     if status_filter:
@@ -55,12 +117,18 @@ async def list_instances(
 
     # Get instances with pagination
     instances, total = await crud.list_instances(
-        offset=pagination.offset, limit=pagination.size, filters=filters
+        offset=pagination.offset,
+        limit=pagination.size,
+        filters=filters,
+        include=include_fields,
+        fields=item_fields,
     )
 
-    # Convert to response schemas
+    # Encode rows with the precompiled encoder instead of validating each model
+    encode = compile_row_encoder(InstanceResponse, item_fields)
     instance_responses = [
-        InstanceResponse.model_validate(instance) for instance in instances
+        expand_relationships(encode(instance), instance, include_fields)
+        for instance in instances
     ]
 
     return {
@@ -208,6 +276,7 @@ async def delete_instance(
 async def start_instance(
     instance_id: int = Depends(validate_instance_id),
     crud: CRUDBase = Depends(get_crud),
+    database_id: str | None = Depends(get_database_id),
 ) -> dict[str, Any]:
     """
     Start a Claude Code instance.
@@ -229,8 +298,16 @@ async def start_instance(
             detail="Instance is already running",
         )
 
-    # Update status to running
-    # TODO: Integrate with actual instance management system
+    # Launch the process when the orchestrator daemon runs; without it only
+    # the recorded status changes
+    await _run_on_daemon(
+        "instances.start",
+        instance,
+        database_id,
+        workspace_path=instance.workspace_path,
+        branch_name=instance.branch_name,
+        tmux_session=instance.tmux_session,
+    )
     updated_instance = await crud.update_instance(
         instance_id, {"status": InstanceStatus.RUNNING}
     )
@@ -248,6 +325,7 @@ async def start_instance(
 async def stop_instance(
     instance_id: int = Depends(validate_instance_id),
     crud: CRUDBase = Depends(get_crud),
+    database_id: str | None = Depends(get_database_id),
 ) -> dict[str, Any]:
     """
     Stop a Claude Code instance.
@@ -269,8 +347,9 @@ async def stop_instance(
             detail="Instance is already stopped",
         )
 
-    # Update status to stopped
-    # TODO: Integrate with actual instance management system
+    # Stop the process when the orchestrator daemon runs; without it only the
+    # recorded status changes
+    await _run_on_daemon("instances.stop", instance, database_id)
     updated_instance = await crud.update_instance(
         instance_id, {"status": InstanceStatus.STOPPED}
     )
@@ -667,15 +667,9 @@ async def cleanup_logs(
     """
     Clean up old log entries to manage storage.
     """
-    global log_storage
     try:
         cutoff_time = datetime.now() - timedelta(hours=older_than_hours)
-        initial_count = len(log_storage)
-
-        # Remove old entries
-        log_storage = [entry for entry in log_storage if entry.timestamp > cutoff_time]
-
-        deleted_count = initial_count - len(log_storage)
+        deleted_count = prune_log_storage(cutoff_time)
 
         logger.info(
             "Log cleanup completed",
@@ -694,6 +688,24 @@ async def cleanup_logs(
         raise HTTPException(status_code=500, detail="Log cleanup failed")
 
 
+def prune_log_storage(cutoff_time: datetime, batch_size: int | None = None) -> int:
+    """Remove log entries at or before the cutoff from the in-memory store.
+
+    The list is mutated in place so that references held by the retention
+    service and the streaming endpoints stay valid.
+
+    Args:
+        cutoff_time: Entries with timestamps at or before this are removed
+        batch_size: Unused for the in-memory store; accepted for pruner parity
+
+    Returns:
+        Number of entries removed
+    """
+    initial_count = len(log_storage)
+    log_storage[:] = [entry for entry in log_storage if entry.timestamp > cutoff_time]
+    return initial_count - len(log_storage)
+
+
 def _filter_log_entries(
     entries: list[LogEntry], search_request: LogSearchRequest
 ) -> list[LogEntry]:
@@ -6,29 +6,41 @@ including CRUD operations, status updates, and assignment to instances.
 """
 
 from datetime import UTC, datetime
-from typing import Any
+from typing import Annotated, Any, NoReturn
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 
-from ....database.models import TaskPriority, TaskStatus
+from ....database.crud import DEFERRED_COLUMNS
+from ....database.models import Task, TaskPriority, TaskStatus
 from ...crud_adapter import CRUDBase
 from ...dependencies import (
     PaginationParams,
     get_crud,
     get_pagination_params,
+    parse_fields,
+    parse_include,
     validate_task_id,
 )
 from ...logging_utils import handle_api_errors, track_api_performance
 from ...schemas import (
     APIResponse,
     PaginatedResponse,
+    TaskClaimRequest,
     TaskCreate,
+    TaskLeaseRequest,
+    TaskReleaseRequest,
     TaskResponse,
     TaskUpdate,
+    compile_row_encoder,
+    expand_relationships,
+    list_fields,
 )
 
 router = APIRouter()
 
+# Relationships the list endpoint can embed via ``?include=``
+TASKS_INCLUDES = ("instance", "worktree")
+
 
 @router.get("/", response_model=PaginatedResponse)
 @track_api_performance()
@@ -39,6 +51,14 @@ async def list_tasks(
     priority_filter: TaskPriority | None = Query(None, alias="priority"),
     instance_id: int | None = Query(None, alias="instance_id"),
     worktree_id: int | None = Query(None, alias="worktree_id"),
+    include: Annotated[
+        str | None,
+        Query(description="Comma-separated relationships to embed: instance, worktree"),
+    ] = None,
+    fields: Annotated[
+        str | None,
+        Query(description="Comma-separated task fields to return"),
+    ] = None,
     crud: CRUDBase = Depends(get_crud),
 ) -> dict[str, Any]:
     """
@@ -50,7 +70,17 @@ async def list_tasks(
     - **priority**: Filter by task priority
     - **instance_id**: Filter by assigned instance
     - **worktree_id**: Filter by associated worktree
+    - **include**: Relationships to embed (instance, worktree)
+    - **fields**: Task fields to return (default: all but requirements, results
+      and extra_metadata)
     """
+    include_fields = parse_include(include, TASKS_INCLUDES)
+    item_fields = list_fields(
+        TaskResponse,
+        deferred=DEFERRED_COLUMNS[Task],
+        requested=parse_fields(fields, TaskResponse.model_fields),
+    )
+
     # Build filter criteria
     filters = {}
     if status_filter:
@@ -64,11 +94,18 @@ async def list_tasks(
 
     # Get tasks with pagination
     tasks, total = await crud.list_tasks(
-        offset=pagination.offset, limit=pagination.size, filters=filters
+        offset=pagination.offset,
+        limit=pagination.size,
+        filters=filters,
+        include=include_fields,
+        fields=item_fields,
     )
 
-    # Convert to response schemas
-    task_responses = [TaskResponse.model_validate(task) for task in tasks]
+    # Encode rows with the precompiled encoder instead of validating each model
+    encode = compile_row_encoder(TaskResponse, item_fields)
+    task_responses = [
+        expand_relationships(encode(task), task, include_fields) for task in tasks
+    ]
 
     return {
         "items": task_responses,
@@ -127,6 +164,142 @@ async def create_task(
     }
 
 
+@router.post("/claim", response_model=APIResponse)
+@track_api_performance()
+@handle_api_errors()
+async def claim_task(
+    claim_data: TaskClaimRequest,
+    crud: CRUDBase = Depends(get_crud),
+) -> dict[str, Any]:
+    """
+    Atomically claim the next pending task for an instance.
+
+    The highest-priority, oldest pending task whose required capabilities are
+    offered is moved to in_progress under a lease. Concurrent callers never
+    receive the same task; a task whose lease expires is requeued.
+
+    - **instance_id**: Instance claiming the task
+    - **capabilities**: Capabilities the instance offers (omit to match any)
+    - **lease_seconds**: Lease duration before the task is requeued
+    """
+    instance = await crud.get_instance(claim_data.instance_id)
+    if not instance:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Instance with ID {claim_data.instance_id} not found",
+        )
+
+    task = await crud.claim_task(
+        claim_data.instance_id,
+        capabilities=claim_data.capabilities,
+        lease_seconds=claim_data.lease_seconds,
+    )
+    if task is None:
+        return {"success": True, "message": "No task available", "data": None}
+
+    return {
+        "success": True,
+        "message": "Task claimed successfully",
+        "data": TaskResponse.model_validate(task),
+    }
+
+
+@router.post("/{task_id}/lease", response_model=APIResponse)
+@track_api_performance()
+@handle_api_errors()
+async def renew_task_lease(
+    lease_data: TaskLeaseRequest,
+    task_id: int = Depends(validate_task_id),
+    crud: CRUDBase = Depends(get_crud),
+) -> dict[str, Any]:
+    """
+    Renew the lease on a claimed task.
+
+    Instances working on a claimed task must renew its lease before it
+    expires, otherwise the task is requeued for another instance.
+
+    - **task_id**: The ID of the claimed task
+    - **instance_id**: Instance holding the lease
+    - **lease_seconds**: New lease duration from now
+    """
+    task = await crud.renew_task_lease(
+        task_id, lease_data.instance_id, lease_seconds=lease_data.lease_seconds
+    )
+    if task is None:
+        await _raise_lease_not_held(crud, task_id, lease_data.instance_id)
+
+    return {
+        "success": True,
+        "message": "Task lease renewed successfully",
+        "data": TaskResponse.model_validate(task),
+    }
+
+
+@router.post("/{task_id}/release", response_model=APIResponse)
+@track_api_performance()
+@handle_api_errors()
+async def release_task(
+    release_data: TaskReleaseRequest,
+    task_id: int = Depends(validate_task_id),
+    crud: CRUDBase = Depends(get_crud),
+) -> dict[str, Any]:
+    """
+    Return a claimed task to the queue.
+
+    - **task_id**: The ID of the claimed task
+    - **instance_id**: Instance holding the lease
+    """
+    task = await crud.release_task(task_id, release_data.instance_id)
+    if task is None:
+        await _raise_lease_not_held(crud, task_id, release_data.instance_id)
+
+    return {
+        "success": True,
+        "message": "Task released successfully",
+        "data": TaskResponse.model_validate(task),
+    }
+
+
+async def _raise_lease_not_held(
+    crud: CRUDBase, task_id: int, instance_id: int
+) -> NoReturn:
+    """Raise 404 for a missing task, otherwise 409 as the lease is not held."""
+    if not await crud.get_task(task_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Task with ID {task_id} not found",
+        )
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=f"Instance {instance_id} does not hold a lease on task {task_id}",
+    )
+
+
+@router.get("/scheduler", response_model=APIResponse)
+@track_api_performance()
+@handle_api_errors()
+async def get_scheduler_metrics(request: Request) -> dict[str, Any]:
+    """
+    Get task scheduler throughput and fairness metrics.
+
+    Includes dispatch counts, queue depth, instance utilization, dispatches
+    per minute, average queue wait and Jain's fairness index over the tasks
+    dispatched to each instance.
+    """
+    scheduler = getattr(request.app.state, "scheduler", None)
+    if scheduler is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Task scheduler is not running",
+        )
+
+    return {
+        "success": True,
+        "message": "Scheduler metrics retrieved successfully",
+        "data": scheduler.get_metrics(),
+    }
+
+
 @router.get("/{task_id}", response_model=APIResponse)
 @track_api_performance()
 @handle_api_errors()
@@ -417,8 +590,15 @@ async def assign_task(
             detail=f"Instance with ID {instance_id} not found",
         )
 
-    # Assign task to instance
-    updated_task = await crud.update_task(task_id, {"instance_id": instance_id})
+    # Assign only if nobody reassigned the task since we read it
+    updated_task = await crud.assign_task(
+        task_id, instance_id, expected_instance_id=task.instance_id
+    )
+    if updated_task is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Task with ID {task_id} was reassigned concurrently",
+        )
 
     return {
         "success": True,
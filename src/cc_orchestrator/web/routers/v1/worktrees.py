@@ -5,16 +5,19 @@ This module provides REST API endpoints for managing git worktrees,
 including CRUD operations, status updates, and git integration.
 """
 
-from typing import Any
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import BaseModel
 
+from ....core.worktree_watcher import get_worktree_status_cache
 from ....database.models import WorktreeStatus
 from ...crud_adapter import CRUDBase
 from ...dependencies import (
     PaginationParams,
     get_crud,
     get_pagination_params,
+    parse_include,
     validate_worktree_id,
 )
 from ...logging_utils import handle_api_errors, track_api_performance
@@ -24,10 +27,40 @@ from ...schemas import (
     WorktreeCreate,
     WorktreeResponse,
     WorktreeUpdate,
+    expand_relationships,
 )
 
 router = APIRouter()
 
+# Relationships the list endpoint can embed via ``?include=``
+WORKTREES_INCLUDES = ("instance", "tasks")
+
+# Statuses the filesystem watcher is allowed to overwrite with live git state
+_WATCHED_STATUSES = (WorktreeStatus.ACTIVE.value, WorktreeStatus.DIRTY.value)
+
+
+def _cached_git_fields(path: str, current_status: Any) -> dict[str, Any]:
+    """Live git fields for a worktree from the watcher cache, if fresh."""
+    entry = get_worktree_status_cache().get(path)
+    if entry is None or entry.stale:
+        return {}
+
+    fields: dict[str, Any] = {
+        "current_commit": entry.commit,
+        "has_uncommitted_changes": entry.has_changes,
+    }
+    if getattr(current_status, "value", current_status) in _WATCHED_STATUSES:
+        fields["status"] = entry.status.value
+    return fields
+
+
+def _with_cached_status(response: WorktreeResponse) -> WorktreeResponse:
+    """Overlay watcher-cached git state onto a worktree response."""
+    if not isinstance(response, BaseModel):
+        return response
+    fields = _cached_git_fields(response.path, response.status)
+    return response.model_copy(update=fields) if fields else response
+
 
 @router.get("/", response_model=PaginatedResponse)
 @track_api_performance()
@@ -37,6 +70,10 @@ async def list_worktrees(
     status_filter: WorktreeStatus | None = Query(None, alias="status"),
     branch_name: str | None = Query(None, alias="branch"),
     instance_id: int | None = Query(None, alias="instance_id"),
+    include: Annotated[
+        str | None,
+        Query(description="Comma-separated relationships to embed: instance, tasks"),
+    ] = None,
     crud: CRUDBase = Depends(get_crud),
 ) -> dict[str, Any]:
     """
@@ -47,7 +84,10 @@ async def list_worktrees(
     - **status**: Filter by worktree status
     - **branch**: Filter by branch name
     - **instance_id**: Filter by associated instance
+    - **include**: Relationships to embed (instance, tasks)
     """
+    include_fields = parse_include(include, WORKTREES_INCLUDES)
+
     # Build filter criteria
     filters = {}
     if status_filter:
@@ -59,12 +99,20 @@ async def list_worktrees(
 
     # Get worktrees with pagination
     worktrees, total = await crud.list_worktrees(
-        offset=pagination.offset, limit=pagination.size, filters=filters
+        offset=pagination.offset,
+        limit=pagination.size,
+        filters=filters,
+        include=include_fields,
     )
 
     # Convert to response schemas
     worktree_responses = [
-        WorktreeResponse.model_validate(worktree) for worktree in worktrees
+        expand_relationships(
+            _with_cached_status(WorktreeResponse.model_validate(worktree)),
+            worktree,
+            include_fields,
+        )
+        for worktree in worktrees
     ]
 
     return {
@@ -145,7 +193,7 @@ async def get_worktree(
     return {
         "success": True,
         "message": "Worktree retrieved successfully",
-        "data": WorktreeResponse.model_validate(worktree),
+        "data": _with_cached_status(WorktreeResponse.model_validate(worktree)),
     }
 
 
@@ -288,6 +336,7 @@ async def get_worktree_status(
         "created_at": worktree.created_at,
         "updated_at": worktree.updated_at,
     }
+    status_data.update(_cached_git_fields(worktree.path, worktree.status))
 
     return {
         "success": True,
@@ -1,8 +1,10 @@
 """Pydantic schemas for API request/response validation."""
 
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from enum import Enum
-from typing import Any, Generic, TypeVar
+from functools import lru_cache
+from typing import Any, Generic, TypeVar, get_args
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -265,6 +267,27 @@ class TaskUpdate(BaseModel):
     worktree_id: int | None = None
 
 
+class TaskClaimRequest(BaseModel):
+    """Schema for claiming the next pending task."""
+
+    instance_id: int
+    capabilities: list[str] | None = None
+    lease_seconds: int = Field(default=900, ge=1, le=86400)
+
+
+class TaskLeaseRequest(BaseModel):
+    """Schema for renewing the lease on a claimed task."""
+
+    instance_id: int
+    lease_seconds: int = Field(default=900, ge=1, le=86400)
+
+
+class TaskReleaseRequest(BaseModel):
+    """Schema for returning a claimed task to the queue."""
+
+    instance_id: int
+
+
 class TaskResponse(BaseModel):
     """Schema for task responses."""
 
@@ -286,6 +309,8 @@ class TaskResponse(BaseModel):
     due_date: datetime | None = None
     estimated_duration: int | None = None
     actual_duration: int | None = None
+    lease_expires_at: datetime | None = None
+    attempts: int = 0
     requirements: dict[str, Any] = Field(default_factory=dict)
     results: dict[str, Any] = Field(default_factory=dict)
     extra_metadata: dict[str, Any] = Field(default_factory=dict)
@@ -306,6 +331,9 @@ class TaskResponse(BaseModel):
             return value.name.lower()
         return value
 
+    class Config:
+        from_attributes = True
+
 
 # Worktree Schemas
 class WorktreeCreate(BaseModel):
@@ -333,7 +361,7 @@ class WorktreeResponse(BaseModel):
     id: int
     name: str
     branch_name: str
-    base_branch: str
+    base_branch: str = "main"
     path: str
     active: bool = True
     created_at: datetime
@@ -349,6 +377,209 @@ class WorktreeResponse(BaseModel):
         from_attributes = True
 
 
+# Relationship summaries embedded via the ``include`` query parameter
+class InstanceSummary(BaseModel):
+    """Compact instance representation embedded in related resources."""
+
+    id: int
+    issue_id: str
+    status: str
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def validate_status(cls, value):
+        """Convert InstanceStatus enum to string value."""
+        if hasattr(value, "value"):
+            return value.value
+        return value
+
+    class Config:
+        from_attributes = True
+
+
+class TaskSummary(BaseModel):
+    """Compact task representation embedded in related resources."""
+
+    id: int
+    title: str
+    status: str
+    priority: str
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def validate_status(cls, value):
+        """Convert TaskStatus enum to string value."""
+        if hasattr(value, "value"):
+            return value.value
+        return value
+
+    @field_validator("priority", mode="before")
+    @classmethod
+    def validate_priority(cls, value):
+        """Convert TaskPriority enum to string value."""
+        if hasattr(value, "value"):
+            return value.name.lower()
+        return value
+
+    class Config:
+        from_attributes = True
+
+
+class WorktreeSummary(BaseModel):
+    """Compact worktree representation embedded in related resources."""
+
+    id: int
+    name: str
+    path: str
+    branch_name: str
+    status: str | None = None
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def validate_status(cls, value):
+        """Convert WorktreeStatus enum to string value."""
+        if hasattr(value, "value"):
+            return value.value
+        return value
+
+    class Config:
+        from_attributes = True
+
+
+RELATIONSHIP_SUMMARIES: dict[str, type[BaseModel]] = {
+    "instance": InstanceSummary,
+    "tasks": TaskSummary,
+    "worktree": WorktreeSummary,
+}
+
+
+def expand_relationships(
+    response: BaseModel | dict[str, Any], obj: Any, include: list[str] | None
+) -> BaseModel | dict[str, Any]:
+    """Embed eagerly loaded relationships into a serialized response.
+
+    Relationships are read from ``obj`` only when named in ``include``, so the
+    caller must have loaded them up front (see ``RELATIONSHIP_LOADERS``) to
+    avoid a lazy load per row.
+
+    Args:
+        response: Response schema or encoded dict already built from ``obj``
+        obj: ORM object the response was built from
+        include: Relationship names to embed
+
+    Returns:
+        The response unchanged, or a dict with the embedded relationships
+    """
+    if not include:
+        return response
+
+    data = dict(response) if isinstance(response, dict) else response.model_dump()
+    for name in include:
+        summary = RELATIONSHIP_SUMMARIES[name]
+        related = getattr(obj, name, None)
+        if related is None:
+            data[name] = None
+        elif isinstance(related, list):
+            data[name] = [summary.model_validate(item) for item in related]
+        else:
+            data[name] = summary.model_validate(related)
+    return data
+
+
+def list_fields(
+    schema: type[BaseModel],
+    deferred: Iterable[str] = (),
+    requested: Iterable[str] | None = None,
+) -> tuple[str, ...]:
+    """Resolve the response fields a list endpoint should return.
+
+    Args:
+        schema: Response schema describing the full item
+        deferred: Heavy fields omitted unless explicitly requested
+        requested: Fields asked for via ``?fields=`` (``id`` is always kept)
+
+    Returns:
+        Ordered field names to select and encode
+    """
+    if requested is not None:
+        return tuple(dict.fromkeys(["id", *requested]))
+
+    skipped = set(deferred)
+    return tuple(name for name in schema.model_fields if name not in skipped)
+
+
+_MISSING = object()
+
+
+def _accepts_none(annotation: Any) -> bool:
+    return annotation in (None, type(None), Any) or type(None) in get_args(annotation)
+
+
+@lru_cache(maxsize=64)
+def compile_row_encoder(
+    schema: type[BaseModel], fields: tuple[str, ...]
+) -> Callable[[Any], dict[str, Any]]:
+    """Build an encoder turning rows into response dicts for ``schema``.
+
+    The per-field plan (attribute name, fallback default and the schema's
+    ``before`` validators) is computed once per schema and field set, so
+    encoding a row is a plain attribute walk instead of a full model
+    validation. Works with projected ``Row`` objects as well as ORM models.
+    Encoding raises ``ValueError`` when a required field is missing from the
+    row or is None without the schema allowing it, instead of emitting a
+    response that breaks its own schema.
+
+    Args:
+        schema: Response schema the output must conform to
+        fields: Fields to emit, in order
+
+    Returns:
+        Callable encoding one row into a dict
+    """
+    converters: dict[str, list[Callable[[Any], Any]]] = {}
+    for decorator in schema.__pydantic_decorators__.field_validators.values():
+        if decorator.info.mode != "before":
+            continue
+        for name in decorator.info.fields:
+            converters.setdefault(name, []).append(
+                getattr(schema, decorator.cls_var_name)
+            )
+
+    plan = []
+    for name in fields:
+        field_info = schema.model_fields[name]
+        required = field_info.is_required()
+        default = (
+            None if required else field_info.get_default(call_default_factory=True)
+        )
+        nullable = _accepts_none(field_info.annotation)
+        plan.append(
+            (name, default, required, nullable, tuple(converters.get(name, ())))
+        )
+
+    def encode(row: Any) -> dict[str, Any]:
+        data = {}
+        for name, default, required, nullable, validators in plan:
+            value = getattr(row, name, _MISSING)
+            if value is _MISSING:
+                if required:
+                    raise ValueError(
+                        f"{schema.__name__}.{name} is required but missing from "
+                        f"the encoded row"
+                    )
+                value = default
+            elif value is None:
+                value = default
+            for validator in validators:
+                value = validator(value)
+            if value is None and required and not nullable:
+                raise ValueError(f"{schema.__name__}.{name} is required but None")
+            data[name] = value
+        return data
+
+    return encode
+
+
 # Configuration Schemas
 class ConfigurationCreate(BaseModel):
     """Schema for creating configuration."""
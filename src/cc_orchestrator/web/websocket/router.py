@@ -224,6 +224,7 @@ async def dashboard_websocket(
         "dashboard",
         "instances",
         "tasks",
+        "worktrees",
         "system_status",
         "alerts",
     ]
@@ -13,6 +13,8 @@ os.environ.setdefault("FRONTEND_URL", "http://localhost:3000")
 os.environ.setdefault("ENABLE_DEMO_USERS", "true")
 os.environ.setdefault("DEBUG", "true")
 os.environ.setdefault("DEMO_ADMIN_PASSWORD", "admin123")
+# Keep CLI tests off any orchestrator daemon running on this machine
+os.environ["CC_ORCHESTRATOR_DAEMON_SOCKET"] = ""
 
 # Add src to path for imports
 import sys
@@ -328,3 +330,43 @@ def capture_logs():
 
     with patch("sys.stdout", log_capture):
         yield log_capture
+
+
+class QueryCounter:
+    """Counts SQL statements executed against an engine."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements: list[str] = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def __enter__(self):
+        from sqlalchemy import event
+
+        self.statements.clear()
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info):
+        from sqlalchemy import event
+
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+
+@pytest.fixture
+def count_queries():
+    """Return a context manager factory counting SQL statements on an engine.
+
+    Usage::
+
+        with count_queries(engine) as counter:
+            ...
+        assert counter.count == 2
+    """
+    return QueryCounter
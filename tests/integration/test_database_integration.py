@@ -196,7 +196,8 @@ class TestMigrationSystem:
         # After migration
         migration_manager.migrate_up()
         status = migration_manager.get_migration_status()
-        assert status["current_version"] == "001"
+        latest = migration_manager.discover_migrations()[-1].version
+        assert status["current_version"] == latest
         assert status["applied_count"] >= 1
         assert status["pending_count"] == 0
 
@@ -88,7 +88,9 @@ def mock_crud():
         crud._instances.append(instance)
         return instance
 
-    def list_instances_mock(offset=0, limit=20, filters=None):
+    def list_instances_mock(
+        offset=0, limit=20, filters=None, include=None, fields=None
+    ):
         return crud._instances[offset : offset + limit], len(crud._instances)
 
     def get_instance_mock(instance_id):
@@ -41,7 +41,7 @@ class TestHealthCLI:
     def test_health_check_command(self, cli_runner):
         """Test the health check CLI command."""
         with patch(
-            "src.cc_orchestrator.cli.instances.get_health_monitor"
+            "src.cc_orchestrator.core.health_monitor.get_health_monitor"
         ) as mock_get_monitor:
             mock_monitor = AsyncMock()
             mock_monitor.check_instance_health.return_value = {
@@ -66,7 +66,7 @@ class TestHealthCLI:
     def test_health_check_command_json(self, cli_runner):
         """Test the health check CLI command with JSON output."""
         with patch(
-            "src.cc_orchestrator.cli.instances.get_health_monitor"
+            "src.cc_orchestrator.core.health_monitor.get_health_monitor"
         ) as mock_get_monitor:
             mock_monitor = AsyncMock()
             mock_monitor.check_instance_health.return_value = {
@@ -89,7 +89,7 @@ class TestHealthCLI:
     def test_health_status_command(self, cli_runner, mock_instance):
         """Test the health status CLI command."""
         with patch(
-            "src.cc_orchestrator.cli.instances.get_health_monitor"
+            "src.cc_orchestrator.core.health_monitor.get_health_monitor"
         ) as mock_get_monitor:
             mock_monitor = AsyncMock()
             mock_process_manager = AsyncMock()
@@ -113,7 +113,7 @@ class TestHealthCLI:
     def test_health_status_command_filtered(self, cli_runner, mock_instance):
         """Test the health status CLI command with status filter (currently not implemented)."""
         with patch(
-            "src.cc_orchestrator.cli.instances.get_health_monitor"
+            "src.cc_orchestrator.core.health_monitor.get_health_monitor"
         ) as mock_get_monitor:
             mock_monitor = AsyncMock()
             mock_process_manager = AsyncMock()
@@ -138,7 +138,7 @@ class TestHealthCLI:
     def test_health_overview_command(self, cli_runner, mock_instance):
         """Test the health overview CLI command."""
         with patch(
-            "src.cc_orchestrator.cli.instances.get_health_monitor"
+            "src.cc_orchestrator.core.health_monitor.get_health_monitor"
         ) as mock_get_monitor:
             mock_monitor = AsyncMock()
             mock_process_manager = AsyncMock()
@@ -173,7 +173,7 @@ class TestHealthCLI:
     def test_health_configure_command(self, cli_runner):
         """Test the health configure CLI command."""
         with patch(
-            "src.cc_orchestrator.cli.instances.get_health_monitor"
+            "src.cc_orchestrator.core.health_monitor.get_health_monitor"
         ) as mock_get_monitor:
             mock_monitor = AsyncMock()
             mock_get_monitor.return_value = mock_monitor
@@ -187,7 +187,7 @@ class TestHealthCLI:
     def test_health_configure_disable(self, cli_runner):
         """Test disabling health monitoring via CLI."""
         with patch(
-            "src.cc_orchestrator.cli.instances.get_health_monitor"
+            "src.cc_orchestrator.core.health_monitor.get_health_monitor"
         ) as mock_get_monitor:
             mock_monitor = AsyncMock()
             mock_get_monitor.return_value = mock_monitor
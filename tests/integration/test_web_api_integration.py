@@ -141,7 +141,9 @@ def mock_crud():
     crud._config_counter = 0
 
     # Instance operations
-    async def mock_list_instances(offset=0, limit=20, filters=None):
+    async def mock_list_instances(
+        offset=0, limit=20, filters=None, include=None, fields=None
+    ):
         instances = list(crud._instances.values())
         if filters:
             if "status" in filters:
@@ -211,7 +213,9 @@ def mock_crud():
         return False
 
     # Task operations
-    async def mock_list_tasks(offset=0, limit=20, filters=None):
+    async def mock_list_tasks(
+        offset=0, limit=20, filters=None, include=None, fields=None
+    ):
         tasks = list(crud._tasks.values())
         if filters and "instance_id" in filters:
             tasks = [t for t in tasks if t.instance_id == filters["instance_id"]]
@@ -281,6 +285,12 @@ def mock_crud():
             }
         return None
 
+    async def mock_assign_task(task_id, instance_id, expected_instance_id):
+        task = crud._tasks.get(task_id)
+        if task is None or task.instance_id != expected_instance_id:
+            return None
+        return await mock_update_task(task_id, {"instance_id": instance_id})
+
     # Worktree operations
     async def mock_get_worktree_by_name(name):
         for worktree in crud._worktrees.values():
@@ -372,6 +382,7 @@ def mock_crud():
     crud.create_task = mock_create_task
     crud.get_task = mock_get_task
     crud.update_task = mock_update_task
+    crud.assign_task = mock_assign_task
 
     crud.create_worktree = mock_create_worktree
     crud.get_worktree = mock_get_worktree
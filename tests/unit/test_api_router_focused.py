@@ -81,7 +81,9 @@ def mock_crud():
         def __init__(self):
             self._create_mock_instance = create_mock_instance
 
-        async def list_instances(self, offset=0, limit=20, filters=None):
+        async def list_instances(
+            self, offset=0, limit=20, filters=None, include=None, fields=None
+        ):
             return ([], 0)
 
         async def get_instance(self, instance_id):
@@ -99,7 +101,9 @@ def mock_crud():
         async def delete_instance(self, instance_id):
             return True
 
-        async def list_tasks(self, offset=0, limit=20, filters=None):
+        async def list_tasks(
+            self, offset=0, limit=20, filters=None, include=None, fields=None
+        ):
             return ([], 0)
 
     mock_crud = MockCRUD()
@@ -70,7 +70,7 @@ class TestInstanceCommands:
 
     # STATUS COMMAND TESTS
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_status_no_instances(self, mock_orchestrator_class):
         """Test status command with no instances."""
         mock_orchestrator = create_mock_orchestrator()
@@ -83,7 +83,7 @@ class TestInstanceCommands:
         mock_orchestrator.initialize.assert_called_once()
         # Note: cleanup is not called because function returns early when no instances
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_status_no_instances_json(self, mock_orchestrator_class):
         """Test status command with no instances in JSON format."""
         mock_orchestrator = create_mock_orchestrator()
@@ -97,7 +97,7 @@ class TestInstanceCommands:
         assert output_data == {"instances": [], "total": 0}
         # Note: cleanup is not called because function returns early when no instances
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_status_with_instances(self, mock_orchestrator_class):
         """Test status command with instances."""
         mock_instance = create_mock_instance()
@@ -114,7 +114,7 @@ class TestInstanceCommands:
         assert "CPU: 25.5%" in result.output
         assert "Memory: 128.0 MB" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_status_with_instances_json(self, mock_orchestrator_class):
         """Test status command with instances in JSON format."""
         mock_instance = create_mock_instance()
@@ -134,7 +134,7 @@ class TestInstanceCommands:
         assert instance_data["cpu_percent"] == 25.5
         assert instance_data["memory_mb"] == 128.0
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_status_with_instances_no_process_info(self, mock_orchestrator_class):
         """Test status command with instances that have no process info."""
         mock_instance = create_mock_instance(
@@ -152,7 +152,7 @@ class TestInstanceCommands:
         assert "Process ID:" not in result.output
         assert "CPU:" not in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_status_error_handling(self, mock_orchestrator_class):
         """Test status command error handling."""
         mock_orchestrator = create_mock_orchestrator()
@@ -163,7 +163,7 @@ class TestInstanceCommands:
         assert result.exit_code == 0
         assert "Error: Test error" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_status_error_handling_json(self, mock_orchestrator_class):
         """Test status command error handling with JSON output."""
         mock_orchestrator = create_mock_orchestrator()
@@ -178,7 +178,7 @@ class TestInstanceCommands:
 
     # START COMMAND TESTS
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_start_new_instance(self, mock_orchestrator_class):
         """Test start command for new instance."""
         mock_instance = create_mock_instance()
@@ -195,7 +195,7 @@ class TestInstanceCommands:
         assert "Process ID: 12345" in result.output
         mock_orchestrator.create_instance.assert_called_once_with("test-123")
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_start_new_instance_with_options(self, mock_orchestrator_class):
         """Test start command for new instance with custom options."""
         mock_instance = create_mock_instance()
@@ -237,7 +237,7 @@ class TestInstanceCommands:
             tmux_session="custom-session",
         )
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_start_new_instance_json(self, mock_orchestrator_class):
         """Test start command for new instance with JSON output."""
         mock_instance = create_mock_instance()
@@ -253,7 +253,7 @@ class TestInstanceCommands:
         assert output_data["status"] == "started"
         assert output_data["instance"]["issue_id"] == "test-123"
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_start_existing_running_instance(self, mock_orchestrator_class):
         """Test start command for already running instance."""
         mock_instance = create_mock_instance()
@@ -265,7 +265,7 @@ class TestInstanceCommands:
         assert result.exit_code == 0
         assert "Instance for issue test-123 is already running" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_start_existing_running_instance_json(self, mock_orchestrator_class):
         """Test start command for already running instance with JSON output."""
         mock_instance = create_mock_instance()
@@ -281,7 +281,7 @@ class TestInstanceCommands:
         assert "already running" in output_data["error"]
         assert output_data["issue_id"] == "test-123"
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_start_existing_stopped_instance_success(self, mock_orchestrator_class):
         """Test start command for existing stopped instance that starts successfully."""
         mock_instance = create_mock_instance(with_process_info=False)
@@ -302,7 +302,7 @@ class TestInstanceCommands:
         assert "Process ID: 12345" in result.output
         mock_instance.start.assert_called_once()
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_start_existing_stopped_instance_success_json(
         self, mock_orchestrator_class
     ):
@@ -327,7 +327,7 @@ class TestInstanceCommands:
         assert output_data["instance"]["issue_id"] == "test-123"
         mock_instance.start.assert_called_once()
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_start_existing_stopped_instance_failure(self, mock_orchestrator_class):
         """Test start command for existing stopped instance that fails to start."""
         mock_instance = create_mock_instance(with_process_info=False)
@@ -343,7 +343,7 @@ class TestInstanceCommands:
         assert "Failed to start existing instance for issue test-123" in result.output
         mock_instance.start.assert_called_once()
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_start_existing_stopped_instance_failure_json(
         self, mock_orchestrator_class
     ):
@@ -365,7 +365,7 @@ class TestInstanceCommands:
         assert output_data["issue_id"] == "test-123"
         mock_instance.start.assert_called_once()
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_start_new_instance_failure(self, mock_orchestrator_class):
         """Test start command when new instance fails to start."""
         mock_instance = create_mock_instance()
@@ -380,7 +380,7 @@ class TestInstanceCommands:
         assert result.exit_code == 0
         assert "Failed to start instance for issue test-123" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_start_new_instance_failure_json(self, mock_orchestrator_class):
         """Test start command when new instance fails to start with JSON output."""
         mock_instance = create_mock_instance()
@@ -399,7 +399,7 @@ class TestInstanceCommands:
         assert "Failed to start instance" in output_data["error"]
         assert output_data["issue_id"] == "test-123"
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_start_error_handling(self, mock_orchestrator_class):
         """Test start command error handling."""
         mock_orchestrator = create_mock_orchestrator()
@@ -410,7 +410,7 @@ class TestInstanceCommands:
         assert result.exit_code == 0
         assert "Error: Test error" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_start_error_handling_json(self, mock_orchestrator_class):
         """Test start command error handling with JSON output."""
         mock_orchestrator = create_mock_orchestrator()
@@ -426,7 +426,7 @@ class TestInstanceCommands:
 
     # STOP COMMAND TESTS
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_stop_no_instance(self, mock_orchestrator_class):
         """Test stop command with no instance found."""
         mock_orchestrator = create_mock_orchestrator()
@@ -438,7 +438,7 @@ class TestInstanceCommands:
         assert "No instance found for issue test-123" in result.output
         # Cleanup is called in this case
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_stop_no_instance_json(self, mock_orchestrator_class):
         """Test stop command with no instance found in JSON format."""
         mock_orchestrator = create_mock_orchestrator()
@@ -453,7 +453,7 @@ class TestInstanceCommands:
         assert "No instance found" in output_data["error"]
         assert output_data["issue_id"] == "test-123"
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_stop_already_stopped_instance(self, mock_orchestrator_class):
         """Test stop command with already stopped instance."""
         mock_instance = create_mock_instance(with_process_info=False)
@@ -466,7 +466,7 @@ class TestInstanceCommands:
         assert "Instance for issue test-123 is already stopped" in result.output
         # Cleanup is called in this case
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_stop_already_stopped_instance_json(self, mock_orchestrator_class):
         """Test stop command with already stopped instance in JSON format."""
         mock_instance = create_mock_instance(with_process_info=False)
@@ -481,7 +481,7 @@ class TestInstanceCommands:
         assert output_data["status"] == "already_stopped"
         assert output_data["issue_id"] == "test-123"
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_stop_running_instance_success(self, mock_orchestrator_class):
         """Test stop command with running instance that stops successfully."""
         mock_instance = create_mock_instance()
@@ -495,7 +495,7 @@ class TestInstanceCommands:
         mock_instance.stop.assert_called_once()
         # Cleanup is called in this case
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_stop_running_instance_success_json(self, mock_orchestrator_class):
         """Test stop command with running instance that stops successfully in JSON format."""
         mock_instance = create_mock_instance()
@@ -510,7 +510,7 @@ class TestInstanceCommands:
         assert output_data["status"] == "stopped"
         assert output_data["issue_id"] == "test-123"
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_stop_running_instance_failure(self, mock_orchestrator_class):
         """Test stop command with running instance that fails to stop."""
         mock_instance = create_mock_instance()
@@ -525,7 +525,7 @@ class TestInstanceCommands:
         assert "Failed to stop instance for issue test-123" in result.output
         mock_instance.stop.assert_called_once()
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_stop_running_instance_failure_json(self, mock_orchestrator_class):
         """Test stop command with running instance that fails to stop in JSON format."""
         mock_instance = create_mock_instance()
@@ -543,7 +543,7 @@ class TestInstanceCommands:
         assert "Failed to stop" in output_data["error"]
         assert output_data["issue_id"] == "test-123"
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_stop_with_force_and_timeout_options(self, mock_orchestrator_class):
         """Test stop command with force and timeout options."""
         mock_instance = create_mock_instance()
@@ -558,7 +558,7 @@ class TestInstanceCommands:
         assert "Successfully stopped instance for issue test-123" in result.output
         mock_instance.stop.assert_called_once()
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_stop_error_handling(self, mock_orchestrator_class):
         """Test stop command error handling."""
         mock_orchestrator = create_mock_orchestrator()
@@ -569,7 +569,7 @@ class TestInstanceCommands:
         assert result.exit_code == 0
         assert "Error: Test error" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_stop_error_handling_json(self, mock_orchestrator_class):
         """Test stop command error handling with JSON output."""
         mock_orchestrator = create_mock_orchestrator()
@@ -584,7 +584,7 @@ class TestInstanceCommands:
 
     # LIST COMMAND TESTS
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_list_no_instances(self, mock_orchestrator_class):
         """Test list command with no instances."""
         mock_orchestrator = create_mock_orchestrator()
@@ -596,7 +596,7 @@ class TestInstanceCommands:
         assert "No active instances found" in result.output
         # Note: cleanup is not called because function returns early when no instances
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_list_no_instances_json(self, mock_orchestrator_class):
         """Test list command with no instances in JSON format."""
         mock_orchestrator = create_mock_orchestrator()
@@ -609,7 +609,7 @@ class TestInstanceCommands:
         output_data = json.loads(result.output)
         assert output_data == {"instances": [], "total": 0}
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_list_no_running_instances(self, mock_orchestrator_class):
         """Test list command with no running instances when using --running-only filter."""
         mock_instance = create_mock_instance(with_process_info=False)
@@ -622,7 +622,7 @@ class TestInstanceCommands:
         assert "No running instances found" in result.output
         # Note: cleanup is not called because function returns early when no instances
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_list_with_instances(self, mock_orchestrator_class):
         """Test list command with instances."""
         mock_instance = create_mock_instance()
@@ -637,7 +637,7 @@ class TestInstanceCommands:
         assert "PID: 12345" in result.output
         assert "Resources: 25.5% CPU, 128.0 MB RAM" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_list_with_instances_json(self, mock_orchestrator_class):
         """Test list command with instances in JSON format."""
         mock_instance = create_mock_instance()
@@ -656,7 +656,7 @@ class TestInstanceCommands:
         assert instance_data["issue_id"] == "test-123"
         assert instance_data["process_status"] == "running"
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_list_running_only_filter(self, mock_orchestrator_class):
         """Test list command with --running-only filter."""
         mock_instance1 = create_mock_instance(
@@ -675,7 +675,7 @@ class TestInstanceCommands:
         assert "Running Claude Instances (1)" in result.output
         assert "🟢 test-123" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_list_running_only_filter_json(self, mock_orchestrator_class):
         """Test list command with --running-only filter in JSON format."""
         mock_instance1 = create_mock_instance(
@@ -700,7 +700,7 @@ class TestInstanceCommands:
         assert len(output_data["instances"]) == 1
         assert output_data["instances"][0]["issue_id"] == "test-123"
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_list_error_handling(self, mock_orchestrator_class):
         """Test list command error handling."""
         mock_orchestrator = create_mock_orchestrator()
@@ -711,7 +711,7 @@ class TestInstanceCommands:
         assert result.exit_code == 0
         assert "Error: Test error" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_list_error_handling_json(self, mock_orchestrator_class):
         """Test list command error handling with JSON output."""
         mock_orchestrator = create_mock_orchestrator()
@@ -54,7 +54,7 @@ class TestStatusCommand:
         """Set up test fixtures."""
         self.runner = CliRunner()
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_status_command_basic(self, mock_orchestrator):
         """Test basic status command execution."""
         # Mock the orchestrator - use Mock, not AsyncMock for main object
@@ -72,7 +72,7 @@ class TestStatusCommand:
         assert result.exit_code == 0
         assert "No active instances found" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_status_command_json_output(self, mock_orchestrator):
         """Test status command with JSON output."""
         # Mock the orchestrator
@@ -92,7 +92,7 @@ class TestStatusCommand:
         assert output_data["instances"] == []
         assert output_data["total"] == 0
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_status_command_with_instances(self, mock_orchestrator):
         """Test status command with active instances."""
         # Mock the orchestrator
@@ -125,7 +125,7 @@ class TestStatusCommand:
         assert "TEST-123" in result.output
         assert "running" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_status_command_error_handling(self, mock_orchestrator):
         """Test status command error handling."""
         # Mock orchestrator to raise exception
@@ -144,7 +144,7 @@ class TestStartCommand:
         """Set up test fixtures."""
         self.runner = CliRunner()
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_start_command_basic(self, mock_orchestrator):
         """Test basic start command execution."""
         # Mock the orchestrator
@@ -172,7 +172,7 @@ class TestStartCommand:
         assert result.exit_code == 0
         assert "Successfully started" in result.output or "started" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_start_command_with_options(self, mock_orchestrator):
         """Test start command with various options."""
         # Mock the orchestrator
@@ -209,7 +209,7 @@ class TestStartCommand:
 
         assert result.exit_code == 0
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_start_command_existing_running(self, mock_orchestrator):
         """Test start command with existing running instance."""
         # Mock the orchestrator
@@ -227,7 +227,7 @@ class TestStartCommand:
         assert result.exit_code == 0
         assert "already running" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_start_command_existing_stopped(self, mock_orchestrator):
         """Test start command with existing stopped instance."""
         # Mock the orchestrator
@@ -250,7 +250,7 @@ class TestStartCommand:
         assert result.exit_code == 0
         assert "Started existing instance" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_start_command_json_output(self, mock_orchestrator):
         """Test start command with JSON output."""
         # Mock the orchestrator
@@ -280,7 +280,7 @@ class TestStartCommand:
         assert output_data["status"] == "started"
         assert "instance" in output_data
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_start_command_failure(self, mock_orchestrator):
         """Test start command when start fails."""
         # Mock the orchestrator
@@ -309,7 +309,7 @@ class TestStopCommand:
         """Set up test fixtures."""
         self.runner = CliRunner()
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_stop_command_basic(self, mock_orchestrator):
         """Test basic stop command execution."""
         # Mock the orchestrator
@@ -328,7 +328,7 @@ class TestStopCommand:
         assert result.exit_code == 0
         assert "Successfully stopped" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_stop_command_not_found(self, mock_orchestrator):
         """Test stop command with non-existent instance."""
         # Mock the orchestrator
@@ -344,7 +344,7 @@ class TestStopCommand:
         assert result.exit_code == 0
         assert "No instance found" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_stop_command_not_running(self, mock_orchestrator):
         """Test stop command with stopped instance."""
         # Mock the orchestrator
@@ -362,7 +362,7 @@ class TestStopCommand:
         assert result.exit_code == 0
         assert "already stopped" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_stop_command_with_options(self, mock_orchestrator):
         """Test stop command with force and timeout options."""
         # Mock the orchestrator
@@ -381,7 +381,7 @@ class TestStopCommand:
         assert result.exit_code == 0
         assert "Successfully stopped" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_stop_command_json_output(self, mock_orchestrator):
         """Test stop command with JSON output."""
         # Mock the orchestrator
@@ -410,7 +410,7 @@ class TestListCommand:
         """Set up test fixtures."""
         self.runner = CliRunner()
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_list_command_basic(self, mock_orchestrator):
         """Test basic list command execution."""
         # Mock the orchestrator
@@ -426,7 +426,7 @@ class TestListCommand:
         assert result.exit_code == 0
         assert "No active instances found" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_list_command_with_instances(self, mock_orchestrator):
         """Test list command with instances."""
         # Mock the orchestrator
@@ -471,7 +471,7 @@ class TestListCommand:
         assert "TEST-456" in result.output
         assert "Active Claude Instances (2)" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_list_command_running_only(self, mock_orchestrator):
         """Test list command with running-only filter."""
         # Mock the orchestrator
@@ -503,7 +503,7 @@ class TestListCommand:
         assert "RUNNING-123" in result.output
         assert "Running Claude Instances (1)" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_list_command_json_output(self, mock_orchestrator):
         """Test list command with JSON output."""
         # Mock the orchestrator
@@ -545,7 +545,7 @@ class TestAsyncCommandExecution:
         """Set up test fixtures."""
         self.runner = CliRunner()
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_async_exception_handling(self, mock_orchestrator):
         """Test async exception handling in commands."""
         # Mock orchestrator to raise exception during initialization
@@ -558,7 +558,7 @@ class TestAsyncCommandExecution:
         assert "Error:" in result.output or "error" in result.output.lower()
 
     @patch("cc_orchestrator.cli.instances.logger")
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_logging_in_error_paths(self, mock_orchestrator, mock_logger):
         """Test logging occurs during error conditions."""
         # Mock orchestrator to raise exception
@@ -588,7 +588,7 @@ class TestCommandArgumentValidation:
 
         assert result.exit_code != 0  # Should fail due to missing argument
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_workspace_option_path_validation(self, mock_orchestrator):
         """Test workspace option accepts Path objects."""
         # This tests the click.Path(path_type=Path) type conversion
@@ -623,7 +623,7 @@ class TestCommandOutputFormatting:
         """Set up test fixtures."""
         self.runner = CliRunner()
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_human_readable_output_formatting(self, mock_orchestrator):
         """Test human-readable output formatting includes emojis and formatting."""
         # Mock the orchestrator
@@ -672,7 +672,7 @@ class TestCoverageTargetedCalls:
         """Set up test fixtures."""
         self.runner = CliRunner()
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_process_status_none_handling(self, mock_orchestrator):
         """Test handling when process status returns None."""
         # Mock the orchestrator
@@ -696,7 +696,7 @@ class TestCoverageTargetedCalls:
         assert result.exit_code == 0
         assert "NO-PROCESS" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_start_existing_instance_failure(self, mock_orchestrator):
         """Test start command when existing instance start fails."""
         # Mock the orchestrator
@@ -715,7 +715,7 @@ class TestCoverageTargetedCalls:
         assert result.exit_code == 0
         assert "Failed to start existing instance" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_stop_command_failure(self, mock_orchestrator):
         """Test stop command when stop operation fails."""
         # Mock the orchestrator
@@ -734,7 +734,7 @@ class TestCoverageTargetedCalls:
         assert result.exit_code == 0
         assert "Failed to stop" in result.output
 
-    @patch("cc_orchestrator.cli.instances.Orchestrator")
+    @patch("cc_orchestrator.daemon.service.Orchestrator")
     def test_resource_display_conditional_paths(self, mock_orchestrator):
         """Test conditional resource display paths in list command."""
         # Mock the orchestrator
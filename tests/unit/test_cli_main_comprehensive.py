@@ -326,11 +326,10 @@ class TestMainCommandIntegration:
 
     def test_command_structure_is_valid(self):
         """Test command structure is properly set up."""
-        assert main.commands is not None
-        assert len(main.commands) > 0
+        assert main.list_commands(None)
 
-        # Verify expected commands are registered
-        command_names = list(main.commands.keys())
+        # Verify expected commands are registered; they load on first use
+        command_names = main.list_commands(None)
         expected_commands = ["instances", "tasks", "worktrees", "config", "web", "tmux"]
         for cmd in expected_commands:
             assert cmd in command_names
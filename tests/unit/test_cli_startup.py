@@ -0,0 +1,111 @@
+"""Tests for CLI startup cost and lazy subcommand loading."""
+
+import json
+import subprocess
+import sys
+
+import click
+from click.testing import CliRunner
+
+from cc_orchestrator.cli.main import SUBCOMMANDS, main
+from cc_orchestrator.cli.utils import LazyGroup
+
+# Budget for importing the CLI entry point; eager imports took about 800 ms
+IMPORT_BUDGET_US = 250_000
+
+# Dependencies no command needs just to start
+HEAVY_MODULES = ["sqlalchemy", "fastapi", "uvicorn", "libtmux", "psutil", "git"]
+
+
+def _run_python(code: str, *flags: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    )
+
+
+def _loaded_heavy_modules(code: str) -> list[str]:
+    probe = (
+        f"{code}\n"
+        "import json, sys\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    return json.loads(_run_python(probe).stdout.strip().splitlines()[-1])
+
+
+class TestImportTime:
+    """Test that starting the CLI does not load heavy dependencies."""
+
+    def test_import_within_budget(self):
+        result = _run_python("import cc_orchestrator.cli.main", "-X", "importtime")
+        total = 0
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line.split("|")
+            # Nested imports are indented and already counted by their parent
+            if not name.startswith("  "):
+                total += int(cumulative)
+        assert 0 < total < IMPORT_BUDGET_US
+
+    def test_help_skips_heavy_imports(self):
+        code = (
+            "from cc_orchestrator.cli.main import main\n"
+            "main(['--help'], standalone_mode=False)"
+        )
+        assert _loaded_heavy_modules(code) == []
+
+    def test_config_command_skips_heavy_imports(self):
+        code = (
+            "from cc_orchestrator.cli.main import main\n"
+            "main(['config', 'show'], standalone_mode=False)"
+        )
+        assert _loaded_heavy_modules(code) == []
+
+
+class TestLazyGroup:
+    """Test lazy subcommand resolution."""
+
+    def test_declared_help_matches_commands(self):
+        for name in SUBCOMMANDS:
+            command = main.get_command(None, name)
+            assert command.get_short_help_str(100) == SUBCOMMANDS[name][1]
+
+    def test_help_and_completion_do_not_import(self):
+        group = LazyGroup(
+            name="cli",
+            lazy_subcommands={
+                "broken": ("cc_orchestrator.missing_module:cmd", "Never loaded.")
+            },
+        )
+
+        @group.command()
+        def eager() -> None:
+            """Eager command."""
+
+        result = CliRunner().invoke(group, ["--help"])
+        assert result.exit_code == 0
+        assert "broken  Never loaded." in result.output
+        assert "eager   Eager command." in result.output
+
+        ctx = click.Context(group)
+        names = [item.value for item in group.shell_complete(ctx, "b")]
+        assert names == ["broken"]
+
+    def test_loads_on_first_use(self):
+        group = LazyGroup(
+            name="cli",
+            lazy_subcommands={
+                "config": ("cc_orchestrator.cli.config:config", "Configuration.")
+            },
+        )
+        assert "config" not in group.commands
+
+        result = CliRunner().invoke(group, ["config", "--help"])
+
+        assert result.exit_code == 0
+        assert "Manage configuration settings." in result.output
+        assert "config" in group.commands
@@ -7,6 +7,7 @@ from unittest.mock import Mock, patch
 from click.testing import CliRunner
 
 from cc_orchestrator.cli.main import main
+from cc_orchestrator.core.enums import WorktreeCheckoutMode
 from cc_orchestrator.core.worktree_service import WorktreeServiceError
 
 
@@ -261,6 +262,8 @@ class TestWorktreesCLI:
             custom_path="/custom/path",
             instance_id=456,
             force=True,
+            checkout_mode=WorktreeCheckoutMode.FULL,
+            sparse_paths=None,
         )
 
     @patch("cc_orchestrator.cli.worktrees.WorktreeService")
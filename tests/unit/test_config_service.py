@@ -0,0 +1,128 @@
+"""Tests for the cached configuration service."""
+
+import asyncio
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from cc_orchestrator.config.loader import OrchestratorConfig
+from cc_orchestrator.config.service import ConfigService
+from cc_orchestrator.core.health_monitor import HealthMonitor
+
+
+def _write(path, settle=True, **settings):
+    path.write_text(yaml.dump(settings))
+    if settle:
+        # Age the file past the racy window so its parse may be cached
+        past = time.time() - 60
+        os.utime(path, (past, past))
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "cc-orchestrator.yaml"
+    _write(path, max_instances=4, health_check_interval=30.0)
+    return path
+
+
+class TestConfigCache:
+    """Test cache keys and invalidation."""
+
+    def test_reuses_config_until_file_changes(self, config_file):
+        service = ConfigService()
+
+        first = service.get(str(config_file))
+        assert service.get(str(config_file)) is first
+        assert (service.hits, service.misses) == (1, 1)
+
+        _write(config_file, max_instances=8)
+        os.utime(config_file, ns=(0, 1_000_000_000))
+        assert service.get(str(config_file)).max_instances == 8
+
+    def test_environment_is_part_of_the_key(self, config_file, monkeypatch):
+        service = ConfigService()
+        assert service.get(str(config_file)).max_instances == 4
+
+        monkeypatch.setenv("CC_ORCHESTRATOR_MAX_INSTANCES", "9")
+        assert service.get(str(config_file)).max_instances == 9
+        monkeypatch.delenv("CC_ORCHESTRATOR_MAX_INSTANCES")
+        assert service.get(str(config_file)).max_instances == 4
+
+    def test_recently_written_file_is_reread(self, config_file):
+        service = ConfigService()
+        _write(config_file, settle=False, max_instances=1)
+        assert service.get(str(config_file)).max_instances == 1
+
+        # Same size, possibly the same mtime tick: only the racy check
+        # prevents serving the stale parse
+        _write(config_file, settle=False, max_instances=2)
+        assert service.get(str(config_file)).max_instances == 2
+
+
+class TestReload:
+    """Test reload events."""
+
+    def test_publishes_changes_and_ignores_invalid_edits(self, config_file):
+        service = ConfigService(str(config_file))
+        received: list[OrchestratorConfig] = []
+        service.add_listener(received.append)
+        initial = service.current
+
+        assert service.reload() is False
+
+        _write(config_file, max_instances=4, health_check_interval=5.0)
+        os.utime(config_file, ns=(0, 2_000_000_000))
+        assert service.reload() is True
+        assert [c.health_check_interval for c in received] == [5.0]
+
+        config_file.write_text("max_instances: [not, a, number]")
+        assert service.reload() is False
+        assert len(received) == 1
+        assert initial.health_check_interval == 30.0
+
+    async def test_running_health_monitor_follows_reloads(self, config_file):
+        service = ConfigService(str(config_file))
+        with patch(
+            "cc_orchestrator.core.health_monitor.get_config_service",
+            return_value=service,
+        ):
+            monitor = HealthMonitor()
+            with patch.object(monitor, "_perform_health_checks") as checks:
+                await monitor.start()
+                await asyncio.sleep(0.01)
+
+                _write(
+                    config_file,
+                    health_check_interval=0.05,
+                    health_cpu_threshold=50.0,
+                    restart_max_attempts=7,
+                )
+                service.reload()
+                await asyncio.sleep(0.2)
+                await monitor.stop()
+
+        assert monitor.check_interval == 0.05
+        assert monitor.cpu_threshold == 50.0
+        assert monitor.restart_manager.max_attempts == 7
+        # The reload woke the loop instead of waiting out the old interval
+        assert checks.call_count >= 3
+        assert service._listeners == []
+
+    async def test_watch_loop_detects_edits(self, config_file):
+        _write(config_file, config_watch_interval=0.02)
+        service = ConfigService(str(config_file))
+        received: list[OrchestratorConfig] = []
+        service.add_listener(received.append)
+
+        await service.start()
+        _write(config_file, config_watch_interval=0.02, max_instances=6)
+        for _ in range(100):
+            if received:
+                break
+            await asyncio.sleep(0.02)
+        await service.stop()
+
+        assert received[-1].max_instances == 6
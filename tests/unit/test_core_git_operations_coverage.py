@@ -786,13 +786,11 @@ branch refs/heads/single"""
         mock_worktree_repo.index = Mock()
         mock_worktree_repo.index.diff = Mock(return_value=[])
 
-        # Mock ahead/behind commits
-        mock_worktree_repo.iter_commits = Mock(
-            side_effect=[
-                ["commit1", "commit2"],  # 2 commits ahead
-                ["commit3"],  # 1 commit behind
-            ]
-        )
+        mock_tracking_branch.commit.hexsha = "upstream123commit"
+
+        # Mock rev-list --left-right --count: 2 ahead, 1 behind
+        mock_worktree_repo.git = Mock()
+        mock_worktree_repo.git.rev_list = Mock(return_value="2\t1")
 
         with patch.object(manager, "_repo", mock_repo):
             with patch("os.path.exists", return_value=True):
@@ -829,8 +827,11 @@ branch refs/heads/single"""
         mock_worktree_repo.index = Mock()
         mock_worktree_repo.index.diff = Mock(return_value=[])
 
-        # Mock iter_commits to raise error
-        mock_worktree_repo.iter_commits = Mock(side_effect=Exception("Tracking error"))
+        mock_tracking_branch.commit.hexsha = "upstream-error-commit"
+
+        # Mock rev-list to raise error
+        mock_worktree_repo.git = Mock()
+        mock_worktree_repo.git.rev_list = Mock(side_effect=Exception("Tracking error"))
 
         with patch.object(manager, "_repo", mock_repo):
             with patch("os.path.exists", return_value=True):
@@ -319,7 +319,10 @@ class TestCRUDAdapter:
             # But total count should be 1
             assert result == ([], 1)
             mock_crud.list_by_instance.assert_called_with(
-                crud_adapter.session, 1, status=TaskStatus.IN_PROGRESS
+                crud_adapter.session,
+                1,
+                status=TaskStatus.IN_PROGRESS,
+                include=None,
             )
 
     @pytest.mark.asyncio
@@ -447,7 +450,9 @@ class TestCRUDAdapter:
             # But total count should be 1
             assert result == ([], 1)
             mock_crud.list_by_status.assert_called_with(
-                crud_adapter.session, WorktreeStatus.ACTIVE
+                crud_adapter.session,
+                WorktreeStatus.ACTIVE,
+                include=None,
             )
 
     @pytest.mark.asyncio
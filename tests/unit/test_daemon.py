@@ -0,0 +1,227 @@
+"""Tests for the orchestrator daemon protocol, server and CLI client mode."""
+
+import asyncio
+import json
+import socket
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from cc_orchestrator.cli.main import main
+from cc_orchestrator.daemon import RPCError, connect_daemon, connect_daemon_async
+from cc_orchestrator.daemon.protocol import HEADER, encode_frame, read_frame
+from cc_orchestrator.daemon.server import DaemonServer
+from cc_orchestrator.daemon.service import OrchestratorService
+from cc_orchestrator.database.models import HealthStatus
+from cc_orchestrator.web.app import _daemon_services
+from cc_orchestrator.web.exceptions import InstanceOperationError
+from cc_orchestrator.web.routers.v1.instances import _run_on_daemon
+
+
+def _mock_orchestrator():
+    instance = Mock()
+    instance.get_info.return_value = {
+        "issue_id": "daemon-1",
+        "status": "running",
+        "workspace_path": "/work",
+        "branch_name": "feature/daemon-1",
+        "tmux_session": "claude-daemon-1",
+        "process_id": None,
+    }
+    instance.get_process_status = AsyncMock(return_value=None)
+    instance.is_running.return_value = True
+    instance.stop = AsyncMock(return_value=True)
+
+    orchestrator = Mock()
+    orchestrator.list_instances.return_value = [instance]
+    orchestrator.get_instance.side_effect = lambda issue_id: (
+        instance if issue_id == "daemon-1" else None
+    )
+    orchestrator.sync_instance_to_database.return_value = True
+
+    monitor = Mock()
+    monitor.enabled = True
+    monitor.check_interval = 30.0
+    monitor.start = AsyncMock()
+    monitor.stop = AsyncMock()
+    monitor.check_instance_health = AsyncMock(
+        return_value={
+            "instance_id": "daemon-1",
+            "overall_status": HealthStatus.DEGRADED,
+            "duration_ms": 12.5,
+            "checks": {"process_running": True},
+        }
+    )
+    orchestrator.health_monitor = monitor
+    return orchestrator
+
+
+@pytest.fixture
+async def server(tmp_path):
+    server = DaemonServer(
+        OrchestratorService(_mock_orchestrator(), database_id="db-1"),
+        tmp_path / "d.sock",
+    )
+    await server.start()
+    yield server
+    await server.close()
+
+
+class TestProtocol:
+    """Test length-prefixed framing."""
+
+    def test_round_trip(self):
+        left, right = socket.socketpair()
+        with left, right:
+            message = {"id": 1, "method": "ping", "params": {"text": "ü" * 10}}
+            left.sendall(encode_frame(message) * 2)
+            assert read_frame(right) == message
+            assert read_frame(right) == message
+
+    def test_rejects_oversized_and_invalid_frames(self):
+        left, right = socket.socketpair()
+        with left, right:
+            left.sendall(HEADER.pack(2**31))
+            with pytest.raises(RPCError) as exc_info:
+                read_frame(right)
+            assert exc_info.value.error_type == "FrameTooLarge"
+
+            left.sendall(HEADER.pack(2) + b"[]")
+            with pytest.raises(RPCError) as exc_info:
+                read_frame(right)
+            assert exc_info.value.error_type == "ProtocolError"
+
+
+class TestDaemonServer:
+    """Test the Unix socket server and client."""
+
+    async def test_calls_and_errors(self, server):
+        def session():
+            with connect_daemon(server.socket_path) as client:
+                listing = client.call("instances.list")
+                stopped = client.call("instances.stop", issue_id="daemon-1")
+                errors = []
+                for method, params in [("bogus", {}), ("instances.stop", {})]:
+                    try:
+                        client.call(method, **params)
+                    except RPCError as e:
+                        errors.append(e.error_type)
+                return listing, stopped, errors, client.call("ping")
+
+        listing, stopped, errors, ping = await asyncio.to_thread(session)
+
+        assert listing["total"] == 1
+        assert listing["instances"][0]["issue_id"] == "daemon-1"
+        assert stopped == {
+            "status": "stopped",
+            "issue_id": "daemon-1",
+            "persistence_status": "success",
+        }
+        assert errors == ["MethodNotFound", "InvalidParams"]
+        assert ping["uptime_seconds"] >= 0
+        assert ping["database_id"] == "db-1"
+        assert ping["services"] == {
+            "orchestrator": True,
+            "health_monitor": True,
+            "scheduler": False,
+            "pane_capture": False,
+        }
+        assert (server.socket_path.stat().st_mode & 0o777) == 0o600
+
+    async def test_refuses_second_daemon_and_replaces_stale_socket(self, server):
+        other = DaemonServer(server.service, server.socket_path)
+        with pytest.raises(RuntimeError, match="already listening"):
+            await other.start()
+
+        await server.close()
+        assert not server.socket_path.exists()
+        assert connect_daemon(server.socket_path) is None
+
+        # A socket file nobody listens on is left over from a crashed daemon
+        stale = socket.socket(socket.AF_UNIX)
+        stale.bind(str(server.socket_path))
+        stale.close()
+        await other.start()
+        await other.close()
+
+    async def test_async_client_health_methods(self, server):
+        monitor = server.service.health_monitor
+
+        async with await connect_daemon_async(server.socket_path) as client:
+            health = await client.call("health.check", issue_id="daemon-1")
+            configured = await client.call("health.configure", enabled=True, interval=5)
+            with pytest.raises(RPCError) as exc_info:
+                await client.call("scheduler.metrics")
+
+        assert health["overall_status"] == "degraded"
+        assert configured == {"enabled": True, "interval": 5}
+        assert monitor.check_interval == 5.0
+        monitor.start.assert_awaited_once()
+        assert exc_info.value.error_type == "Unavailable"
+
+    def test_disabled_by_environment(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("CC_ORCHESTRATOR_DAEMON_SOCKET", "")
+        assert connect_daemon() is None
+        monkeypatch.setenv("CC_ORCHESTRATOR_DAEMON_SOCKET", str(tmp_path / "none"))
+        assert connect_daemon() is None
+
+
+class TestClientMode:
+    """Test that CLI commands use a running daemon."""
+
+    async def test_status_uses_daemon(self, server, monkeypatch):
+        monkeypatch.setenv("CC_ORCHESTRATOR_DAEMON_SOCKET", str(server.socket_path))
+
+        with patch("cc_orchestrator.daemon.service.Orchestrator") as local:
+            result = await asyncio.to_thread(
+                CliRunner().invoke, main, ["instances", "status", "--json"]
+            )
+
+        assert result.exit_code == 0
+        assert json.loads(result.output)["instances"][0]["issue_id"] == "daemon-1"
+        local.assert_not_called()
+
+    async def test_stop_reports_daemon_errors(self, server, monkeypatch):
+        monkeypatch.setenv("CC_ORCHESTRATOR_DAEMON_SOCKET", str(server.socket_path))
+
+        result = await asyncio.to_thread(
+            CliRunner().invoke, main, ["instances", "stop", "missing"]
+        )
+
+        assert result.exit_code == 0
+        assert "Error: No instance found for issue missing" in result.output
+
+    async def test_health_check_uses_daemon_monitor(self, server, monkeypatch):
+        monkeypatch.setenv("CC_ORCHESTRATOR_DAEMON_SOCKET", str(server.socket_path))
+
+        with patch("cc_orchestrator.core.health_monitor.get_health_monitor") as local:
+            result = await asyncio.to_thread(
+                CliRunner().invoke, main, ["instances", "health", "check", "daemon-1"]
+            )
+
+        assert result.exit_code == 0
+        assert "Overall Status: 🟡 DEGRADED" in result.output
+        assert "✅ process_running" in result.output
+        local.assert_not_called()
+
+    async def test_web_forwards_instance_operations(self, server, monkeypatch):
+        monkeypatch.setenv("CC_ORCHESTRATOR_DAEMON_SOCKET", str(server.socket_path))
+        running = Mock(id=1, issue_id="daemon-1")
+        missing = Mock(id=2, issue_id="missing")
+
+        result = await _run_on_daemon("instances.stop", running, "db-1")
+        with pytest.raises(InstanceOperationError, match="No instance found"):
+            await _run_on_daemon("instances.stop", missing, "db-1")
+
+        assert result["status"] == "stopped"
+        # A daemon of another database does not own the instance
+        assert await _run_on_daemon("instances.stop", missing, "db-2") is None
+        monkeypatch.setenv("CC_ORCHESTRATOR_DAEMON_SOCKET", "")
+        assert await _run_on_daemon("instances.stop", running, "db-1") is None
+
+    async def test_web_ignores_daemon_of_another_database(self, server, monkeypatch):
+        monkeypatch.setenv("CC_ORCHESTRATOR_DAEMON_SOCKET", str(server.socket_path))
+
+        assert (await _daemon_services("db-1"))["orchestrator"] is True
+        assert await _daemon_services("db-2") == {}
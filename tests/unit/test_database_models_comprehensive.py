@@ -870,8 +870,8 @@ class TestModelIndexes:
             if isinstance(attr, Index):
                 index_count += 1
 
-        # Total expected indexes: 3 + 5 + 3 + 2 + 2 = 15
-        assert index_count == 15
+        # Total expected indexes: 3 + 7 + 3 + 2 + 2 + 1 = 18
+        assert index_count == 18
 
 
 class TestModelFieldTypes:
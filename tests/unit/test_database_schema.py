@@ -11,6 +11,7 @@ from cc_orchestrator.database.models import (
     Base,
     Configuration,
     HealthCheck,
+    HealthCheckRollup,
     Instance,
     Task,
     Worktree,
@@ -78,7 +79,14 @@ class TestSchemaInformation:
         model_classes = get_model_classes()
 
         # Check all expected model classes are present
-        expected_models = {Instance, Task, Worktree, Configuration, HealthCheck}
+        expected_models = {
+            Instance,
+            Task,
+            Worktree,
+            Configuration,
+            HealthCheck,
+            HealthCheckRollup,
+        }
         assert set(model_classes) == expected_models
 
         # Check they're all proper model classes
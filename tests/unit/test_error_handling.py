@@ -23,6 +23,13 @@ from cc_orchestrator.utils.logging import (
     handle_errors,
     log_performance,
 )
+from cc_orchestrator.utils.metrics import get_metrics_registry
+
+
+def _duration_series(func, status):
+    """Get the duration histogram series of a log_performance function."""
+    histogram = get_metrics_registry().get("cc_orchestrator_function_duration_seconds")
+    return histogram.labels(f"{func.__module__}.{func.__qualname__}", status)
 
 
 class TestHandleErrorsDecorator:
@@ -154,51 +161,57 @@ class TestLogPerformanceDecorator:
     """Test the log_performance decorator functionality."""
 
     @patch("cc_orchestrator.utils.logging.get_logger")
-    @patch("time.time")
-    def test_log_performance_success(self, mock_time, mock_get_logger):
-        """Test performance logging for successful function execution."""
+    @patch("time.perf_counter_ns")
+    def test_log_performance_success(self, mock_clock, mock_get_logger):
+        """Test that successful executions are recorded without logging."""
         mock_logger = Mock()
         mock_get_logger.return_value = mock_logger
 
-        # Mock time progression
-        mock_time.side_effect = [100.0, 100.5]  # 0.5 second execution
+        # Mock clock progression
+        mock_clock.side_effect = [100_000_000_000, 100_500_000_000]  # 0.5 seconds
 
         @log_performance(LogContext.TASK)
         def timed_function():
             return "success"
 
+        series = _duration_series(timed_function, "success")
+        count, total = series.count, series.sum
+
         result = timed_function()
 
         assert result == "success"
-        mock_get_logger.assert_called_with(timed_function.__module__, LogContext.TASK)
-
-        # Check that debug and info calls were made
-        mock_logger.debug.assert_called()
-        mock_logger.info.assert_called()
+        mock_logger.debug.assert_not_called()
+        mock_logger.info.assert_not_called()
 
-        # Verify the info call includes execution time
-        info_call = mock_logger.info.call_args
-        assert "completed" in info_call[0][0]
-        assert info_call[1]["execution_time"] == 0.5
-        assert info_call[1]["status"] == "success"
+        # Verify the histogram recorded the execution time
+        assert series.count == count + 1
+        assert series.sum - total == pytest.approx(0.5)
 
     @patch("cc_orchestrator.utils.logging.get_logger")
-    @patch("time.time")
-    def test_log_performance_failure(self, mock_time, mock_get_logger):
+    @patch("time.perf_counter_ns")
+    def test_log_performance_failure(self, mock_clock, mock_get_logger):
         """Test performance logging for failed function execution."""
         mock_logger = Mock()
         mock_get_logger.return_value = mock_logger
 
-        # Mock time progression
-        mock_time.side_effect = [200.0, 200.3]  # 0.3 second execution before failure
+        # Mock clock progression, 0.3 seconds before failure
+        mock_clock.side_effect = [200_000_000_000, 200_300_000_000]
 
         @log_performance(LogContext.INSTANCE)
         def failing_function():
             raise ValueError("Function failed")
 
+        series = _duration_series(failing_function, "error")
+        count = series.count
+
         with pytest.raises(ValueError):
             failing_function()
 
+        mock_get_logger.assert_called_with(
+            failing_function.__module__, LogContext.INSTANCE
+        )
+        assert series.count == count + 1
+
         # Check that warning was logged for failure
         mock_logger.warning.assert_called()
 
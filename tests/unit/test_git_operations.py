@@ -1,6 +1,7 @@
 """Unit tests for git operations module."""
 
 import os
+import shutil
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -8,9 +9,12 @@ import pytest
 from git import Repo
 from git.exc import GitCommandError
 
+from cc_orchestrator.core.enums import WorktreeCheckoutMode
 from cc_orchestrator.core.git_operations import (
     GitWorktreeError,
     GitWorktreeManager,
+    cone_directories,
+    count_ahead_behind,
 )
 
 
@@ -289,6 +293,194 @@ branch refs/heads/feature-branch"""
         with pytest.raises(GitWorktreeError, match="does not exist"):
             manager.get_worktree_status("/nonexistent/path")
 
+    def test_worktree_fingerprint_tracks_git_state(self, manager, tmp_path):
+        """Test the stat-based fingerprint changes with HEAD and the index."""
+        worktree_path = tmp_path / "fingerprint_worktree"
+        manager.create_worktree(str(worktree_path), "fingerprint-branch")
+
+        first = manager.get_worktree_fingerprint(str(worktree_path))
+        assert first is not None
+        assert manager.get_worktree_fingerprint(str(worktree_path)) == first
+
+        worktree_repo = Repo(worktree_path)
+        new_file = worktree_path / "new.txt"
+        new_file.write_text("content")
+        worktree_repo.index.add([str(new_file)])
+        worktree_repo.index.write()
+        staged = manager.get_worktree_fingerprint(str(worktree_path))
+        assert staged != first
+
+        worktree_repo.index.commit("Add file")
+        assert manager.get_worktree_fingerprint(str(worktree_path)) != staged
+
+    def test_worktree_fingerprint_not_a_repository(self, manager, tmp_path):
+        """Test fingerprinting a plain directory returns None."""
+        assert manager.get_worktree_fingerprint(str(tmp_path)) is None
+
+    def test_count_ahead_behind_is_memoized(self, manager, temp_git_repo):
+        """Test ahead/behind comes from one rev-list call per SHA pair."""
+        repo = Repo(temp_git_repo)
+        base = repo.head.commit.hexsha
+        for i in range(3):
+            repo.index.commit(f"Local {i}")
+        local = repo.head.commit.hexsha
+        repo.head.reset(base, index=True, working_tree=True)
+        repo.index.commit("Upstream")
+        upstream = repo.head.commit.hexsha
+
+        assert count_ahead_behind(repo, local, upstream) == (3, 1)
+        assert count_ahead_behind(repo, upstream, local) == (1, 3)
+        assert count_ahead_behind(repo, local, local) == (0, 0)
+
+        counting_repo = Mock()
+        counting_repo.git.rev_list.side_effect = AssertionError("not memoized")
+        assert count_ahead_behind(counting_repo, local, upstream) == (3, 1)
+
+    def test_write_commit_graph(self, manager, temp_git_repo):
+        """Test the commit-graph is written once and refreshed on demand."""
+        info_dir = Path(temp_git_repo) / ".git" / "objects" / "info"
+
+        assert manager.ensure_commit_graph()
+        assert (info_dir / "commit-graphs").is_dir()
+
+        with patch.object(manager, "write_commit_graph") as write:
+            assert manager.ensure_commit_graph()
+            write.assert_not_called()
+
+        Repo(temp_git_repo).index.commit("Another commit")
+        assert manager.write_commit_graph()
+
+    def test_write_commit_graph_invalid_repository(self, tmp_path):
+        """Test commit-graph failures are reported, not raised."""
+        assert GitWorktreeManager(str(tmp_path)).write_commit_graph() is False
+
+    @pytest.fixture
+    def layered_repo(self, temp_git_repo):
+        """Add nested directories to the test repository."""
+        repo = Repo(temp_git_repo)
+        files = ["api/v1/routes.py", "api/models.py", "docs/guide.md", "run.sh"]
+        for name in files:
+            target = Path(temp_git_repo) / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(f"{name}\n")
+        os.chmod(Path(temp_git_repo) / "run.sh", 0o755)
+        repo.index.add(files)
+        repo.index.commit("Add layout")
+        return temp_git_repo
+
+    def test_cone_directories(self):
+        """Test touched paths collapse to minimal cone directories."""
+        assert cone_directories(
+            ["api/v1/routes.py", "api/models.py", "docs/", "README.md", "../x"]
+        ) == ["api", "docs"]
+
+    def test_create_sparse_worktree(self, layered_repo, tmp_path):
+        """Test sparse mode checks out only the touched directories."""
+        manager = GitWorktreeManager(layered_repo)
+        path = tmp_path / "sparse"
+
+        result = manager.create_worktree(
+            str(path),
+            "sparse-branch",
+            mode=WorktreeCheckoutMode.SPARSE,
+            sparse_paths=["api/v1/routes.py"],
+        )
+
+        assert result["checkout_mode"] == "sparse"
+        assert (path / "api" / "v1" / "routes.py").exists()
+        # Cone mode also keeps files directly inside ancestor directories
+        assert (path / "api" / "models.py").exists()
+        assert (path / "README.md").exists()
+        assert not (path / "docs").exists()
+        assert manager.get_worktree_status(str(path))["has_changes"] is False
+
+        # Widening the cone later pulls in more directories
+        manager.populate_worktree(str(path), ["docs/guide.md"])
+        assert (path / "docs" / "guide.md").exists()
+
+        with pytest.raises(GitWorktreeError, match="sparse_paths"):
+            manager.create_worktree(
+                str(tmp_path / "bad"), "bad", mode=WorktreeCheckoutMode.SPARSE
+            )
+
+    def test_create_no_checkout_worktree_populates_lazily(self, layered_repo, tmp_path):
+        """Test no-checkout mode writes only top-level files until populated."""
+        manager = GitWorktreeManager(layered_repo)
+        path = tmp_path / "lazy"
+
+        manager.create_worktree(
+            str(path), "lazy-branch", mode=WorktreeCheckoutMode.NO_CHECKOUT
+        )
+        assert sorted(os.listdir(path)) == [".git", "README.md", "run.sh"]
+        # It has an index, so it reads as clean rather than deleted
+        status = manager.get_worktree_statuses([str(path)])[str(path)]
+        assert status["has_changes"] is False
+
+        manager.populate_worktree(str(path), ["docs/guide.md"])
+        assert (path / "docs" / "guide.md").exists()
+        assert not (path / "api").exists()
+
+        manager.populate_worktree(str(path))
+        assert (path / "api" / "v1" / "routes.py").exists()
+        assert manager.get_worktree_status(str(path))["has_changes"] is False
+
+    def test_no_checkout_worktree_removes_without_force(self, layered_repo, tmp_path):
+        """Test an unpopulated no-checkout worktree is not seen as modified."""
+        manager = GitWorktreeManager(layered_repo)
+        path = tmp_path / "untouched"
+
+        manager.create_worktree(
+            str(path), "untouched-branch", mode=WorktreeCheckoutMode.NO_CHECKOUT
+        )
+
+        assert manager.remove_worktree(str(path))
+        assert not path.exists()
+
+    def test_create_reflink_worktree(self, layered_repo, tmp_path):
+        """Test reflink mode clones clean files and checks out the rest."""
+        manager = GitWorktreeManager(layered_repo)
+        # Locally modified files must not be cloned
+        (Path(layered_repo) / "docs" / "guide.md").write_text("local edit\n")
+
+        clones = []
+
+        def fake_clone(source, target):
+            clones.append(os.path.relpath(source, layered_repo))
+            shutil.copyfile(source, target)
+
+        path = tmp_path / "cow"
+        with (
+            patch(
+                "cc_orchestrator.core.git_operations.reflink_supported",
+                return_value=True,
+            ),
+            patch("cc_orchestrator.core.git_operations._clone_file", fake_clone),
+        ):
+            result = manager.create_worktree(
+                str(path), "cow-branch", mode=WorktreeCheckoutMode.REFLINK
+            )
+
+        assert result["checkout_mode"] == "reflink"
+        assert "docs/guide.md" not in clones
+        assert "api/v1/routes.py" in clones
+        assert (path / "docs" / "guide.md").read_text() == "docs/guide.md\n"
+        assert os.access(path / "run.sh", os.X_OK)
+        assert manager.get_worktree_status(str(path))["has_changes"] is False
+
+    def test_reflink_falls_back_to_full_checkout(self, layered_repo, tmp_path):
+        """Test reflink mode degrades to a full checkout when unsupported."""
+        manager = GitWorktreeManager(layered_repo)
+        with patch(
+            "cc_orchestrator.core.git_operations.reflink_supported",
+            return_value=False,
+        ):
+            result = manager.create_worktree(
+                str(tmp_path / "full"), "full-branch", mode=WorktreeCheckoutMode.REFLINK
+            )
+
+        assert result["checkout_mode"] == "full"
+        assert (tmp_path / "full" / "api" / "models.py").exists()
+
     def test_generate_worktree_path_unique(self, manager, tmp_path):
         """Test generating unique worktree path."""
         base_dir = str(tmp_path)
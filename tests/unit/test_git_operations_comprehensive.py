@@ -800,19 +800,11 @@ branch refs/heads/feature
                 mock_tracking_branch
             )
 
-            # Mock ahead commits
-            mock_ahead_commits = [Mock(), Mock()]  # 2 commits ahead
-            mock_behind_commits = [Mock()]  # 1 commit behind
+            mock_tracking_branch.commit.hexsha = "efgh5678"
 
-            def iter_commits_side_effect(range_spec):
-                if "feature-branch" in range_spec and ".." in range_spec:
-                    if range_spec.startswith(str(mock_tracking_branch)):
-                        return mock_ahead_commits
-                    else:
-                        return mock_behind_commits
-                return []
-
-            mock_worktree_repo.iter_commits.side_effect = iter_commits_side_effect
+            # rev-list --left-right --count: 2 commits ahead, 1 commit behind
+            mock_worktree_repo.git = Mock()
+            mock_worktree_repo.git.rev_list.return_value = "2\t1"
 
             mock_repo_class.return_value = mock_worktree_repo
 
@@ -836,13 +828,15 @@ branch refs/heads/feature
             mock_worktree_repo.untracked_files = []
             mock_worktree_repo.index.diff.return_value = []
 
-            # Mock tracking branch but iter_commits raises error
+            # Mock tracking branch but rev-list raises error
             mock_tracking_branch = Mock()
+            mock_tracking_branch.commit.hexsha = "ijkl9012"
             mock_worktree_repo.active_branch.tracking_branch.return_value = (
                 mock_tracking_branch
             )
-            mock_worktree_repo.iter_commits.side_effect = GitCommandError(
-                "iter_commits", 1, "error"
+            mock_worktree_repo.git = Mock()
+            mock_worktree_repo.git.rev_list.side_effect = GitCommandError(
+                "rev-list", 1, "error"
             )
 
             mock_repo_class.return_value = mock_worktree_repo
@@ -0,0 +1,236 @@
+"""Tests for the persistent git command runner."""
+
+import os
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from git import Repo
+from git.exc import GitCommandError
+
+from cc_orchestrator.core.git_operations import GitWorktreeManager
+from cc_orchestrator.core.git_runner import (
+    GitRunner,
+    LatencyHistogram,
+    cleanup_git_runners,
+    get_git_latency_stats,
+    get_git_runner,
+    parse_porcelain_v2,
+)
+
+
+@pytest.fixture
+def repo_path(tmp_path):
+    """Create a repository with one commit."""
+    path = tmp_path / "repo"
+    path.mkdir()
+    repo = Repo.init(path)
+    (path / "a.txt").write_text("a\n")
+    (path / "b.txt").write_text("b\n")
+    repo.index.add(["a.txt", "b.txt"])
+    repo.index.commit("Initial commit")
+    return str(path)
+
+
+@pytest.fixture
+def runner(repo_path):
+    """Create a runner and close its processes afterwards."""
+    runner = GitRunner(repo_path)
+    yield runner
+    runner.close()
+
+
+class TestLatencyHistogram:
+    """Test latency bookkeeping."""
+
+    def test_buckets_and_percentiles(self):
+        histogram = LatencyHistogram(buckets_ms=(1, 10, 100))
+        for duration in (0.5, 0.7, 5, 50, 500):
+            histogram.observe(duration)
+
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 5
+        assert snapshot["buckets"] == {"1": 2, "10": 3, "100": 4, "+Inf": 5}
+        assert snapshot["p50_ms"] == 10.0
+        assert snapshot["p99_ms"] == 500
+        assert snapshot["max_ms"] == 500
+
+
+class TestPorcelainStatus:
+    """Test parsing of ``git status --porcelain=v2 --branch -z``."""
+
+    def test_parse_branch_and_entries(self):
+        output = "\0".join(
+            [
+                "# branch.oid 1234abcd",
+                "# branch.head feature",
+                "# branch.upstream origin/feature",
+                "# branch.ab +2 -3",
+                "1 .M N... 100644 100644 100644 aaa bbb a.txt",
+                "2 R. N... 100644 100644 100644 aaa aaa R100 new.txt",
+                "old.txt",
+                "? untracked.txt",
+                "",
+            ]
+        )
+
+        status = parse_porcelain_v2(output, "/wt")
+
+        assert status.commit == "1234abcd"
+        assert status.branch == "feature"
+        assert status.upstream == "origin/feature"
+        assert (status.ahead, status.behind) == (2, 3)
+        assert (status.changed, status.untracked) == (2, 1)
+        assert status.to_status_dict()["has_changes"] is True
+
+    def test_parse_clean_detached(self):
+        status = parse_porcelain_v2(
+            "# branch.oid abc\0# branch.head (detached)\0", "/wt"
+        )
+        assert status.branch is None
+        assert status.has_changes is False
+
+
+class TestGitRunner:
+    """Test command execution against a real repository."""
+
+    def test_status_matches_worktree_state(self, runner, repo_path):
+        clean = runner.status(repo_path)
+        assert clean.has_changes is False
+        assert clean.commit == Repo(repo_path).head.commit.hexsha
+
+        with open(f"{repo_path}/a.txt", "a") as f:
+            f.write("more\n")
+        with open(f"{repo_path}/c.txt", "w") as f:
+            f.write("new\n")
+
+        results = runner.status_many([repo_path, f"{repo_path}/missing"])
+        dirty = results[repo_path]
+        assert (dirty.changed, dirty.untracked) == (1, 1)
+        assert isinstance(results[f"{repo_path}/missing"], Exception)
+
+        stats = runner.latency_stats()
+        assert stats["status"]["count"] == 3
+
+    def test_run_raises_git_command_error(self, runner):
+        with pytest.raises(GitCommandError):
+            runner.run("rev-parse", "does-not-exist")
+
+    def test_status_takes_no_optional_locks(self, runner, repo_path):
+        index = os.path.join(repo_path, ".git", "index")
+        # A touched file makes plain ``git status`` refresh and rewrite the index
+        time.sleep(1.1)
+        os.utime(os.path.join(repo_path, "a.txt"))
+        before = os.stat(index).st_mtime_ns
+
+        assert runner.status(repo_path).has_changes is False
+        assert os.stat(index).st_mtime_ns == before
+        assert runner.latency_stats()["status"]["count"] == 1
+
+    def test_cat_file_session_is_reused(self, runner, repo_path):
+        head = Repo(repo_path).head.commit.hexsha
+
+        assert runner.resolve("HEAD") == head
+        assert runner.read_object("HEAD:a.txt") == b"a\n"
+        assert runner.read_object("HEAD:b.txt") == b"b\n"
+        assert runner.resolve("refs/heads/missing") is None
+
+        session = runner.cat_file()
+        process = session._process
+        assert runner.read_object("HEAD:a.txt") == b"a\n"
+        assert session._process is process
+
+        # A dead process is restarted transparently
+        process.kill()
+        process.wait()
+        assert runner.read_object("HEAD:b.txt") == b"b\n"
+        assert runner.latency_stats()["cat-file --batch"]["count"] == 4
+
+    def test_coalesce_shares_concurrent_runs(self, runner):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_prune():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+
+        first = threading.Thread(
+            target=runner.coalesce, args=("worktree prune", slow_prune)
+        )
+        first.start()
+        started.wait(5)
+
+        # These arrive while the first run is in flight and share one rerun
+        waiters = [
+            threading.Thread(
+                target=runner.coalesce, args=("worktree prune", slow_prune)
+            )
+            for _ in range(5)
+        ]
+        for waiter in waiters:
+            waiter.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in [first, *waiters]:
+            thread.join(5)
+
+        assert len(calls) == 2
+        assert runner.coalesced_runs("worktree prune") == 2
+
+
+class TestManagerIntegration:
+    """Test GitWorktreeManager routes work through the runner."""
+
+    def test_cleanup_prunes_once(self, repo_path):
+        manager = GitWorktreeManager(repo_path)
+        stale = [{"path": f"/stale/path{i}"} for i in range(3)]
+        repo = Mock()
+
+        with (
+            patch.object(manager, "_repo", repo),
+            patch.object(manager, "list_worktrees", return_value=stale),
+        ):
+            assert manager.cleanup_worktrees() == [w["path"] for w in stale]
+
+        repo.git.worktree.assert_called_once_with("prune")
+
+    def test_batch_statuses_and_latency_registry(self, repo_path):
+        cleanup_git_runners()
+        manager = GitWorktreeManager(repo_path)
+        manager.list_worktrees()
+
+        statuses = manager.get_worktree_statuses([repo_path])
+        assert statuses[repo_path]["has_changes"] is False
+        assert statuses[repo_path]["branch"] == Repo(repo_path).active_branch.name
+
+        assert get_git_runner(repo_path) is manager.runner
+        stats = get_git_latency_stats()[manager.runner.repo_path]
+        assert stats["worktree list"]["count"] == 1
+        cleanup_git_runners()
+
+    def test_worktree_heads_resolve_through_one_session(self, repo_path, tmp_path):
+        cleanup_git_runners()
+        manager = GitWorktreeManager(repo_path)
+        main_head = Repo(repo_path).head.commit.hexsha
+        created = manager.create_worktree(str(tmp_path / "wt"), "feature")
+        assert created["commit"] == main_head
+
+        linked = Repo(created["path"])
+        (tmp_path / "wt" / "c.txt").write_text("c\n")
+        linked.index.add(["c.txt"])
+        linked_head = linked.index.commit("Linked commit").hexsha
+
+        session = manager.runner.cat_file(check_only=True)
+        process = session._process
+        assert process is not None
+        assert manager.resolve_head(created["path"]) == linked_head
+        assert manager.resolve_head(repo_path) == main_head
+        assert manager.get_worktree_status(created["path"])["commit"] == linked_head
+        assert session._process is process
+
+        # Seen from a linked worktree, the main worktree is main-worktree/HEAD
+        assert GitWorktreeManager(created["path"]).resolve_head(repo_path) == main_head
+        cleanup_git_runners()
@@ -10,7 +10,7 @@ Tests cover all instance management functionality including:
 """
 
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import ANY, AsyncMock, Mock
 
 import pytest
 from fastapi import HTTPException
@@ -95,7 +95,13 @@ class TestInstancesRouterFunctions:
         assert result["pages"] == 1
 
         # Verify CRUD was called correctly
-        mock_crud.list_instances.assert_called_once_with(offset=0, limit=20, filters={})
+        mock_crud.list_instances.assert_called_once_with(
+            offset=0,
+            limit=20,
+            filters={},
+            include=[],
+            fields=ANY,
+        )
 
     @pytest.mark.asyncio
     async def test_list_instances_with_filters(self, mock_crud, pagination_params):
@@ -114,6 +120,8 @@ class TestInstancesRouterFunctions:
             offset=0,
             limit=20,
             filters={"status": InstanceStatus.RUNNING, "branch_name": "feature-branch"},
+            include=[],
+            fields=ANY,
         )
 
     @pytest.mark.asyncio
@@ -253,7 +261,9 @@ class TestInstancesRouterFunctions:
         mock_instance.status = InstanceStatus.STOPPED
         mock_crud.get_instance.return_value = mock_instance
 
-        result = await instances.start_instance(instance_id=1, crud=mock_crud)
+        result = await instances.start_instance(
+            instance_id=1, crud=mock_crud, database_id=None
+        )
 
         assert result["success"] is True
         assert "Instance started successfully" in result["message"]
@@ -294,7 +304,9 @@ class TestInstancesRouterFunctions:
         mock_instance.status = InstanceStatus.RUNNING
         mock_crud.get_instance.return_value = mock_instance
 
-        result = await instances.stop_instance(instance_id=1, crud=mock_crud)
+        result = await instances.stop_instance(
+            instance_id=1, crud=mock_crud, database_id=None
+        )
 
         assert result["success"] is True
         assert "Instance stopped successfully" in result["message"]
@@ -0,0 +1,234 @@
+"""Tests for column-projected list fast paths."""
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from cc_orchestrator.database.crud import (
+    InstanceCRUD,
+    TaskCRUD,
+    projection_columns,
+)
+from cc_orchestrator.database.models import (
+    Instance,
+    InstanceStatus,
+    Task,
+    TaskPriority,
+    TaskStatus,
+)
+from cc_orchestrator.web.crud_adapter import CRUDBase
+from cc_orchestrator.web.dependencies import PaginationParams, parse_fields
+from cc_orchestrator.web.routers.v1 import instances, tasks
+from cc_orchestrator.web.schemas import (
+    InstanceResponse,
+    TaskResponse,
+    compile_row_encoder,
+    list_fields,
+)
+
+TASK_FILTERS = {
+    "status_filter": None,
+    "priority_filter": None,
+    "instance_id": 1,
+    "worktree_id": None,
+}
+
+
+@pytest.fixture
+def session():
+    """Create an in-memory database with a few instances and tasks."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    # Create tables from the models directly; other suites clear Base.metadata
+    for model in (Instance, Task):
+        model.__table__.create(engine, checkfirst=True)
+
+    with Session(engine) as session:
+        first = InstanceCRUD.create(
+            session, issue_id="issue-1", extra_metadata={"big": "x" * 100}
+        )
+        InstanceCRUD.create(session, issue_id="issue-2")
+        InstanceCRUD.update(session, first.id, status=InstanceStatus.RUNNING)
+        for priority in (TaskPriority.LOW, TaskPriority.URGENT, TaskPriority.MEDIUM):
+            TaskCRUD.create(
+                session,
+                title=f"task-{priority.name.lower()}",
+                description="Seeded task",
+                instance_id=first.id,
+                priority=priority,
+                requirements={"cpu": 2},
+            )
+        session.commit()
+        yield session
+
+    engine.dispose()
+
+
+class TestProjectionColumns:
+    """Test column selection for projections."""
+
+    def test_default_skips_deferred_json_columns(self):
+        names = [column.key for column in projection_columns(Task)]
+        assert "title" in names
+        assert "requirements" not in names
+        assert "results" not in names
+        assert "extra_metadata" not in names
+
+    def test_requested_fields_keep_id_and_ignore_non_columns(self):
+        names = [
+            column.key
+            for column in projection_columns(Task, ["title", "results", "command"])
+        ]
+        assert names == ["id", "title", "results"]
+
+
+class TestCRUDRows:
+    """Test row listing and counting in the CRUD layer."""
+
+    def test_instance_rows_and_count(self, session):
+        rows = InstanceCRUD.list_rows(session, fields=["issue_id", "status"])
+        assert {row.issue_id for row in rows} == {"issue-1", "issue-2"}
+        assert not hasattr(rows[0], "extra_metadata")
+
+        running = InstanceCRUD.list_rows(session, status=InstanceStatus.RUNNING)
+        assert [row.issue_id for row in running] == ["issue-1"]
+        assert InstanceCRUD.count(session) == 2
+        assert InstanceCRUD.count(session, status=InstanceStatus.RUNNING) == 1
+
+    def test_task_rows_ordered_by_priority(self, session):
+        rows = TaskCRUD.list_rows(session, status=TaskStatus.PENDING, limit=2)
+        assert [row.priority for row in rows] == [
+            TaskPriority.URGENT,
+            TaskPriority.MEDIUM,
+        ]
+        assert TaskCRUD.count(session, status=TaskStatus.PENDING) == 3
+        assert TaskCRUD.count(session, instance_id=999) == 0
+
+
+class TestRowEncoder:
+    """Test the precompiled row encoder."""
+
+    def test_list_fields(self):
+        default = list_fields(TaskResponse, deferred=("requirements", "results"))
+        assert "requirements" not in default
+        assert "title" in default
+        assert list_fields(TaskResponse, requested=["title"]) == ("id", "title")
+
+    def test_encoder_applies_validators_and_defaults(self, session):
+        fields = ("id", "title", "status", "priority", "enabled", "requirements")
+        encode = compile_row_encoder(TaskResponse, fields)
+        row = TaskCRUD.list_rows(session, fields=fields, limit=1)[0]
+
+        assert encode(row) == {
+            "id": row.id,
+            "title": "task-urgent",
+            "status": "pending",
+            "priority": "urgent",
+            "enabled": True,
+            "requirements": {"cpu": 2},
+        }
+        assert compile_row_encoder(TaskResponse, fields) is encode
+
+    def test_encoder_matches_model_validation(self, session):
+        fields = list_fields(InstanceResponse)
+        encode = compile_row_encoder(InstanceResponse, fields)
+        instance = InstanceCRUD.list_all(session)[0]
+
+        assert encode(instance) == InstanceResponse.model_validate(instance).model_dump(
+            include=set(fields)
+        )
+
+    def test_encoder_rejects_rows_breaking_the_schema(self, session):
+        encode = compile_row_encoder(TaskResponse, ("id", "title"))
+        row = TaskCRUD.list_rows(session, fields=["id"], limit=1)[0]
+
+        with pytest.raises(ValueError, match="TaskResponse.title is required"):
+            encode(row)
+
+        untitled = type("Row", (), {"id": 1, "title": None})()
+        with pytest.raises(ValueError, match="required but None"):
+            encode(untitled)
+
+    def test_parse_fields(self):
+        assert parse_fields(None, ("title",)) is None
+        assert parse_fields("title, status,title", ("title", "status")) == [
+            "title",
+            "status",
+        ]
+        with pytest.raises(HTTPException) as exc_info:
+            parse_fields("password", ("title",))
+        assert exc_info.value.status_code == 422
+
+
+class TestListEndpoints:
+    """Test the list endpoints served from projected rows."""
+
+    async def test_tasks_defer_json_fields_by_default(self, session):
+        result = await tasks.list_tasks(
+            pagination=PaginationParams(page=1, size=20),
+            **TASK_FILTERS,
+            crud=CRUDBase(session),
+        )
+
+        assert result["total"] == 3
+        item = result["items"][0]
+        assert item["title"] == "task-urgent"
+        assert "requirements" not in item
+        assert "results" not in item
+
+    async def test_tasks_fields_selects_json_fields(self, session):
+        result = await tasks.list_tasks(
+            pagination=PaginationParams(page=1, size=20),
+            **TASK_FILTERS,
+            fields="title,requirements",
+            crud=CRUDBase(session),
+        )
+
+        assert result["items"][0] == {
+            "id": result["items"][0]["id"],
+            "title": "task-urgent",
+            "requirements": {"cpu": 2},
+        }
+
+    async def test_instances_paginate_rows(self, session):
+        result = await instances.list_instances(
+            pagination=PaginationParams(page=2, size=1),
+            status_filter=None,
+            branch_name=None,
+            fields="issue_id,status",
+            crud=CRUDBase(session),
+        )
+
+        assert result["total"] == 2
+        assert result["pages"] == 2
+        assert len(result["items"]) == 1
+        assert set(result["items"][0]) == {"id", "issue_id", "status"}
+
+    async def test_tasks_general_listing_honours_status(self, session):
+        task = TaskCRUD.list_rows(session, limit=1)[0]
+        TaskCRUD.update_status(session, task.id, TaskStatus.COMPLETED)
+        session.commit()
+        filters = {**TASK_FILTERS, "instance_id": None}
+
+        for include in (None, "instance"):
+            completed = await tasks.list_tasks(
+                pagination=PaginationParams(page=1, size=20),
+                **{**filters, "status_filter": TaskStatus.COMPLETED},
+                include=include,
+                crud=CRUDBase(session),
+            )
+            pending = await tasks.list_tasks(
+                pagination=PaginationParams(page=1, size=20),
+                **filters,
+                include=include,
+                crud=CRUDBase(session),
+            )
+
+            assert completed["total"] == 1
+            assert [item["id"] for item in completed["items"]] == [task.id]
+            assert pending["total"] == 2
@@ -0,0 +1,135 @@
+"""Tests for the asynchronous, queue-backed logging pipeline."""
+
+import json
+import logging
+import queue
+from unittest.mock import patch
+
+import pytest
+
+from cc_orchestrator.utils.logging import (
+    BatchingQueueListener,
+    BoundedQueueHandler,
+    LogContext,
+    get_logger,
+    get_logging_stats,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture(autouse=True)
+def restore_root_logger():
+    """Put the root logger back the way the test found it."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    shutdown_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+class TestAsynchronousSetup:
+    """Test setup_logging with the queue pipeline."""
+
+    def test_records_are_written_by_the_listener(self, tmp_path):
+        log_file = tmp_path / "logs" / "app.log"
+        setup_logging(log_file=log_file, enable_console=False, asynchronous=True)
+
+        root = logging.getLogger()
+        assert [type(h) for h in root.handlers] == [BoundedQueueHandler]
+
+        logger = get_logger("pipeline.test", LogContext.WEB)
+        for i in range(50):
+            logger.info(f"event {i}", index=i)
+        shutdown_logging()
+
+        assert root.handlers == []
+        lines = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert [line["index"] for line in lines] == list(range(50))
+        assert lines[0]["context"] == "web"
+
+    def test_size_rotation(self, tmp_path):
+        log_file = tmp_path / "app.log"
+        setup_logging(
+            log_file=log_file,
+            enable_console=False,
+            enable_structured=False,
+            asynchronous=True,
+            max_bytes=500,
+            backup_count=2,
+        )
+
+        logger = logging.getLogger("pipeline.rotation")
+        for i in range(40):
+            logger.warning("line %02d", i)
+        shutdown_logging()
+
+        assert (tmp_path / "app.log.1").exists()
+        assert (tmp_path / "app.log.2").exists()
+        assert not (tmp_path / "app.log.3").exists()
+        assert log_file.read_text().splitlines()[-1].endswith("line 39")
+
+
+class TestQueueBounds:
+    """Test drop accounting when the queue is full."""
+
+    def test_full_queue_drops_and_reports(self):
+        log_queue = queue.Queue(maxsize=2)
+        queue_handler = BoundedQueueHandler(log_queue)
+        logger = logging.getLogger("pipeline.drops")
+        logger.propagate = False
+        logger.addHandler(queue_handler)
+        try:
+            for i in range(5):
+                logger.warning("message %s", i)
+            assert queue_handler.dropped == 3
+
+            sink = _ListHandler()
+            listener = BatchingQueueListener(
+                log_queue, sink, queue_handler=queue_handler
+            )
+            listener.start()
+            listener.stop()
+        finally:
+            logger.removeHandler(queue_handler)
+            logger.propagate = True
+
+        messages = [record.getMessage() for record in sink.records]
+        assert messages == [
+            "message 0",
+            "message 1",
+            "Log queue full, dropped 3 records",
+        ]
+
+    def test_stats(self, tmp_path):
+        assert get_logging_stats() == {"queued": 0, "dropped": 0}
+        setup_logging(
+            log_file=tmp_path / "app.log", enable_console=False, asynchronous=True
+        )
+        assert get_logging_stats()["dropped"] == 0
+
+
+class TestLevelFastPath:
+    """Test that disabled levels skip building the record."""
+
+    def test_disabled_level_skips_logging_call(self):
+        logger = get_logger("pipeline.fast", LogContext.WEB)
+        logger.logger.setLevel(logging.WARNING)
+        try:
+            with patch.object(logger.logger, "log") as log:
+                logger.debug("hidden", detail=1)
+                logger.info("hidden")
+                logger.warning("shown")
+            log.assert_called_once()
+        finally:
+            logger.logger.setLevel(logging.NOTSET)
@@ -0,0 +1,92 @@
+"""Tests for the in-process metrics registry and the /metrics endpoint."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from cc_orchestrator.utils.metrics import MetricsRegistry
+from cc_orchestrator.web.app import create_app
+from cc_orchestrator.web.dependencies import get_crud
+
+
+class TestMetricsRegistry:
+    """Test recording and the Prometheus text rendering."""
+
+    def test_counter_and_gauge(self):
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Requests", ("method",))
+        requests.labels("GET").inc()
+        requests.labels("GET").inc(2)
+        requests.labels('P"O\nST').inc()
+        registry.gauge("queue_depth", "Queue depth").set(1.5)
+
+        assert registry.render() == (
+            "# HELP queue_depth Queue depth\n"
+            "# TYPE queue_depth gauge\n"
+            "queue_depth 1.5\n"
+            "# HELP requests_total Requests\n"
+            "# TYPE requests_total counter\n"
+            'requests_total{method="GET"} 3\n'
+            'requests_total{method="P\\"O\\nST"} 1\n'
+        )
+
+    def test_histogram_buckets(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram(
+            "latency_seconds", "Latency", ("route",), buckets=(0.01, 0.1)
+        )
+        series = histogram.labels("/a")
+        series.observe_ns(10_000_000)  # On the bound counts in that bucket
+        series.observe(0.05)
+        series.observe(3.0)
+
+        assert series.count == 3
+        assert series.sum == pytest.approx(3.06)
+        lines = registry.render().splitlines()[2:]
+        assert lines == [
+            'latency_seconds_bucket{route="/a",le="0.01"} 1',
+            'latency_seconds_bucket{route="/a",le="0.1"} 2',
+            'latency_seconds_bucket{route="/a",le="+Inf"} 3',
+            'latency_seconds_sum{route="/a"} 3.06',
+            'latency_seconds_count{route="/a"} 3',
+        ]
+
+    def test_registration_is_idempotent_and_checked(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("events_total", "Events", ("kind",))
+
+        assert registry.counter("events_total", "Events", ("kind",)) is counter
+        assert registry.get("events_total") is counter
+        with pytest.raises(ValueError):
+            registry.gauge("events_total", "Events", ("kind",))
+        with pytest.raises(ValueError):
+            counter.labels("a", "b")
+        with pytest.raises(ValueError):
+            counter.labels("a").inc(-1)
+        with pytest.raises(ValueError):
+            registry.counter("bad-name", "Bad")
+        with pytest.raises(ValueError):
+            registry.histogram("h", "H", buckets=(1.0, 0.5))
+
+
+class TestMetricsEndpoint:
+    """Test the /metrics endpoint."""
+
+    def test_exposes_api_handler_durations(self):
+        crud = MagicMock()
+        crud.list_instances = AsyncMock(return_value=([], 0))
+        app = create_app()
+        app.dependency_overrides[get_crud] = lambda: crud
+        client = TestClient(app)
+
+        assert client.get("/api/v1/instances/").status_code == 200
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert (
+            "cc_orchestrator_api_handler_duration_seconds_count"
+            '{handler="cc_orchestrator.web.routers.v1.instances.list_instances",'
+            'status="success"}'
+        ) in response.text
@@ -1,6 +1,5 @@
 """Comprehensive tests for web middleware to achieve 100% coverage."""
 
-from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -12,6 +11,7 @@ from cc_orchestrator.web.middleware import (
     RequestIDMiddleware,
     SecurityHeadersMiddleware,
 )
+from cc_orchestrator.web.rate_limit_engine import RateLimitEngine
 
 
 @pytest.fixture
@@ -198,10 +198,17 @@ class TestRateLimitMiddleware:
     """Test RateLimitMiddleware functionality."""
 
     @pytest.fixture
-    def middleware(self):
+    def clock(self):
+        """Create a manually advanced clock."""
+        return Mock(return_value=1000.0)
+
+    @pytest.fixture
+    def middleware(self, clock):
         """Create RateLimitMiddleware instance."""
         app = Mock()
-        return RateLimitMiddleware(app, requests_per_minute=3)
+        return RateLimitMiddleware(
+            app, requests_per_minute=3, engine=RateLimitEngine(clock=clock)
+        )
 
     async def test_dispatch_allows_requests_within_limit(
         self, middleware, mock_request, mock_response
@@ -209,66 +216,56 @@ class TestRateLimitMiddleware:
         """Test that requests within limit are allowed."""
         call_next = AsyncMock(return_value=mock_response)
 
-        with patch("cc_orchestrator.web.middleware.datetime") as mock_datetime:
-            now = datetime(2023, 1, 1, 12, 0, 0)
-            mock_datetime.now.return_value = now
-
-            result = await middleware.dispatch(mock_request, call_next)
+        result = await middleware.dispatch(mock_request, call_next)
 
-            assert result == mock_response
-            call_next.assert_called_once_with(mock_request)
+        assert result == mock_response
+        call_next.assert_called_once_with(mock_request)
 
-            # Check rate limit headers were added
-            assert mock_response.headers["X-RateLimit-Limit"] == "3"
-            assert mock_response.headers["X-RateLimit-Remaining"] == "2"
-            assert "X-RateLimit-Reset" in mock_response.headers
+        # Check rate limit headers were added
+        assert mock_response.headers["X-RateLimit-Limit"] == "3"
+        assert mock_response.headers["X-RateLimit-Remaining"] == "2"
+        assert "X-RateLimit-Reset" in mock_response.headers
 
     async def test_dispatch_blocks_requests_over_limit(self, middleware, mock_request):
         """Test that requests over limit are blocked."""
         call_next = AsyncMock()
 
-        with patch("cc_orchestrator.web.middleware.datetime") as mock_datetime:
-            now = datetime(2023, 1, 1, 12, 0, 0)
-            mock_datetime.now.return_value = now
-
-            # Make requests up to the limit
-            for _ in range(3):
-                await middleware.dispatch(mock_request, call_next)
+        # Make requests up to the limit
+        for _ in range(3):
+            await middleware.dispatch(mock_request, call_next)
 
-            # Next request should be blocked
-            result = await middleware.dispatch(mock_request, call_next)
+        # Next request should be blocked
+        result = await middleware.dispatch(mock_request, call_next)
 
-            assert result.status_code == 429
-            assert "Rate limit exceeded" in result.body.decode()
-            assert result.headers["Retry-After"] == "60"
-            assert result.media_type == "application/json"
+        assert result.status_code == 429
+        assert "Rate limit exceeded" in result.body.decode()
+        assert result.headers["Retry-After"] == "20"
+        assert result.media_type == "application/json"
 
-            # Should not have called next handler for blocked request
-            assert call_next.call_count == 3
+        # Should not have called next handler for blocked request
+        assert call_next.call_count == 3
 
     async def test_dispatch_cleans_old_requests(
-        self, middleware, mock_request, mock_response
+        self, middleware, clock, mock_request, mock_response
     ):
-        """Test that old requests are cleaned up."""
+        """Test that old requests stop counting."""
         call_next = AsyncMock(return_value=mock_response)
 
-        with patch("cc_orchestrator.web.middleware.datetime") as mock_datetime:
-            # First request at time 0
-            mock_datetime.now.return_value = datetime(2023, 1, 1, 12, 0, 0)
-            await middleware.dispatch(mock_request, call_next)
-            await middleware.dispatch(mock_request, call_next)
-            await middleware.dispatch(mock_request, call_next)
+        await middleware.dispatch(mock_request, call_next)
+        await middleware.dispatch(mock_request, call_next)
+        await middleware.dispatch(mock_request, call_next)
 
-            # Should be at limit now
-            assert len(middleware.client_requests["192.168.1.100"]) == 3
+        # Should be at limit now
+        quota = middleware.quota
+        assert middleware.engine.peek("192.168.1.100", quota).remaining == 0
 
-            # Move time forward by 2 minutes (old requests should be cleaned)
-            mock_datetime.now.return_value = datetime(2023, 1, 1, 12, 2, 0)
-            result = await middleware.dispatch(mock_request, call_next)
+        # Move time forward by 2 minutes (old requests no longer count)
+        clock.return_value += 120
+        result = await middleware.dispatch(mock_request, call_next)
 
-            # Should be allowed again (old requests cleaned)
-            assert result == mock_response
-            assert len(middleware.client_requests["192.168.1.100"]) == 1
+        # Should be allowed again
+        assert result == mock_response
+        assert middleware.engine.peek("192.168.1.100", quota).remaining == 2
 
     async def test_dispatch_different_ips_separate_limits(
         self, middleware, mock_response
@@ -287,16 +284,13 @@ class TestRateLimitMiddleware:
         request2.client.host = "192.168.1.101"
         request2.headers = {}
 
-        with patch("cc_orchestrator.web.middleware.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(2023, 1, 1, 12, 0, 0)
+        # Fill up limit for first IP
+        for _ in range(3):
+            await middleware.dispatch(request1, call_next)
 
-            # Fill up limit for first IP
-            for _ in range(3):
-                await middleware.dispatch(request1, call_next)
-
-            # Second IP should still be allowed
-            result = await middleware.dispatch(request2, call_next)
-            assert result == mock_response
+        # Second IP should still be allowed
+        result = await middleware.dispatch(request2, call_next)
+        assert result == mock_response
 
     def test_get_client_ip_forwarded_for(self, middleware):
         """Test client IP extraction from X-Forwarded-For header."""
@@ -341,7 +335,8 @@ class TestRateLimitMiddleware:
         middleware = RateLimitMiddleware(app, requests_per_minute=100)
 
         assert middleware.requests_per_minute == 100
-        assert isinstance(middleware.client_requests, dict)
+        assert middleware.quota.limit == 100
+        assert isinstance(middleware.engine, RateLimitEngine)
 
 
 class TestSecurityHeadersMiddleware:
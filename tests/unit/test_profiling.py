@@ -0,0 +1,133 @@
+"""Tests for the profiling helpers, endpoint and CLI option."""
+
+import threading
+import time
+
+import pytest
+from click.testing import CliRunner
+from fastapi.testclient import TestClient
+
+from cc_orchestrator.cli.main import main
+from cc_orchestrator.utils.profiling import CommandProfiler, StackSampler
+from cc_orchestrator.web.app import create_app
+
+
+def _spin(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(100))
+
+
+class TestStackSampler:
+    """Test the statistical stack sampler."""
+
+    def test_samples_busy_thread(self):
+        stop = threading.Event()
+        worker = threading.Thread(target=_spin, args=(stop,), name="busy-worker")
+        worker.start()
+        try:
+            sampler = StackSampler(interval=0.001)
+            sampler.run(0.2)
+        finally:
+            stop.set()
+            worker.join()
+
+        assert sampler.samples > 0
+        busy = [
+            line
+            for line in sampler.collapsed().splitlines()
+            if line.startswith("busy-worker;")
+        ]
+        assert busy
+        stack, count = busy[0].rsplit(" ", 1)
+        assert int(count) > 0
+        assert " " not in stack
+        assert any(frame.startswith("_spin_(") for frame in stack.split(";"))
+
+        summary = sampler.to_dict(limit=5)
+        assert summary["samples"] == sampler.samples
+        assert len(summary["stacks"]) <= 5
+        assert summary["top_functions"][0]["count"] > 0
+
+    def test_idle_threads_are_skipped(self):
+        stop = threading.Event()
+        waiter = threading.Thread(target=stop.wait, name="idle-waiter")
+        waiter.start()
+        try:
+            sampler = StackSampler()
+            sampler.sample()
+            with_idle = StackSampler(include_idle=True)
+            with_idle.sample()
+        finally:
+            stop.set()
+            waiter.join()
+
+        assert not any(s.startswith("idle-waiter;") for s in sampler.stacks)
+        assert any(s.startswith("idle-waiter;") for s in with_idle.stacks)
+
+
+class TestCommandProfiler:
+    """Test the cProfile and tracemalloc report."""
+
+    def test_writes_report_and_raw_profile(self, tmp_path):
+        profiler = CommandProfiler(tmp_path / "out" / "report.txt", title="demo")
+        profiler.start()
+        data = [bytearray(1024) for _ in range(100)]
+        time.sleep(0.01)
+        path = profiler.stop()
+
+        report = path.read_text()
+        assert report.startswith("Profile: demo\n")
+        assert "== CPU (top 40 by cumulative time) ==" in report
+        assert "== Allocations (top 40 sites still allocated) ==" in report
+        assert "test_profiling.py" in report
+        assert (tmp_path / "out" / "report.prof").exists()
+        assert len(data) == 100
+
+    def test_cli_option(self, tmp_path):
+        report = tmp_path / "cli.txt"
+        result = CliRunner().invoke(
+            main, ["--profile-report", str(report), "config", "--help"]
+        )
+
+        assert result.exit_code == 0
+        assert f"Profile report written to {report}" in result.output
+        assert "cumulative time" in report.read_text()
+
+
+class TestProfileEndpoint:
+    """Test the /debug/profile endpoint."""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(create_app())
+
+    def test_collapsed_and_json_output(self, client):
+        admin = {"Authorization": "Bearer admin-token"}
+
+        response = client.get(
+            "/debug/profile",
+            params={"seconds": 0.2, "interval_ms": 1, "include_idle": True},
+            headers=admin,
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        for line in response.text.splitlines():
+            assert int(line.rsplit(" ", 1)[1]) > 0
+
+        response = client.get(
+            "/debug/profile",
+            params={"seconds": 0.1, "output": "json"},
+            headers=admin,
+        )
+        assert response.status_code == 200
+        assert response.json()["samples"] > 0
+
+    def test_validation_and_permissions(self, client):
+        admin = {"Authorization": "Bearer admin-token"}
+        user = {"Authorization": "Bearer valid-jwt-token"}
+
+        assert client.get("/debug/profile", headers=user).status_code == 403
+        too_long = client.get("/debug/profile?seconds=600", headers=admin)
+        assert too_long.status_code == 422
+        bad_output = client.get("/debug/profile?output=svg", headers=admin)
+        assert bad_output.status_code == 422
@@ -0,0 +1,145 @@
+"""Tests for the shared rate limiting engine."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from cc_orchestrator.web.middlewares.rate_limiter import RateLimiter
+from cc_orchestrator.web.rate_limit_engine import Quota, RateLimitEngine, RouteRules
+
+
+@pytest.fixture
+def clock():
+    return Mock(return_value=1000.0)
+
+
+@pytest.fixture
+def engine(clock):
+    return RateLimitEngine(capacity=3, clock=clock)
+
+
+class TestRateLimitEngine:
+    """Test GCRA decisions, bounded memory and expiry."""
+
+    def test_burst_then_steady_rate(self, engine, clock):
+        quota = Quota(limit=6, period=60.0, burst=2)
+
+        decisions = [engine.hit("a", quota) for _ in range(9)]
+        assert [d.allowed for d in decisions] == [True] * 8 + [False]
+        assert [d.remaining for d in decisions[:3]] == [7, 6, 5]
+        assert decisions[-1].retry_after == pytest.approx(10.0)
+
+        # One request's worth of quota recovers every 10 seconds
+        clock.return_value += 10
+        assert engine.hit("a", quota).allowed
+        assert not engine.hit("a", quota).allowed
+
+    def test_block_and_peek(self, engine, clock):
+        quota = Quota(limit=1, period=60.0, block=120.0)
+
+        assert engine.peek("a", quota).remaining == 1
+        assert "a" not in engine
+
+        engine.hit("a", quota)
+        assert not engine.hit("a", quota).allowed
+
+        # The block outlasts the recovery of the counter
+        clock.return_value += 90
+        peeked = engine.peek("a", quota)
+        assert not peeked.allowed
+        assert peeked.retry_after == pytest.approx(30.0)
+        assert not engine.hit("a", quota).allowed
+
+        clock.return_value += 31
+        assert engine.hit("a", quota).allowed
+
+    def test_degenerate_quotas(self, engine):
+        assert not engine.hit("a", Quota(limit=0)).allowed
+        assert engine.hit("a", Quota(limit=1, period=0)).allowed
+        assert len(engine) == 0
+
+    def test_evicts_least_recently_used(self, engine):
+        quota = Quota(limit=1)
+        for key in ("a", "b", "c"):
+            engine.hit(key, quota)
+        engine.hit("a", quota)
+
+        engine.hit("d", quota)
+
+        assert len(engine) == 3
+        assert "b" not in engine
+        assert "a" in engine
+        assert engine.evictions == 1
+
+    def test_timing_wheel_expires_recovered_keys(self, clock):
+        engine = RateLimitEngine(wheel_size=8, clock=clock)
+        short, long = Quota(limit=1, period=2.0), Quota(limit=1, period=30.0)
+        engine.hit("short", short)
+        engine.hit("long", long)
+
+        clock.return_value += 3
+        assert engine.expire() == 1
+        assert "short" not in engine
+
+        # Beyond the wheel's horizon the key is rescheduled, not dropped
+        clock.return_value += 20
+        assert engine.expire() == 0
+        clock.return_value += 10
+        assert engine.expire() == 1
+        assert len(engine) == 0
+
+    def test_expire_idle_keys(self, engine, clock):
+        quota = Quota(limit=1, period=3600.0)
+        engine.hit("a", quota)
+        clock.return_value += 10
+        engine.hit("b", quota)
+
+        assert engine.expire(idle=5) == 1
+        assert list(engine._entries) == ["b"]
+
+
+class TestRouteRules:
+    """Test the route pattern trie."""
+
+    def test_literal_segments_win_over_wildcards(self):
+        rules = RouteRules(
+            {
+                "/api/v1/instances/*/start": "any",
+                "/api/v1/instances/special/start": "special",
+                "/api/v1/instances/*": "instance",
+            }
+        )
+
+        assert rules.match("/api/v1/instances/7/start") == (
+            "/api/v1/instances/*/start",
+            "any",
+        )
+        assert rules.match("/api/v1/instances/special/start")[1] == "special"
+        assert rules.match("/api/v1/instances/special")[1] == "instance"
+        assert rules.match("/api/v1/instances/7/stop") is None
+        assert "/api/v1/instances/*" in rules
+
+
+class TestMiddlewareRateLimiter:
+    """Test the API and WebSocket limiter on top of the engine."""
+
+    def test_endpoint_rules_and_websocket_limits(self, clock):
+        limiter = RateLimiter(RateLimitEngine(clock=clock))
+        export = Mock()
+        export.url.path = "/api/v1/logs/export"
+        other = Mock()
+        other.url.path = "/api/v1/instances"
+
+        allowed = [limiter.check_api_rate_limit(export, "1.2.3.4") for _ in range(8)]
+        assert allowed == [True] * 7 + [False]
+        assert limiter.check_api_rate_limit(other, "1.2.3.4")
+
+        info = limiter.get_rate_limit_info("1.2.3.4", "/api/v1/logs/export")
+        assert info["capacity"] == 7
+        assert info["remaining_tokens"] == 0
+        assert info["blocked_until"] is not None
+        assert limiter.get_rate_limit_info("1.2.3.4")["remaining_tokens"] == 99
+
+        assert [limiter.check_websocket_rate_limit("1.2.3.4") for _ in range(6)] == [
+            True
+        ] * 5 + [False]
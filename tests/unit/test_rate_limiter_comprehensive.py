@@ -1,11 +1,11 @@
 """Comprehensive tests for rate limiter."""
 
-import time
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
 from cc_orchestrator.web.exceptions import RateLimitExceededError
+from cc_orchestrator.web.rate_limit_engine import RateLimitEngine
 from cc_orchestrator.web.rate_limiter import (
     InMemoryRateLimiter,
     get_client_ip,
@@ -22,7 +22,7 @@ class TestInMemoryRateLimiter:
     def test_rate_limiter_init(self):
         """Test rate limiter initialization."""
         limiter = InMemoryRateLimiter()
-        assert len(limiter.request_history) == 0
+        assert len(limiter.engine) == 0
 
     def test_rate_limit_under_limit(self):
         """Test requests under rate limit."""
@@ -92,7 +92,8 @@ class TestInMemoryRateLimiter:
 
     def test_rate_limit_window_expiration(self):
         """Test that rate limit window expires."""
-        limiter = InMemoryRateLimiter()
+        clock = Mock(return_value=1000.0)
+        limiter = InMemoryRateLimiter(RateLimitEngine(clock=clock))
         client_ip = "192.168.1.1"
         endpoint = "GET:/api/test"
         limit = 2
@@ -106,10 +107,12 @@ class TestInMemoryRateLimiter:
         with pytest.raises(RateLimitExceededError):
             limiter.check_rate_limit(client_ip, endpoint, limit, window)
 
-        # Fast-forward time by mocking the current time
-        with patch("time.time", return_value=time.time() + 1.1):
-            # Should be able to make requests again
-            limiter.check_rate_limit(client_ip, endpoint, limit, window)
+        # Fast-forward time past the window
+        clock.return_value += 1.1
+
+        # Should be able to make requests again
+        limiter.check_rate_limit(client_ip, endpoint, limit, window)
+        limiter.check_rate_limit(client_ip, endpoint, limit, window)
 
     def test_cleanup_old_entries(self):
         """Test cleanup of old entries."""
@@ -119,17 +122,14 @@ class TestInMemoryRateLimiter:
 
         # Add some requests
         limiter.check_rate_limit(client_ip, endpoint, 10, 60)
-        assert len(limiter.request_history[client_ip][endpoint]) == 1
+        assert limiter.remaining(client_ip, endpoint, 10, 60) == 9
 
         # Cleanup with very short age should remove them
         limiter.cleanup_old_entries(max_age_seconds=0)
 
         # Should be cleaned up
-        assert (
-            client_ip not in limiter.request_history
-            or endpoint not in limiter.request_history[client_ip]
-            or len(limiter.request_history[client_ip][endpoint]) == 0
-        )
+        assert (client_ip, endpoint) not in limiter.engine
+        assert limiter.remaining(client_ip, endpoint, 10, 60) == 10
 
     def test_cleanup_preserves_recent_entries(self):
         """Test cleanup preserves recent entries."""
@@ -144,21 +144,22 @@ class TestInMemoryRateLimiter:
         limiter.cleanup_old_entries(max_age_seconds=3600)
 
         # Should still be there
-        assert len(limiter.request_history[client_ip][endpoint]) == 1
+        assert limiter.remaining(client_ip, endpoint, 10, 60) == 9
 
     def test_cleanup_removes_empty_entries(self):
         """Test cleanup removes empty client/endpoint entries."""
-        limiter = InMemoryRateLimiter()
+        clock = Mock(return_value=1000.0)
+        limiter = InMemoryRateLimiter(RateLimitEngine(clock=clock))
 
-        # Manually add old entries
-        old_time = time.time() - 7200  # 2 hours ago
-        limiter.request_history["192.168.1.1"]["GET:/api/test"] = [old_time]
+        # Add an entry that is still limited 2 hours later
+        limiter.check_rate_limit("192.168.1.1", "GET:/api/test", 1, 86400)
+        clock.return_value += 7200
 
         # Cleanup
         limiter.cleanup_old_entries(max_age_seconds=3600)
 
-        # Should remove empty entries
-        assert "192.168.1.1" not in limiter.request_history
+        # Should remove idle entries
+        assert len(limiter.engine) == 0
 
     def test_rate_limit_with_zero_limit(self):
         """Test rate limiting with zero limit."""
@@ -168,20 +169,17 @@ class TestInMemoryRateLimiter:
         with pytest.raises(RateLimitExceededError):
             limiter.check_rate_limit("192.168.1.1", "GET:/api/test", 0, 60)
 
-    def test_rate_limit_records_timestamp(self):
-        """Test that requests are recorded with timestamps."""
+    def test_rate_limit_records_request(self):
+        """Test that requests are recorded against the client's quota."""
         limiter = InMemoryRateLimiter()
         client_ip = "192.168.1.1"
         endpoint = "GET:/api/test"
 
-        before = time.time()
         limiter.check_rate_limit(client_ip, endpoint, 10, 60)
-        after = time.time()
 
-        # Should have recorded a timestamp
-        timestamps = limiter.request_history[client_ip][endpoint]
-        assert len(timestamps) == 1
-        assert before <= timestamps[0] <= after
+        # Should have recorded one request
+        assert (client_ip, endpoint) in limiter.engine
+        assert limiter.remaining(client_ip, endpoint, 10, 60) == 9
 
 
 class TestGetClientIP:
@@ -359,7 +357,7 @@ class TestRateLimiterEdgeCases:
         limiter.check_rate_limit("", "GET:/api/test", 10, 60)
 
         # Should be tracked under empty string
-        assert "" in limiter.request_history
+        assert ("", "GET:/api/test") in limiter.engine
 
     def test_empty_endpoint(self):
         """Test rate limiting with empty endpoint."""
@@ -369,7 +367,7 @@ class TestRateLimiterEdgeCases:
         limiter.check_rate_limit("192.168.1.1", "", 10, 60)
 
         # Should be tracked
-        assert "" in limiter.request_history["192.168.1.1"]
+        assert ("192.168.1.1", "") in limiter.engine
 
     def test_very_small_window(self):
         """Test rate limiting with very small time window."""
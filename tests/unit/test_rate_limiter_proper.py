@@ -77,13 +77,13 @@ class TestInMemoryRateLimiter:
         """Test that cleanup removes old entries."""
         # Add some requests
         self.limiter.check_rate_limit("127.0.0.1", "GET:/test", 10, 60)
-        assert len(self.limiter.request_history["127.0.0.1"]["GET:/test"]) == 1
+        assert ("127.0.0.1", "GET:/test") in self.limiter.engine
 
         # Clean up entries older than 0 seconds (should remove everything)
         self.limiter.cleanup_old_entries(0)
 
         # History should be cleaned up
-        assert "127.0.0.1" not in self.limiter.request_history
+        assert ("127.0.0.1", "GET:/test") not in self.limiter.engine
 
 
 class TestRateLimitDecorator:
@@ -170,7 +170,7 @@ class TestRateLimiterIntegration:
         """Reset rate limiter state."""
         from cc_orchestrator.web.rate_limiter import rate_limiter
 
-        rate_limiter.request_history.clear()
+        rate_limiter.engine.reset()
 
     def test_rate_limiter_state_reset_works(self):
         """Test that the state reset in conftest.py works properly."""
@@ -178,7 +178,7 @@ class TestRateLimiterIntegration:
 
         # Add some state
         rate_limiter.check_rate_limit("127.0.0.1", "GET:/test", 10, 60)
-        assert len(rate_limiter.request_history) > 0
+        assert len(rate_limiter.engine) > 0
 
         # State should be cleared between tests (this happens automatically via conftest.py)
         # This test verifies that our reset mechanism works
@@ -0,0 +1,189 @@
+"""Tests for eager relationship loading on list endpoints."""
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from cc_orchestrator.database.crud import (
+    InstanceCRUD,
+    TaskCRUD,
+    ValidationError,
+    WorktreeCRUD,
+    loader_options,
+)
+from cc_orchestrator.database.models import Instance, Task, Worktree
+from cc_orchestrator.web.crud_adapter import CRUDBase
+from cc_orchestrator.web.dependencies import PaginationParams, parse_include
+from cc_orchestrator.web.routers.v1 import instances, tasks, worktrees
+
+INSTANCE_COUNT = 12
+
+
+@pytest.fixture
+def engine():
+    """Create a populated in-memory database."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    # Create tables from the models directly; other suites clear Base.metadata
+    for model in (Instance, Worktree, Task):
+        model.__table__.create(engine, checkfirst=True)
+
+    with Session(engine) as session:
+        for i in range(INSTANCE_COUNT):
+            instance = InstanceCRUD.create(session, issue_id=f"issue-{i}")
+            worktree = WorktreeCRUD.create(
+                session,
+                name=f"wt-{i}",
+                path=f"/tmp/wt-{i}",
+                branch_name=f"feature/{i}",
+                instance_id=instance.id,
+            )
+            for j in range(2):
+                TaskCRUD.create(
+                    session,
+                    title=f"task-{i}-{j}",
+                    description="Seeded task",
+                    instance_id=instance.id,
+                    worktree_id=worktree.id,
+                )
+        session.commit()
+
+    yield engine
+    engine.dispose()
+
+
+async def _count_list_queries(engine, count_queries, endpoint, size, **params):
+    with Session(engine) as session:
+        with count_queries(engine) as counter:
+            result = await endpoint(
+                pagination=PaginationParams(page=1, size=size),
+                crud=CRUDBase(session),
+                **params,
+            )
+    return counter.count, result
+
+
+class TestLoaderOptions:
+    """Test loader option resolution."""
+
+    def test_no_include_returns_no_options(self):
+        assert loader_options(Instance, None) == []
+        assert loader_options(Instance, []) == []
+
+    def test_unknown_relationship_rejected(self):
+        with pytest.raises(ValidationError, match="Cannot include 'bogus'"):
+            loader_options(Task, ["bogus"])
+
+    def test_parse_include(self):
+        assert parse_include("tasks, worktree,tasks", ("tasks", "worktree")) == [
+            "tasks",
+            "worktree",
+        ]
+        assert parse_include(None, ("tasks",)) == []
+
+        with pytest.raises(HTTPException) as exc_info:
+            parse_include("secrets", ("tasks",))
+        assert exc_info.value.status_code == 422
+
+
+class TestListEndpointQueryCounts:
+    """List endpoints run a constant number of statements regardless of page size."""
+
+    async def test_instances_with_tasks_and_worktree(self, engine, count_queries):
+        params = {"status_filter": None, "branch_name": None}
+        small, _ = await _count_list_queries(
+            engine,
+            count_queries,
+            instances.list_instances,
+            2,
+            include="tasks,worktree",
+            **params,
+        )
+        large, result = await _count_list_queries(
+            engine,
+            count_queries,
+            instances.list_instances,
+            10,
+            include="tasks,worktree",
+            **params,
+        )
+
+        assert small == large
+        item = result["items"][0]
+        assert len(item["tasks"]) == 2
+        assert item["worktree"].name.startswith("wt-")
+
+    async def test_tasks_with_instance_and_worktree(self, engine, count_queries):
+        params = {
+            "status_filter": None,
+            "priority_filter": None,
+            "instance_id": None,
+            "worktree_id": None,
+        }
+        small, _ = await _count_list_queries(
+            engine,
+            count_queries,
+            tasks.list_tasks,
+            2,
+            include="instance,worktree",
+            **params,
+        )
+        large, result = await _count_list_queries(
+            engine,
+            count_queries,
+            tasks.list_tasks,
+            10,
+            include="instance,worktree",
+            **params,
+        )
+
+        assert small == large
+        item = result["items"][0]
+        assert item["instance"].issue_id.startswith("issue-")
+        assert item["worktree"].branch_name.startswith("feature/")
+
+    async def test_worktrees_with_instance_and_tasks(self, engine, count_queries):
+        params = {"status_filter": None, "branch_name": None, "instance_id": None}
+        small, _ = await _count_list_queries(
+            engine,
+            count_queries,
+            worktrees.list_worktrees,
+            2,
+            include="instance,tasks",
+            **params,
+        )
+        large, result = await _count_list_queries(
+            engine,
+            count_queries,
+            worktrees.list_worktrees,
+            10,
+            include="instance,tasks",
+            **params,
+        )
+
+        assert small == large
+        item = result["items"][0]
+        assert item["instance"].issue_id.startswith("issue-")
+        assert len(item["tasks"]) == 2
+
+    async def test_without_include_relationships_are_not_loaded(
+        self, engine, count_queries
+    ):
+        count, result = await _count_list_queries(
+            engine,
+            count_queries,
+            instances.list_instances,
+            10,
+            status_filter=None,
+            branch_name=None,
+            include=None,
+        )
+
+        # One query for the page and one for the total
+        assert count == 2
+        assert "tasks" not in result["items"][0]
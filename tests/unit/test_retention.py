@@ -0,0 +1,187 @@
+"""Tests for the data retention service."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from cc_orchestrator.config.loader import OrchestratorConfig, RetentionPolicy
+from cc_orchestrator.core.retention import RetentionService, bucket_start
+from cc_orchestrator.database.connection import DatabaseManager
+from cc_orchestrator.database.crud import HealthCheckCRUD, InstanceCRUD
+from cc_orchestrator.database.models import (
+    HealthCheck,
+    HealthCheckRollup,
+    HealthStatus,
+    Instance,
+)
+
+NOW = datetime(2024, 6, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Create a file-backed SQLite database manager."""
+    manager = DatabaseManager(database_url=f"sqlite:///{tmp_path / 'retention.db'}")
+    # Create tables from the models directly; other suites clear Base.metadata
+    for model in (Instance, HealthCheck, HealthCheckRollup):
+        model.__table__.create(manager.engine, checkfirst=True)
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def instance_id(db_manager):
+    """Create an instance to attach health checks to."""
+    with db_manager.get_session() as session:
+        return InstanceCRUD.create(session, issue_id="retention-1").id
+
+
+def _make_service(db_manager, batch_size=2, **policies):
+    config = OrchestratorConfig(
+        retention_batch_size=batch_size,
+        retention_policies=policies
+        or {
+            "health_checks": RetentionPolicy(
+                max_age_hours=24, rollup_bucket_minutes=60
+            ),
+            "health_check_rollups": RetentionPolicy(max_age_hours=24 * 30),
+        },
+    )
+    return RetentionService(config=config, db_manager=db_manager)
+
+
+def _add_checks(db_manager, instance_id, timestamps, status=HealthStatus.HEALTHY):
+    with db_manager.get_session() as session:
+        for ts in timestamps:
+            HealthCheckCRUD.create(
+                session,
+                instance_id=instance_id,
+                overall_status=status,
+                check_results="{}",
+                duration_ms=10,
+                check_timestamp=ts,
+            )
+
+
+class TestBucketStart:
+    """Test rollup bucket flooring."""
+
+    def test_floors_to_bucket(self):
+        ts = datetime(2024, 6, 1, 10, 47, 13)
+        assert bucket_start(ts, 3600) == datetime(2024, 6, 1, 10, 0, 0)
+        assert bucket_start(ts, 900) == datetime(2024, 6, 1, 10, 45, 0)
+
+
+class TestRetentionService:
+    """Test retention policy application."""
+
+    def test_prunes_expired_checks_in_batches(self, db_manager, instance_id):
+        old = NOW - timedelta(days=2)
+        _add_checks(
+            db_manager,
+            instance_id,
+            [old + timedelta(minutes=i) for i in range(5)],
+        )
+        _add_checks(db_manager, instance_id, [NOW - timedelta(hours=1)])
+
+        service = _make_service(db_manager, batch_size=2)
+        results = service.apply_policies(now=NOW)
+
+        health = next(r for r in results if r.table == "health_checks")
+        assert health.deleted == 5
+        assert health.batches == 3
+        assert health.error is None
+
+        with db_manager.get_session() as session:
+            assert session.query(HealthCheck).count() == 1
+
+    def test_rolls_up_before_deleting(self, db_manager, instance_id):
+        hour = datetime(2024, 5, 30, 9, 0, 0)
+        _add_checks(
+            db_manager, instance_id, [hour + timedelta(minutes=5 * i) for i in range(3)]
+        )
+        _add_checks(
+            db_manager,
+            instance_id,
+            [hour + timedelta(minutes=30)],
+            status=HealthStatus.CRITICAL,
+        )
+
+        service = _make_service(db_manager, batch_size=3)
+        service.apply_policies(now=NOW)
+
+        with db_manager.get_session() as session:
+            rollups = session.query(HealthCheckRollup).all()
+            assert len(rollups) == 1
+            rollup = rollups[0]
+            assert rollup.bucket_start == hour
+            assert rollup.bucket_seconds == 3600
+            assert rollup.check_count == 4
+            assert rollup.healthy_count == 3
+            assert rollup.critical_count == 1
+            assert rollup.avg_duration_ms == 10
+
+    def test_expired_rollups_are_deleted(self, db_manager, instance_id):
+        with db_manager.get_session() as session:
+            session.add(
+                HealthCheckRollup(
+                    instance_id=instance_id,
+                    bucket_start=NOW - timedelta(days=60),
+                    bucket_seconds=3600,
+                )
+            )
+
+        results = _make_service(db_manager).apply_policies(now=NOW)
+
+        rollups = next(r for r in results if r.table == "health_check_rollups")
+        assert rollups.deleted == 1
+
+    def test_registered_pruner_and_disabled_policy(self, db_manager):
+        calls = []
+
+        def pruner(cutoff, batch_size):
+            calls.append((cutoff, batch_size))
+            return 7
+
+        service = _make_service(
+            db_manager,
+            logs=RetentionPolicy(max_age_hours=1),
+            health_checks=RetentionPolicy(enabled=False),
+        )
+        service.register_pruner("logs", pruner)
+        results = service.apply_policies(now=NOW)
+
+        assert [r.table for r in results] == ["logs"]
+        assert results[0].deleted == 7
+        assert calls == [(NOW - timedelta(hours=1), 2)]
+
+    async def test_start_and_stop(self, db_manager):
+        service = _make_service(db_manager)
+        await service.start()
+        assert service.retention_task is not None
+        await service.stop()
+        assert service.retention_task.done()
+
+    def test_migration_creates_rollup_table(self, tmp_path):
+        from sqlalchemy import create_engine, inspect
+
+        from cc_orchestrator.database.migrations import MigrationManager
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+        with engine.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE instances (id INTEGER PRIMARY KEY)")
+
+        manager = MigrationManager(engine)
+        migration = next(m for m in manager.discover_migrations() if m.version == "004")
+        migration.upgrade(engine)
+        # Re-running is a no-op for databases created from the current models
+        migration.upgrade(engine)
+
+        indexes = {
+            ix["name"] for ix in inspect(engine).get_indexes("health_check_rollups")
+        }
+        assert "idx_health_check_rollups_bucket" in indexes
+
+        migration.downgrade(engine)
+        assert "health_check_rollups" not in inspect(engine).get_table_names()
+        engine.dispose()
@@ -0,0 +1,347 @@
+"""Tests for the priority- and affinity-aware task scheduler."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from cc_orchestrator.config.loader import OrchestratorConfig
+from cc_orchestrator.core import scheduler as scheduler_module
+from cc_orchestrator.core.scheduler import SchedulerService, task_sort_key
+from cc_orchestrator.database.connection import DatabaseManager
+from cc_orchestrator.database.crud import InstanceCRUD, TaskCRUD, WorktreeCRUD
+from cc_orchestrator.database.models import (
+    Instance,
+    InstanceStatus,
+    Task,
+    TaskPriority,
+    TaskStatus,
+    Worktree,
+)
+from cc_orchestrator.utils.process import ProcessInfo, ProcessStatus
+from cc_orchestrator.web.routers.v1 import tasks
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Create a file-backed SQLite database manager."""
+    manager = DatabaseManager(database_url=f"sqlite:///{tmp_path / 'sched.db'}")
+    # Create tables from the models directly; other suites clear Base.metadata
+    for model in (Instance, Worktree, Task):
+        model.__table__.create(manager.engine, checkfirst=True)
+    yield manager
+    manager.close()
+
+
+def _scheduler(db_manager, **overrides):
+    config = OrchestratorConfig(**overrides)
+    return SchedulerService(config, db_manager=db_manager)
+
+
+def _add_instances(db_manager, count, status=InstanceStatus.RUNNING):
+    with db_manager.get_session() as session:
+        ids = []
+        for i in range(count):
+            instance = InstanceCRUD.create(
+                session, issue_id=f"issue-{status.value}-{i}"
+            )
+            InstanceCRUD.update(session, instance.id, status=status)
+            ids.append(instance.id)
+        return ids
+
+
+def _add_task(db_manager, title, **kwargs):
+    with db_manager.get_session() as session:
+        return TaskCRUD.create(session, title=title, **kwargs).id
+
+
+def _assignments(db_manager):
+    with db_manager.get_session() as session:
+        return {
+            task.title: task.instance_id
+            for task in session.query(Task).filter(
+                Task.status == TaskStatus.IN_PROGRESS
+            )
+        }
+
+
+class TestTaskOrdering:
+    """Test the heap ordering key."""
+
+    def test_priority_then_deadline_then_duration(self):
+        created = datetime(2024, 1, 1)
+        due = datetime(2024, 1, 2)
+        keys = {
+            "urgent": task_sort_key(4, None, None, created, 1),
+            "due-soon": task_sort_key(2, due, 60, created, 2),
+            # Same deadline but needs longer, so it must start earlier
+            "due-long": task_sort_key(2, due, 600, created, 3),
+            "short": task_sort_key(2, None, 5, created, 4),
+            "unknown": task_sort_key(2, None, None, created, 5),
+        }
+
+        assert sorted(keys, key=keys.get) == [
+            "urgent",
+            "due-long",
+            "due-soon",
+            "short",
+            "unknown",
+        ]
+
+
+class TestDispatch:
+    """Test matching pending tasks to instances."""
+
+    def test_fills_every_running_instance(self, db_manager):
+        instance_ids = _add_instances(db_manager, 50)
+        _add_instances(db_manager, 2, status=InstanceStatus.STOPPED)
+        for i in range(120):
+            _add_task(db_manager, f"task-{i}")
+
+        scheduler = _scheduler(db_manager)
+        assert scheduler.dispatch() == 50
+
+        assigned = _assignments(db_manager)
+        assert sorted(assigned.values()) == sorted(instance_ids)
+        metrics = scheduler.get_metrics()
+        assert metrics["utilization"] == 1.0
+        assert metrics["fairness_index"] == 1.0
+        assert metrics["queue_depth"] == 70
+
+        # Saturated instances receive nothing further
+        assert scheduler.dispatch() == 0
+
+    def test_highest_priority_dispatched_first(self, db_manager):
+        _add_instances(db_manager, 1)
+        _add_task(db_manager, "low", priority=TaskPriority.LOW)
+        _add_task(db_manager, "urgent", priority=TaskPriority.URGENT)
+
+        _scheduler(db_manager).dispatch()
+
+        assert set(_assignments(db_manager)) == {"urgent"}
+
+    def test_busy_cpu_and_capacity_limit(self, db_manager):
+        first, second = _add_instances(db_manager, 2)
+        for i in range(4):
+            _add_task(db_manager, f"task-{i}")
+
+        scheduler = _scheduler(db_manager, scheduler_max_tasks_per_instance=2)
+        dispatched = scheduler.dispatch({"issue-running-0": 95.0})
+
+        assert dispatched == 2
+        assert set(_assignments(db_manager).values()) == {second}
+
+    def test_worktree_affinity(self, db_manager):
+        owner, other = _add_instances(db_manager, 2)
+        with db_manager.get_session() as session:
+            worktree = WorktreeCRUD.create(
+                session,
+                name="wt",
+                path="/tmp/wt-affinity",
+                branch_name="feature",
+                instance_id=owner,
+            )
+            worktree_id = worktree.id
+        bound = _add_task(db_manager, "bound", worktree_id=worktree_id)
+        scheduler = _scheduler(db_manager)
+
+        # Owner is busy: the task waits for it instead of going to the idle one
+        with db_manager.get_session() as session:
+            busy = TaskCRUD.create(session, title="busy", instance_id=owner).id
+            TaskCRUD.update_status(session, busy, TaskStatus.IN_PROGRESS)
+        assert scheduler.dispatch() == 0
+        assert scheduler.queue_depth == 1
+
+        # Once the owner frees up the task goes to it
+        with db_manager.get_session() as session:
+            TaskCRUD.update_status(session, busy, TaskStatus.COMPLETED)
+        assert scheduler.dispatch() == 1
+        assert _assignments(db_manager)["bound"] == owner
+        assert scheduler.metrics.affinity_hits == 1
+
+        # After the affinity wait, bound work falls back to any idle instance
+        with db_manager.get_session() as session:
+            TaskCRUD.release(session, bound, owner)
+            hog = TaskCRUD.create(session, title="hog", instance_id=owner).id
+            TaskCRUD.update_status(session, hog, TaskStatus.IN_PROGRESS)
+        scheduler.affinity_wait = 0
+        scheduler.request_resync()
+        assert scheduler.dispatch() == 1
+        assert _assignments(db_manager)["bound"] == other
+
+    def test_assigned_tasks_wait_for_their_instance(self, db_manager):
+        first, second = _add_instances(db_manager, 2)
+        pinned = _add_task(db_manager, "pinned", priority=TaskPriority.URGENT)
+        _add_task(db_manager, "open")
+        with db_manager.get_session() as session:
+            TaskCRUD.assign(session, pinned, first, None)
+            InstanceCRUD.update(session, first, status=InstanceStatus.STOPPED)
+
+        scheduler = _scheduler(db_manager)
+        assert scheduler.dispatch() == 1
+        assert _assignments(db_manager) == {"open": second}
+        assert scheduler.metrics.missed_claims == 0
+
+        with db_manager.get_session() as session:
+            InstanceCRUD.update(session, first, status=InstanceStatus.RUNNING)
+        scheduler.request_resync()
+        assert scheduler.dispatch() == 1
+        assert _assignments(db_manager)["pinned"] == first
+
+    def test_live_instances_keep_their_leases(self, db_manager, monkeypatch):
+        live, dead = _add_instances(db_manager, 2)
+        with db_manager.get_session() as session:
+            InstanceCRUD.update(session, live, process_id=1111)
+            InstanceCRUD.update(session, dead, process_id=2222)
+        monkeypatch.setattr(
+            scheduler_module.psutil, "pid_exists", lambda pid: pid != 2222
+        )
+        running = _add_task(db_manager, "running")
+        orphaned = _add_task(db_manager, "orphaned")
+        with db_manager.get_session() as session:
+            assert TaskCRUD.claim(session, running, live, lease_seconds=60)
+            assert TaskCRUD.claim(session, orphaned, dead, lease_seconds=60)
+
+        scheduler = _scheduler(
+            db_manager,
+            scheduler_lease_seconds=60,
+            scheduler_max_tasks_per_instance=1,
+        )
+        # Both leases run out between cycles, far past the first lease
+        for _ in range(3):
+            with db_manager.get_session() as session:
+                session.query(Task).update(
+                    {"lease_expires_at": datetime.now(UTC) - timedelta(seconds=1)}
+                )
+            scheduler.dispatch()
+
+        with db_manager.get_session() as session:
+            task = session.get(Task, running)
+            assert task.status == TaskStatus.IN_PROGRESS
+            assert task.instance_id == live
+            assert task.attempts == 1
+            # Work of the vanished process is requeued, not handed back to it
+            task = session.get(Task, orphaned)
+            assert task.status == TaskStatus.PENDING
+            assert task.instance_id is None
+        assert scheduler.queue_depth == 1
+
+    def test_untracked_instances_must_renew_their_own_leases(self, db_manager):
+        (instance_id,) = _add_instances(db_manager, 1)
+        task_id = _add_task(db_manager, "silent")
+        scheduler = _scheduler(db_manager, scheduler_lease_seconds=60)
+
+        # Nothing vouches for an instance without a recorded process, so work
+        # it never heartbeats is requeued and redispatched until it fails
+        for _ in range(4):
+            scheduler.dispatch()
+            with db_manager.get_session() as session:
+                session.query(Task).update(
+                    {"lease_expires_at": datetime.now(UTC) - timedelta(seconds=1)}
+                )
+        scheduler.dispatch()
+
+        with db_manager.get_session() as session:
+            task = session.get(Task, task_id)
+            assert task.status == TaskStatus.FAILED
+            assert task.attempts == 3
+
+    def test_dispatch_notifies_listeners(self, db_manager):
+        (instance_id,) = _add_instances(db_manager, 1)
+        task_id = _add_task(db_manager, "notified")
+        scheduler = _scheduler(db_manager)
+        calls = []
+        scheduler.add_listener(lambda *args: calls.append(args))
+        scheduler.add_listener(lambda *args: 1 / 0)
+
+        assert scheduler.dispatch() == 1
+        assert calls == [(task_id, instance_id)]
+
+    def test_incremental_sync_and_resync(self, db_manager):
+        _add_instances(db_manager, 1)
+        scheduler = _scheduler(db_manager, scheduler_max_tasks_per_instance=1)
+        first = _add_task(db_manager, "first")
+        _add_task(db_manager, "second")
+        scheduler.dispatch()
+        assert scheduler.queue_depth == 1
+
+        _add_task(db_manager, "third")
+        scheduler.dispatch()
+        assert scheduler.queue_depth == 2
+
+        # Completing and deleting work shows up after a full resync
+        with db_manager.get_session() as session:
+            TaskCRUD.update_status(session, first, TaskStatus.COMPLETED)
+            session.delete(session.get(Task, first + 1))
+        scheduler.request_resync()
+        assert scheduler.dispatch() == 1
+        assert scheduler.queue_depth == 0
+        assert "third" in _assignments(db_manager)
+
+
+class TestSchedulerService:
+    """Test the async service wrapper and API exposure."""
+
+    async def test_run_once_uses_process_samples(self, db_manager):
+        _add_instances(db_manager, 1)
+        _add_task(db_manager, "task")
+
+        class FakeProcessManager:
+            async def list_processes(self):
+                return {
+                    "issue-running-0": ProcessInfo(
+                        pid=1,
+                        status=ProcessStatus.RUNNING,
+                        command=["claude"],
+                        working_directory=Path("/tmp"),
+                        environment={},
+                        started_at=0.0,
+                        cpu_percent=99.0,
+                    )
+                }
+
+        scheduler = SchedulerService(
+            OrchestratorConfig(),
+            db_manager=db_manager,
+            process_manager=FakeProcessManager(),
+        )
+        assert await scheduler.run_once() == 0
+        assert scheduler.queue_depth == 1
+
+    async def test_start_dispatches_and_stops(self, db_manager):
+        _add_instances(db_manager, 1)
+        _add_task(db_manager, "task")
+        scheduler = _scheduler(db_manager, scheduler_interval=0.01)
+        scheduler._process_manager = SimpleNamespace(list_processes=_no_processes)
+
+        await scheduler.start()
+        for _ in range(100):
+            if scheduler.metrics.dispatched:
+                break
+            await asyncio.sleep(0.01)
+        await scheduler.stop()
+
+        assert scheduler.metrics.dispatched == 1
+        assert scheduler.scheduler_task.done()
+
+    async def test_metrics_endpoint(self, db_manager):
+        scheduler = _scheduler(db_manager)
+        request = SimpleNamespace(
+            app=SimpleNamespace(state=SimpleNamespace(scheduler=scheduler))
+        )
+
+        result = await tasks.get_scheduler_metrics(request)
+        assert result["data"]["dispatched"] == 0
+        assert result["data"]["fairness_index"] == 1.0
+
+        request.app.state.scheduler = None
+        with pytest.raises(HTTPException) as exc_info:
+            await tasks.get_scheduler_metrics(request)
+        assert exc_info.value.status_code == 503
+
+
+async def _no_processes():
+    return {}
@@ -0,0 +1,224 @@
+"""Tests for bulk tmux session cleanup and the orphaned session reaper."""
+
+import asyncio
+import os
+import shutil
+import subprocess
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from cc_orchestrator.core.enums import InstanceStatus
+from cc_orchestrator.core.session_reaper import SessionReaperService
+from cc_orchestrator.database.connection import DatabaseManager
+from cc_orchestrator.database.models import Instance
+from cc_orchestrator.tmux.control import (
+    OWNER_OPTION,
+    TmuxControlClient,
+    TmuxSessionState,
+)
+from cc_orchestrator.tmux.service import SessionConfig, SessionInfo, TmuxService
+
+requires_tmux = pytest.mark.skipif(
+    shutil.which("tmux") is None, reason="tmux is not installed"
+)
+
+
+def _config(min_age=60.0):
+    return SimpleNamespace(tmux_reap_interval=300.0, tmux_reap_min_age=min_age)
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Create a file-backed database with the instance registry."""
+    manager = DatabaseManager(database_url=f"sqlite:///{tmp_path / 'reaper.db'}")
+    Instance.__table__.create(manager.engine, checkfirst=True)
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def socket_name():
+    """Private tmux socket, torn down after the test."""
+    name = f"cc-orchestrator-reaper-test-{os.getpid()}"
+    yield name
+    subprocess.run(["tmux", "-L", name, "kill-server"], capture_output=True)
+
+
+class TestBulkCleanup:
+    """Test destroying many sessions at once."""
+
+    async def test_cleanup_runs_destroys_concurrently(self):
+        with patch("cc_orchestrator.tmux.service.libtmux.Server"):
+            service = TmuxService(cleanup_concurrency=3)
+        for i in range(10):
+            service._sessions[f"cc-orchestrator-{i}"] = SessionInfo(
+                session_name=f"cc-orchestrator-{i}",
+                instance_id=str(i),
+                status=None,
+                working_directory=None,
+                layout_template="default",
+                created_at=0.0,
+                windows=[],
+                current_window=None,
+            )
+        running = 0
+        peak = 0
+
+        async def destroy(name, force=False):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if name == "cc-orchestrator-4":
+                raise RuntimeError("boom")
+            return True
+
+        with patch.object(service, "destroy_session", side_effect=destroy):
+            assert await service.cleanup_sessions() == 9
+
+        assert peak == 3
+
+
+class TestFindOrphans:
+    """Test which sessions the reaper selects."""
+
+    def test_find_orphans(self, db_manager):
+        with patch("cc_orchestrator.tmux.service.libtmux.Server"):
+            service = TmuxService()
+        service._sessions["cc-orchestrator-tracked"] = None
+        reaper = SessionReaperService(
+            _config(), db_manager=db_manager, tmux_service=service
+        )
+        now = 10_000.0
+
+        def state(name, created=now - 3600, attached=0, owner=db_manager.database_id):
+            return TmuxSessionState("$1", name, created, attached, owner=owner)
+
+        states = [
+            state("cc-orchestrator-stale"),
+            state("cc-orchestrator-tracked"),
+            state("cc-orchestrator-by-id"),
+            state("cc-orchestrator-by-name"),
+            state("cc-orchestrator-young", created=now - 10),
+            state("cc-orchestrator-unknown-age", created=0),
+            state("cc-orchestrator-attached", attached=1),
+            state("cc-orchestrator-untagged", owner=None),
+            state("cc-orchestrator-other-db", owner="another-database"),
+            state("unmanaged"),
+        ]
+        claimed = {"by-id", "cc-orchestrator-by-name"}
+
+        assert reaper.find_orphans(states, claimed, now) == ["cc-orchestrator-stale"]
+
+    def test_owner_is_resolved_on_first_use(self):
+        calls = []
+
+        def resolve():
+            calls.append(1)
+            return "db-1"
+
+        with patch("cc_orchestrator.tmux.service.libtmux.Server"):
+            service = TmuxService(owner=resolve)
+        assert calls == []
+        assert service.owner == "db-1"
+        assert service.owner == "db-1"
+        assert calls == [1]
+
+    def test_global_service_does_not_open_the_database(self, monkeypatch):
+        from cc_orchestrator.tmux import service as service_module
+
+        monkeypatch.setattr(service_module, "_tmux_service", None)
+        monkeypatch.setattr(
+            service_module,
+            "load_config",
+            lambda: SimpleNamespace(
+                tmux_control_mode=False,
+                tmux_cleanup_concurrency=4,
+            ),
+        )
+        with (
+            patch.object(service_module, "get_database_manager") as get_db,
+            patch("cc_orchestrator.tmux.service.libtmux.Server"),
+        ):
+            service = service_module.get_tmux_service()
+            get_db.assert_not_called()
+            get_db.return_value.database_id = "db-2"
+            assert service.owner == "db-2"
+
+
+@requires_tmux
+class TestReaper:
+    """Test reaping against a real tmux server and database."""
+
+    async def test_reaps_unclaimed_sessions_in_one_batch(
+        self, db_manager, socket_name, tmp_path
+    ):
+        control = TmuxControlClient(socket_name=socket_name)
+        assert control.start()
+        try:
+            with patch("cc_orchestrator.tmux.service.libtmux.Server"):
+                service = TmuxService(
+                    control_client=control, owner=db_manager.database_id
+                )
+            names = ["live", "stopped", "renamed"] + [f"stale-{i}" for i in range(20)]
+            for name in names:
+                await service.create_session(
+                    SessionConfig(
+                        session_name=name,
+                        working_directory=Path(tmp_path),
+                        instance_id=name,
+                    )
+                )
+            # Sessions made by hand or for another database are not ours
+            for name, owner in (("manual", None), ("elsewhere", "another-database")):
+                command = ["new-session", "-d", "-s", f"cc-orchestrator-{name}"]
+                subprocess.run(["tmux", "-L", socket_name, *command], check=True)
+                if owner:
+                    option = ["set-option", "-t", f"=cc-orchestrator-{name}:"]
+                    subprocess.run(
+                        ["tmux", "-L", socket_name, *option, OWNER_OPTION, owner],
+                        check=True,
+                    )
+            # The reaper only knows what the database claims
+            service._sessions.clear()
+            control.refresh()
+
+            with db_manager.get_session() as session:
+                session.add_all(
+                    [
+                        Instance(issue_id="live", status=InstanceStatus.RUNNING),
+                        Instance(issue_id="stopped", status=InstanceStatus.STOPPED),
+                        Instance(
+                            issue_id="other",
+                            status=InstanceStatus.INITIALIZING,
+                            tmux_session="renamed",
+                        ),
+                    ]
+                )
+
+            reaper = SessionReaperService(
+                _config(), db_manager=db_manager, tmux_service=service
+            )
+            # Everything was just created, so nothing is old enough yet
+            assert await reaper.run_once() == []
+
+            with patch.object(control, "batch", wraps=control.batch) as batch:
+                reaped = await reaper.run_once(now=time.time() + 120)
+
+            batch.assert_called_once()
+            assert len(reaped) == 21
+            assert "cc-orchestrator-stopped" in reaped
+            remaining = {state.name for state in await service.list_session_states()}
+            assert remaining == {
+                "cc-orchestrator-live",
+                "cc-orchestrator-renamed",
+                "cc-orchestrator-manual",
+                "cc-orchestrator-elsewhere",
+            }
+        finally:
+            control.close()
@@ -0,0 +1,121 @@
+"""Tests for the StructuredFormatter encoders."""
+
+import json
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from cc_orchestrator.utils import logging as cc_logging
+from cc_orchestrator.utils.logging import StructuredFormatter
+
+BACKENDS = ["json"] + (["orjson"] if cc_logging.orjson is not None else [])
+
+
+def _record(created=1_700_000_000.25, **extra):
+    record = logging.LogRecord(
+        "cc.test", logging.WARNING, "/src/mod.py", 7, "hello %s", ("wörld",), None
+    )
+    record.created = created
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+class TestEncoders:
+    """Test the encoders produce the expected JSON."""
+
+    def test_fields_and_order(self, backend):
+        record = _record(
+            task_id="t-1",
+            context="web",
+            path=Path("/tmp/x"),
+            when=datetime(2024, 1, 2),
+            ratio=0.5,
+            count=3,
+            flag=True,
+            nothing=None,
+            nested={"a": [1, 2]},
+            _private="hidden",
+        )
+
+        line = StructuredFormatter(backend=backend).format(record)
+        data = json.loads(line)
+
+        assert list(data) == [
+            "timestamp",
+            "level",
+            "logger",
+            "message",
+            "module",
+            "function",
+            "line",
+            "context",
+            "task_id",
+            "path",
+            "when",
+            "ratio",
+            "count",
+            "flag",
+            "nothing",
+            "nested",
+        ]
+        assert data["timestamp"] == "2023-11-14T22:13:20.250000"
+        assert data["message"] == "hello wörld"
+        assert data["module"] == "mod"
+        assert data["path"] == "/tmp/x"
+        assert data["nested"] == {"a": [1, 2]}
+        assert (data["ratio"], data["count"], data["flag"]) == (0.5, 3, True)
+        assert data["nothing"] is None
+
+    def test_exception(self, backend):
+        try:
+            raise ValueError("bad")
+        except ValueError:
+            record = _record(exc_info=sys.exc_info())
+
+        data = json.loads(StructuredFormatter(backend=backend).format(record))
+
+        assert data["exception"]["type"] == "ValueError"
+        assert data["exception"]["message"] == "bad"
+        assert data["exception"]["traceback"][-1] == "ValueError: bad\n"
+
+
+class TestStdlibEncoder:
+    """Test details of the appending encoder."""
+
+    def test_matches_json_dumps(self):
+        record = _record(instance_id="i-1", score=float("nan"), name_="x")
+        line = StructuredFormatter(backend="json").format(record)
+
+        expected = json.dumps(
+            {
+                "timestamp": "2023-11-14T22:13:20.250000",
+                "level": "WARNING",
+                "logger": "cc.test",
+                "message": "hello wörld",
+                "module": "mod",
+                "function": None,
+                "line": 7,
+                "instance_id": "i-1",
+                "score": float("nan"),
+                "name_": "x",
+            }
+        )
+        assert line == expected
+
+    def test_timestamp_prefix_follows_seconds(self):
+        formatter = StructuredFormatter(backend="json")
+        first = json.loads(formatter.format(_record(created=59.5)))
+        second = json.loads(formatter.format(_record(created=60.000001)))
+
+        assert first["timestamp"] == "1970-01-01T00:00:59.500000"
+        assert second["timestamp"] == "1970-01-01T00:01:00.000001"
+
+    def test_line_is_encoded_once_per_record(self):
+        record = _record()
+        line = StructuredFormatter(backend="json").format(record)
+        assert StructuredFormatter(backend="json").format(record) is line
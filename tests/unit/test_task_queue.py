@@ -0,0 +1,330 @@
+"""Tests for the SQL-side task queue."""
+
+import threading
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import MetaData, inspect
+
+from cc_orchestrator.database.connection import DatabaseManager
+from cc_orchestrator.database.crud import InstanceCRUD, TaskCRUD
+from cc_orchestrator.database.models import (
+    Instance,
+    Task,
+    TaskPriority,
+    TaskStatus,
+    Worktree,
+)
+from cc_orchestrator.web.crud_adapter import CRUDBase
+from cc_orchestrator.web.routers.v1 import tasks
+from cc_orchestrator.web.schemas import (
+    TaskClaimRequest,
+    TaskLeaseRequest,
+    TaskReleaseRequest,
+)
+
+NOW = datetime(2024, 6, 1, 12, 0, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Create a file-backed SQLite database manager."""
+    manager = DatabaseManager(database_url=f"sqlite:///{tmp_path / 'queue.db'}")
+    # Create tables from the models directly; other suites clear Base.metadata
+    for model in (Instance, Worktree, Task):
+        model.__table__.create(manager.engine, checkfirst=True)
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def instance_ids(db_manager):
+    """Create two instances to claim work for."""
+    with db_manager.get_session() as session:
+        return [
+            InstanceCRUD.create(session, issue_id=f"queue-{i}").id for i in range(2)
+        ]
+
+
+def _add_task(db_manager, title, priority=TaskPriority.MEDIUM, requirements=None):
+    with db_manager.get_session() as session:
+        return TaskCRUD.create(
+            session, title=title, priority=priority, requirements=requirements
+        ).id
+
+
+class TestClaimNext:
+    """Test atomic task claims."""
+
+    def test_claims_by_priority_then_age(self, db_manager, instance_ids):
+        _add_task(db_manager, "low", TaskPriority.LOW)
+        _add_task(db_manager, "high-1", TaskPriority.HIGH)
+        _add_task(db_manager, "high-2", TaskPriority.HIGH)
+
+        titles = []
+        with db_manager.get_session() as session:
+            while task := TaskCRUD.claim_next(session, instance_ids[0], now=NOW):
+                titles.append(task.title)
+                assert task.status == TaskStatus.IN_PROGRESS
+                assert task.instance_id == instance_ids[0]
+                assert task.attempts == 1
+                assert task.lease_expires_at is not None
+
+        assert titles == ["high-1", "high-2", "low"]
+
+    def test_assigned_task_is_only_claimed_by_its_instance(
+        self, db_manager, instance_ids
+    ):
+        first, second = instance_ids
+        task_id = _add_task(db_manager, "assigned", TaskPriority.URGENT)
+        plain = _add_task(db_manager, "plain")
+
+        with db_manager.get_session() as session:
+            TaskCRUD.assign(session, task_id, first, None)
+            assert not TaskCRUD.claim(session, task_id, second)
+
+            task = TaskCRUD.claim_next(session, second)
+            assert task.id == plain
+            assert TaskCRUD.claim_next(session, second) is None
+
+            task = TaskCRUD.claim_next(session, first)
+            assert task.id == task_id
+            assert task.instance_id == first
+
+    def test_capabilities_filter_candidates(self, db_manager, instance_ids):
+        gpu = _add_task(
+            db_manager,
+            "gpu",
+            TaskPriority.URGENT,
+            requirements={"capabilities": ["gpu"]},
+        )
+        plain = _add_task(db_manager, "plain")
+
+        with db_manager.get_session() as session:
+            task = TaskCRUD.claim_next(session, instance_ids[0], capabilities=["cpu"])
+            assert task.id == plain
+            assert (
+                TaskCRUD.claim_next(session, instance_ids[0], capabilities=[]) is None
+            )
+
+            task = TaskCRUD.claim_next(session, instance_ids[1], capabilities=["gpu"])
+            assert task.id == gpu
+
+    def test_concurrent_workers_never_share_a_task(self, db_manager, instance_ids):
+        task_count = 40
+        for i in range(task_count):
+            _add_task(db_manager, f"task-{i}")
+
+        claimed: list[int] = []
+        lock = threading.Lock()
+
+        def worker(instance_id):
+            # Each worker owns its connection, like a separate orchestrator process
+            manager = DatabaseManager(database_url=db_manager.database_url)
+            try:
+                while True:
+                    with manager.get_session() as session:
+                        task = TaskCRUD.claim_next(session, instance_id)
+                        if task is None:
+                            return
+                        with lock:
+                            claimed.append(task.id)
+            finally:
+                manager.close()
+
+        threads = [
+            threading.Thread(target=worker, args=(instance_ids[i % 2],))
+            for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(claimed) == task_count
+        assert len(set(claimed)) == task_count
+
+
+class TestLeases:
+    """Test lease renewal, release and requeue."""
+
+    def test_expired_lease_is_requeued_then_failed(self, db_manager, instance_ids):
+        task_id = _add_task(db_manager, "flaky")
+
+        with db_manager.get_session() as session:
+            TaskCRUD.claim_next(session, instance_ids[0], lease_seconds=60, now=NOW)
+
+        later = NOW + timedelta(minutes=5)
+        with db_manager.get_session() as session:
+            assert TaskCRUD.requeue_expired(session, now=later) == (1, 0)
+            task = session.get(Task, task_id)
+            assert task.status == TaskStatus.PENDING
+            assert task.instance_id is None
+
+        # Second claim expires with attempts exhausted
+        with db_manager.get_session() as session:
+            TaskCRUD.claim_next(session, instance_ids[1], lease_seconds=60, now=later)
+        with db_manager.get_session() as session:
+            result = TaskCRUD.requeue_expired(
+                session, now=later + timedelta(minutes=5), max_attempts=2
+            )
+            assert result == (0, 1)
+            assert session.get(Task, task_id).status == TaskStatus.FAILED
+
+    def test_renew_and_release_require_the_holder(self, db_manager, instance_ids):
+        task_id = _add_task(db_manager, "held")
+        holder, other = instance_ids
+
+        with db_manager.get_session() as session:
+            TaskCRUD.claim_next(session, holder, lease_seconds=60, now=NOW)
+            assert TaskCRUD.renew_lease(session, task_id, holder, 600, now=NOW)
+            assert not TaskCRUD.renew_lease(session, task_id, other, 600, now=NOW)
+            assert TaskCRUD.requeue_expired(
+                session, now=NOW + timedelta(minutes=5)
+            ) == (
+                0,
+                0,
+            )
+
+            assert not TaskCRUD.release(session, task_id, other)
+            assert TaskCRUD.release(session, task_id, holder)
+            assert session.get(Task, task_id, populate_existing=True).status == (
+                TaskStatus.PENDING
+            )
+
+    def test_renewed_task_runs_past_its_first_lease(self, db_manager, instance_ids):
+        task_id = _add_task(db_manager, "long-running")
+        holder = instance_ids[0]
+
+        with db_manager.get_session() as session:
+            TaskCRUD.claim_next(session, holder, lease_seconds=60, now=NOW)
+
+        # Renewing every 30 seconds keeps the task well past its first lease
+        for step in range(1, 21):
+            now = NOW + timedelta(seconds=30 * step)
+            with db_manager.get_session() as session:
+                assert TaskCRUD.requeue_expired(session, now=now) == (0, 0)
+                assert TaskCRUD.renew_lease(session, task_id, holder, 60, now=now)
+
+        with db_manager.get_session() as session:
+            task = session.get(Task, task_id)
+            assert task.status == TaskStatus.IN_PROGRESS
+            assert task.instance_id == holder
+            assert task.attempts == 1
+
+            # Finished work drops its lease and is never requeued
+            TaskCRUD.update_status(session, task_id, TaskStatus.COMPLETED)
+        with db_manager.get_session() as session:
+            later = NOW + timedelta(days=1)
+            assert TaskCRUD.requeue_expired(session, now=later) == (0, 0)
+            task = session.get(Task, task_id)
+            assert task.status == TaskStatus.COMPLETED
+            assert task.lease_expires_at is None
+
+    async def test_lease_endpoints(self, db_manager, instance_ids):
+        with db_manager.get_session() as session:
+            task_id = TaskCRUD.create(session, title="api", description="via api").id
+        holder, other = instance_ids
+
+        with db_manager.get_session() as session:
+            crud = CRUDBase(session)
+            claimed = await tasks.claim_task(
+                TaskClaimRequest(instance_id=holder, lease_seconds=60), crud=crud
+            )
+            first_lease = session.get(Task, task_id).lease_expires_at
+
+            renewed = await tasks.renew_task_lease(
+                TaskLeaseRequest(instance_id=holder, lease_seconds=3600),
+                task_id=task_id,
+                crud=crud,
+            )
+            assert claimed["data"].id == renewed["data"].id == task_id
+            assert session.get(Task, task_id).lease_expires_at > first_lease
+
+            with pytest.raises(HTTPException) as exc_info:
+                await tasks.renew_task_lease(
+                    TaskLeaseRequest(instance_id=other), task_id=task_id, crud=crud
+                )
+            assert exc_info.value.status_code == 409
+            with pytest.raises(HTTPException) as exc_info:
+                await tasks.release_task(
+                    TaskReleaseRequest(instance_id=holder), task_id=999, crud=crud
+                )
+            assert exc_info.value.status_code == 404
+
+            released = await tasks.release_task(
+                TaskReleaseRequest(instance_id=holder), task_id=task_id, crud=crud
+            )
+            assert released["data"].status == TaskStatus.PENDING.value
+            assert released["data"].instance_id is None
+
+    def test_assign_is_compare_and_set(self, db_manager, instance_ids):
+        task_id = _add_task(db_manager, "assign")
+        first, second = instance_ids
+
+        with db_manager.get_session() as session:
+            assert TaskCRUD.assign(session, task_id, first, None).instance_id == first
+            # A stale read of "unassigned" must not overwrite the winner
+            assert TaskCRUD.assign(session, task_id, second, None) is None
+            assert TaskCRUD.assign(session, task_id, second, first) is not None
+
+
+class TestQueueIndexes:
+    """Test that claims are served by the queue index."""
+
+    def test_candidate_lookup_uses_queue_index(self, db_manager):
+        with db_manager.engine.connect() as conn:
+            plan = conn.exec_driver_sql(
+                "EXPLAIN QUERY PLAN SELECT id FROM tasks "
+                "WHERE status = 'PENDING' AND priority = 'HIGH' "
+                "ORDER BY created_at, id LIMIT 32"
+            ).fetchall()
+
+        assert "idx_tasks_queue" in " ".join(str(row) for row in plan)
+        indexes = {ix["name"] for ix in inspect(db_manager.engine).get_indexes("tasks")}
+        assert {"idx_tasks_queue", "idx_tasks_lease"} <= indexes
+
+    def test_migration_adds_lease_columns(self, tmp_path):
+        from sqlalchemy import create_engine
+
+        from cc_orchestrator.database.migrations import MigrationManager
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+        with engine.begin() as conn:
+            conn.exec_driver_sql(
+                "CREATE TABLE tasks (id INTEGER PRIMARY KEY, status VARCHAR(11), "
+                "priority VARCHAR(6), created_at DATETIME)"
+            )
+
+        manager = MigrationManager(engine)
+        migration = next(m for m in manager.discover_migrations() if m.version == "002")
+        migration.upgrade(engine)
+        # Re-running is a no-op for databases created from the current models
+        migration.upgrade(engine)
+
+        columns = {c["name"] for c in inspect(engine).get_columns("tasks")}
+        assert {"lease_expires_at", "attempts"} <= columns
+        engine.dispose()
+
+    def test_existing_database_gains_new_columns(self, tmp_path):
+        database_url = f"sqlite:///{tmp_path / 'existing.db'}"
+        manager = DatabaseManager(database_url=database_url)
+        with manager.engine.begin() as conn:
+            conn.exec_driver_sql(
+                "CREATE TABLE tasks (id INTEGER PRIMARY KEY, title VARCHAR(255), "
+                "status VARCHAR(11), priority VARCHAR(6), created_at DATETIME)"
+            )
+            conn.exec_driver_sql("INSERT INTO tasks (id, title) VALUES (1, 'old')")
+
+        # Upgrade against a private copy; other suites clear Base.metadata
+        metadata = MetaData()
+        for model in (Instance, Worktree, Task):
+            model.__table__.to_metadata(metadata)
+        manager._upgrade_existing_tables(metadata)
+
+        columns = {c["name"] for c in inspect(manager.engine).get_columns("tasks")}
+        assert {"lease_expires_at", "attempts"} <= columns
+        with manager.engine.connect() as conn:
+            assert conn.exec_driver_sql("SELECT attempts FROM tasks").scalar() == 0
+        manager.close()
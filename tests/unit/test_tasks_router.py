@@ -10,7 +10,7 @@ Tests cover all task management functionality including:
 """
 
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import ANY, AsyncMock, Mock
 
 import pytest
 from fastapi import HTTPException
@@ -61,6 +61,7 @@ class TestTasksRouterFunctions:
         crud.create_task.return_value = mock_task
         crud.get_task.return_value = mock_task
         crud.update_task.return_value = mock_task
+        crud.assign_task.return_value = mock_task
         crud.delete_task.return_value = True
         crud.get_instance.return_value = mock_instance
         crud.get_worktree.return_value = mock_worktree
@@ -95,7 +96,13 @@ class TestTasksRouterFunctions:
         assert result["pages"] == 1
 
         # Verify CRUD was called correctly
-        mock_crud.list_tasks.assert_called_once_with(offset=0, limit=20, filters={})
+        mock_crud.list_tasks.assert_called_once_with(
+            offset=0,
+            limit=20,
+            filters={},
+            include=[],
+            fields=ANY,
+        )
 
     @pytest.mark.asyncio
     async def test_list_tasks_with_filters(self, mock_crud, pagination_params):
@@ -121,6 +128,8 @@ class TestTasksRouterFunctions:
                 "instance_id": 1,
                 "worktree_id": 2,
             },
+            include=[],
+            fields=ANY,
         )
 
     @pytest.mark.asyncio
@@ -367,7 +376,19 @@ class TestTasksRouterFunctions:
 
         mock_crud.get_task.assert_called_once_with(1)
         mock_crud.get_instance.assert_called_once_with(2)
-        mock_crud.update_task.assert_called_once_with(1, {"instance_id": 2})
+        mock_crud.assign_task.assert_called_once_with(1, 2, expected_instance_id=1)
+
+    @pytest.mark.asyncio
+    async def test_assign_task_concurrent_reassignment(self, mock_crud):
+        """Test task assignment losing a race to another worker."""
+        mock_crud.assign_task.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            await tasks.assign_task(
+                assignment_data={"instance_id": 2}, task_id=1, crud=mock_crud
+            )
+
+        assert exc_info.value.status_code == 409
 
     @pytest.mark.asyncio
     async def test_assign_task_invalid_instance(self, mock_crud):
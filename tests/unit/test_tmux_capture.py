@@ -0,0 +1,177 @@
+"""Tests for tmux pane output capture."""
+
+import asyncio
+import os
+import shutil
+import subprocess
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from cc_orchestrator.tmux import service as service_module
+from cc_orchestrator.tmux.capture import PaneOutputCapture, clean_output
+from cc_orchestrator.tmux.control import OWNER_OPTION, TmuxControlClient
+from cc_orchestrator.tmux.service import (
+    SessionConfig,
+    TmuxService,
+    start_output_capture,
+    stop_output_capture,
+)
+
+requires_tmux = pytest.mark.skipif(
+    shutil.which("tmux") is None, reason="tmux is not installed"
+)
+
+
+async def _settle(predicate, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while asyncio.get_running_loop().time() < deadline:
+        if predicate():
+            return True
+        await asyncio.sleep(0.02)
+    return False
+
+
+@pytest.fixture
+def socket_name():
+    """Private tmux socket, torn down after the test."""
+    name = f"cc-orchestrator-capture-test-{os.getpid()}"
+    yield name
+    subprocess.run(["tmux", "-L", name, "kill-server"], capture_output=True)
+
+
+class TestPaneOutputCapture:
+    """Test chunking, truncation and rate limiting of captured output."""
+
+    def test_clean_output(self):
+        raw = b"\x1b[1;32mok\x1b[0m\r\n\x1b]0;title\x07prog 10%\rprog 20%\x07\n"
+        assert clean_output(raw) == b"ok\n" + b"prog 10%\nprog 20%\n"
+
+    async def test_chunks_truncation_and_rate_limit(self, tmp_path):
+        capture = PaneOutputCapture(
+            directory=tmp_path, rate_bytes=1, burst_bytes=100, max_line_bytes=20
+        )
+        chunks = []
+        capture.add_listener(chunks.append)
+        path = capture.open_pane("cc-orchestrator-a", "%1", "a")
+        assert capture.is_captured("cc-orchestrator-a", "%1")
+
+        with open(path, "wb", buffering=0) as fifo:
+            fifo.write(b"hello\n\nwor")
+            assert await _settle(lambda: len(chunks) == 1)
+            fifo.write(b"ld\n" + b"x" * 30 + b"\n")
+            assert await _settle(lambda: len(chunks) == 2)
+            # The budget runs out partway through these lines
+            fifo.write((b"y" * 20 + b"\n") * 4)
+            await asyncio.sleep(0.1)
+            fifo.write(b"partial")
+
+        assert chunks[0].text == "hello"
+        assert chunks[0].instance_id == "a"
+        assert chunks[1].text == "world\n" + "x" * 20
+        assert chunks[1].truncated_bytes == 10
+
+        assert capture.close_session("cc-orchestrator-a") == ["%1"]
+        assert chunks[-1].text == "partial"
+        assert sum(chunk.dropped_bytes for chunk in chunks) > 0
+        assert not path.exists()
+
+
+@requires_tmux
+class TestServiceCapture:
+    """Test piping real pane output through the service."""
+
+    async def test_created_session_output_is_captured(self, socket_name, tmp_path):
+        control = TmuxControlClient(socket_name=socket_name)
+        assert control.start()
+        capture = PaneOutputCapture(directory=tmp_path / "fifos")
+        chunks = []
+        capture.add_listener(chunks.append)
+        try:
+            with patch("cc_orchestrator.tmux.service.libtmux.Server"):
+                service = TmuxService(control_client=control, output_capture=capture)
+            config = SessionConfig(
+                session_name="echo",
+                working_directory=tmp_path,
+                instance_id="echo-instance",
+            )
+            await service.create_session(config)
+            control.command(
+                "send-keys", "-t", "=cc-orchestrator-echo:", "echo cap''tured", "Enter"
+            )
+
+            assert await _settle(
+                lambda: any("captured" in c.text for c in chunks), timeout=15.0
+            )
+            assert {chunk.instance_id for chunk in chunks} == {"echo-instance"}
+            assert await service.start_capture("echo") == []
+
+            assert await service.destroy_session("echo")
+            assert not capture.is_captured("cc-orchestrator-echo", chunks[0].pane_id)
+        finally:
+            control.close()
+            capture.close()
+
+    async def test_host_captures_existing_sessions_until_it_stops(
+        self, socket_name, tmp_path, monkeypatch
+    ):
+        def tmux(*args):
+            return subprocess.run(
+                ["tmux", "-L", socket_name, *args],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.split()
+
+        control = TmuxControlClient(socket_name=socket_name)
+        assert control.start()
+        try:
+            with patch("cc_orchestrator.tmux.service.libtmux.Server"):
+                service = TmuxService(control_client=control, owner="db-1")
+            monkeypatch.setattr(service_module, "_tmux_service", service)
+            # A one-shot command creates sessions without capturing them
+            await service.create_session(
+                SessionConfig(
+                    session_name="early",
+                    working_directory=tmp_path,
+                    instance_id="early",
+                )
+            )
+            assert service.output_capture is None
+            tmux("new-session", "-d", "-s", "cc-orchestrator-foreign")
+            tmux("set-option", "-t", "=cc-orchestrator-foreign:", OWNER_OPTION, "db-2")
+            control.refresh()
+
+            disabled = SimpleNamespace(tmux_capture_enabled=False)
+            assert await start_output_capture(disabled) is None
+
+            config = SimpleNamespace(
+                tmux_capture_enabled=True,
+                tmux_capture_dir=None,
+                tmux_capture_rate=65536.0,
+                tmux_capture_burst=262144.0,
+                tmux_capture_max_line=4096,
+            )
+            temp = tmp_path / "temp"
+            temp.mkdir()
+            monkeypatch.setattr(tempfile, "tempdir", str(temp))
+            chunks = []
+            capture = await start_output_capture(config, chunks.append)
+            assert capture.captured_sessions() == ["cc-orchestrator-early"]
+            control.command(
+                "send-keys", "-t", "=cc-orchestrator-early:", "echo la''te", "Enter"
+            )
+            assert await _settle(
+                lambda: any("late" in c.text for c in chunks), timeout=15.0
+            )
+            assert any(temp.iterdir())
+
+            await stop_output_capture()
+            assert service.output_capture is None
+            assert not any(temp.iterdir())
+            # No pane is left piping into a FIFO nobody reads
+            assert set(tmux("list-panes", "-a", "-F", "#{pane_pipe}")) == {"0"}
+        finally:
+            control.close()
@@ -0,0 +1,235 @@
+"""Tests for the tmux control-mode client."""
+
+import asyncio
+import os
+import shutil
+import subprocess
+import time
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from cc_orchestrator.tmux.control import (
+    TmuxControlClient,
+    TmuxControlError,
+    parse_listing,
+    quote_argument,
+)
+from cc_orchestrator.tmux.service import (
+    SessionConfig,
+    SessionStatus,
+    TmuxError,
+    TmuxService,
+)
+
+requires_tmux = pytest.mark.skipif(
+    shutil.which("tmux") is None, reason="tmux is not installed"
+)
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.fixture
+def socket_name():
+    """Private tmux socket, torn down after the test."""
+    name = f"cc-orchestrator-test-{os.getpid()}"
+    yield name
+    subprocess.run(["tmux", "-L", name, "kill-server"], capture_output=True)
+
+
+@pytest.fixture
+def client(socket_name):
+    """Connected control client on the private socket."""
+    client = TmuxControlClient(socket_name=socket_name)
+    assert client.start()
+    yield client
+    client.close()
+
+
+def _tmux(socket_name, *args):
+    subprocess.run(["tmux", "-L", socket_name, *args], check=True)
+
+
+class TestParsing:
+    """Test listing parsing and argument quoting."""
+
+    def test_parse_listing(self):
+        lines = [
+            "$1\tcc-orchestrator-a\t100\t0\t1\t0\tshell\tdb-1\t/tmp/a",
+            "$1\tcc-orchestrator-a\t100\t0\t0\t1\tclaude\tdb-1\t/tmp/a",
+            "$2\tother\t200\t2\t0\t1\tbash\t\t/path\twith\ttabs",
+            "garbage",
+        ]
+
+        sessions = parse_listing(lines)
+
+        assert sessions["cc-orchestrator-a"].windows == ["claude", "shell"]
+        assert sessions["cc-orchestrator-a"].active_window == "claude"
+        assert sessions["other"].attached_clients == 2
+        assert sessions["cc-orchestrator-a"].owner == "db-1"
+        assert sessions["other"].owner is None
+        assert sessions["other"].path == "/path\twith\ttabs"
+
+    def test_quote_argument(self):
+        assert quote_argument("=cc-orchestrator-a") == "=cc-orchestrator-a"
+        assert quote_argument("it's #{x}") == "'it'\\''s #{x}'"
+        assert quote_argument("") == "''"
+
+
+@requires_tmux
+class TestTmuxControlClient:
+    """Test the live model against a real tmux server."""
+
+    def test_model_follows_notifications(self, client, socket_name):
+        assert client.sessions() == {}
+
+        _tmux(socket_name, "new-session", "-d", "-s", "cc-orchestrator-a", "-c", "/")
+        assert _wait_for(lambda: client.has_session("cc-orchestrator-a"))
+
+        _tmux(socket_name, "new-window", "-d", "-t", "cc-orchestrator-a", "-n", "logs")
+        assert _wait_for(
+            lambda: client.get_session("cc-orchestrator-a").windows[-1] == "logs"
+        )
+
+        _tmux(socket_name, "kill-session", "-t", "cc-orchestrator-a")
+        assert _wait_for(lambda: not client.has_session("cc-orchestrator-a"))
+
+    def test_commands_and_errors(self, client):
+        assert client.command("display-message", "-p", "it's #{session_name}") == [
+            f"it's {client.session_name}"
+        ]
+        with pytest.raises(TmuxControlError):
+            client.command("no-such-command")
+
+    def test_close_removes_control_session(self, socket_name):
+        client = TmuxControlClient(socket_name=socket_name)
+        assert client.start()
+        _tmux(socket_name, "new-session", "-d", "-s", "keep")
+        client.close()
+
+        assert not client.connected
+        listed = subprocess.run(
+            ["tmux", "-L", socket_name, "list-sessions", "-F", "#{session_name}"],
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        assert listed == ["keep"]
+
+
+@requires_tmux
+class TestServiceReads:
+    """Test TmuxService queries are served from the control client."""
+
+    async def test_reads_do_not_query_libtmux(self, client, socket_name):
+        with patch("cc_orchestrator.tmux.service.libtmux.Server") as server_class:
+            server = MagicMock()
+            sessions = PropertyMock(side_effect=AssertionError("forked a query"))
+            type(server).sessions = sessions
+            server_class.return_value = server
+            service = TmuxService(control_client=client)
+
+        _tmux(socket_name, "new-session", "-d", "-s", "cc-orchestrator-one")
+        _tmux(socket_name, "new-session", "-d", "-s", "unmanaged")
+        client.refresh()
+
+        assert await service.session_exists("one")
+        assert not await service.session_exists("two")
+        listed = await service.list_sessions(include_orphaned=True)
+        assert [info.session_name for info in listed] == ["cc-orchestrator-one"]
+        assert listed[0].status == SessionStatus.DETACHED
+        info = await service.get_session_info("one")
+        assert info.instance_id == "one"
+        assert await service._detect_orphaned_sessions() == ["cc-orchestrator-one"]
+
+        assert await service.destroy_session("one")
+        assert not await service.session_exists("one")
+        sessions.assert_not_called()
+
+    async def test_control_commands_do_not_block_the_event_loop(
+        self, client, socket_name
+    ):
+        with patch("cc_orchestrator.tmux.service.libtmux.Server"):
+            service = TmuxService(control_client=client)
+        _tmux(socket_name, "new-session", "-d", "-s", "cc-orchestrator-slow")
+        client.refresh()
+
+        command = client.command
+
+        def slow_command(*args, **kwargs):
+            time.sleep(0.3)
+            return command(*args, **kwargs)
+
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        try:
+            with patch.object(client, "command", side_effect=slow_command):
+                assert await service.destroy_session("slow")
+        finally:
+            ticker.cancel()
+
+        # The loop kept running while the kill waited on tmux
+        assert ticks >= 10
+
+    async def test_create_session_in_one_batch(self, client, socket_name, tmp_path):
+        with patch("cc_orchestrator.tmux.service.libtmux.Server") as server_class:
+            service = TmuxService(control_client=client)
+        config = SessionConfig(
+            session_name="dev",
+            working_directory=tmp_path,
+            instance_id="dev",
+            layout_template="development",
+            environment={"CC_TEST": "value with spaces"},
+        )
+
+        with patch.object(client, "batch", wraps=client.batch) as batch:
+            info = await service.create_session(config)
+
+        batch.assert_called_once()
+        server_class.return_value.new_session.assert_not_called()
+        assert info.windows == ["editor", "terminal", "monitoring"]
+        assert info.current_window == "editor"
+        panes = subprocess.run(
+            [
+                "tmux",
+                "-L",
+                socket_name,
+                "list-panes",
+                "-t",
+                "=cc-orchestrator-dev:monitoring",
+                "-F",
+                "#{pane_index}",
+            ],
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        assert panes == ["0", "1"]
+        environment = subprocess.run(
+            [
+                "tmux",
+                "-L",
+                socket_name,
+                "show-environment",
+                "-t",
+                "=cc-orchestrator-dev",
+            ],
+            capture_output=True,
+            text=True,
+        ).stdout
+        assert "CC_TEST=value with spaces" in environment
+
+        with pytest.raises(TmuxError):
+            await service.create_session(config)
@@ -433,3 +433,89 @@ class TestTmuxTemplates:
 
         # The dangerous command should not be sent to the pane
         mock_split_pane.send_keys.assert_not_called()
+
+
+class TestCompiledLayouts:
+    """Test templates compiled into tmux command batches."""
+
+    @pytest.fixture
+    def tmux_service(self):
+        """Create TmuxService instance with mocked server."""
+        with patch("cc_orchestrator.tmux.service.libtmux.Server"):
+            return TmuxService()
+
+    def test_development_template_batch(self, tmux_service, tmp_path):
+        template = tmux_service.get_layout_templates()["development"]
+
+        compiled = tmux_service._compile_layout(template)
+        commands = compiled.render("cc-orchestrator-dev", tmp_path, {"A": "1"})
+
+        assert compiled.windows == ("editor", "terminal", "monitoring")
+        assert commands[0] == [
+            "new-session",
+            "-d",
+            "-s",
+            "cc-orchestrator-dev",
+            "-c",
+            str(tmp_path),
+            "-n",
+            "editor",
+        ]
+        assert commands[1] == [
+            "set-environment",
+            "-t",
+            "=cc-orchestrator-dev",
+            "A",
+            "1",
+        ]
+        assert [c[0] for c in commands].count("new-window") == 2
+        assert [
+            "split-window",
+            "-h",
+            "-t",
+            "=cc-orchestrator-dev:",
+            "-c",
+            str(tmp_path),
+        ] in commands
+        sent = [c[-1] for c in commands if c[0] == "send-keys" and "-l" in c]
+        assert sent == ["top", "tail -f /var/log/syslog"]
+        assert commands[-1] == ["select-window", "-t", "=cc-orchestrator-dev:^"]
+
+    def test_compilation_and_validation_are_cached(self, tmux_service):
+        template = tmux_service.get_layout_templates()["claude"]
+
+        with patch.object(
+            tmux_service, "_validate_template", wraps=tmux_service._validate_template
+        ) as validate:
+            first = tmux_service._compile_layout(template)
+            assert tmux_service._compile_layout(template) is first
+            assert validate.call_count == 1
+
+            # Replacing a template invalidates its compiled batch
+            replacement = LayoutTemplate("claude", "new", [{"name": "only"}])
+            tmux_service.add_layout_template(replacement)
+            assert tmux_service._compile_layout(replacement).windows == ("only",)
+            assert validate.call_count == 2
+
+    def test_unsafe_pane_commands_are_left_out(self, tmux_service, tmp_path):
+        template = LayoutTemplate(
+            "unsafe",
+            "x",
+            [{"name": "w", "panes": [{"command": "ls"}, {"command": "rm -rf /"}]}],
+        )
+
+        commands = tmux_service._compile_layout(template).render("s", tmp_path)
+
+        sent = [c[-1] for c in commands if c[0] == "send-keys" and "-l" in c]
+        assert sent == ["ls"]
+        assert commands[-1][0] == "split-window"
+
+    def test_invalid_template_is_not_compiled(self, tmux_service):
+        template = LayoutTemplate(
+            "too-many", "x", [{"name": f"w{i}"} for i in range(21)]
+        )
+
+        compiled = tmux_service._compile_layout(template)
+
+        assert not compiled.is_valid
+        assert "exceeds maximum" in compiled.error
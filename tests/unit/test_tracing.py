@@ -0,0 +1,214 @@
+"""Tests for request tracing."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from cc_orchestrator.core.git_runner import GitRunner
+from cc_orchestrator.utils.tracing import (
+    InMemoryTraceExporter,
+    OTLPJsonFileExporter,
+    Tracer,
+    cleanup_tracer,
+    configure_tracing,
+    current_span,
+    start_span,
+    traced,
+)
+from cc_orchestrator.web.app import create_app
+from cc_orchestrator.web.dependencies import get_crud
+
+
+@pytest.fixture
+def memory():
+    return InMemoryTraceExporter(capacity=10)
+
+
+@pytest.fixture
+def global_memory():
+    """Trace everything on the global tracer, reset afterwards."""
+    yield configure_tracing(1.0).memory_exporter
+    cleanup_tracer()
+
+
+class TestSpans:
+    """Test span nesting, propagation and sampling."""
+
+    async def test_span_tree_spans_threads_and_tasks(self, memory):
+        tracer = Tracer(sample_rate=1.0, exporters=[memory])
+
+        def blocking():
+            with tracer.span("crud.get", table="instances"):
+                pass
+
+        with tracer.span("GET /x", kind="server") as root:
+            await asyncio.to_thread(blocking)
+            with tracer.span("tmux.create"):
+                await asyncio.create_task(asyncio.sleep(0))
+            assert current_span() is root
+
+        assert current_span() is None
+        [trace] = memory.traces()
+        tree = trace.to_dict()["root"]
+        assert tree["name"] == "GET /x"
+        assert [child["name"] for child in tree["children"]] == [
+            "crud.get",
+            "tmux.create",
+        ]
+        assert tree["children"][0]["attributes"] == {"table": "instances"}
+        assert trace.trace_id == root.trace_id
+
+    def test_unsampled_roots_record_nothing(self, memory):
+        tracer = Tracer(sample_rate=0.0, exporters=[memory])
+
+        with tracer.span("root") as root:
+            with tracer.span("child") as child:
+                child.set_attribute("ignored", True)
+
+        assert not root.recording and not child.recording
+        assert memory.traces() == []
+
+    def test_errors_and_span_limit(self, memory):
+        tracer = Tracer(sample_rate=1.0, exporters=[memory], max_spans=2)
+
+        with pytest.raises(ValueError):
+            with tracer.span("root"):
+                with tracer.span("kept"):
+                    pass
+                with tracer.span("dropped"):
+                    raise ValueError("boom")
+
+        [trace] = memory.traces()
+        assert [span.name for span in trace.spans] == ["root", "kept"]
+        assert trace.dropped_spans == 1
+        assert trace.root.error == "ValueError: boom"
+
+    async def test_span_after_root_ends_starts_new_trace(self, memory):
+        tracer = Tracer(sample_rate=1.0, exporters=[memory])
+        started = asyncio.Event()
+
+        async def background():
+            await started.wait()
+            with tracer.span("monitor"):
+                pass
+
+        with tracer.span("request"):
+            task = asyncio.create_task(background())
+        started.set()
+        await task
+
+        assert [trace.root.name for trace in memory.traces()] == [
+            "monitor",
+            "request",
+        ]
+
+    async def test_traced_decorator(self, global_memory):
+        @traced("work")
+        async def work():
+            return current_span().name
+
+        assert await work() == "work"
+        assert [trace.root.name for trace in global_memory.traces()] == ["work"]
+
+    def test_memory_query(self, memory):
+        tracer = Tracer(sample_rate=1.0, exporters=[memory])
+        for name in ["GET /a", "GET /b", "POST /a"]:
+            with tracer.span(name):
+                pass
+
+        assert [t.root.name for t in memory.traces(name="/a")] == [
+            "POST /a",
+            "GET /a",
+        ]
+        assert len(memory.traces(limit=1)) == 1
+        assert memory.traces(min_duration_ms=60_000) == []
+        newest = memory.traces()[0]
+        assert memory.get(newest.trace_id) is newest
+
+
+class TestOTLPExport:
+    """Test the OTLP/JSON file exporter."""
+
+    def test_writes_one_request_per_trace(self, tmp_path):
+        exporter = OTLPJsonFileExporter(tmp_path / "out" / "traces.jsonl")
+        tracer = Tracer(sample_rate=1.0, exporters=[exporter])
+        with pytest.raises(RuntimeError):
+            with tracer.span("root", kind="server", port=80):
+                with tracer.span("child", ratio=0.5, ok=True, path="/tmp"):
+                    raise RuntimeError("failed")
+        with tracer.span("second"):
+            pass
+        tracer.close()
+
+        lines = (tmp_path / "out" / "traces.jsonl").read_text().splitlines()
+        assert len(lines) == 2
+        request = json.loads(lines[0])
+        resource_spans = request["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"] == [
+            {"key": "service.name", "value": {"stringValue": "cc-orchestrator"}}
+        ]
+        root, child = resource_spans["scopeSpans"][0]["spans"]
+        assert root["kind"] == 2 and "parentSpanId" not in root
+        assert child["parentSpanId"] == root["spanId"]
+        assert child["traceId"] == root["traceId"]
+        assert len(root["traceId"]) == 32 and len(root["spanId"]) == 16
+        assert int(root["endTimeUnixNano"]) >= int(root["startTimeUnixNano"])
+        assert root["attributes"] == [{"key": "port", "value": {"intValue": "80"}}]
+        assert child["attributes"] == [
+            {"key": "ratio", "value": {"doubleValue": 0.5}},
+            {"key": "ok", "value": {"boolValue": True}},
+            {"key": "path", "value": {"stringValue": "/tmp"}},
+        ]
+        assert child["status"] == {"code": 2, "message": "RuntimeError: failed"}
+
+
+class TestRequestTracing:
+    """Test the tracing middleware and the /debug/traces endpoint."""
+
+    @pytest.fixture
+    def client(self):
+        crud = MagicMock()
+        crud.get_instance = AsyncMock(return_value=None)
+        app = create_app()
+        app.dependency_overrides[get_crud] = lambda: crud
+        configure_tracing(1.0)
+        yield TestClient(app)
+        cleanup_tracer()
+
+    def test_request_trace_is_queryable(self, client):
+        response = client.post("/api/v1/instances/7/start")
+        assert response.status_code == 404
+        trace_id = response.headers["X-Trace-ID"]
+
+        admin = {"Authorization": "Bearer admin-token"}
+        listing = client.get("/debug/traces", headers=admin).json()
+        assert listing["sample_rate"] == 1.0
+        assert listing["traces"][0]["trace_id"] == trace_id
+
+        trace = client.get(f"/debug/traces/{trace_id}", headers=admin).json()
+        root = trace["root"]
+        assert root["name"] == "POST /api/v1/instances/{instance_id}/start"
+        assert root["attributes"]["http.status_code"] == 404
+        assert root["attributes"]["http.target"] == "/api/v1/instances/7/start"
+
+        assert client.get("/debug/traces/unknown", headers=admin).status_code == 404
+
+    def test_requires_admin(self, client):
+        user = {"Authorization": "Bearer valid-jwt-token"}
+        assert client.get("/debug/traces").status_code == 401
+        assert client.get("/debug/traces", headers=user).status_code == 403
+
+
+def test_git_runner_spans(tmp_path, global_memory):
+    """Git commands run inside spans under the caller's span."""
+    runner = GitRunner(str(tmp_path))
+    with start_span("root"):
+        runner.run("init", "-q")
+        runner.status_many([str(tmp_path)])
+
+    [trace] = global_memory.traces()
+    assert [span.name for span in trace.spans] == ["root", "git init", "git status"]
+    assert trace.spans[1].attributes["exit_code"] == 0
@@ -45,6 +45,13 @@ from cc_orchestrator.utils.logging import (
     orchestrator_logger,
     setup_logging,
 )
+from cc_orchestrator.utils.metrics import get_metrics_registry
+
+
+def _duration_series(func, status):
+    """Get the duration histogram series of a log_performance function."""
+    histogram = get_metrics_registry().get("cc_orchestrator_function_duration_seconds")
+    return histogram.labels(f"{func.__module__}.{func.__qualname__}", status)
 
 
 class TestLogLevel:
@@ -940,14 +947,12 @@ class TestLogPerformanceDecorator:
             result = test_function()
 
             assert result == "success"
-            assert mock_logger.debug.call_count == 1  # Performance tracking started
-            assert mock_logger.info.call_count == 1  # Performance completed
+            assert mock_logger.debug.call_count == 0
+            assert mock_logger.info.call_count == 0
 
-            info_call = mock_logger.info.call_args
-            assert "Performance: test_function completed" in info_call[0][0]
-            assert "execution_time" in info_call[1]
-            assert "status" in info_call[1]
-            assert info_call[1]["status"] == "success"
+        series = _duration_series(test_function, "success")
+        assert series.count == 1
+        assert _duration_series(test_function, "error").count == 0
 
     def test_log_performance_with_exception(self):
         """Test log_performance decorator when function raises exception."""
@@ -964,7 +969,7 @@ class TestLogPerformanceDecorator:
             with pytest.raises(ValueError):
                 test_function()
 
-            assert mock_logger.debug.call_count == 1  # Performance tracking started
+            assert mock_logger.debug.call_count == 0
             assert mock_logger.warning.call_count == 1  # Performance failed
 
             warning_call = mock_logger.warning.call_args
@@ -973,23 +978,43 @@ class TestLogPerformanceDecorator:
             assert "status" in warning_call[1]
             assert warning_call[1]["status"] == "error"
 
+        assert _duration_series(test_function, "error").count == 1
+
     def test_log_performance_custom_context(self):
         """Test log_performance decorator with custom log context."""
 
         @log_performance(log_context=LogContext.DATABASE)
         def test_function():
-            return "success"
+            raise ValueError("Test error")
 
         with patch("cc_orchestrator.utils.logging.get_logger") as mock_get_logger:
             mock_logger = Mock()
             mock_get_logger.return_value = mock_logger
 
-            test_function()
+            with pytest.raises(ValueError):
+                test_function()
 
             mock_get_logger.assert_called()
             get_logger_call = mock_get_logger.call_args
             assert get_logger_call[0][1] == LogContext.DATABASE
 
+    def test_log_performance_custom_name(self):
+        """Test log_performance decorator with an explicit function label."""
+
+        @log_performance(name="custom_operation")
+        def test_function():
+            return "success"
+
+        histogram = get_metrics_registry().get(
+            "cc_orchestrator_function_duration_seconds"
+        )
+        series = histogram.labels("custom_operation", "success")
+        count = series.count
+
+        test_function()
+
+        assert series.count == count + 1
+
     def test_log_performance_timing_accuracy(self):
         """Test log_performance decorator measures time accurately."""
 
@@ -998,15 +1023,10 @@ class TestLogPerformanceDecorator:
             time.sleep(0.1)  # 100ms delay
             return "success"
 
-        with patch("cc_orchestrator.utils.logging.get_logger") as mock_get_logger:
-            mock_logger = Mock()
-            mock_get_logger.return_value = mock_logger
-
-            test_function()
+        test_function()
 
-            info_call = mock_logger.info.call_args
-            execution_time = info_call[1]["execution_time"]
-            assert 0.09 <= execution_time <= 0.15  # Allow some variance
+        execution_time = _duration_series(test_function, "success").sum
+        assert 0.09 <= execution_time <= 0.15  # Allow some variance
 
     def test_log_performance_preserves_function_metadata(self):
         """Test log_performance decorator preserves function metadata."""
@@ -1183,10 +1203,8 @@ class TestIntegrationScenarios:
 
             assert result == "processed 9 items"
             # Verify multiple logging calls were made
-            assert mock_logger.debug.call_count >= 2  # handle_errors + performance
-            assert (
-                mock_logger.info.call_count >= 3
-            )  # audit start/complete + performance + custom
+            assert mock_logger.debug.call_count >= 1  # handle_errors
+            assert mock_logger.info.call_count >= 2  # audit start/complete
 
     def test_exception_handling_with_structured_logging(self):
         """Test exception handling integrates properly with structured logging."""
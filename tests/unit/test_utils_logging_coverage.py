@@ -901,7 +901,8 @@ class TestLogPerformanceDecorator:
     @patch("src.cc_orchestrator.utils.logging.time")
     def test_log_performance_timing(self, mock_time):
         """Test that log_performance measures execution time."""
-        mock_time.time.side_effect = [1.0, 2.5]  # Start and end times
+        # Start and end times
+        mock_time.perf_counter_ns.side_effect = [1_000_000_000, 2_500_000_000]
 
         @log_performance()
         def test_function():
@@ -909,8 +910,8 @@ class TestLogPerformanceDecorator:
 
         result = test_function()
         assert result == "success"
-        # Verify time.time was called twice
-        assert mock_time.time.call_count == 2
+        # Verify the clock was read twice
+        assert mock_time.perf_counter_ns.call_count == 2
 
 
 class TestAuditLogDecorator:
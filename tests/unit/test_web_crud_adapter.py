@@ -334,7 +334,10 @@ class TestTaskOperations:
             assert tasks == mock_tasks
             assert total == 2
             mock_crud.list_by_instance.assert_called_once_with(
-                mock_session, 1, status=None
+                mock_session,
+                1,
+                status=None,
+                include=None,
             )
 
     @pytest.mark.asyncio
@@ -352,7 +355,10 @@ class TestTaskOperations:
             assert tasks == mock_tasks
             assert total == 1
             mock_crud.list_by_instance.assert_called_once_with(
-                mock_session, 1, status=TaskStatus.PENDING
+                mock_session,
+                1,
+                status=TaskStatus.PENDING,
+                include=None,
             )
 
     @pytest.mark.asyncio
@@ -559,7 +565,7 @@ class TestWorktreeOperations:
 
             assert worktrees == mock_worktrees
             assert total == 2
-            mock_crud.list_all.assert_called_once_with(mock_session)
+            mock_crud.list_all.assert_called_once_with(mock_session, include=None)
 
     @pytest.mark.asyncio
     async def test_list_worktrees_with_status_filter(self, crud_adapter, mock_session):
@@ -576,7 +582,9 @@ class TestWorktreeOperations:
             assert worktrees == mock_worktrees
             assert total == 1
             mock_crud.list_by_status.assert_called_once_with(
-                mock_session, WorktreeStatus.ACTIVE
+                mock_session,
+                WorktreeStatus.ACTIVE,
+                include=None,
             )
 
     @pytest.mark.asyncio
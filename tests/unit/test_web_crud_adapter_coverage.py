@@ -419,7 +419,9 @@ class TestTaskOperations:
             tasks, total = await crud.list_tasks(offset=1, limit=2, filters=filters)
 
             # Lines 188-202: Instance filter path
-            mock_crud.list_by_instance.assert_called_with(mock_session, 1, status=None)
+            mock_crud.list_by_instance.assert_called_with(
+                mock_session, 1, status=None, include=None
+            )
             # Lines 204-209: Pagination logic
             assert len(tasks) == 2  # Limited by pagination
             assert total == 3  # Total count
@@ -440,7 +442,10 @@ class TestTaskOperations:
 
             # Lines 190-199: Status filter conversion
             mock_crud.list_by_instance.assert_called_with(
-                mock_session, 1, status=TaskStatus.PENDING
+                mock_session,
+                1,
+                status=TaskStatus.PENDING,
+                include=None,
             )
 
     @pytest.mark.asyncio
@@ -459,7 +464,10 @@ class TestTaskOperations:
 
             # Lines 197-199: Direct enum use
             mock_crud.list_by_instance.assert_called_with(
-                mock_session, 1, status=TaskStatus.COMPLETED
+                mock_session,
+                1,
+                status=TaskStatus.COMPLETED,
+                include=None,
             )
 
     @pytest.mark.asyncio
@@ -720,7 +728,9 @@ class TestWorktreeOperations:
 
             # Lines 310-318: Status filter path
             mock_crud.list_by_status.assert_called_with(
-                mock_session, WorktreeStatus.ACTIVE
+                mock_session,
+                WorktreeStatus.ACTIVE,
+                include=None,
             )
 
     @pytest.mark.asyncio
@@ -739,7 +749,9 @@ class TestWorktreeOperations:
 
             # Lines 316-318: Direct enum use
             mock_crud.list_by_status.assert_called_with(
-                mock_session, WorktreeStatus.DIRTY
+                mock_session,
+                WorktreeStatus.DIRTY,
+                include=None,
             )
 
     @pytest.mark.asyncio
@@ -759,7 +771,7 @@ class TestWorktreeOperations:
             worktrees, total = await crud.list_worktrees(offset=1, limit=2)
 
             # Lines 320: No filter path
-            mock_crud.list_all.assert_called_with(mock_session)
+            mock_crud.list_all.assert_called_with(mock_session, include=None)
             # Lines 322-327: Pagination logic
             assert len(worktrees) == 2  # Limited by pagination
             assert total == 3
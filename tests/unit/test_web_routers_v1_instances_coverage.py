@@ -19,7 +19,7 @@ and push coverage from 43% to the highest possible level. It focuses on:
 """
 
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
 from fastapi import HTTPException, status
@@ -28,6 +28,7 @@ from cc_orchestrator.database.models import (
     InstanceStatus,
     TaskPriority,
 )
+from cc_orchestrator.utils.metrics import get_metrics_registry
 from cc_orchestrator.web.dependencies import PaginationParams
 from cc_orchestrator.web.exceptions import CCOrchestratorAPIException
 from cc_orchestrator.web.routers.v1 import instances
@@ -143,7 +144,13 @@ class TestInstancesRouterComprehensiveCoverage:
         assert result["page"] == 1
         assert result["size"] == 20
         assert result["pages"] == 1
-        mock_crud.list_instances.assert_called_once_with(offset=0, limit=20, filters={})
+        mock_crud.list_instances.assert_called_once_with(
+            offset=0,
+            limit=20,
+            filters={},
+            include=[],
+            fields=ANY,
+        )
 
     @pytest.mark.asyncio
     async def test_list_instances_status_filter_only(
@@ -159,7 +166,11 @@ class TestInstancesRouterComprehensiveCoverage:
 
         assert result["total"] == 1
         mock_crud.list_instances.assert_called_once_with(
-            offset=0, limit=20, filters={"status": InstanceStatus.RUNNING}
+            offset=0,
+            limit=20,
+            filters={"status": InstanceStatus.RUNNING},
+            include=[],
+            fields=ANY,
         )
 
     @pytest.mark.asyncio
@@ -176,7 +187,11 @@ class TestInstancesRouterComprehensiveCoverage:
 
         assert result["total"] == 1
         mock_crud.list_instances.assert_called_once_with(
-            offset=0, limit=20, filters={"branch_name": "feature-branch"}
+            offset=0,
+            limit=20,
+            filters={"branch_name": "feature-branch"},
+            include=[],
+            fields=ANY,
         )
 
     @pytest.mark.asyncio
@@ -194,6 +209,8 @@ class TestInstancesRouterComprehensiveCoverage:
             offset=0,
             limit=20,
             filters={"status": InstanceStatus.STOPPED, "branch_name": "develop"},
+            include=[],
+            fields=ANY,
         )
 
     @pytest.mark.asyncio
@@ -434,7 +451,9 @@ class TestInstancesRouterComprehensiveCoverage:
         mock_instance_data.status = InstanceStatus.STOPPED
         mock_crud.get_instance.return_value = mock_instance_data
 
-        result = await instances.start_instance(instance_id=1, crud=mock_crud)
+        result = await instances.start_instance(
+            instance_id=1, crud=mock_crud, database_id=None
+        )
 
         assert result["success"] is True
         assert result["message"] == "Instance started successfully"
@@ -452,7 +471,9 @@ class TestInstancesRouterComprehensiveCoverage:
         mock_crud.get_instance.return_value = None
 
         with pytest.raises(HTTPException) as exc_info:
-            await instances.start_instance(instance_id=999, crud=mock_crud)
+            await instances.start_instance(
+                instance_id=999, crud=mock_crud, database_id=None
+            )
 
         assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
         assert "Instance with ID 999 not found" in str(exc_info.value.detail)
@@ -465,7 +486,9 @@ class TestInstancesRouterComprehensiveCoverage:
         mock_crud.get_instance.return_value = mock_instance_data
 
         with pytest.raises(HTTPException) as exc_info:
-            await instances.start_instance(instance_id=1, crud=mock_crud)
+            await instances.start_instance(
+                instance_id=1, crud=mock_crud, database_id=None
+            )
 
         assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
         assert "Instance is already running" in str(exc_info.value.detail)
@@ -484,7 +507,9 @@ class TestInstancesRouterComprehensiveCoverage:
         mock_instance_data.status = InstanceStatus.RUNNING
         mock_crud.get_instance.return_value = mock_instance_data
 
-        result = await instances.stop_instance(instance_id=1, crud=mock_crud)
+        result = await instances.stop_instance(
+            instance_id=1, crud=mock_crud, database_id=None
+        )
 
         assert result["success"] is True
         assert result["message"] == "Instance stopped successfully"
@@ -502,7 +527,9 @@ class TestInstancesRouterComprehensiveCoverage:
         mock_crud.get_instance.return_value = None
 
         with pytest.raises(HTTPException) as exc_info:
-            await instances.stop_instance(instance_id=999, crud=mock_crud)
+            await instances.stop_instance(
+                instance_id=999, crud=mock_crud, database_id=None
+            )
 
         assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
         assert "Instance with ID 999 not found" in str(exc_info.value.detail)
@@ -515,7 +542,9 @@ class TestInstancesRouterComprehensiveCoverage:
         mock_crud.get_instance.return_value = mock_instance_data
 
         with pytest.raises(HTTPException) as exc_info:
-            await instances.stop_instance(instance_id=1, crud=mock_crud)
+            await instances.stop_instance(
+                instance_id=1, crud=mock_crud, database_id=None
+            )
 
         assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
         assert "Instance is already stopped" in str(exc_info.value.detail)
@@ -675,6 +704,14 @@ class TestDecoratorFunctionality:
     @pytest.mark.asyncio
     async def test_track_api_performance_decorator_success(self):
         """Test @track_api_performance decorator on successful execution."""
+        histogram = get_metrics_registry().get(
+            "cc_orchestrator_api_handler_duration_seconds"
+        )
+        series = histogram.labels(
+            "cc_orchestrator.web.routers.v1.instances.list_instances", "success"
+        )
+        count = series.count
+
         with patch("cc_orchestrator.web.logging_utils.api_logger") as mock_logger:
             # Create mock CRUD and call a decorated function
             mock_crud = AsyncMock()
@@ -692,13 +729,11 @@ class TestDecoratorFunctionality:
                 crud=mock_crud,
             )
 
-            # Verify performance logging calls
-            assert mock_logger.debug.called
-            assert mock_logger.info.called
-
-            # Check for performance logging messages
+            # Successful calls are recorded as metrics, not logged
             info_calls = list(mock_logger.info.call_args_list)
-            assert any("completed" in str(call) for call in info_calls)
+            assert not any("Performance" in str(call) for call in info_calls)
+
+        assert series.count == count + 1
 
     @pytest.mark.asyncio
     async def test_track_api_performance_decorator_error(self):
@@ -909,12 +944,16 @@ class TestEdgeCasesAndBoundaryConditions:
         # Test start_instance endpoint (change status to stopped for valid start)
         mock_instance.status = InstanceStatus.STOPPED
         mock_crud.update_instance.return_value = mock_instance
-        result = await instances.start_instance(instance_id=1, crud=mock_crud)
+        result = await instances.start_instance(
+            instance_id=1, crud=mock_crud, database_id=None
+        )
         assert "data" in result
 
         # Test stop_instance endpoint (change status to running for valid stop)
         mock_instance.status = InstanceStatus.RUNNING
-        result = await instances.stop_instance(instance_id=1, crud=mock_crud)
+        result = await instances.stop_instance(
+            instance_id=1, crud=mock_crud, database_id=None
+        )
         assert "data" in result
 
     @pytest.mark.asyncio
@@ -972,11 +1011,15 @@ class TestComplexScenarios:
             if status_value == InstanceStatus.RUNNING:
                 # Should fail to start but succeed to stop
                 with pytest.raises(HTTPException):
-                    await instances.start_instance(instance_id=1, crud=mock_crud)
+                    await instances.start_instance(
+                        instance_id=1, crud=mock_crud, database_id=None
+                    )
             elif status_value == InstanceStatus.STOPPED:
                 # Should fail to stop but succeed to start
                 with pytest.raises(HTTPException):
-                    await instances.stop_instance(instance_id=1, crud=mock_crud)
+                    await instances.stop_instance(
+                        instance_id=1, crud=mock_crud, database_id=None
+                    )
 
     @pytest.mark.asyncio
     async def test_comprehensive_filter_combinations(self):
@@ -1014,7 +1057,11 @@ class TestComplexScenarios:
                 expected_filters["branch_name"] = branch_name
 
             mock_crud.list_instances.assert_called_with(
-                offset=0, limit=20, filters=expected_filters
+                offset=0,
+                limit=20,
+                filters=expected_filters,
+                include=[],
+                fields=ANY,
             )
 
     @pytest.mark.asyncio
@@ -1087,7 +1134,9 @@ class TestInstanceRouterIntegrationCoverage:
         # Step 3: Start instance
         mock_instance.status = InstanceStatus.STOPPED
         mock_crud.update_instance.return_value = mock_instance
-        start_result = await instances.start_instance(instance_id=1, crud=mock_crud)
+        start_result = await instances.start_instance(
+            instance_id=1, crud=mock_crud, database_id=None
+        )
         assert start_result["success"] is True
 
         # Step 4: Get status
@@ -1106,7 +1155,9 @@ class TestInstanceRouterIntegrationCoverage:
         assert update_result["success"] is True
 
         # Step 6: Stop instance
-        stop_result = await instances.stop_instance(instance_id=1, crud=mock_crud)
+        stop_result = await instances.stop_instance(
+            instance_id=1, crud=mock_crud, database_id=None
+        )
         assert stop_result["success"] is True
 
         # Step 7: Delete instance
@@ -1138,8 +1189,12 @@ class TestInstanceRouterIntegrationCoverage:
                 crud=mock_crud,
             ),
             lambda: instances.delete_instance(instance_id=999, crud=mock_crud),
-            lambda: instances.start_instance(instance_id=999, crud=mock_crud),
-            lambda: instances.stop_instance(instance_id=999, crud=mock_crud),
+            lambda: instances.start_instance(
+                instance_id=999, crud=mock_crud, database_id=None
+            ),
+            lambda: instances.stop_instance(
+                instance_id=999, crud=mock_crud, database_id=None
+            ),
             lambda: instances.get_instance_status(instance_id=999, crud=mock_crud),
         ]
 
@@ -6,7 +6,7 @@ including all endpoints, error conditions, edge cases, and conditional branches.
 """
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
 from fastapi import HTTPException, status
@@ -71,7 +71,13 @@ class TestTasksListEndpoint:
         assert result["page"] == 1
         assert result["size"] == 20
         assert result["pages"] == 1
-        mock_crud.list_tasks.assert_called_once_with(offset=0, limit=20, filters={})
+        mock_crud.list_tasks.assert_called_once_with(
+            offset=0,
+            limit=20,
+            filters={},
+            include=[],
+            fields=ANY,
+        )
 
     @pytest.mark.asyncio
     async def test_list_tasks_with_status_filter(
@@ -92,7 +98,11 @@ class TestTasksListEndpoint:
 
         assert result["total"] == 1
         mock_crud.list_tasks.assert_called_once_with(
-            offset=0, limit=20, filters={"status": TaskStatus.IN_PROGRESS}
+            offset=0,
+            limit=20,
+            filters={"status": TaskStatus.IN_PROGRESS},
+            include=[],
+            fields=ANY,
         )
 
     @pytest.mark.asyncio
@@ -114,7 +124,11 @@ class TestTasksListEndpoint:
 
         assert result["total"] == 1
         mock_crud.list_tasks.assert_called_once_with(
-            offset=0, limit=20, filters={"priority": TaskPriority.HIGH}
+            offset=0,
+            limit=20,
+            filters={"priority": TaskPriority.HIGH},
+            include=[],
+            fields=ANY,
         )
 
     @pytest.mark.asyncio
@@ -136,7 +150,11 @@ class TestTasksListEndpoint:
 
         assert result["total"] == 1
         mock_crud.list_tasks.assert_called_once_with(
-            offset=0, limit=20, filters={"instance_id": 123}
+            offset=0,
+            limit=20,
+            filters={"instance_id": 123},
+            include=[],
+            fields=ANY,
         )
 
     @pytest.mark.asyncio
@@ -158,7 +176,11 @@ class TestTasksListEndpoint:
 
         assert result["total"] == 1
         mock_crud.list_tasks.assert_called_once_with(
-            offset=0, limit=20, filters={"worktree_id": 456}
+            offset=0,
+            limit=20,
+            filters={"worktree_id": 456},
+            include=[],
+            fields=ANY,
         )
 
     @pytest.mark.asyncio
@@ -188,6 +210,8 @@ class TestTasksListEndpoint:
                 "instance_id": 123,
                 "worktree_id": 456,
             },
+            include=[],
+            fields=ANY,
         )
 
     @pytest.mark.asyncio
@@ -228,7 +252,13 @@ class TestTasksListEndpoint:
         assert result["page"] == 2
         assert result["size"] == 10
         assert result["pages"] == 3  # (25 + 10 - 1) // 10 = 3
-        mock_crud.list_tasks.assert_called_once_with(offset=10, limit=10, filters={})
+        mock_crud.list_tasks.assert_called_once_with(
+            offset=10,
+            limit=10,
+            filters={},
+            include=[],
+            fields=ANY,
+        )
 
 
 class TestTasksCreateEndpoint:
@@ -942,7 +972,7 @@ class TestTasksAssignEndpoint:
         """Test successful task assignment."""
         assignment_data = {"instance_id": 2}
         updated_task = TaskResponse(**sample_task_data)
-        mock_crud.update_task.return_value = updated_task
+        mock_crud.assign_task.return_value = updated_task
 
         result = await tasks.assign_task(
             assignment_data=assignment_data, task_id=1, crud=mock_crud
@@ -952,7 +982,9 @@ class TestTasksAssignEndpoint:
         assert "Task assigned successfully" in result["message"]
         mock_crud.get_task.assert_called_once_with(1)
         mock_crud.get_instance.assert_called_once_with(2)
-        mock_crud.update_task.assert_called_once_with(1, {"instance_id": 2})
+        mock_crud.assign_task.assert_called_once_with(
+            1, 2, expected_instance_id=mock_crud.get_task.return_value.instance_id
+        )
 
     @pytest.mark.asyncio
     async def test_assign_task_missing_instance_id(self, mock_crud):
@@ -148,7 +148,9 @@ class TestWorktreesRouterComprehensiveCoverage:
             )
 
         # Verify filters dict is empty
-        mock_crud.list_worktrees.assert_called_once_with(offset=0, limit=20, filters={})
+        mock_crud.list_worktrees.assert_called_once_with(
+            offset=0, limit=20, filters={}, include=[]
+        )
         assert result["total"] == 1
         assert result["page"] == 1
         assert result["size"] == 20
@@ -173,7 +175,10 @@ class TestWorktreesRouterComprehensiveCoverage:
         # Verify status filter is applied
         expected_filters = {"status": WorktreeStatus.ACTIVE}
         mock_crud.list_worktrees.assert_called_once_with(
-            offset=0, limit=20, filters=expected_filters
+            offset=0,
+            limit=20,
+            filters=expected_filters,
+            include=[],
         )
 
     @pytest.mark.asyncio
@@ -195,7 +200,10 @@ class TestWorktreesRouterComprehensiveCoverage:
         # Verify branch filter is applied
         expected_filters = {"branch_name": "feature/test"}
         mock_crud.list_worktrees.assert_called_once_with(
-            offset=0, limit=20, filters=expected_filters
+            offset=0,
+            limit=20,
+            filters=expected_filters,
+            include=[],
         )
 
     @pytest.mark.asyncio
@@ -217,7 +225,10 @@ class TestWorktreesRouterComprehensiveCoverage:
         # Verify instance_id filter is applied
         expected_filters = {"instance_id": 123}
         mock_crud.list_worktrees.assert_called_once_with(
-            offset=0, limit=20, filters=expected_filters
+            offset=0,
+            limit=20,
+            filters=expected_filters,
+            include=[],
         )
 
     @pytest.mark.asyncio
@@ -243,7 +254,10 @@ class TestWorktreesRouterComprehensiveCoverage:
             "instance_id": 456,
         }
         mock_crud.list_worktrees.assert_called_once_with(
-            offset=0, limit=20, filters=expected_filters
+            offset=0,
+            limit=20,
+            filters=expected_filters,
+            include=[],
         )
 
     @pytest.mark.asyncio
@@ -0,0 +1,211 @@
+"""Tests for reconciling git worktrees against the database."""
+
+import shutil
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+from cc_orchestrator.core import worktree_service
+from cc_orchestrator.core.git_operations import parse_worktree_list
+from cc_orchestrator.core.worktree_reconcile import plan_reconciliation
+from cc_orchestrator.core.worktree_service import WorktreeService
+from cc_orchestrator.database.connection import DatabaseManager
+from cc_orchestrator.database.crud import WorktreeCRUD
+from cc_orchestrator.database.models import Instance, Worktree, WorktreeStatus
+
+
+def _git(*args, cwd):
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def db_manager(tmp_path, monkeypatch):
+    """Create a file-backed database used by the worktree service."""
+    manager = DatabaseManager(database_url=f"sqlite:///{tmp_path / 'wt.db'}")
+    # Create tables from the models directly; other suites clear Base.metadata
+    for model in (Instance, Worktree):
+        model.__table__.create(manager.engine, checkfirst=True)
+    monkeypatch.setattr(worktree_service, "get_db_session", manager.get_session)
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create a repository with one commit."""
+    path = tmp_path / "repo"
+    path.mkdir()
+    _git("init", "-q", "-b", "main", cwd=path)
+    _git("config", "user.email", "test@example.com", cwd=path)
+    _git("config", "user.name", "Test", cwd=path)
+    (path / "README.md").write_text("hello\n")
+    _git("add", ".", cwd=path)
+    _git("commit", "-q", "-m", "Initial commit", cwd=path)
+    return path
+
+
+class TestParseWorktreeList:
+    """Test parsing of the porcelain worktree listing."""
+
+    def test_nul_separated_states(self):
+        output = "\0".join(
+            [
+                "worktree /repo",
+                "HEAD aaa",
+                "branch refs/heads/main",
+                "",
+                "worktree /wt/gone",
+                "HEAD bbb",
+                "detached",
+                "prunable gitdir file points to non-existent location",
+                "",
+                "worktree /wt/usb",
+                "HEAD ccc",
+                "branch refs/heads/usb",
+                "locked",
+                "",
+                "",
+            ]
+        )
+
+        main, gone, usb = parse_worktree_list(output)
+
+        assert main == {"path": "/repo", "commit": "aaa", "branch": "refs/heads/main"}
+        assert gone["status"] == "detached"
+        assert gone["prunable"].startswith("gitdir file")
+        assert usb["locked"] == ""
+        assert "prunable" not in usb
+
+    def test_newline_separated(self):
+        output = (
+            "worktree /repo\nbare\n\nworktree /wt/a\nHEAD abc\nbranch refs/heads/a\n"
+        )
+
+        assert parse_worktree_list(output) == [
+            {"path": "/repo", "status": "bare"},
+            {"path": "/wt/a", "commit": "abc", "branch": "refs/heads/a"},
+        ]
+
+
+class TestPlanReconciliation:
+    """Test the set-based diff."""
+
+    def test_plan(self):
+        rows = [
+            SimpleNamespace(
+                id=1, path="/wt/kept", status=WorktreeStatus.ACTIVE, current_commit="a"
+            ),
+            SimpleNamespace(
+                id=2,
+                path="/wt/back",
+                status=WorktreeStatus.INACTIVE,
+                current_commit="b",
+            ),
+            SimpleNamespace(
+                id=3, path="/wt/gone", status=WorktreeStatus.ACTIVE, current_commit="c"
+            ),
+            SimpleNamespace(
+                id=4, path="/wt/old", status=WorktreeStatus.INACTIVE, current_commit="d"
+            ),
+        ]
+        listed = [
+            {"path": "/repo", "commit": "m", "branch": "refs/heads/main"},
+            {"path": "/wt/kept", "commit": "a2", "branch": "refs/heads/kept"},
+            {"path": "/wt/back", "commit": "b", "branch": "refs/heads/back"},
+            {"path": "/wt/gone", "commit": "c", "prunable": "gone"},
+            {"path": "/wt/new", "commit": "n", "status": "detached", "locked": "usb"},
+        ]
+
+        plan = plan_reconciliation(listed, rows, main_path="/repo")
+
+        assert [row.id for row in plan.present] == [1, 2]
+        assert plan.reactivate_ids == [2]
+        assert plan.missing_ids == [3]
+        assert plan.head_updates == {1: "a2"}
+        assert plan.prunable == ["/wt/gone"]
+        assert plan.locked == {"/wt/new": "usb"}
+        assert plan.to_add == [
+            {
+                "name": "new",
+                "path": "/wt/new",
+                "branch_name": "HEAD",
+                "current_commit": "n",
+                "extra_metadata": {"adopted": True, "locked": "usb"},
+            }
+        ]
+
+    def test_in_sync_plan_is_empty(self):
+        rows = [
+            SimpleNamespace(
+                id=1, path="/wt/a", status=WorktreeStatus.ACTIVE, current_commit="a"
+            )
+        ]
+        plan = plan_reconciliation([{"path": "/wt/a", "commit": "a"}], rows)
+        assert plan.is_empty
+
+
+class TestSyncReconciliation:
+    """Test sync against a real repository and database."""
+
+    def test_adopts_marks_missing_and_reactivates(self, repo, tmp_path, db_manager):
+        adopted = tmp_path / "adopted"
+        gone = tmp_path / "gone"
+        locked = tmp_path / "locked"
+        _git("worktree", "add", "-q", str(adopted), "-b", "adopted", cwd=repo)
+        _git("worktree", "add", "-q", str(gone), "-b", "gone", cwd=repo)
+        _git("worktree", "add", "-q", "--detach", str(locked), cwd=repo)
+        _git("worktree", "lock", "--reason", "usb drive", str(locked), cwd=repo)
+
+        with db_manager.get_session() as session:
+            tracked = WorktreeCRUD.create(
+                session, name="gone", path=str(gone), branch_name="gone"
+            )
+            stale = WorktreeCRUD.create(
+                session, name="stale", path=str(tmp_path / "never"), branch_name="x"
+            )
+            tracked_id, stale_id = tracked.id, stale.id
+
+        service = WorktreeService(str(repo), str(tmp_path / "worktrees"))
+        result = service.sync_worktrees()
+
+        assert result["added"] == 2
+        assert result["marked_missing"] == 1
+        with db_manager.get_session() as session:
+            rows = {row.path: row for row in WorktreeCRUD.list_all(session)}
+            assert set(rows) == {
+                str(adopted),
+                str(gone),
+                str(locked),
+                str(tmp_path / "never"),
+            }
+            assert rows[str(adopted)].branch_name == "adopted"
+            assert rows[str(adopted)].extra_metadata == {"adopted": True}
+            assert rows[str(locked)].branch_name == "HEAD"
+            assert rows[str(locked)].extra_metadata["locked"] == "usb drive"
+            assert rows[str(gone)].current_commit == _git("rev-parse", "HEAD", cwd=repo)
+            assert session.get(Worktree, stale_id).status == WorktreeStatus.INACTIVE
+
+        # A deleted directory shows up as prunable and is marked missing
+        shutil.rmtree(gone)
+        result = service.sync_worktrees()
+        assert result["marked_missing"] == 1
+        assert result["added"] == 0
+
+        # Restoring it reactivates the record
+        _git("worktree", "prune", cwd=repo)
+        _git("worktree", "add", "-q", str(gone), "gone", cwd=repo)
+        result = service.sync_worktrees()
+        assert result["reactivated"] == 1
+        with db_manager.get_session() as session:
+            assert session.get(Worktree, tracked_id).status == WorktreeStatus.ACTIVE
+
+        # A fully reconciled tree needs no further writes
+        result = service.sync_worktrees()
+        assert (result["added"], result["marked_missing"], result["reactivated"]) == (
+            0,
+            0,
+            0,
+        )
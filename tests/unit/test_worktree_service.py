@@ -1,11 +1,14 @@
 """Unit tests for worktree service module."""
 
 import os
+from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
 import pytest
 
+from cc_orchestrator.core.enums import WorktreeCheckoutMode
 from cc_orchestrator.core.worktree_service import (
+    SYNC_MAX_SKIP_SECONDS,
     WorktreeService,
     WorktreeServiceError,
 )
@@ -24,6 +27,18 @@ class TestWorktreeService:
             mock_instance = Mock()
             mock_class.return_value = mock_instance
             mock_instance.repo_path = "/test/repo"
+
+            # Batch status lookups delegate to the per-path mock
+            def statuses(paths, max_workers=None):
+                results = {}
+                for path in paths:
+                    try:
+                        results[path] = mock_instance.get_worktree_status(path)
+                    except Exception as e:
+                        results[path] = e
+                return results
+
+            mock_instance.get_worktree_statuses.side_effect = statuses
             yield mock_instance
 
     @pytest.fixture
@@ -185,6 +200,8 @@ class TestWorktreeService:
                 branch="feature-branch",
                 checkout_branch=None,
                 force=False,
+                mode=WorktreeCheckoutMode.FULL,
+                sparse_paths=None,
             )
 
     def test_create_worktree_git_error(
@@ -337,6 +354,113 @@ class TestWorktreeService:
             # Verify update was called
             mock_crud.update_status.assert_called_once()
 
+    def test_sync_worktrees_skips_unchanged_fingerprints(
+        self, service, mock_git_manager, mock_db_session
+    ):
+        """Test sync only checks worktrees whose git state changed."""
+        mock_git_manager.list_worktrees.return_value = [
+            {"path": f"/test/path{i}"} for i in range(3)
+        ]
+        mock_git_manager.get_worktree_fingerprint.side_effect = lambda path: (
+            f"fp-{path}"
+        )
+        mock_git_manager.get_worktree_status.side_effect = lambda path: {
+            "commit": "abcd1234",
+            "has_changes": False,
+        }
+
+        worktrees = []
+        for i in range(3):
+            worktree = Mock()
+            worktree.id = i
+            worktree.path = f"/test/path{i}"
+            worktree.status = WorktreeStatus.ACTIVE
+            worktree.current_commit = "abcd1234"
+            worktree.has_uncommitted_changes = False
+            worktree.last_sync = datetime.now()
+            # Only the first worktree still matches its recorded fingerprint
+            worktree.sync_fingerprint = "fp-/test/path0" if i == 0 else "stale"
+            worktrees.append(worktree)
+
+        with patch("cc_orchestrator.core.worktree_service.WorktreeCRUD") as mock_crud:
+            mock_crud.list_all.return_value = worktrees
+
+            result = service.sync_worktrees()
+
+        assert result["skipped"] == 1
+        assert result["updated"] == 0
+        checked = sorted(
+            call.args[0] for call in mock_git_manager.get_worktree_status.call_args_list
+        )
+        assert checked == ["/test/path1", "/test/path2"]
+        assert worktrees[1].sync_fingerprint == "fp-/test/path1"
+        mock_db_session.commit.assert_called_once()
+
+    def test_sync_worktrees_force_and_stale_last_sync(
+        self, service, mock_git_manager, mock_db_session
+    ):
+        """Test force and old last_sync values bypass the fingerprint skip."""
+        mock_git_manager.list_worktrees.return_value = [{"path": "/test/path"}]
+        mock_git_manager.get_worktree_fingerprint.return_value = "fp"
+        mock_git_manager.get_worktree_status.return_value = {
+            "commit": "abcd1234",
+            "has_changes": True,
+        }
+
+        worktree = Mock()
+        worktree.id = 1
+        worktree.path = "/test/path"
+        worktree.status = WorktreeStatus.ACTIVE
+        worktree.current_commit = "abcd1234"
+        worktree.has_uncommitted_changes = False
+        worktree.sync_fingerprint = "fp"
+        worktree.last_sync = datetime.now()
+
+        with patch("cc_orchestrator.core.worktree_service.WorktreeCRUD") as mock_crud:
+            mock_crud.list_all.return_value = [worktree]
+
+            assert service.sync_worktrees()["skipped"] == 1
+            assert service.sync_worktrees(force=True)["updated"] == 1
+
+            worktree.last_sync = datetime.now() - timedelta(
+                seconds=SYNC_MAX_SKIP_SECONDS + 1
+            )
+            assert service.sync_worktrees()["updated"] == 1
+
+    def test_sync_worktrees_status_error_is_skipped(
+        self, service, mock_git_manager, mock_db_session
+    ):
+        """Test a failing status check does not abort the whole sync."""
+        mock_git_manager.list_worktrees.return_value = [
+            {"path": "/test/good"},
+            {"path": "/test/bad"},
+        ]
+        mock_git_manager.get_worktree_fingerprint.return_value = None
+
+        def status(path):
+            if path == "/test/bad":
+                raise RuntimeError("boom")
+            return {"commit": "new", "has_changes": False}
+
+        mock_git_manager.get_worktree_status.side_effect = status
+
+        worktrees = []
+        for path in ("/test/good", "/test/bad"):
+            worktree = Mock()
+            worktree.path = path
+            worktree.status = WorktreeStatus.ACTIVE
+            worktree.current_commit = "old"
+            worktree.has_uncommitted_changes = False
+            worktrees.append(worktree)
+
+        with patch("cc_orchestrator.core.worktree_service.WorktreeCRUD") as mock_crud:
+            mock_crud.list_all.return_value = worktrees
+
+            result = service.sync_worktrees()
+
+        assert result["updated"] == 1
+        mock_crud.update_status.assert_called_once()
+
     def test_get_worktree_status_by_id(
         self, service, mock_git_manager, mock_db_session
     ):
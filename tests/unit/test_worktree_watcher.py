@@ -0,0 +1,203 @@
+"""Tests for the filesystem-watcher driven worktree status cache."""
+
+import os
+import subprocess
+import time
+from datetime import datetime
+
+import pytest
+
+from cc_orchestrator.core.worktree_watcher import (
+    GitIgnoreRules,
+    WorktreeStatusCache,
+    WorktreeWatcher,
+)
+from cc_orchestrator.web.routers.v1 import worktrees
+from cc_orchestrator.web.schemas import WorktreeResponse
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class TestGitIgnoreRules:
+    """Test the minimal gitignore matcher."""
+
+    def test_patterns(self, tmp_path):
+        rules = GitIgnoreRules(
+            str(tmp_path),
+            [
+                "# comment",
+                "*.pyc",
+                "build/",
+                "/top.txt",
+                "docs/**/*.tmp",
+                "*.log",
+                "!keep.log",
+            ],
+        )
+
+        def ignored(rel, is_dir=False):
+            return rules.is_ignored(str(tmp_path / rel), is_dir)
+
+        assert ignored("a.pyc")
+        assert ignored("pkg/sub/a.pyc")
+        assert ignored("build", is_dir=True)
+        assert ignored("build/out.o")
+        assert not ignored("build")
+        assert ignored("top.txt")
+        assert not ignored("sub/top.txt")
+        assert ignored("docs/a/b/c.tmp")
+        assert ignored("debug.log")
+        assert not ignored("keep.log")
+        assert not ignored("src/main.py")
+
+    def test_loads_gitignore_and_exclude(self, tmp_path):
+        (tmp_path / ".gitignore").write_text("node_modules/\n")
+        info = tmp_path / ".git" / "info"
+        info.mkdir(parents=True)
+        (info / "exclude").write_text("*.swp\n")
+
+        rules = GitIgnoreRules.for_worktree(str(tmp_path), str(tmp_path / ".git"))
+
+        assert rules.is_ignored(str(tmp_path / "node_modules" / "x.js"))
+        assert rules.is_ignored(str(tmp_path / "a.swp"))
+        assert not rules.is_ignored(str(tmp_path / "a.py"))
+
+
+class TestWorktreeStatusCache:
+    """Test cache bookkeeping and change notifications."""
+
+    def test_put_notifies_only_on_change(self, tmp_path):
+        cache = WorktreeStatusCache()
+        events = []
+        cache.add_listener(lambda path, entry: events.append((path, entry)))
+        path = str(tmp_path)
+        status = {"branch": "main", "commit": "abc", "has_changes": False}
+
+        cache.put(path, status)
+        cache.put(path, status)
+        cache.put(path, {**status, "has_changes": True})
+
+        assert len(events) == 2
+        assert events[-1][1].status.value == "dirty"
+        assert cache.get_status(path)["is_dirty"] is True
+
+        cache.mark_stale(path)
+        assert cache.get_status(path) is None
+
+        cache.remove(path)
+        assert events[-1] == (path, None)
+        assert len(cache) == 0
+
+
+class TestWorktreeWatcher:
+    """Test debounced refreshes driven by real filesystem events."""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        (tmp_path / ".gitignore").write_text("*.log\n")
+        return tmp_path
+
+    def test_bursts_are_debounced_and_ignored_files_skipped(self, repo):
+        calls = []
+
+        def status_fn(path):
+            calls.append(path)
+            return {"branch": "main", "commit": "abc", "has_changes": len(calls) > 1}
+
+        cache = WorktreeStatusCache()
+        watcher = WorktreeWatcher(cache, status_fn=status_fn, debounce_seconds=0.2)
+        watcher.start()
+        try:
+            assert watcher.watch(str(repo))
+            assert _wait_for(lambda: len(calls) == 1)
+
+            # Ignored files and git internals do not trigger a refresh
+            (repo / "debug.log").write_text("noise")
+            (repo / ".git" / "description").write_text("noise")
+            time.sleep(0.5)
+            assert len(calls) == 1
+
+            for i in range(20):
+                (repo / f"file{i}.txt").write_text(str(i))
+            assert _wait_for(lambda: len(calls) == 2)
+            time.sleep(0.4)
+            assert len(calls) == 2
+            assert cache.get_status(str(repo))["has_changes"] is True
+
+            # Index updates (e.g. git add) are watched as well
+            subprocess.run(["git", "-C", str(repo), "add", "file0.txt"], check=True)
+            assert _wait_for(lambda: len(calls) == 3)
+
+            watcher.sync([])
+            assert watcher.watched_paths == set()
+            assert cache.get(str(repo)) is None
+        finally:
+            watcher.stop()
+
+    def test_own_index_writes_do_not_retrigger(self, repo):
+        index = repo / ".git" / "index"
+        subprocess.run(["git", "-C", str(repo), "add", ".gitignore"], check=True)
+        calls = []
+
+        def status_fn(path):
+            # Stand in for a status run that refreshes the index on disk
+            calls.append(path)
+            stat = index.stat()
+            os.utime(index, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            return {"branch": "main", "commit": "abc", "has_changes": False}
+
+        watcher = WorktreeWatcher(
+            WorktreeStatusCache(), status_fn=status_fn, debounce_seconds=0.1
+        )
+        watcher.start()
+        try:
+            assert watcher.watch(str(repo))
+            assert _wait_for(lambda: len(calls) == 1)
+            time.sleep(0.5)
+            assert len(calls) == 1
+
+            # Index writes by anyone else still refresh the status
+            (repo / "tracked.txt").write_text("x")
+            subprocess.run(["git", "-C", str(repo), "add", "tracked.txt"], check=True)
+            assert _wait_for(lambda: len(calls) == 2)
+            time.sleep(0.5)
+            assert len(calls) == 2
+        finally:
+            watcher.stop()
+
+
+class TestRouterOverlay:
+    """Test that API responses are served from the cache."""
+
+    def test_cached_status_overrides_database_fields(self, tmp_path, monkeypatch):
+        cache = WorktreeStatusCache()
+        monkeypatch.setattr(worktrees, "get_worktree_status_cache", lambda: cache)
+        response = WorktreeResponse(
+            id=1,
+            name="wt",
+            branch_name="main",
+            path=str(tmp_path),
+            created_at=datetime.now(),
+            status="active",
+            current_commit="old",
+        )
+
+        assert worktrees._with_cached_status(response) is response
+
+        cache.put(str(tmp_path), {"commit": "new", "has_changes": True})
+        updated = worktrees._with_cached_status(response)
+        assert updated.status == "dirty"
+        assert updated.current_commit == "new"
+        assert updated.has_uncommitted_changes is True
+
+        # Statuses the watcher does not own are left alone
+        errored = response.model_copy(update={"status": "error"})
+        assert worktrees._with_cached_status(errored).status == "error"
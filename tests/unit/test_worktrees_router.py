@@ -106,7 +106,9 @@ class TestWorktreesRouterFunctions:
         assert result["pages"] == 1
 
         # Verify CRUD was called correctly
-        mock_crud.list_worktrees.assert_called_once_with(offset=0, limit=20, filters={})
+        mock_crud.list_worktrees.assert_called_once_with(
+            offset=0, limit=20, filters={}, include=[]
+        )
 
     @pytest.mark.asyncio
     async def test_list_worktrees_with_filters(self, mock_crud, pagination_params):
@@ -130,6 +132,7 @@ class TestWorktreesRouterFunctions:
                 "branch_name": "main",
                 "instance_id": 1,
             },
+            include=[],
         )
 
     @pytest.mark.asyncio
@@ -326,11 +326,12 @@ class TestWebSocketEndpointsFunctional:
             ("dashboard-connection-222", "dashboard"),
             ("dashboard-connection-222", "instances"),
             ("dashboard-connection-222", "tasks"),
+            ("dashboard-connection-222", "worktrees"),
             ("dashboard-connection-222", "system_status"),
             ("dashboard-connection-222", "alerts"),
         ]
 
-        assert mock_manager.subscribe.call_count == 5
+        assert mock_manager.subscribe.call_count == 6
         for expected_call in expected_subscriptions:
             mock_manager.subscribe.assert_any_call(*expected_call)
 